@@ -6,13 +6,14 @@ Sophisticated camera controls with smooth animations, presets, and cinematic fea
 
 import math
 import time
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-from PyQt6.QtCore import (QEasingCurve, QObject, QPropertyAnimation, QTimer,
-                          pyqtSignal)
+from golf_frame_clock import FrameClock, get_frame_clock
+from PyQt6.QtCore import QEasingCurve, QObject, QPropertyAnimation, pyqtSignal
 
 # ============================================================================
 # CAMERA DATA STRUCTURES
@@ -171,6 +172,355 @@ class SmoothAnimator:
 
         return new_dist, new_azim, new_elev
 
+    @staticmethod
+    def easing_function(easing: QEasingCurve.Type) -> Optional[Callable]:
+        """Easing function for a keyframe easing type (None means linear)"""
+        if easing == QEasingCurve.Type.InOutCubic:
+            return SmoothAnimator.ease_in_out_cubic
+        if easing == QEasingCurve.Type.InOutQuart:
+            return SmoothAnimator.ease_in_out_quart
+        if easing == QEasingCurve.Type.OutElastic:
+            return SmoothAnimator.ease_elastic_out
+        return None
+
+
+# ============================================================================
+# COMPILED CAMERA PATHS
+# ============================================================================
+
+
+def spherical_to_cartesian(
+    distance: np.ndarray,
+    azimuth: np.ndarray,
+    elevation: np.ndarray,
+    target: np.ndarray,
+) -> np.ndarray:
+    """Vectorized orbit positions (Y up) for arrays of spherical coordinates"""
+    azimuth_rad = np.radians(azimuth)
+    elevation_rad = np.radians(elevation)
+    offset = np.stack(
+        [
+            distance * np.cos(elevation_rad) * np.cos(azimuth_rad),
+            distance * np.sin(elevation_rad),
+            distance * np.cos(elevation_rad) * np.sin(azimuth_rad),
+        ],
+        axis=-1,
+    )
+    return (target + offset).astype(np.float32)
+
+
+def look_at_matrices(
+    eyes: np.ndarray, targets: np.ndarray, up: np.ndarray
+) -> np.ndarray:
+    """Vectorized CameraController._create_look_at_matrix over (N, 3) arrays"""
+    forward = targets - eyes
+    norms = np.linalg.norm(forward, axis=1, keepdims=True)
+    forward = np.where(norms > 1e-6, forward / np.maximum(norms, 1e-12), [0, 0, -1])
+
+    side = np.cross(forward, up)
+    norms = np.linalg.norm(side, axis=1, keepdims=True)
+    side = np.where(norms > 1e-6, side / np.maximum(norms, 1e-12), [1, 0, 0])
+    true_up = np.cross(side, forward)
+
+    matrices = np.tile(np.eye(4, dtype=np.float32), (len(eyes), 1, 1))
+    matrices[:, 0, :3] = side
+    matrices[:, 1, :3] = true_up
+    matrices[:, 2, :3] = -forward
+    matrices[:, 0, 3] = -np.einsum("ij,ij->i", side, eyes)
+    matrices[:, 1, 3] = -np.einsum("ij,ij->i", true_up, eyes)
+    matrices[:, 2, 3] = np.einsum("ij,ij->i", forward, eyes)
+    return matrices
+
+
+def hermite_tangents(times: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Catmull-Rom tangents for keys at non-uniform times (one-sided at the ends)"""
+    tangents = np.zeros_like(values)
+    if len(times) < 2:
+        return tangents
+    spans = (times[2:] - times[:-2])[:, None]
+    tangents[1:-1] = (values[2:] - values[:-2]) / spans
+    tangents[0] = (values[1] - values[0]) / (times[1] - times[0])
+    tangents[-1] = (values[-1] - values[-2]) / (times[-1] - times[-2])
+    return tangents
+
+
+@dataclass
+class CompiledCameraPath:
+    """Camera states and view matrices pre-sampled at a fixed rate.
+
+    Lookup is a direct index computation, so playback costs O(1) per frame
+    regardless of the number of keyframes. Nothing here depends on a Qt timer,
+    so offline export can step through ``view_matrices`` directly.
+    """
+
+    sample_rate: float
+    times: np.ndarray  # (N,) seconds
+    distance: np.ndarray  # (N,)
+    azimuth: np.ndarray  # (N,) degrees, unwrapped
+    elevation: np.ndarray  # (N,) degrees
+    fov: np.ndarray  # (N,) degrees
+    targets: np.ndarray  # (N, 3)
+    positions: np.ndarray  # (N, 3)
+    view_matrices: np.ndarray  # (N, 4, 4)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def duration(self) -> float:
+        return float(self.times[-1]) if len(self.times) else 0.0
+
+    def index_at(self, time_s: float, loop: bool = False) -> int:
+        """Nearest sample index for a playback time"""
+        count = len(self.times)
+        index = int(round(time_s * self.sample_rate))
+        if loop and count > 1:
+            return index % (count - 1)
+        return min(max(index, 0), count - 1)
+
+    def view_matrix_at(self, time_s: float, loop: bool = False) -> np.ndarray:
+        return self.view_matrices[self.index_at(time_s, loop)]
+
+    def state_at(self, time_s: float, loop: bool = False) -> "CameraState":
+        """Camera state at a playback time"""
+        i = self.index_at(time_s, loop)
+        return CameraState(
+            position=self.positions[i].copy(),
+            target=self.targets[i].copy(),
+            fov=float(self.fov[i]),
+            distance=float(self.distance[i]),
+            azimuth=float(self.azimuth[i]),
+            elevation=float(self.elevation[i]),
+        )
+
+
+class CameraPathCompiler:
+    """Fits a spline through cinematic keyframes and samples it once"""
+
+    @staticmethod
+    def compile(
+        keyframes: List[CameraKeyframe],
+        sample_rate: float = 60.0,
+        duration: Optional[float] = None,
+    ) -> CompiledCameraPath:
+        """Sample a Catmull-Rom path through the keyframes at ``sample_rate``.
+
+        Distance, azimuth, elevation, FOV and target are splined independently,
+        with keyframe times as the curve parameter. Each segment keeps the
+        easing of its end keyframe as a remap of local time, as before. The
+        camera holds the first/last keyframe outside the keyed range.
+        """
+        if not keyframes:
+            raise ValueError("Cannot compile a camera path without keyframes")
+
+        keyframes = sorted(keyframes, key=lambda kf: kf.time)
+        key_times = np.array([kf.time for kf in keyframes], dtype=np.float64)
+        if duration is None:
+            duration = float(key_times[-1])
+
+        # Shortest-way azimuth between neighbouring keys, then unwrapped
+        azimuth = np.array([kf.state.azimuth for kf in keyframes], dtype=np.float64)
+        azimuth[1:] = azimuth[0] + np.cumsum(
+            (np.diff(azimuth) + 180.0) % 360.0 - 180.0
+        )
+        key_values = np.column_stack(
+            [
+                [kf.state.distance for kf in keyframes],
+                azimuth,
+                [kf.state.elevation for kf in keyframes],
+                [kf.state.fov for kf in keyframes],
+                np.array([kf.state.target for kf in keyframes], dtype=np.float64),
+            ]
+        )
+
+        sample_count = int(math.floor(duration * sample_rate + 1e-9)) + 1
+        times = np.arange(sample_count, dtype=np.float64) / sample_rate
+        values = np.empty((sample_count, key_values.shape[1]), dtype=np.float64)
+        values[times <= key_times[0]] = key_values[0]
+        values[times >= key_times[-1]] = key_values[-1]
+
+        if len(keyframes) > 1:
+            tangents = hermite_tangents(key_times, key_values)
+            inside = (times > key_times[0]) & (times < key_times[-1])
+            segment = np.clip(
+                np.searchsorted(key_times, times[inside], side="right") - 1,
+                0,
+                len(key_times) - 2,
+            )
+            span = key_times[segment + 1] - key_times[segment]
+            u = (times[inside] - key_times[segment]) / span
+
+            # Per-segment easing (taken from the segment's end keyframe)
+            for index, keyframe in enumerate(keyframes[1:]):
+                easing = SmoothAnimator.easing_function(keyframe.easing)
+                mask = segment == index
+                if easing is not None and mask.any():
+                    u[mask] = np.vectorize(easing, otypes=[np.float64])(u[mask])
+
+            u = u[:, None]
+            u2 = u * u
+            u3 = u2 * u
+            h00 = 2 * u3 - 3 * u2 + 1
+            h10 = u3 - 2 * u2 + u
+            h01 = -2 * u3 + 3 * u2
+            h11 = u3 - u2
+            values[inside] = (
+                h00 * key_values[segment]
+                + h10 * span[:, None] * tangents[segment]
+                + h01 * key_values[segment + 1]
+                + h11 * span[:, None] * tangents[segment + 1]
+            )
+
+        distance, azimuth, elevation, fov = values[:, :4].T
+        elevation = np.clip(elevation, -89.0, 89.0)
+        targets = values[:, 4:7].astype(np.float32)
+        positions = spherical_to_cartesian(distance, azimuth, elevation, targets)
+        up = np.asarray(keyframes[0].state.up, dtype=np.float64)
+
+        return CompiledCameraPath(
+            sample_rate=sample_rate,
+            times=times,
+            distance=distance,
+            azimuth=azimuth,
+            elevation=elevation,
+            fov=fov,
+            targets=targets,
+            positions=positions,
+            view_matrices=look_at_matrices(positions, targets, up),
+        )
+
+
+# ============================================================================
+# FOLLOW TRACKS
+# ============================================================================
+
+
+def gaussian_smooth(values: np.ndarray, sigma_samples: float) -> np.ndarray:
+    """Zero-phase Gaussian smoothing along axis 0"""
+    if sigma_samples <= 0 or len(values) < 3:
+        return values.astype(np.float64)
+    radius = min(int(math.ceil(3.0 * sigma_samples)), len(values) - 1)
+    offsets = np.arange(-radius, radius + 1, dtype=np.float64)
+    kernel = np.exp(-0.5 * (offsets / sigma_samples) ** 2)
+    kernel /= kernel.sum()
+
+    # Odd reflection keeps linear trends going, so the ends are not pulled back
+    padded = np.pad(
+        values.astype(np.float64),
+        ((radius, radius), (0, 0)),
+        mode="reflect",
+        reflect_type="odd",
+    )
+    windows = np.lib.stride_tricks.sliding_window_view(padded, len(kernel), axis=0)
+    return windows @ kernel
+
+
+def compute_follow_track(
+    trajectory: np.ndarray,
+    time_vector: np.ndarray,
+    smoothing_s: float = 0.02,
+    look_ahead_s: float = 0.005,
+) -> np.ndarray:
+    """Camera target track for a whole trajectory in one vectorized pass.
+
+    The symmetric kernel smooths without phase lag, unlike per-frame
+    exponential smoothing. Leading the smoothed path by its own velocity
+    keeps the clubhead centred through impact. A second pass over the result
+    keeps acceleration and jerk bounded.
+    """
+    trajectory = np.asarray(trajectory, dtype=np.float64)
+    time_vector = np.asarray(time_vector, dtype=np.float64)
+    if len(trajectory) < 2:
+        return trajectory.astype(np.float32)
+
+    # Bridge dropouts so they do not drag the camera to the origin
+    valid = np.isfinite(trajectory).all(axis=1)
+    if not valid.any():
+        return np.zeros_like(trajectory, dtype=np.float32)
+    if not valid.all():
+        trajectory = np.column_stack(
+            [
+                np.interp(time_vector, time_vector[valid], trajectory[valid, axis])
+                for axis in range(3)
+            ]
+        )
+
+    dt = float(np.median(np.diff(time_vector)))
+    sigma = smoothing_s / dt if dt > 0 else 0.0
+
+    smoothed = gaussian_smooth(trajectory, sigma)
+    velocity = np.gradient(smoothed, time_vector, axis=0)
+    track = gaussian_smooth(smoothed + velocity * look_ahead_s, sigma)
+    return track.astype(np.float32)
+
+
+@dataclass
+class FollowTrack:
+    """Precomputed per-frame camera targets for one swing"""
+
+    targets: np.ndarray  # (num_frames, 3)
+    time_vector: np.ndarray
+    point: str
+    filter_name: str
+    source: np.ndarray  # Trajectory the track was built from
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def target_at_frame(self, frame_idx: int) -> np.ndarray:
+        return self.targets[min(max(int(frame_idx), 0), len(self.targets) - 1)]
+
+    def target_at_time(self, time_s: float) -> np.ndarray:
+        """Target at a data time, interpolated between frames"""
+        return np.array(
+            [
+                np.interp(time_s, self.time_vector, self.targets[:, axis])
+                for axis in range(3)
+            ],
+            dtype=np.float32,
+        )
+
+
+# Frame processor -> {(point, filter, smoothing, look-ahead): FollowTrack}
+_follow_track_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_follow_track(
+    frame_processor,
+    point: str = "clubhead",
+    smoothing_s: float = 0.02,
+    look_ahead_s: float = 0.005,
+) -> FollowTrack:
+    """Follow track for a swing, cached per swing, filter and parameters"""
+    filter_name = getattr(frame_processor, "current_filter", "None")
+    if hasattr(frame_processor, "get_filtered_point_trajectory"):
+        trajectory = frame_processor.get_filtered_point_trajectory(point)
+    else:
+        trajectory = frame_processor.get_point_trajectory(point)
+
+    tracks = _follow_track_cache.setdefault(frame_processor, {})
+    key = (point, filter_name, smoothing_s, look_ahead_s)
+    track = tracks.get(key)
+    # The processor rebuilds trajectories when filter parameters change
+    if track is None or track.source is not trajectory:
+        start_time = time.perf_counter()
+        time_vector = np.asarray(frame_processor.time_vector, dtype=np.float64)
+        track = FollowTrack(
+            targets=compute_follow_track(
+                trajectory, time_vector, smoothing_s, look_ahead_s
+            ),
+            time_vector=time_vector,
+            point=point,
+            filter_name=filter_name,
+            source=trajectory,
+        )
+        tracks[key] = track
+        print(
+            f"📷 Computed {point} follow track ({filter_name}): {len(track)} frames "
+            f"in {(time.perf_counter() - start_time) * 1000:.1f} ms"
+        )
+    return track
+
 
 # ============================================================================
 # ADVANCED CAMERA CONTROLLER
@@ -185,7 +535,7 @@ class CameraController(QObject):
     animationFinished = pyqtSignal()
     modeChanged = pyqtSignal(str)
 
-    def __init__(self):
+    def __init__(self, frame_clock: Optional[FrameClock] = None):
         super().__init__()
 
         # Core state
@@ -198,9 +548,8 @@ class CameraController(QObject):
         self.auto_frame_data = True
         self.smooth_transitions = True
 
-        # Animation system
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self._update_animation)
+        # Animation system: transitions, cinematics and inertia share one clock
+        self.frame_clock = frame_clock or get_frame_clock()
         self.animation_start_time = 0.0
         self.animation_start_state = CameraState()
 
@@ -216,12 +565,18 @@ class CameraController(QObject):
         self.velocity_elevation = 0.0
         self.velocity_zoom = 0.0
         self.velocity_pan = np.array([0.0, 0.0], dtype=np.float32)
+        self._inertia_active = False
 
         # Cinematic features
         self.keyframes: List[CameraKeyframe] = []
         self.cinematic_time = 0.0
         self.cinematic_duration = 10.0
         self.cinematic_loop = False
+        self.cinematic_sample_rate = 60.0
+        self.compiled_path: Optional[CompiledCameraPath] = None
+
+        # Follow mode
+        self.follow_track: Optional[FollowTrack] = None
 
         # Preset configurations
         self._setup_presets()
@@ -365,6 +720,7 @@ class CameraController(QObject):
         """Handle mouse orbital movement"""
         if self.mode != CameraMode.ORBIT:
             return
+        self._inertia_active = False
 
         # Apply sensitivity and update spherical coordinates
         azimuth_delta = dx * self.mouse_sensitivity
@@ -389,6 +745,7 @@ class CameraController(QObject):
         """Handle mouse panning movement"""
         if self.mode not in [CameraMode.ORBIT, CameraMode.FLY]:
             return
+        self._inertia_active = False
 
         # Calculate camera right and up vectors
         eye = self._spherical_to_cartesian()
@@ -414,6 +771,7 @@ class CameraController(QObject):
 
     def handle_mouse_zoom(self, delta: float):
         """Handle mouse wheel zoom"""
+        self._inertia_active = False
         zoom_factor = 1.0 + (delta * self.zoom_sensitivity)
         new_distance = self.current_state.distance / zoom_factor
 
@@ -427,33 +785,51 @@ class CameraController(QObject):
 
         self.cameraChanged.emit()
 
-    def update_inertia(self):
-        """Update camera movement with inertia"""
+    def release_inertia(self):
+        """Let the camera coast with the last drag velocity (call on mouse release)"""
+        if self.inertia_enabled and self._total_velocity() > 0.01:
+            self._inertia_active = True
+            self.frame_clock.start(self._on_frame_tick)
+
+    def _total_velocity(self) -> float:
+        return float(
+            abs(self.velocity_azimuth)
+            + abs(self.velocity_elevation)
+            + abs(self.velocity_zoom)
+            + np.linalg.norm(self.velocity_pan)
+        )
+
+    def update_inertia(self, dt: float = 1.0 / 60.0) -> bool:
+        """Update camera movement with inertia; returns True while still moving"""
         if not self.inertia_enabled:
-            return
+            return False
+
+        # Velocities and damping are per 60 Hz frame; scale to the real step
+        steps = dt * 60.0
+        damping = self.inertia_damping**steps
 
         # Apply inertial movement
         if abs(self.velocity_azimuth) > 0.01:
-            self.current_state.azimuth += self.velocity_azimuth
-            self.velocity_azimuth *= self.inertia_damping
+            self.current_state.azimuth += self.velocity_azimuth * steps
+            self.velocity_azimuth *= damping
 
         if abs(self.velocity_elevation) > 0.01:
             self.current_state.elevation = np.clip(
-                self.current_state.elevation + self.velocity_elevation,
+                self.current_state.elevation + self.velocity_elevation * steps,
                 self.constraints.min_elevation,
                 self.constraints.max_elevation,
             )
-            self.velocity_elevation *= self.inertia_damping
+            self.velocity_elevation *= damping
 
         if abs(self.velocity_zoom) > 0.001:
-            zoom_factor = 1.0 + self.velocity_zoom
+            zoom_factor = 1.0 + self.velocity_zoom * steps
             new_distance = self.current_state.distance / zoom_factor
             self.current_state.distance = np.clip(
                 new_distance,
                 self.constraints.min_distance,
                 self.constraints.max_distance,
             )
-            self.velocity_zoom *= self.inertia_damping
+            self.velocity_zoom *= damping
 
         if np.linalg.norm(self.velocity_pan) > 0.001:
             # Calculate camera vectors for pan
@@ -467,19 +843,14 @@ class CameraController(QObject):
             up = np.cross(right, forward)
 
             pan_offset = right * self.velocity_pan[0] + up * self.velocity_pan[1]
-            self.current_state.target += pan_offset
-            self.velocity_pan *= self.inertia_damping
+            self.current_state.target += pan_offset * steps
+            self.velocity_pan *= damping
 
         # Check if any velocity is significant enough to continue
-        total_velocity = (
-            abs(self.velocity_azimuth)
-            + abs(self.velocity_elevation)
-            + abs(self.velocity_zoom)
-            + np.linalg.norm(self.velocity_pan)
-        )
-
-        if total_velocity > 0.01:
+        if self._total_velocity() > 0.01:
             self.cameraChanged.emit()
+            return True
+        return False
 
     # ========================================================================
     # CAMERA PRESETS AND ANIMATION
@@ -519,21 +890,36 @@ class CameraController(QObject):
         self._copy_state(target_state, self.target_state)
 
         self.current_state.animation_duration = duration
-        self.animation_start_time = time.time()
+        self.animation_start_time = self.frame_clock.clock()
 
-        # Start animation timer
-        self.animation_timer.start(16)  # ~60 FPS
+        # Advance on the shared frame clock
         self.current_state.is_animating = True
+        self.frame_clock.start(self._on_frame_tick)
 
         print(f"📷 Animating camera over {duration:.1f}s")
 
-    def _update_animation(self):
+    def _on_frame_tick(self, now: float, dt: float) -> bool:
+        """Advance cinematics, transitions and inertia; False once all are done"""
+        if self.mode == CameraMode.CINEMATIC:
+            self.update_cinematic_camera(dt)
+        elif self.current_state.is_animating:
+            self._update_animation(now)
+        if self._inertia_active:
+            self._inertia_active = self.update_inertia(dt)
+
+        return (
+            self.mode == CameraMode.CINEMATIC
+            or self.current_state.is_animating
+            or self._inertia_active
+        )
+
+    def _update_animation(self, now: float):
         """Update ongoing camera animation"""
         if not self.current_state.is_animating:
             return
 
         # Calculate animation progress
-        elapsed = time.time() - self.animation_start_time
+        elapsed = now - self.animation_start_time
         progress = elapsed / self.current_state.animation_duration
 
         if progress >= 1.0:
@@ -584,7 +970,6 @@ class CameraController(QObject):
 
     def stop_animation(self):
         """Stop any ongoing animation"""
-        self.animation_timer.stop()
         self.current_state.is_animating = False
 
     def _copy_state(self, source: CameraState, destination: CameraState):
@@ -613,6 +998,7 @@ class CameraController(QObject):
             self._copy_state(self.current_state, state)
 
         keyframe = CameraKeyframe(time=time, state=state, easing=easing)
+        self.compiled_path = None
 
         # Insert in chronological order
         inserted = False
@@ -630,8 +1016,28 @@ class CameraController(QObject):
     def clear_keyframes(self):
         """Clear all cinematic keyframes"""
         self.keyframes.clear()
+        self.compiled_path = None
         print("📷 Cleared all keyframes")
 
+    def compile_camera_path(
+        self, duration: Optional[float] = None
+    ) -> CompiledCameraPath:
+        """Compile the keyframes into a sampled path (cached until they change)"""
+        duration = duration or max(kf.time for kf in self.keyframes)
+        path = self.compiled_path
+        if path is None or abs(path.duration - duration) > 1.0 / path.sample_rate:
+            start_time = time.perf_counter()
+            path = CameraPathCompiler.compile(
+                self.keyframes, self.cinematic_sample_rate, duration
+            )
+            self.compiled_path = path
+            print(
+                f"📷 Compiled camera path: {len(path)} samples from "
+                f"{len(self.keyframes)} keyframes in "
+                f"{(time.perf_counter() - start_time) * 1000:.1f} ms"
+            )
+        return path
+
     def start_cinematic_playback(
         self, duration: Optional[float] = None, loop: bool = False
     ):
@@ -648,8 +1054,9 @@ class CameraController(QObject):
             self.cinematic_duration = duration
         else:
             self.cinematic_duration = max(kf.time for kf in self.keyframes)
+        self.compile_camera_path(self.cinematic_duration)
 
-        self.animation_timer.start(16)  # ~60 FPS
+        self.frame_clock.start(self._on_frame_tick)
         self.modeChanged.emit(self.mode.value)
 
         print(f"📷 Started cinematic playback: {self.cinematic_duration:.1f}s")
@@ -669,47 +1076,20 @@ class CameraController(QObject):
                 self.stop_cinematic_playback()
                 return
 
-        # Find surrounding keyframes
-        prev_keyframe = None
-        next_keyframe = None
-
-        for keyframe in self.keyframes:
-            if keyframe.time <= self.cinematic_time:
-                prev_keyframe = keyframe
-            elif keyframe.time > self.cinematic_time and next_keyframe is None:
-                next_keyframe = keyframe
-                break
-
-        if prev_keyframe and next_keyframe:
-            # Interpolate between keyframes
-            time_span = next_keyframe.time - prev_keyframe.time
-            local_progress = (self.cinematic_time - prev_keyframe.time) / time_span
-
-            # Apply easing from next keyframe
-            if next_keyframe.easing == QEasingCurve.Type.InOutCubic:
-                eased_progress = SmoothAnimator.ease_in_out_cubic(local_progress)
-            elif next_keyframe.easing == QEasingCurve.Type.InOutQuart:
-                eased_progress = SmoothAnimator.ease_in_out_quart(local_progress)
-            elif next_keyframe.easing == QEasingCurve.Type.OutElastic:
-                eased_progress = SmoothAnimator.ease_elastic_out(local_progress)
-            else:
-                eased_progress = local_progress
-
-            # Interpolate all camera properties
-            self._interpolate_between_states(
-                prev_keyframe.state, next_keyframe.state, eased_progress
-            )
-
-        elif prev_keyframe:
-            # Use the last keyframe
-            self._copy_state(prev_keyframe.state, self.current_state)
+        # Indexed lookup into the pre-sampled path
+        path = self.compiled_path or self.compile_camera_path(self.cinematic_duration)
+        i = path.index_at(self.cinematic_time)
+        self.current_state.distance = float(path.distance[i])
+        self.current_state.azimuth = float(path.azimuth[i])
+        self.current_state.elevation = float(path.elevation[i])
+        self.current_state.fov = float(path.fov[i])
+        self.current_state.target = path.targets[i].copy()
 
         self.cameraChanged.emit()
 
     def stop_cinematic_playback(self):
         """Stop cinematic camera playback"""
         self.mode = CameraMode.ORBIT
-        self.animation_timer.stop()
         self.modeChanged.emit(self.mode.value)
         print("📷 Stopped cinematic playback")
 
@@ -742,19 +1122,26 @@ class CameraController(QObject):
 
     def frame_data(self, data_points: List[np.ndarray], margin: float = 1.5):
         """Automatically frame camera to view all data points"""
-        if not data_points:
+        if len(data_points) == 0:
+            return
+
+        # Drop non-finite points, then frame their bounding box
+        all_points = np.asarray(data_points, dtype=np.float64).reshape(-1, 3)
+        all_points = all_points[np.isfinite(all_points).all(axis=1)]
+        if not len(all_points):
             return
 
-        # Filter valid points
-        valid_points = [p for p in data_points if np.isfinite(p).all()]
-        if not valid_points:
+        self.frame_bounds(all_points.min(axis=0), all_points.max(axis=0), margin)
+
+    def frame_bounds(
+        self, bounds_min: np.ndarray, bounds_max: np.ndarray, margin: float = 1.5
+    ):
+        """Frame the camera on an axis-aligned box (e.g. from SwingBounds)"""
+        if not (np.isfinite(bounds_min).all() and np.isfinite(bounds_max).all()):
             return
 
-        # Calculate bounding box
-        all_points = np.array(valid_points)
-        center = np.mean(all_points, axis=0)
-        extents = np.max(all_points, axis=0) - np.min(all_points, axis=0)
-        max_extent = np.max(extents)
+        center = (np.asarray(bounds_min) + np.asarray(bounds_max)) * 0.5
+        max_extent = np.max(np.asarray(bounds_max) - np.asarray(bounds_min))
 
         # Set target to center of data
         self.current_state.target = center.astype(np.float32)
@@ -774,8 +1161,23 @@ class CameraController(QObject):
             f"📷 Auto-framed data: center={center}, distance={self.current_state.distance:.2f}"
         )
 
+    def set_follow_track(self, track: Optional[FollowTrack]):
+        """Use a precomputed track for follow mode (None for live smoothing)"""
+        self.follow_track = track
+
+    def follow_frame(self, frame_idx: int):
+        """Move the target to the follow track at a frame (follow mode only)"""
+        if self.mode != CameraMode.FOLLOW or self.follow_track is None:
+            return
+        self.current_state.target = self.follow_track.target_at_frame(frame_idx).copy()
+        self.cameraChanged.emit()
+
     def follow_point(self, point: np.ndarray, smooth_factor: float = 0.1):
-        """Smoothly follow a moving point"""
+        """Smoothly follow a moving point.
+
+        Live exponential smoothing lags fast motion and depends on frame rate;
+        prefer set_follow_track/follow_frame when the whole swing is loaded.
+        """
         if self.mode != CameraMode.FOLLOW:
             return
 
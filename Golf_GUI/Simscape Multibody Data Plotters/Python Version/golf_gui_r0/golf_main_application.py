@@ -4,12 +4,18 @@ Golf Swing Visualizer - Main Application Entry Point
 Complete integration of all components with enhanced features and error handling
 """
 
+import copy
+import itertools
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 import traceback
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -23,8 +29,8 @@ logger = logging.getLogger(__name__)
 
 # Import PyQt6 with error handling
 try:
-    from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
-    from PyQt6.QtGui import QFont, QPixmap
+    from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+    from PyQt6.QtGui import QAction, QFont, QKeySequence, QPixmap
     from PyQt6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 except ImportError as e:
     print("❌ PyQt6 not found. Please install it with: pip install PyQt6")
@@ -41,12 +47,21 @@ except ImportError as e:
 
 # Import core modules with error handling
 try:
-    from golf_camera_system import CameraController, CameraMode, CameraPreset
+    from golf_camera_system import (CameraController, CameraMode, CameraPreset,
+                                    get_follow_track)
     from golf_data_core import (FrameProcessor, MatlabDataLoader,
                                 PerformanceStats, RenderConfig)
+    from golf_data_export import (EXPORT_FORMATS, DataExportOptions,
+                                  export_datasets)
     from golf_gui_application import (GolfVisualizerMainWindow,
                                       GolfVisualizerWidget)
+    from golf_metrics import (MetricsSampler, export_chrome_trace,
+                              export_jsonl, get_metrics)
     from golf_opengl_renderer import OpenGLRenderer
+    from golf_plugins import PluginRegistry
+    from golf_session_snapshot import (StaleSnapshotError,
+                                       load_session_snapshot,
+                                       save_session_snapshot)
 except ImportError as e:
     logger.error(f"Failed to import core modules: {e}")
     print(
@@ -174,67 +189,61 @@ class EnhancedGolfVisualizerApp(QApplication):
                 )
 
 
-class PerformanceMonitor(QThread):
-    """Background performance monitoring"""
+class PerformanceMonitor(QObject):
+    """Background performance monitoring.
+
+    Wraps a MetricsSampler: process CPU/RSS, render FPS and frame-time
+    percentiles are sampled without blocking and forwarded to the UI.
+    """
 
     performanceUpdate = pyqtSignal(dict)
 
-    def __init__(self):
+    def __init__(self, rate_hz: float = 1.0, jsonl_path: Optional[str] = None):
         super().__init__()
-        self.monitoring = False
-        self.stats = {
-            "cpu_usage": 0.0,
-            "memory_usage": 0.0,
-            "gpu_usage": 0.0,
-            "frame_rate": 0.0,
-        }
+        self.sampler = MetricsSampler(rate_hz=rate_hz, jsonl_path=jsonl_path)
+        # Emitted on the sampler thread; Qt queues it to connected slots
+        self.sampler.add_listener(self.performanceUpdate.emit)
+
+    @property
+    def stats(self) -> Dict:
+        """Most recent sample"""
+        return self.sampler.samples[-1] if self.sampler.samples else {}
 
     def start_monitoring(self):
         """Start performance monitoring"""
-        self.monitoring = True
-        self.start()
-        logger.info("Performance monitoring started")
+        self.sampler.start()
+        logger.info(f"Performance monitoring started ({self.sampler.rate_hz:g} Hz)")
 
     def stop_monitoring(self):
         """Stop performance monitoring"""
-        self.monitoring = False
-        self.wait()
+        self.sampler.stop()
         logger.info("Performance monitoring stopped")
 
-    def run(self):
-        """Performance monitoring loop"""
-        while self.monitoring:
-            try:
-                # Update performance stats (simplified implementation)
-                import psutil
-
-                self.stats["cpu_usage"] = psutil.cpu_percent(interval=1)
-                self.stats["memory_usage"] = psutil.virtual_memory().percent
-
-                # GPU usage would require additional libraries (pynvml, etc.)
-                self.stats["gpu_usage"] = 0.0
-
-                self.performanceUpdate.emit(self.stats.copy())
-
-            except Exception as e:
-                logger.warning(f"Performance monitoring error: {e}")
-
-            self.msleep(1000)  # Update every second
+    def export_trace(self, path: str) -> Path:
+        """Write samples as JSON lines (.jsonl) or a Chrome trace (.json)"""
+        if Path(path).suffix.lower() == ".jsonl":
+            return export_jsonl(self.sampler.samples, path)
+        return export_chrome_trace(path, get_metrics(), self.sampler.samples)
 
 
 class EnhancedMainWindow(GolfVisualizerMainWindow):
     """Enhanced main window with additional features"""
 
+    pluginsFinished = pyqtSignal(object)  # Dict[str, PluginResult]
+
     def __init__(self):
         super().__init__()
 
         # Enhanced camera system
         self.camera_controller = CameraController()
+        self._followed_frame: Optional[int] = None
         self._integrate_camera_system()
 
         # Advanced features
         self.session_manager = SessionManager()
         self.export_manager = ExportManager()
+        self.export_manager.jobProgress.connect(self._on_export_progress)
+        self.export_manager.jobFinished.connect(self._on_export_finished)
         self.plugin_manager = PluginManager()
 
         # Enhanced status tracking
@@ -249,7 +258,10 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
         """Integrate advanced camera system"""
         if hasattr(self.gl_widget, "camera_controller"):
             # Replace the basic camera with our advanced system
-            self.gl_widget.camera_controller = self.camera_controller
+            if hasattr(self.gl_widget, "set_camera_controller"):
+                self.gl_widget.set_camera_controller(self.camera_controller)
+            else:
+                self.gl_widget.camera_controller = self.camera_controller
 
             # Connect camera signals
             self.camera_controller.cameraChanged.connect(self.gl_widget.update)
@@ -257,6 +269,8 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
             self.camera_controller.animationFinished.connect(
                 self._on_camera_animation_finished
             )
+            # Playback advances on the frame clock; follow the playhead after it
+            self.camera_controller.frame_clock.ticked.connect(self._sync_follow_camera)
 
         # Add camera preset menu
         self._add_camera_preset_menu()
@@ -302,12 +316,42 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
         # Add toolbar extensions
         self._add_enhanced_toolbar()
 
+        # Session snapshot actions in the File menu
+        self._add_snapshot_menu_actions()
+
         # Setup keyboard shortcuts
         self._setup_enhanced_shortcuts()
 
         # Setup status monitoring
         self._setup_status_monitoring()
 
+        # Plugins are only listed here; each is imported when it first runs
+        self.plugin_manager.load_plugins()
+        self.pluginsFinished.connect(self._on_plugins_finished)
+
+    def _add_snapshot_menu_actions(self):
+        """Add Save/Open Session Snapshot to the File menu, above Exit"""
+        file_menu = None
+        for action in self.menuBar().actions():
+            if action.menu() is not None and action.text() == "File":
+                file_menu = action.menu()
+                break
+        if file_menu is None:
+            file_menu = self.menuBar().addMenu("File")
+
+        actions = file_menu.actions()
+        # The base File menu ends with a separator and Exit
+        before = actions[-2] if len(actions) >= 2 else None
+
+        open_action = QAction("Open Session Snapshot...", self)
+        open_action.triggered.connect(self._open_snapshot_dialog)
+        save_action = QAction("Save Session Snapshot...", self)
+        save_action.setShortcut(QKeySequence.StandardKey.Save)
+        save_action.triggered.connect(self._save_snapshot_dialog)
+
+        file_menu.insertAction(before, open_action)
+        file_menu.insertAction(before, save_action)
+
     def _add_enhanced_toolbar(self):
         """Add enhanced toolbar with additional controls"""
         toolbar = self.findChild(object, "MainToolBar")  # Find existing toolbar
@@ -329,9 +373,13 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
             export_action.setToolTip("Export Data/Video")
             export_action.triggered.connect(self._show_export_dialog)
 
+            cancel_export_action = toolbar.addAction("⏹")
+            cancel_export_action.setToolTip("Cancel Exports")
+            cancel_export_action.triggered.connect(self._cancel_exports)
+
     def _setup_enhanced_shortcuts(self):
         """Setup enhanced keyboard shortcuts"""
-        from PyQt6.QtGui import QKeySequence, QShortcut
+        from PyQt6.QtGui import QShortcut
 
         # Camera presets (F1-F7)
         presets = list(CameraPreset)
@@ -390,40 +438,10 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
             if success:
                 # Create new session
                 self.current_session = self.session_manager.create_session(file_paths)
-
-                # Initialize camera framing
-                if self.gl_widget.frame_processor:
-                    sample_frames = [
-                        0,
-                        self.gl_widget.num_frames // 4,
-                        self.gl_widget.num_frames // 2,
-                        3 * self.gl_widget.num_frames // 4,
-                        self.gl_widget.num_frames - 1,
-                    ]
-
-                    data_points = []
-                    for frame_idx in sample_frames:
-                        frame_data = self.gl_widget.frame_processor.get_frame_data(
-                            frame_idx
-                        )
-                        data_points.extend(
-                            [
-                                frame_data.butt,
-                                frame_data.clubhead,
-                                frame_data.midpoint,
-                                frame_data.left_shoulder,
-                                frame_data.right_shoulder,
-                            ]
-                        )
-
-                    self.camera_controller.frame_data(data_points, margin=1.8)
-
-                # Update UI
-                self.playback_panel.update_num_frames(self.gl_widget.num_frames)
-                self.statusBar().showMessage(
-                    f"Loaded {self.gl_widget.num_frames} frames from {len(file_paths)} files"
+                self._on_swing_loaded(
+                    f"Loaded {self.gl_widget.num_frames} frames "
+                    f"from {len(file_paths)} files"
                 )
-
                 logger.info(
                     f"Successfully loaded data: {self.gl_widget.num_frames} frames"
                 )
@@ -437,6 +455,79 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
 
         return False
 
+    def save_session_snapshot(self, directory: str) -> bool:
+        """Save the current session with its preprocessed data"""
+        if not self.current_session or not self.gl_widget.frame_processor:
+            return False
+        try:
+            self.session_manager.save_snapshot(
+                self.current_session, directory, self.gl_widget.frame_processor
+            )
+            self.statusBar().showMessage(f"Session snapshot saved: {directory}")
+            return True
+        except Exception as e:
+            logger.error(f"Session snapshot failed: {e}")
+            return False
+
+    def open_session_snapshot(self, directory: str) -> bool:
+        """Reopen a session snapshot, reloading the MAT files only if they changed"""
+        try:
+            session_id, frame_processor = self.session_manager.open_snapshot(
+                directory
+            )
+        except StaleSnapshotError as e:
+            logger.info(f"{e}; reloading the source files")
+            return self.load_data_files(e.session.get("data_files", []))
+        except Exception as e:
+            logger.error(f"Failed to open session snapshot: {e}")
+            return False
+
+        self.current_session = session_id
+        self.gl_widget.set_frame_processor(frame_processor)
+        self._on_swing_loaded(
+            f"Opened session {session_id}: {frame_processor.num_frames} frames"
+        )
+        return True
+
+    def _on_swing_loaded(self, message: str):
+        """Steps shared by every load path once gl_widget has the new swing"""
+        frame_processor = self.gl_widget.frame_processor
+        if frame_processor:
+            # Frame the whole swing from its precomputed bounds
+            bounds = frame_processor.get_bounds()
+            self.camera_controller.frame_bounds(*bounds.range_bounds(), margin=1.8)
+            self.camera_controller.set_follow_track(get_follow_track(frame_processor))
+            self._followed_frame = None
+
+        # Update UI
+        self.playback_panel.update_num_frames(self.gl_widget.num_frames)
+        self.statusBar().showMessage(message)
+
+    def _save_snapshot_dialog(self):
+        """Ask for a directory and snapshot the current session into it"""
+        from PyQt6.QtWidgets import QFileDialog
+
+        if not self.current_session or not self.gl_widget.frame_processor:
+            QMessageBox.information(self, "Info", "Please load data first")
+            return
+        directory, _ = QFileDialog.getSaveFileName(
+            self, "Save Session Snapshot", f"session_{self.current_session}"
+        )
+        if directory and not self.save_session_snapshot(directory):
+            QMessageBox.warning(
+                self, "Snapshot Error", f"Could not save snapshot:\n{directory}"
+            )
+
+    def _open_snapshot_dialog(self):
+        """Ask for a snapshot directory and reopen it"""
+        from PyQt6.QtWidgets import QFileDialog
+
+        directory = QFileDialog.getExistingDirectory(self, "Open Session Snapshot")
+        if directory and not self.open_session_snapshot(directory):
+            QMessageBox.warning(
+                self, "Snapshot Error", f"Could not open snapshot:\n{directory}"
+            )
+
     # ========================================================================
     # ENHANCED FEATURE IMPLEMENTATIONS
     # ========================================================================
@@ -445,6 +536,23 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
         """Handle camera mode changes"""
         self.statusBar().showMessage(f"Camera mode: {mode}")
         logger.info(f"Camera mode changed to: {mode}")
+        if mode == CameraMode.FOLLOW.value and self.gl_widget.frame_processor:
+            self.camera_controller.follow_frame(self.gl_widget.current_frame)
+
+    def _set_frame(self, frame_idx: int):
+        """Show a frame and keep the follow camera on its track"""
+        self.gl_widget.set_frame(frame_idx)
+        self._followed_frame = frame_idx
+        self.camera_controller.follow_frame(frame_idx)
+
+    def _sync_follow_camera(self, now: float, dt: float):
+        """Move the follow camera when playback has changed the frame"""
+        if not self.gl_widget.frame_processor:
+            return
+        frame_idx = self.gl_widget.current_frame
+        if frame_idx != self._followed_frame:
+            self._followed_frame = frame_idx
+            self.camera_controller.follow_frame(frame_idx)
 
     def _on_camera_animation_finished(self):
         """Handle camera animation completion"""
@@ -490,9 +598,9 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
             (10.0, CameraPreset.DEFAULT),
         ]
 
-        for time, preset in presets_tour:
+        for keyframe_time, preset in presets_tour:
             state = self.camera_controller.presets[preset]
-            self.camera_controller.add_keyframe(time, state)
+            self.camera_controller.add_keyframe(keyframe_time, state)
 
         # Start cinematic playback
         self.camera_controller.start_cinematic_playback(duration=10.0, loop=False)
@@ -503,13 +611,40 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
         if self.gl_widget.frame_processor:
             new_frame = self.gl_widget.current_frame + delta
             new_frame = max(0, min(new_frame, self.gl_widget.num_frames - 1))
-            self.gl_widget.set_frame(new_frame)
+            self._set_frame(new_frame)
 
     def _toggle_realtime_analysis(self):
         """Toggle real-time analysis display"""
         # This would toggle additional analysis overlays
         self.statusBar().showMessage("Real-time analysis toggled")
         logger.info("Real-time analysis toggled")
+        self._run_analysis_plugins()
+
+    def _run_analysis_plugins(self):
+        """Run the analysis plugins on the loaded swing without blocking the UI"""
+        frame_processor = self.gl_widget.frame_processor
+        if not frame_processor or not self.plugin_manager.plugins:
+            return
+
+        def run():
+            try:
+                self.pluginsFinished.emit(
+                    self.plugin_manager.run_plugins(frame_processor)
+                )
+            except Exception as e:
+                logger.error(f"Plugin run failed: {e}")
+
+        threading.Thread(target=run, name="PluginRun", daemon=True).start()
+
+    def _on_plugins_finished(self, results: Dict):
+        failed = [name for name, result in results.items() if not result.ok]
+        self.analysis_results.update(
+            {name: result.outputs for name, result in results.items() if result.ok}
+        )
+        message = f"Analysis plugins finished: {len(results) - len(failed)} ok"
+        if failed:
+            message += f", failed: {', '.join(failed)}"
+        self.statusBar().showMessage(message)
 
     def _toggle_measurement_mode(self):
         """Toggle measurement/annotation mode"""
@@ -545,7 +680,15 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
         layout.addWidget(QLabel("Export Type:"))
         export_combo = QComboBox()
         export_combo.addItems(
-            ["Video (MP4)", "Image Sequence", "Data (CSV)", "3D Model"]
+            [
+                "Video (MP4)",
+                "Image Sequence",
+                "Data (CSV)",
+                "Data (Parquet)",
+                "Data (Feather)",
+                "Data (HDF5)",
+                "3D Model",
+            ]
         )
         layout.addWidget(export_combo)
 
@@ -590,9 +733,116 @@ class EnhancedMainWindow(GolfVisualizerMainWindow):
         export_btn.clicked.connect(dialog.accept)
         cancel_btn.clicked.connect(dialog.reject)
 
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.statusBar().showMessage("Export started...")
-            logger.info("Export dialog accepted")
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+
+        job = self._build_export_job(
+            export_combo.currentText(),
+            quality_combo.currentText(),
+            start_spin.value(),
+            end_spin.value(),
+        )
+        if job is None:
+            return
+        self.export_manager.submit(job)
+        self.statusBar().showMessage(f"Export queued: {job.output_path}")
+        logger.info(f"Export queued: {job.kind} -> {job.output_path}")
+
+    def _build_export_job(
+        self, export_type: str, quality: str, start: int, end: int
+    ) -> Optional["ExportJob"]:
+        """Turn the export dialog choices into a background job"""
+        from PyQt6.QtWidgets import QFileDialog
+
+        frame_processor = self.gl_widget.frame_processor
+        if not frame_processor:
+            self.statusBar().showMessage("No data loaded to export")
+            return None
+        if export_type == "3D Model":
+            self.statusBar().showMessage("3D model export is not supported yet")
+            return None
+
+        start, end = min(start, end), max(start, end)
+        if export_type.startswith("Data"):
+            format_name = export_type[len("Data (") : -1]
+            data_format = format_name.lower()
+            extension = EXPORT_FORMATS[data_format]
+            output_path, _ = QFileDialog.getSaveFileName(
+                self,
+                "Export Data",
+                f"golf_swing_data{extension}",
+                f"{format_name} Files (*{extension})",
+            )
+            if not output_path:
+                return None
+            # All three datasets, streamed from the loaded swing in row chunks
+            return ExportJob(
+                kind="data",
+                output_path=output_path,
+                data=frame_processor,
+                format=data_format,
+                data_options=DataExportOptions(
+                    format=data_format, start=start, stop=end + 1
+                ),
+            )
+
+        if export_type == "Video (MP4)":
+            output_path, _ = QFileDialog.getSaveFileName(
+                self, "Export Video", "golf_swing.mp4", "MP4 Video (*.mp4)"
+            )
+            kind = "video"
+        else:
+            output_path = QFileDialog.getExistingDirectory(self, "Export Images")
+            kind = "images"
+        if not output_path:
+            return None
+
+        # Frozen at the active filter; the export thread builds its own frames
+        frames = frame_processor.capture_frames(start, end + 1)
+        frame_range = range(frames.start, frames.stop)
+        width, height = EXPORT_RESOLUTIONS.get(quality, EXPORT_RESOLUTIONS["720p"])
+        render_config = getattr(self.gl_widget, "current_render_config", None)
+        # In follow mode the export camera tracks the same smoothed targets
+        camera_targets = None
+        follow_track = self.camera_controller.follow_track
+        if self.camera_controller.mode == CameraMode.FOLLOW and follow_track:
+            camera_targets = np.array(
+                [follow_track.target_at_frame(i) for i in frame_range],
+                dtype=np.float32,
+            )
+        return ExportJob(
+            kind=kind,
+            output_path=output_path,
+            frames=frame_range,
+            get_frame=frames.get_frame_data,
+            render_config=copy.deepcopy(render_config),
+            camera_targets=camera_targets,
+            width=width,
+            height=height,
+        )
+
+    def _on_export_progress(self, job: "ExportJob"):
+        eta = f", {job.eta_s:.0f}s left" if job.eta_s is not None else ""
+        self.statusBar().showMessage(
+            f"Exporting {Path(job.output_path).name}: "
+            f"{job.done}/{job.total} ({job.progress * 100:.0f}%{eta})"
+        )
+
+    def _on_export_finished(self, job: "ExportJob"):
+        name = Path(job.output_path).name
+        if job.status == "done":
+            self.statusBar().showMessage(
+                f"Export finished: {name} ({job.elapsed_s:.1f}s)"
+            )
+        elif job.status == "cancelled":
+            self.statusBar().showMessage(f"Export cancelled: {name}")
+        else:
+            self.statusBar().showMessage(f"Export failed: {name} ({job.error})")
+
+    def _cancel_exports(self):
+        cancelled = self.export_manager.cancel_all()
+        if cancelled:
+            self.statusBar().showMessage(f"Cancelling {cancelled} export(s)...")
 
     def _update_enhanced_status(self):
         """Update enhanced status information"""
@@ -660,53 +910,495 @@ class SessionManager:
             logger.error(f"Failed to load session: {e}")
             return None
 
+    def save_snapshot(self, session_id: str, directory: str, frame_processor):
+        """Save a session together with its preprocessed swing data.
 
-class ExportManager:
-    """Manage various export functionalities"""
+        The snapshot directory holds a JSON manifest and one .npy file per
+        array, which are memory-mapped when the snapshot is reopened.
+        """
+        session = self.sessions[session_id]
+        save_session_snapshot(
+            directory, frame_processor, session, session.get("data_files", [])
+        )
+        logger.info(f"Session snapshot saved: {directory}")
 
-    def __init__(self):
-        self.export_queue: List[Dict] = []
-        self.is_exporting = False
+    def open_snapshot(self, directory: str) -> Tuple[str, FrameProcessor]:
+        """Reopen a snapshot; raises StaleSnapshotError if a source changed"""
+        snapshot = load_session_snapshot(directory)
+        session_id = snapshot.session["id"]
+        self.sessions[session_id] = snapshot.session
+        self.current_session = session_id
+        logger.info(
+            f"Session snapshot opened: {session_id} "
+            f"({snapshot.load_time_s * 1000:.0f} ms)"
+        )
+        return session_id, snapshot.frame_processor
+
+
+# Width and height for the export dialog's quality choices
+EXPORT_RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "Custom": (1280, 720),
+}
+
+_export_job_ids = itertools.count(1)
+
+
+class _ExportCancelled(Exception):
+    pass
+
+
+@dataclass
+class ExportJob:
+    """One video, image sequence or data export.
+
+    ``frames`` holds FrameData objects, or keys (e.g. frame indices) that
+    ``get_frame`` turns into FrameData on the export thread.
+    """
+
+    kind: str  # "video", "images" or "data"
+    output_path: str
+    frames: Sequence = ()
+    get_frame: Optional[Callable[[Any], Any]] = None
+    render_config: Any = None
+    camera_targets: Optional[np.ndarray] = None  # Per-frame look-at points
+    data: Any = None  # Swing store, processor, DataFrame or dict of columns
+    data_options: Optional[DataExportOptions] = None
+    fps: int = 30
+    width: int = 1280
+    height: int = 720
+    format: str = "png"  # "png" for images; csv/parquet/feather/hdf5 for data
+
+    job_id: int = field(default_factory=lambda: next(_export_job_ids))
+    status: str = "queued"  # queued, running, done, failed or cancelled
+    done: int = 0
+    total: int = 0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+    result: Any = None
+    _cancel_event: threading.Event = field(
+        default_factory=threading.Event, repr=False
+    )
 
-    def export_video(self, frames: List, output_path: str, fps: int = 30):
-        """Export frames as video"""
-        # This would use OpenCV or similar to create video
-        logger.info(f"Exporting video: {output_path}")
+    def cancel(self):
+        self._cancel_event.set()
 
-    def export_data(self, data: Dict, output_path: str, format: str = "csv"):
-        """Export analysis data"""
-        if format.lower() == "csv":
-            import pandas as pd
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+    @property
+    def elapsed_s(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def eta_s(self) -> Optional[float]:
+        """Seconds left at the average rate so far"""
+        if not self.done or self.is_finished:
+            return None
+        return self.elapsed_s / self.done * (self.total - self.done)
+
+
+class ExportManager(QObject):
+    """Run exports one after another on a background thread.
+
+    Rendering and encoding form a producer/consumer pipeline: the export
+    thread renders frames into a bounded buffer that encoder threads drain,
+    so memory stays flat and the renderer never waits on a slow encoder
+    for longer than the buffer allows.
+    """
+
+    jobQueued = pyqtSignal(object)
+    jobProgress = pyqtSignal(object)
+    jobFinished = pyqtSignal(object)
 
-            df = pd.DataFrame(data)
-            df.to_csv(output_path, index=False)
-        logger.info(f"Exported data: {output_path}")
+    def __init__(
+        self,
+        buffer_frames: int = 8,
+        encoder_threads: int = min(4, os.cpu_count() or 1),
+        progress_interval: float = 0.1,
+    ):
+        super().__init__()
+        self.buffer_frames = buffer_frames
+        self.encoder_threads = max(1, encoder_threads)
+        self.progress_interval = progress_interval
+
+        self.export_queue: List[ExportJob] = []
+        self.current_job: Optional[ExportJob] = None
+        self._jobs: "queue.Queue[ExportJob]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._last_progress = 0.0
+
+    @property
+    def is_exporting(self) -> bool:
+        return self.current_job is not None or bool(self.export_queue)
+
+    # ------------------------------------------------------------------
+    # Queue
+    # ------------------------------------------------------------------
+
+    def submit(self, job: ExportJob) -> ExportJob:
+        """Queue a job for the export thread and return immediately"""
+        with self._lock:
+            self.export_queue.append(job)
+            # Enqueue under the lock: an idle worker only exits after checking
+            # the queue under the same lock, so it cannot strand this job
+            self._jobs.put(job)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._worker_loop, name="ExportWorker", daemon=True
+                )
+                self._worker.start()
+        self.jobQueued.emit(job)
+        return job
+
+    def cancel_all(self) -> int:
+        """Cancel the running job and everything queued behind it"""
+        with self._lock:
+            jobs = list(self.export_queue)
+            if self.current_job is not None:
+                jobs.append(self.current_job)
+        for job in jobs:
+            job.cancel()
+        return len(jobs)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the queue is empty; True unless the timeout ran out"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.is_exporting:
+            if deadline is not None and time.perf_counter() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _worker_loop(self):
+        while True:
+            try:
+                job = self._jobs.get(timeout=1.0)
+            except queue.Empty:
+                with self._lock:
+                    # Exit when idle; submit() starts a new worker
+                    if self._jobs.empty():
+                        self._worker = None
+                        return
+                continue
+            with self._lock:
+                self.export_queue.remove(job)
+                self.current_job = job
+            try:
+                self.run_job(job)
+            finally:
+                with self._lock:
+                    self.current_job = None
+
+    # ------------------------------------------------------------------
+    # Running jobs
+    # ------------------------------------------------------------------
+
+    def run_job(self, job: ExportJob) -> ExportJob:
+        """Run a job on the calling thread, reporting through the signals"""
+        job.started = time.perf_counter()
+        job.status = "running"
+        try:
+            if job.is_cancelled:
+                raise _ExportCancelled()
+            if job.kind == "video":
+                self._run_video(job)
+            elif job.kind == "images":
+                self._run_images(job)
+            elif job.kind == "data":
+                self._run_data(job)
+            else:
+                raise ValueError(f"Unknown export kind: {job.kind}")
+            job.status = "cancelled" if job.is_cancelled else "done"
+        except _ExportCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"Export failed ({job.output_path}): {e}")
+        job.finished = time.perf_counter()
+
+        if job.status == "done":
+            logger.info(
+                f"Exported {job.kind}: {job.output_path} "
+                f"({job.done} items in {job.elapsed_s:.1f}s)"
+            )
+        elif job.status == "cancelled":
+            logger.info(f"Export cancelled: {job.output_path}")
+        self.jobFinished.emit(job)
+        return job
+
+    def _advance(self, job: ExportJob, count: int = 1):
+        """Count finished items and emit throttled progress"""
+        with self._lock:
+            job.done += count
+            now = time.perf_counter()
+            if (
+                now - self._last_progress < self.progress_interval
+                and job.done < job.total
+            ):
+                return
+            self._last_progress = now
+        self.jobProgress.emit(job)
+
+    def _run_pipeline(
+        self,
+        job: ExportJob,
+        consume: Callable[[int, np.ndarray], None],
+        consumers: int = 1,
+    ):
+        """Render job.frames on this thread while ``consumers`` threads encode.
+
+        With a single consumer frames are encoded in order. The first error
+        on either side stops the pipeline and is re-raised here.
+        """
+        from golf_headless_renderer import HeadlessRenderer
+
+        buffer: "queue.Queue[Optional[Tuple[int, np.ndarray]]]" = queue.Queue(
+            maxsize=self.buffer_frames
+        )
+        abort = threading.Event()
+        errors: List[BaseException] = []
+
+        def stopped() -> bool:
+            return abort.is_set() or job.is_cancelled
+
+        def encode():
+            while True:
+                item = buffer.get()
+                if item is None:
+                    return
+                if stopped():
+                    continue  # Drain so the producer never blocks
+                try:
+                    consume(*item)
+                except Exception as e:
+                    errors.append(e)
+                    abort.set()
+                else:
+                    self._advance(job)
+
+        threads = [
+            threading.Thread(target=encode, name=f"ExportEncoder{i}", daemon=True)
+            for i in range(consumers)
+        ]
+        for thread in threads:
+            thread.start()
 
-    def export_images(self, frames: List, output_dir: str, format: str = "png"):
+        # The renderer's GL context belongs to this thread
+        renderer = HeadlessRenderer(job.width, job.height)
+        try:
+            for index, item in enumerate(job.frames):
+                if stopped():
+                    break
+                frame = job.get_frame(item) if job.get_frame else item
+                if index == 0:
+                    renderer.frame_camera(frame)
+                if job.camera_targets is not None:
+                    renderer.camera_target = job.camera_targets[index]
+                image = renderer.render(frame, job.render_config)
+                while not stopped():
+                    try:
+                        buffer.put((index, image), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            errors.append(e)
+            abort.set()
+        finally:
+            for _ in threads:
+                buffer.put(None)
+            for thread in threads:
+                thread.join()
+            renderer.release()
+
+        if errors:
+            raise errors[0]
+        if job.is_cancelled:
+            raise _ExportCancelled()
+
+    def _run_video(self, job: ExportJob):
+        import shutil
+        import subprocess
+
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg not found on PATH, cannot export video")
+        if not job.frames:
+            raise ValueError("No frames to export")
+
+        job.total = len(job.frames)
+        command = [
+            ffmpeg,
+            "-y",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            f"{job.width}x{job.height}",
+            "-r",
+            str(job.fps),
+            "-i",
+            "-",
+            "-pix_fmt",
+            "yuv420p",
+            job.output_path,
+        ]
+        process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        try:
+            # One encoder keeps the frames in order on the pipe
+            self._run_pipeline(
+                job, lambda index, image: process.stdin.write(image.tobytes())
+            )
+            process.stdin.close()
+            if process.wait() != 0:
+                raise RuntimeError("ffmpeg failed encoding the video")
+        except BaseException:
+            process.kill()
+            process.wait()
+            Path(job.output_path).unlink(missing_ok=True)
+            raise
+        job.result = Path(job.output_path)
+
+    def _run_images(self, job: ExportJob):
+        from golf_headless_renderer import write_png
+
+        if job.format.lower() != "png":
+            raise ValueError(f"Unsupported image format: {job.format}")
+
+        output = Path(job.output_path)
+        output.mkdir(parents=True, exist_ok=True)
+        job.total = len(job.frames)
+        paths = [output / f"frame_{i:06d}.png" for i in range(job.total)]
+
+        # zlib releases the GIL, so PNG encoding scales across threads
+        self._run_pipeline(
+            job,
+            lambda index, image: write_png(paths[index], image),
+            consumers=self.encoder_threads,
+        )
+        job.result = paths
+
+    def _run_data(self, job: ExportJob):
+        options = job.data_options or DataExportOptions(format=job.format.lower())
+
+        def on_progress(rows: int, total: int):
+            job.total = total
+            self._advance(job, rows - job.done)
+
+        result = export_datasets(
+            job.data,
+            job.output_path,
+            options,
+            should_stop=lambda: job.is_cancelled,
+            on_progress=on_progress,
+        )
+        if not result.completed:
+            raise _ExportCancelled()
+        job.result = result.path
+
+    # ------------------------------------------------------------------
+    # Blocking helpers
+    # ------------------------------------------------------------------
+
+    def export_video(
+        self,
+        frames: List,
+        output_path: str,
+        fps: int = 30,
+        width: int = 1280,
+        height: int = 720,
+    ) -> bool:
+        """Export frames as video by piping offscreen renders into ffmpeg"""
+        job = ExportJob(
+            "video", output_path, frames, fps=fps, width=width, height=height
+        )
+        return self.run_job(job).status == "done"
+
+    def export_data(self, data: Dict, output_path: str, format: str = "csv"):
+        """Export analysis data as csv, parquet, feather or hdf5"""
+        job = self.run_job(ExportJob("data", output_path, data=data, format=format))
+        if job.status == "failed":
+            raise RuntimeError(job.error)
+
+    def export_images(
+        self,
+        frames: List,
+        output_dir: str,
+        format: str = "png",
+        width: int = 1280,
+        height: int = 720,
+    ) -> List[Path]:
         """Export frame sequence as images"""
+        if format.lower() != "png":
+            raise ValueError(f"Unsupported image format: {format}")
+
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        # Export logic here
-        logger.info(f"Exported images to: {output_dir}")
+        if not frames:
+            return []
+
+        job = self.run_job(
+            ExportJob(
+                "images", output_dir, frames, format=format, width=width, height=height
+            )
+        )
+        if job.status == "failed":
+            raise RuntimeError(job.error)
+        return job.result or []
 
 
 class PluginManager:
     """Manage plugins and extensions"""
 
     def __init__(self):
-        self.plugins: Dict[str, object] = {}
+        self.registry = PluginRegistry()
         self.plugin_dir = Path("plugins")
 
+    @property
+    def plugins(self) -> Dict[str, object]:
+        return self.registry.specs
+
     def load_plugins(self):
-        """Load available plugins"""
+        """Find plugins in the plugin directory (imported on first run)"""
         if self.plugin_dir.exists():
             logger.info("Loading plugins...")
-            # Plugin loading logic here
+            self.registry.discover(self.plugin_dir)
 
     def register_plugin(self, name: str, plugin: object):
-        """Register a plugin"""
-        self.plugins[name] = plugin
+        """Register an AnalysisPlugin class or instance"""
+        spec = self.registry.register(plugin)
+        if spec.name != name:
+            # Keep the name the caller registered it under
+            del self.registry.specs[spec.name]
+            spec.name = name
+            self.registry.specs[name] = spec
         logger.info(f"Plugin registered: {name}")
 
+    def run_plugins(
+        self, frame_processor, names: Optional[List[str]] = None, version=None
+    ) -> Dict:
+        """Run plugins in the worker pool; results are cached per dataset version"""
+        return self.registry.run(frame_processor, names, version)
+
 
 # ============================================================================
 # MAIN ENTRY POINT
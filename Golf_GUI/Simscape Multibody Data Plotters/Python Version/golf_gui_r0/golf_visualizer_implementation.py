@@ -7,18 +7,19 @@ Key Technologies:
 - PyQt6 for modern GUI
 - OpenGL 4.3+ for hardware-accelerated rendering
 - ModernGL for simplified OpenGL interface
-- NumPy + Numba for high-performance computations
+- NumPy for vectorized computations
 """
 
 import sys
 import time
+import warnings
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import moderngl as mgl
 import numpy as np
+import pandas as pd
 import scipy.io
-from numba import jit
 from PyQt6.QtCore import *
 from PyQt6.QtOpenGL import *
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
@@ -78,19 +79,86 @@ class RenderConfig:
     trail_length: int = 30
 
 
+@dataclass
+class ColumnStats:
+    """Whole-swing statistics of one vector column (non-finite rows ignored)"""
+
+    count: int
+    min: np.ndarray  # Per component
+    max: np.ndarray
+    mean: np.ndarray
+    norm_min: float
+    norm_max: float
+    norm_p50: float
+    norm_p95: float
+    norm_p99: float
+    norm_rms: float
+
+    @property
+    def robust_max(self) -> float:
+        """Vector length to scale against; ignores single-frame spikes"""
+        return self.norm_p99 if self.norm_p99 > 0 else self.norm_max
+
+
+def compute_vector_stats(vectors: np.ndarray) -> List[ColumnStats]:
+    """Statistics for every column of a (num_frames, num_columns, 3) array"""
+    vectors = np.asarray(vectors, dtype=np.float64)
+    valid = np.isfinite(vectors).all(axis=2)  # (frames, columns)
+    masked = np.where(valid[:, :, None], vectors, np.nan)
+    norms = np.linalg.norm(masked, axis=2)
+    counts = valid.sum(axis=0)
+
+    with warnings.catch_warnings():
+        # Columns without a single valid row produce all-NaN slices
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mins = np.nanmin(masked, axis=0)
+        maxs = np.nanmax(masked, axis=0)
+        means = np.nanmean(masked, axis=0)
+        norm_min = np.nanmin(norms, axis=0)
+        norm_max = np.nanmax(norms, axis=0)
+        p50, p95, p99 = np.nanpercentile(norms, [50, 95, 99], axis=0)
+        rms = np.sqrt(np.nanmean(norms**2, axis=0))
+
+    def value(array, i):
+        return float(np.nan_to_num(array[i]))
+
+    return [
+        ColumnStats(
+            count=int(counts[i]),
+            min=np.nan_to_num(mins[i]).astype(np.float32),
+            max=np.nan_to_num(maxs[i]).astype(np.float32),
+            mean=np.nan_to_num(means[i]).astype(np.float32),
+            norm_min=value(norm_min, i),
+            norm_max=value(norm_max, i),
+            norm_p50=value(p50, i),
+            norm_p95=value(p95, i),
+            norm_p99=value(p99, i),
+            norm_rms=value(rms, i),
+        )
+        for i in range(vectors.shape[1])
+    ]
+
+
 # ============================================================================
 # HIGH-PERFORMANCE DATA PROCESSOR
 # ============================================================================
 
 
 class DataProcessor:
-    """Optimized data loading and processing with Numba acceleration"""
+    """Optimized data loading and processing with precomputed statistics"""
+
+    # Columns drawn as vectors, and what their lengths are scaled against
+    FORCE_COLUMN = "TotalHandForceGlobal"
+    TORQUE_COLUMN = "EquivalentMidpointCoupleGlobal"
 
     def __init__(self):
         self.cache = {}
         self.max_force_magnitude = 1.0
         self.max_torque_magnitude = 1.0
 
+        # Dataset -> column -> statistics, filled once at load time
+        self.column_stats: Dict[str, Dict[str, ColumnStats]] = {}
+
     def load_matlab_data(
         self, baseq_file: str, ztcfq_file: str, delta_file: str
     ) -> Tuple[np.ndarray, ...]:
@@ -108,7 +176,7 @@ class DataProcessor:
             except Exception as e:
                 raise RuntimeError(f"Failed to load {filepath}: {e}")
 
-        self._calculate_scaling_factors(datasets["BASEQ"])
+        self._calculate_scaling_factors(datasets)
         return datasets["BASEQ"], datasets["ZTCFQ"], datasets["DELTAQ"]
 
     def _find_table_variable(self, mat_data: dict, dataset_name: str) -> str:
@@ -124,12 +192,53 @@ class DataProcessor:
             return vars_found[0]
         raise ValueError(f"No valid table found in {dataset_name}")
 
-    @jit(nopython=True)
-    def _calculate_scaling_factors(self, baseq_data: np.ndarray):
-        """Numba-accelerated scaling calculation"""
-        # This would be implemented with proper Numba-compatible data access
-        # For now, using regular NumPy approach
-        pass
+    @staticmethod
+    def _vector_columns(dataset: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """(num_frames, 3) arrays for every column whose cells are all 3-vectors"""
+        columns = {}
+        for column in dataset.columns:
+            values = dataset[column].to_numpy()
+            if not len(values) or values.dtype != object:
+                continue  # Scalar columns
+            try:
+                stacked = np.stack(values).astype(np.float64)
+            except (TypeError, ValueError):
+                continue  # Ragged, missing or non-numeric cells
+            if stacked.shape == (len(values), 3):
+                columns[column] = stacked
+        return columns
+
+    def _calculate_scaling_factors(self, datasets: Dict[str, pd.DataFrame]):
+        """Column statistics for every dataset, and the vector scales from them"""
+        self.column_stats = {}
+        for name, dataset in datasets.items():
+            columns = self._vector_columns(dataset)
+            if not columns:
+                self.column_stats[name] = {}
+                continue
+            stats = compute_vector_stats(np.stack(list(columns.values()), axis=1))
+            self.column_stats[name] = dict(zip(columns, stats))
+
+        self.max_force_magnitude = self._scale_for(self.FORCE_COLUMN)
+        self.max_torque_magnitude = self._scale_for(self.TORQUE_COLUMN)
+        print(
+            f"📊 Vector scales: force {self.max_force_magnitude:.3g}, "
+            f"torque {self.max_torque_magnitude:.3g}"
+        )
+
+    def _scale_for(self, column: str) -> float:
+        """Largest robust length of a column across datasets (1.0 if absent)"""
+        lengths = [
+            stats[column].robust_max
+            for stats in self.column_stats.values()
+            if column in stats
+        ]
+        scale = max(lengths, default=0.0)
+        return scale if scale > 1e-9 else 1.0
+
+    def get_column_stats(self, dataset: str, column: str) -> Optional[ColumnStats]:
+        """Statistics of one vector column (None if it is absent or not 3-vectors)"""
+        return self.column_stats.get(dataset, {}).get(column)
 
     def extract_frame_data(self, frame_idx: int, datasets: Dict) -> FrameData:
         """Extract and process single frame data efficiently"""
@@ -229,6 +338,10 @@ class OpenGLRenderer:
         self.vaos = {}
         self.textures = {}
 
+        # Vector lengths that map to a full-size arrow (set from DataProcessor)
+        self.max_force_magnitude = 1.0
+        self.max_torque_magnitude = 1.0
+
         # Shader sources
         self.vertex_shader_source = """
         #version 330 core
@@ -739,6 +852,10 @@ class ModernGolfVisualizerWidget(QOpenGLWidget):
             }
             self.num_frames = len(datasets[0])
             self.current_frame = 0
+            self.renderer.max_force_magnitude = self.data_processor.max_force_magnitude
+            self.renderer.max_torque_magnitude = (
+                self.data_processor.max_torque_magnitude
+            )
             print(f"✅ Data loaded: {self.num_frames} frames")
             self.update()
         except Exception as e:
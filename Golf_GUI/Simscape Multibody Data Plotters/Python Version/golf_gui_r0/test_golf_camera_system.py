@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Tests for the camera system: compiled cinematic paths and their cache, and
+smoothed follow tracks
+"""
+
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(HERE)
+sys.path.append(os.path.join(os.path.dirname(HERE), "integrated_golf_gui_r0"))
+
+import numpy as np
+from golf_camera_system import (CameraController, CameraKeyframe,
+                                CameraPathCompiler, CameraState,
+                                SmoothAnimator, compute_follow_track,
+                                gaussian_smooth, get_follow_track)
+from golf_frame_clock import FrameClock
+from PyQt6.QtCore import QEasingCurve
+
+EASINGS = (
+    QEasingCurve.Type.Linear,
+    QEasingCurve.Type.InOutCubic,
+    QEasingCurve.Type.InOutQuart,
+    QEasingCurve.Type.OutElastic,
+)
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeFrameProcessor:
+    """Per-filter trajectories that are rebuilt when parameters change"""
+
+    def __init__(self, num_frames=200):
+        self.time_vector = np.arange(num_frames) / 1000.0
+        self.current_filter = "None"
+        self.trajectories = {}
+
+    def get_point_trajectory(self, point):
+        if self.current_filter not in self.trajectories:
+            offset = len(self.trajectories)
+            self.trajectories[self.current_filter] = swing_line(
+                self.time_vector, offset
+            )
+        return self.trajectories[self.current_filter]
+
+
+def swing_line(time_vector, offset=0.0):
+    """Constant-velocity clubhead path well away from the origin"""
+    return np.column_stack(
+        [
+            2.0 + 40.0 * time_vector,
+            1.0 - 10.0 * time_vector + offset,
+            -3.0 + 5.0 * time_vector,
+        ]
+    )
+
+
+def keyframe(time_s, easing=QEasingCurve.Type.InOutCubic, **state):
+    state.setdefault("target", np.zeros(3, dtype=np.float32))
+    return CameraKeyframe(time=time_s, state=CameraState(**state), easing=easing)
+
+
+def sample_values(path, index):
+    """(distance, azimuth mod 360, elevation, fov, *target) of one sample"""
+    return np.array(
+        [
+            path.distance[index],
+            path.azimuth[index] % 360.0,
+            path.elevation[index],
+            path.fov[index],
+            *path.targets[index],
+        ]
+    )
+
+
+def key_values(kf):
+    state = kf.state
+    return np.array(
+        [
+            state.distance,
+            state.azimuth % 360.0,
+            state.elevation,
+            state.fov,
+            *state.target,
+        ]
+    )
+
+
+def test_path_hits_keyframes():
+    """Samples at keyframe times reproduce the keyframes exactly"""
+    print("🧪 Testing keyframe interpolation...")
+    for easing in EASINGS:
+        keyframes = [
+            keyframe(0.0, easing, distance=5.0, azimuth=45.0, elevation=20.0),
+            keyframe(
+                1.0,
+                easing,
+                distance=3.0,
+                azimuth=120.0,
+                elevation=-10.0,
+                fov=60.0,
+                target=np.array([0.5, 1.0, -0.25], dtype=np.float32),
+            ),
+            keyframe(2.5, easing, distance=8.0, azimuth=300.0, elevation=45.0),
+            keyframe(4.0, easing, distance=4.0, azimuth=10.0, fov=30.0),
+        ]
+        # Compiling sorts the keys, so the input order must not matter
+        path = CameraPathCompiler.compile(keyframes[::-1], sample_rate=60.0)
+
+        assert len(path) == 241 and path.duration == 4.0
+        for kf in keyframes:
+            index = path.index_at(kf.time)
+            assert path.times[index] == kf.time
+            np.testing.assert_allclose(
+                sample_values(path, index), key_values(kf), rtol=0, atol=1e-5
+            )
+
+        # Held before the first key and after the last one
+        held = CameraPathCompiler.compile(keyframes, sample_rate=60.0, duration=5.0)
+        np.testing.assert_allclose(
+            sample_values(held, len(held) - 1), key_values(keyframes[-1]), atol=1e-5
+        )
+    print("✅ Keyframe interpolation OK")
+
+
+def test_azimuth_takes_shortest_way():
+    """Azimuth crosses ±180° instead of swinging back around through 0°"""
+    print("🧪 Testing azimuth wrap...")
+    for start, end, sign in ((170.0, -170.0, 1.0), (-170.0, 170.0, -1.0)):
+        path = CameraPathCompiler.compile(
+            [
+                keyframe(0.0, QEasingCurve.Type.Linear, azimuth=start),
+                keyframe(1.0, QEasingCurve.Type.Linear, azimuth=end),
+            ],
+            sample_rate=100.0,
+        )
+        # Monotonic 20° move, unwrapped past ±180°
+        steps = np.diff(path.azimuth) * sign
+        assert (steps >= 0).all() and (steps > 0).any()
+        assert path.azimuth[0] == start
+        assert path.azimuth[-1] == start + 20.0 * sign
+        np.testing.assert_allclose(abs(path.azimuth[50]), 180.0, atol=1e-9)
+
+        # Positions stay on the far side of the orbit (x < 0) all the way
+        assert (path.positions[:, 0] < 0).all()
+
+    # A key list crossing ±180° twice keeps the unwrapped track continuous
+    path = CameraPathCompiler.compile(
+        [
+            keyframe(0.0, azimuth=170.0),
+            keyframe(1.0, azimuth=-170.0),
+            keyframe(2.0, azimuth=170.0),
+        ],
+        sample_rate=10.0,
+    )
+    assert np.abs(np.diff(path.azimuth)).max() < 20.0
+    assert path.azimuth[10] == 190.0 and path.azimuth[20] == 170.0
+    print("✅ Azimuth wrap OK")
+
+
+def test_easing_endpoints():
+    """Easings map 0 -> 0 and 1 -> 1, so eased segments meet their keys"""
+    print("🧪 Testing easing endpoints...")
+    for easing in EASINGS[1:]:
+        function = SmoothAnimator.easing_function(easing)
+        assert function(0.0) == 0.0 and function(1.0) == 1.0
+    assert SmoothAnimator.easing_function(QEasingCurve.Type.Linear) is None
+
+    linear, cubic = (
+        CameraPathCompiler.compile(
+            [
+                keyframe(0.0, easing, distance=2.0),
+                keyframe(1.0, easing, distance=12.0),
+            ],
+            sample_rate=100.0,
+        )
+        for easing in (QEasingCurve.Type.Linear, QEasingCurve.Type.InOutCubic)
+    )
+    for path in (linear, cubic):
+        assert path.distance[0] == 2.0 and path.distance[-1] == 12.0
+        # Continuous into both keys
+        assert abs(path.distance[1] - 2.0) < 0.2
+        assert abs(path.distance[-2] - 12.0) < 0.2
+
+    # Ease-in-out starts and ends slower than linear, and is faster mid-way
+    linear_steps = np.diff(linear.distance)
+    cubic_steps = np.diff(cubic.distance)
+    np.testing.assert_allclose(linear_steps, 0.1, atol=1e-9)
+    assert cubic_steps[0] < linear_steps[0] / 10
+    assert cubic_steps[-1] < linear_steps[-1] / 10
+    assert cubic_steps[50] > linear_steps[50]
+    print("✅ Easing endpoints OK")
+
+
+def test_index_at_loop():
+    """index_at clamps with looping off and wraps onto [0, N-1) with it on"""
+    print("🧪 Testing index_at...")
+    path = CameraPathCompiler.compile(
+        [keyframe(0.0), keyframe(1.0, azimuth=90.0)], sample_rate=10.0
+    )
+    assert len(path) == 11
+
+    assert path.index_at(0.0) == 0
+    assert path.index_at(0.52) == 5
+    assert path.index_at(1.0) == 10
+    assert path.index_at(1.5) == 10
+    assert path.index_at(-0.5) == 0
+
+    # The last sample equals the first one of the next loop
+    assert path.index_at(0.52, loop=True) == 5
+    assert path.index_at(1.0, loop=True) == 0
+    assert path.index_at(1.23, loop=True) == 2
+    assert path.index_at(3.71, loop=True) == 7
+    np.testing.assert_array_equal(
+        path.view_matrix_at(1.23, loop=True), path.view_matrices[2]
+    )
+    state = path.state_at(1.5)
+    assert state.azimuth == 90.0
+
+    # A single keyframe compiles to one held sample
+    single = CameraPathCompiler.compile([keyframe(0.0, azimuth=30.0)])
+    assert len(single) == 1
+    assert single.index_at(2.0) == single.index_at(2.0, loop=True) == 0
+    print("✅ index_at OK")
+
+
+def test_compiled_path_cache():
+    """The controller's compiled path is reused until the keyframes change"""
+    print("🧪 Testing compiled path cache...")
+    controller = CameraController(FrameClock(refresh_rate=60.0, clock=FakeClock()))
+    controller.add_keyframe(0.0, CameraState(azimuth=0.0))
+    controller.add_keyframe(2.0, CameraState(azimuth=90.0))
+
+    path = controller.compile_camera_path()
+    assert path.duration == 2.0
+    assert controller.compile_camera_path() is path
+    assert controller.compile_camera_path(2.0) is path
+
+    # A different duration recompiles
+    longer = controller.compile_camera_path(3.0)
+    assert longer is not path and longer.duration == 3.0
+
+    # Adding a keyframe (even out of order) drops the cached path
+    controller.add_keyframe(1.0, CameraState(azimuth=135.0))
+    assert controller.compiled_path is None
+    path = controller.compile_camera_path(2.0)
+    assert [kf.time for kf in controller.keyframes] == [0.0, 1.0, 2.0]
+    assert path.state_at(1.0).azimuth == 135.0
+
+    controller.clear_keyframes()
+    assert controller.compiled_path is None and not controller.keyframes
+    controller.add_keyframe(0.0, CameraState(azimuth=10.0))
+    controller.add_keyframe(1.0, CameraState(azimuth=20.0))
+    path = controller.compile_camera_path()
+    assert path.duration == 1.0 and path.azimuth[0] == 10.0
+    print("✅ Compiled path cache OK")
+
+
+def test_follow_track_edges():
+    """Odd edge padding keeps straight motion straight up to both ends"""
+    print("🧪 Testing follow track edges...")
+    time_vector = np.arange(300) / 1000.0
+    trajectory = swing_line(time_vector)
+    velocity = np.array([40.0, -10.0, 5.0])
+
+    smoothed = gaussian_smooth(trajectory, sigma_samples=20.0)
+    np.testing.assert_allclose(smoothed, trajectory, rtol=0, atol=1e-9)
+
+    track = compute_follow_track(trajectory, time_vector, 0.02, 0.005)
+    assert track.dtype == np.float32 and track.shape == trajectory.shape
+    # Smoothing is a no-op on a line; only the look-ahead lead remains
+    np.testing.assert_allclose(track, trajectory + velocity * 0.005, atol=1e-5)
+
+    # On a curve the ends are not pulled towards the origin either
+    curve = np.column_stack([np.cos(time_vector * 10), time_vector, time_vector**2])
+    curve += [5.0, 5.0, 5.0]
+    track = compute_follow_track(curve, time_vector, 0.02, 0.0)
+    np.testing.assert_allclose(track[[0, -1]], curve[[0, -1]], atol=1e-3)
+
+    # A kernel wider than the swing is cut down to fit
+    short = trajectory[:5]
+    np.testing.assert_allclose(gaussian_smooth(short, 50.0), short, atol=1e-9)
+    print("✅ Follow track edges OK")
+
+
+def test_follow_track_nan_frames():
+    """Dropped frames are bridged instead of dragging the camera to 0"""
+    print("🧪 Testing follow track NaN frames...")
+    time_vector = np.arange(300) / 1000.0
+    trajectory = swing_line(time_vector)
+    expected = compute_follow_track(trajectory, time_vector, 0.02, 0.005)
+
+    gappy = trajectory.copy()
+    gappy[100:140] = np.nan
+    gappy[200, 1] = np.nan  # One missing axis drops the whole frame
+    track = compute_follow_track(gappy, time_vector, 0.02, 0.005)
+    assert np.isfinite(track).all()
+    np.testing.assert_allclose(track, expected, atol=1e-4)
+
+    # Leading and trailing dropouts hold the nearest valid frame
+    gappy = trajectory.copy()
+    gappy[:10] = np.nan
+    gappy[-10:] = np.nan
+    track = compute_follow_track(gappy, time_vector, 0.0, 0.0)
+    np.testing.assert_allclose(track[:10], np.tile(trajectory[10], (10, 1)))
+    np.testing.assert_allclose(track[-10:], np.tile(trajectory[-11], (10, 1)))
+
+    # Nothing valid at all gives a resting camera rather than NaN
+    track = compute_follow_track(np.full((50, 3), np.nan), time_vector[:50])
+    assert track.shape == (50, 3) and not track.any()
+    print("✅ Follow track NaN frames OK")
+
+
+def test_follow_track_without_smoothing():
+    """sigma = 0 leaves the trajectory as it is"""
+    print("🧪 Testing follow track with sigma 0...")
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(100, 3)).astype(np.float32)
+    smoothed = gaussian_smooth(values, 0.0)
+    assert smoothed.dtype == np.float64 and smoothed is not values
+    np.testing.assert_array_equal(smoothed, values)
+    np.testing.assert_array_equal(gaussian_smooth(values, -1.0), values)
+
+    time_vector = np.arange(100) / 1000.0
+    track = compute_follow_track(values, time_vector, 0.0, 0.0)
+    np.testing.assert_array_equal(track, values)
+
+    # A single frame is returned unchanged
+    np.testing.assert_array_equal(
+        compute_follow_track(values[:1], time_vector[:1]), values[:1]
+    )
+    print("✅ Follow track with sigma 0 OK")
+
+
+def test_follow_track_cache():
+    """Tracks are cached per processor and filter, and rebuilt with the data"""
+    print("🧪 Testing follow track cache...")
+    processor = FakeFrameProcessor()
+    track = get_follow_track(processor)
+    assert track.filter_name == "None" and len(track) == 200
+    assert get_follow_track(processor) is track
+
+    # Other parameters are separate entries
+    assert get_follow_track(processor, look_ahead_s=0.0) is not track
+
+    processor.current_filter = "butterworth"
+    filtered = get_follow_track(processor)
+    assert filtered is not track and filtered.filter_name == "butterworth"
+    assert not np.allclose(filtered.targets, track.targets)
+
+    # Switching back reuses the first track
+    processor.current_filter = "None"
+    assert get_follow_track(processor) is track
+
+    # New filter parameters rebuild the trajectory, which rebuilds the track
+    processor.trajectories["None"] = swing_line(processor.time_vector, 2.0)
+    rebuilt = get_follow_track(processor)
+    assert rebuilt is not track
+    np.testing.assert_allclose(
+        rebuilt.targets[:, 1] - track.targets[:, 1], 2.0, atol=1e-5
+    )
+
+    # Another processor does not share the cache
+    assert get_follow_track(FakeFrameProcessor()) is not rebuilt
+    print("✅ Follow track cache OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Camera System Tests")
+    print("=" * 50)
+
+    test_path_hits_keyframes()
+    test_azimuth_takes_shortest_way()
+    test_easing_endpoints()
+    test_index_at_loop()
+    test_compiled_path_cache()
+    test_follow_track_edges()
+    test_follow_track_nan_frames()
+    test_follow_track_without_smoothing()
+    test_follow_track_cache()
+
+    print("\n✅ All camera system tests passed!")
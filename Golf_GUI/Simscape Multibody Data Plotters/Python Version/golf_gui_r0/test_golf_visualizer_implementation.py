@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for load-time vector statistics: vectorized stats against a per-column
+brute force, vector column detection and the scales derived from them
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from golf_visualizer_implementation import DataProcessor, compute_vector_stats
+
+NUM_FRAMES = 500
+
+
+def brute_force_stats(column: np.ndarray):
+    """Reference statistics for one (num_frames, 3) column, finite rows only"""
+    rows = column[np.isfinite(column).all(axis=1)]
+    if not len(rows):
+        return None
+    norms = np.sqrt((rows**2).sum(axis=1))
+    return {
+        "count": len(rows),
+        "min": rows.min(axis=0),
+        "max": rows.max(axis=0),
+        "mean": rows.mean(axis=0),
+        "norm_min": norms.min(),
+        "norm_max": norms.max(),
+        "norm_p50": np.percentile(norms, 50),
+        "norm_p95": np.percentile(norms, 95),
+        "norm_p99": np.percentile(norms, 99),
+        "norm_rms": np.sqrt(np.mean(norms**2)),
+    }
+
+
+def assert_stats_match(stats, column, label):
+    expected = brute_force_stats(column)
+    if expected is None:
+        # Nothing valid: zeroed statistics rather than NaN
+        assert stats.count == 0, label
+        for array in (stats.min, stats.max, stats.mean):
+            np.testing.assert_array_equal(array, 0.0, err_msg=label)
+        assert stats.norm_max == stats.norm_p99 == stats.norm_rms == 0.0, label
+        return
+    assert stats.count == expected["count"], label
+    for key in ("min", "max", "mean"):
+        np.testing.assert_allclose(
+            getattr(stats, key), expected[key], rtol=1e-6, err_msg=f"{label} {key}"
+        )
+    for key in ("norm_min", "norm_max", "norm_p50", "norm_p95", "norm_p99"):
+        np.testing.assert_allclose(
+            getattr(stats, key), expected[key], rtol=1e-12, err_msg=f"{label} {key}"
+        )
+    np.testing.assert_allclose(stats.norm_rms, expected["norm_rms"], rtol=1e-12)
+
+
+def make_columns(rng):
+    """(frames, columns, 3) with clean, gappy, spiky and all-NaN columns"""
+    clean = rng.normal(scale=50.0, size=(NUM_FRAMES, 3))
+    gappy = rng.normal(scale=5.0, size=(NUM_FRAMES, 3))
+    gappy[rng.random(NUM_FRAMES) < 0.2] = np.nan  # Whole rows missing
+    gappy[::37, 1] = np.nan  # One component missing drops the row
+    gappy[::53, 2] = np.inf
+    spiky = rng.normal(size=(NUM_FRAMES, 3))
+    spiky[250] = [1e6, 0.0, 0.0]
+    empty = np.full((NUM_FRAMES, 3), np.nan)
+    return np.stack([clean, gappy, spiky, empty], axis=1)
+
+
+def vector_cells(array):
+    return list(np.asarray(array, dtype=np.float64))
+
+
+def test_stats_match_brute_force():
+    """Vectorized statistics equal a per-column nanpercentile/RMS reference"""
+    print("🧪 Testing vector statistics...")
+    vectors = make_columns(np.random.default_rng(0))
+    stats = compute_vector_stats(vectors)
+
+    assert len(stats) == vectors.shape[1]
+    for i, label in enumerate(("clean", "gappy", "spiky", "empty")):
+        assert_stats_match(stats[i], vectors[:, i], label)
+
+    # A single spike sets the maximum but not the robust length
+    spiky = stats[2]
+    assert spiky.norm_max == 1e6 and spiky.robust_max < 10.0
+    assert stats[3].robust_max == 0.0
+
+    # One frame behaves like any other count
+    single = compute_vector_stats(vectors[:1])
+    assert_stats_match(single[0], vectors[:1, 0], "single frame")
+    print("✅ Vector statistics OK")
+
+
+def test_vector_column_detection():
+    """Only columns whose every cell is a 3-vector count as vectors"""
+    print("🧪 Testing vector column detection...")
+    rng = np.random.default_rng(1)
+    forces = rng.normal(size=(NUM_FRAMES, 3))
+    later_ragged = vector_cells(forces)
+    later_ragged[100] = np.zeros(2)
+    later_missing = vector_cells(forces)
+    later_missing[-1] = None
+    later_scalar = vector_cells(forces)
+    later_scalar[7] = 1.0
+    first_ragged = vector_cells(forces)
+    first_ragged[0] = np.zeros(4)
+
+    dataset = pd.DataFrame(
+        {
+            "Time": np.arange(NUM_FRAMES) / 1000.0,
+            "CHx": rng.normal(size=NUM_FRAMES),
+            "Name": ["frame"] * NUM_FRAMES,
+        }
+    )
+    dataset["TotalHandForceGlobal"] = vector_cells(forces)
+    dataset["AsLists"] = [list(row) for row in forces]
+    dataset["LaterRagged"] = later_ragged
+    dataset["LaterMissing"] = later_missing
+    dataset["LaterScalar"] = later_scalar
+    dataset["FirstRagged"] = first_ragged
+    dataset["Columns"] = list(forces[:, :, None])  # (3, 1) cells
+    dataset["Rotation"] = list(np.tile(np.eye(3), (NUM_FRAMES, 1, 1)))
+
+    columns = DataProcessor._vector_columns(dataset)
+    assert list(columns) == ["TotalHandForceGlobal", "AsLists"]
+    for array in columns.values():
+        assert array.dtype == np.float64
+        np.testing.assert_array_equal(array, forces)
+
+    assert DataProcessor._vector_columns(dataset.iloc[:0]) == {}
+    print("✅ Vector column detection OK")
+
+
+def test_scaling_factors():
+    """Scales are the largest robust length across datasets; 1.0 if absent"""
+    print("🧪 Testing scaling factors...")
+    vectors = make_columns(np.random.default_rng(2))
+    datasets = {}
+    for i, name in enumerate(("BASEQ", "ZTCFQ", "DELTAQ")):
+        dataset = pd.DataFrame({"Time": np.arange(NUM_FRAMES) / 1000.0})
+        dataset[DataProcessor.FORCE_COLUMN] = vector_cells(vectors[:, i])
+        if name != "DELTAQ":
+            dataset[DataProcessor.TORQUE_COLUMN] = vector_cells(vectors[:, 3])
+        datasets[name] = dataset
+
+    processor = DataProcessor()
+    processor._calculate_scaling_factors(datasets)
+
+    expected = max(
+        brute_force_stats(vectors[:, i])["norm_p99"] for i in range(3)
+    )
+    np.testing.assert_allclose(processor.max_force_magnitude, expected, rtol=1e-12)
+    # Only all-NaN torques were loaded
+    assert processor.max_torque_magnitude == 1.0
+
+    for i, name in enumerate(("BASEQ", "ZTCFQ", "DELTAQ")):
+        assert_stats_match(
+            processor.get_column_stats(name, DataProcessor.FORCE_COLUMN),
+            vectors[:, i],
+            name,
+        )
+    assert processor.get_column_stats("DELTAQ", DataProcessor.TORQUE_COLUMN) is None
+    assert processor.get_column_stats("BASEQ", "Time") is None
+    assert processor.get_column_stats("MISSING", DataProcessor.FORCE_COLUMN) is None
+    print("✅ Scaling factors OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Vector Statistics Tests")
+    print("=" * 50)
+
+    test_stats_match_brute_force()
+    test_vector_column_detection()
+    test_scaling_factors()
+
+    print("\n✅ All vector statistics tests passed!")
@@ -4,11 +4,14 @@ Golf Swing Visualizer - Core Data Structures and Processing
 High-performance data handling with optimized MATLAB loading and frame processing
 """
 
+import threading
 import time
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -16,8 +19,13 @@ import scipy.io
 from golf_inverse_dynamics import (butter_lowpass_filter,
                                    calculate_inverse_dynamics,
                                    savitzky_golay_filter)
+from golf_metrics import get_metrics
 from numba import jit, njit
 
+# Recorded on every frame request; looked up once so recording stays cheap
+_frames_served = get_metrics().counter("frame_processor.frames")
+_frame_cache_misses = get_metrics().counter("frame_processor.cache_misses")
+
 # ============================================================================
 # OPTIMIZED DATA STRUCTURES
 # ============================================================================
@@ -134,6 +142,19 @@ class RenderConfig:
             "right_shoulder_neck": True,
         }
     )
+    show_trails: Dict[str, bool] = field(
+        default_factory=lambda: {
+            "clubhead": True,
+            "butt": False,
+            "left_wrist": True,
+            "right_wrist": False,
+            "left_elbow": False,
+            "right_elbow": False,
+            "left_shoulder": False,
+            "right_shoulder": False,
+            "hub": False,
+        }
+    )
 
     # Core visibility
     show_club: bool = True
@@ -163,7 +184,11 @@ class RenderConfig:
 
     # Animation settings
     motion_blur: bool = False
-    trail_length: int = 30
+    trail_length: int = 0  # Frames of trail behind the current frame, 0 = whole swing
+    trail_color_by_speed: bool = True
+    show_ghosts: bool = False  # Overlay of additional swings
+    ghost_opacity: float = 0.3
+    ghost_alignment: str = "normalized"  # "normalized" or "impact"
     smooth_interpolation: bool = True
 
     # Performance settings
@@ -231,6 +256,7 @@ class MatlabDataLoader:
 
         load_time = time.time() - start_time
         print(f"📊 Total load time: {load_time:.2f}s")
+        get_metrics().histogram("loader.matlab_load_ms").observe(load_time * 1000)
 
         return datasets["BASEQ"], datasets["ZTCFQ"], datasets["DELTAQ"]
 
@@ -422,6 +448,24 @@ class MatlabDataLoader:
 # HIGH-PERFORMANCE FRAME PROCESSOR
 # ============================================================================
 
+# FrameData point attribute -> position column prefix (e.g. "CH" -> CHx, CHy, CHz)
+POINT_COLUMN_PREFIXES: Dict[str, str] = {
+    "butt": "B",
+    "clubhead": "CH",
+    "midpoint": "MP",
+    "left_wrist": "LW",
+    "left_elbow": "LE",
+    "left_shoulder": "LS",
+    "right_wrist": "RW",
+    "right_elbow": "RE",
+    "right_shoulder": "RS",
+    "hub": "H",
+}
+
+# Dataset columns holding per-frame force/torque vectors, in lookup order
+FORCE_COLUMNS = ("Force", "TotalHandForceGlobal")
+TORQUE_COLUMNS = ("Torque", "EquivalentMidpointCoupleGlobal")
+
 
 class FrameProcessor:
     """Process and prepare raw data frames for rendering"""
@@ -443,6 +487,10 @@ class FrameProcessor:
         # Data caches
         self.raw_data_cache: Dict[int, FrameData] = {}
         self.dynamics_cache: Dict[str, Dict] = {}
+        self.trajectory_cache: Dict[str, np.ndarray] = {}
+        self.filtered_trajectory_cache: Dict[Tuple[str, str], np.ndarray] = {}
+        self._bounds: Optional["SwingBounds"] = None
+        self.vector_scale_cache: Dict[str, Dict[str, float]] = {}
         self.current_filter = "None"
 
         # Track current frame for UI coordination
@@ -457,6 +505,8 @@ class FrameProcessor:
     def invalidate_cache(self):
         """Invalidate cached dynamics data."""
         self.dynamics_cache = {}
+        self.vector_scale_cache = {}
+        self.filtered_trajectory_cache = {}
         print(f"Cache invalidated due to filter change to {self.current_filter}")
 
     def get_frame_data(self, frame_idx: int) -> FrameData:
@@ -465,7 +515,9 @@ class FrameProcessor:
         frame_idx = max(0, min(frame_idx, self.num_frames - 1))
 
         # Get raw data from cache or process it
+        _frames_served.inc()
         if frame_idx not in self.raw_data_cache:
+            _frame_cache_misses.inc()
             self.raw_data_cache[frame_idx] = self._process_raw_frame(frame_idx)
         frame_data = self.raw_data_cache[frame_idx]
 
@@ -479,6 +531,41 @@ class FrameProcessor:
 
         return frame_data
 
+    def get_interpolated_frame_data(self, position: float) -> FrameData:
+        """Frame data blended between the frames around a fractional index"""
+        position = min(max(float(position), 0.0), self.num_frames - 1.0)
+        frame0 = int(np.floor(position))
+        alpha = position - frame0
+        first = self.get_frame_data(frame0)
+        if alpha < 1e-6 or frame0 + 1 >= self.num_frames:
+            return first
+        second = self.get_frame_data(frame0 + 1)
+
+        def blend(a, b):
+            a = np.asarray(a, dtype=np.float32)
+            b = np.asarray(b, dtype=np.float32)
+            return a + (b - a) * np.float32(alpha)
+
+        points = {
+            point: blend(getattr(first, point), getattr(second, point))
+            for point in POINT_COLUMN_PREFIXES
+        }
+        return FrameData(
+            frame_idx=frame0 if alpha < 0.5 else frame0 + 1,
+            time=first.time + (second.time - first.time) * alpha,
+            forces={
+                k: blend(v, second.forces[k])
+                for k, v in first.forces.items()
+                if k in second.forces
+            },
+            torques={
+                k: blend(v, second.torques[k])
+                for k, v in first.torques.items()
+                if k in second.torques
+            },
+            **points,
+        )
+
     def _calculate_dynamics_for_filter(self):
         """Calculate inverse dynamics for the entire dataset with the current filter."""
         print(f"Calculating dynamics with filter: {self.current_filter}...")
@@ -495,15 +582,7 @@ class FrameProcessor:
         orientation_data = np.array([np.identity(3)] * self.num_frames)
 
         # Apply filter if selected
-        if self.current_filter != "None":
-            fs = 1 / np.mean(np.diff(self.time_vector))
-            for i in range(3):  # Filter X, Y, Z components
-                if self.current_filter == "Butterworth":
-                    position_data[:, i] = butter_lowpass_filter(
-                        position_data[:, i], cutoff=50, fs=fs
-                    )
-                elif self.current_filter == "Savitzky-Golay":
-                    position_data[:, i] = savitzky_golay_filter(position_data[:, i])
+        position_data = self._filter_positions(position_data)
 
         # Calculate dynamics
         self.dynamics_cache[self.current_filter] = calculate_inverse_dynamics(
@@ -512,6 +591,24 @@ class FrameProcessor:
 
         end_time = time.time()
         print(f"Dynamics calculation took {end_time - start_time:.2f}s")
+        get_metrics().histogram("frame_processor.dynamics_ms").observe(
+            (end_time - start_time) * 1000
+        )
+
+    def _filter_positions(self, position_data: np.ndarray) -> np.ndarray:
+        """Apply the current filter to each axis of a (num_frames, 3) array."""
+        if self.current_filter == "None":
+            return position_data
+        position_data = np.array(position_data, dtype=np.float64)
+        fs = 1 / np.mean(np.diff(self.time_vector))
+        for i in range(3):  # Filter X, Y, Z components
+            if self.current_filter == "Butterworth":
+                position_data[:, i] = butter_lowpass_filter(
+                    position_data[:, i], cutoff=50, fs=fs
+                )
+            elif self.current_filter == "Savitzky-Golay":
+                position_data[:, i] = savitzky_golay_filter(position_data[:, i])
+        return position_data
 
     def _process_raw_frame(self, frame_idx: int) -> FrameData:
         """Process a single frame from raw data sources."""
@@ -538,17 +635,66 @@ class FrameProcessor:
         }
 
         for dataset_name, df in datasets.items():
-            if "Force" in df.columns:
+            force_col = self._find_column(df, FORCE_COLUMNS)
+            if force_col:
                 frame_data.forces[dataset_name] = self.get_column_data(
-                    df, "Force", frame_idx
+                    df, force_col, frame_idx
                 )
-            if "Torque" in df.columns:
+            torque_col = self._find_column(df, TORQUE_COLUMNS)
+            if torque_col:
                 frame_data.torques[dataset_name] = self.get_column_data(
-                    df, "Torque", frame_idx
+                    df, torque_col, frame_idx
                 )
 
         return frame_data
 
+    @staticmethod
+    def _find_column(df: pd.DataFrame, candidates: Tuple[str, ...]) -> Optional[str]:
+        """Return the first candidate column present in the DataFrame."""
+        for column in candidates:
+            if column in df.columns:
+                return column
+        return None
+
+    @staticmethod
+    def _max_vector_magnitude(vectors) -> float:
+        """Largest finite magnitude in an (N, 3) array or column of 3-vectors."""
+        try:
+            data = np.asarray(list(vectors), dtype=np.float64).reshape(-1, 3)
+        except (TypeError, ValueError):
+            return 0.0
+        magnitudes = np.linalg.norm(data, axis=1)
+        magnitudes = magnitudes[np.isfinite(magnitudes)]
+        return float(magnitudes.max()) if len(magnitudes) else 0.0
+
+    def get_vector_scales(self) -> Dict[str, float]:
+        """Dataset-wide maximum force/torque magnitudes for glyph scaling."""
+        if self.current_filter not in self.vector_scale_cache:
+            scales = {"force": 0.0, "torque": 0.0}
+            for df in (self.baseq_df, self.ztcfq_df, self.deltaq_df):
+                force_col = self._find_column(df, FORCE_COLUMNS)
+                if force_col:
+                    scales["force"] = max(
+                        scales["force"], self._max_vector_magnitude(df[force_col])
+                    )
+                torque_col = self._find_column(df, TORQUE_COLUMNS)
+                if torque_col:
+                    scales["torque"] = max(
+                        scales["torque"], self._max_vector_magnitude(df[torque_col])
+                    )
+
+            # Calculated dynamics depend on the active filter
+            if self.current_filter not in self.dynamics_cache:
+                self._calculate_dynamics_for_filter()
+            dynamics = self.dynamics_cache[self.current_filter]
+            scales["calculated_force"] = self._max_vector_magnitude(dynamics["force"])
+            scales["calculated_torque"] = self._max_vector_magnitude(
+                dynamics["torque"]
+            )
+
+            self.vector_scale_cache[self.current_filter] = scales
+        return self.vector_scale_cache[self.current_filter]
+
     def _get_position_vector(
         self, df: pd.DataFrame, prefix: str, row_idx: int
     ) -> np.ndarray:
@@ -569,6 +715,36 @@ class FrameProcessor:
             )
             return np.zeros(3, dtype=np.float32)
 
+    def get_point_trajectory(self, point: str) -> np.ndarray:
+        """Get the full (num_frames, 3) trajectory of a tracked point."""
+        prefix = POINT_COLUMN_PREFIXES.get(point, point)
+        if prefix not in self.trajectory_cache:
+            trajectory = np.zeros((self.num_frames, 3), dtype=np.float32)
+            for axis_idx, axis in enumerate("xyz"):
+                column = f"{prefix}{axis}"
+                if column in self.baseq_df.columns:
+                    trajectory[:, axis_idx] = self.baseq_df[column].to_numpy(
+                        dtype=np.float32
+                    )
+            self.trajectory_cache[prefix] = trajectory
+        return self.trajectory_cache[prefix]
+
+    def get_filtered_point_trajectory(self, point: str) -> np.ndarray:
+        """Get a point's trajectory with the current filter applied."""
+        key = (self.current_filter, POINT_COLUMN_PREFIXES.get(point, point))
+        if key not in self.filtered_trajectory_cache:
+            trajectory = self.get_point_trajectory(point)
+            if self.current_filter != "None" and self.num_frames > 1:
+                trajectory = self._filter_positions(trajectory).astype(np.float32)
+            self.filtered_trajectory_cache[key] = trajectory
+        return self.filtered_trajectory_cache[key]
+
+    def get_bounds(self) -> "SwingBounds":
+        """Per-frame and hierarchical bounds of all tracked points (cached)."""
+        if self._bounds is None:
+            self._bounds = SwingBounds.from_frame_processor(self)
+        return self._bounds
+
     def get_column_data(
         self, df: pd.DataFrame, col_name: str, row_idx: int
     ) -> np.ndarray:
@@ -576,7 +752,7 @@ class FrameProcessor:
         try:
             if col_name in df.columns:
                 data = df.iloc[row_idx][col_name]
-                if isinstance(data, (list, tuple)):
+                if isinstance(data, (list, tuple, np.ndarray)):
                     return np.array(data, dtype=np.float32)
                 else:
                     # For single values, we need to get the corresponding X, Y, Z components
@@ -656,6 +832,306 @@ class FrameProcessor:
         elif vector_type == "torque":
             self.config.torque_vector_scale = scale
 
+    def warm_caches(self, should_stop=None, include_dynamics: bool = True) -> bool:
+        """Precompute trajectories, vector scales and dynamics off the UI thread.
+
+        ``should_stop`` is polled between steps; returns False if it fired.
+        """
+        steps = [
+            lambda point=point: self.get_point_trajectory(point)
+            for point in POINT_COLUMN_PREFIXES
+        ]
+        steps.append(self.get_bounds)
+        if include_dynamics:
+            steps += [self.get_vector_scales, lambda: self.get_frame_data(0)]
+        for step in steps:
+            if should_stop is not None and should_stop():
+                return False
+            step()
+        return True
+
+    def capture_frames(self, start: int, stop: int) -> "FrameRangeSnapshot":
+        """Frames [start, stop) frozen at the current filter's dynamics"""
+        return FrameRangeSnapshot(self, start, stop)
+
+
+class FrameRangeSnapshot:
+    """A frame range that can be read from another thread.
+
+    The current filter's dynamics are copied when the snapshot is taken and
+    every frame is built as a new FrameData, so neither a later filter change
+    nor the UI's frame cache is seen or touched by readers of the snapshot.
+    """
+
+    def __init__(self, frame_processor: FrameProcessor, start: int, stop: int):
+        if frame_processor.current_filter not in frame_processor.dynamics_cache:
+            frame_processor._calculate_dynamics_for_filter()
+        dynamics = frame_processor.dynamics_cache[frame_processor.current_filter]
+
+        self.frame_processor = frame_processor
+        self.filter_name = frame_processor.current_filter
+        self.start = max(0, start)
+        self.stop = max(self.start, min(stop, frame_processor.num_frames))
+        self.forces = np.array(dynamics["force"][self.start : self.stop])
+        self.torques = np.array(dynamics["torque"][self.start : self.stop])
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def get_frame_data(self, frame_idx: int) -> FrameData:
+        """A fresh FrameData for ``frame_idx``, clamped to the range"""
+        frame_idx = max(self.start, min(frame_idx, self.stop - 1))
+        frame_data = self.frame_processor._process_raw_frame(frame_idx)
+        frame_data.forces["calculated"] = self.forces[frame_idx - self.start]
+        frame_data.torques["calculated"] = self.torques[frame_idx - self.start]
+        return frame_data
+
+
+# ============================================================================
+# SWING BOUNDS
+# ============================================================================
+
+
+def merge_bounds(
+    bounds: List[Tuple[np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Axis-aligned box enclosing several (min, max) boxes"""
+    if not bounds:
+        return SwingBounds.empty()
+    return (
+        np.min([lo for lo, _ in bounds], axis=0),
+        np.max([hi for _, hi in bounds], axis=0),
+    )
+
+
+class SwingBounds:
+    """Axis-aligned bounds of every tracked point, per frame and per block.
+
+    Level 0 holds one box per frame; each higher level merges pairs of boxes
+    from the level below (level 6 is 64-frame blocks, and so on up to the
+    whole swing). Any frame range is covered by at most two boxes per level,
+    so range queries are O(log n). Frames without valid points hold an empty
+    box (min = +inf, max = -inf).
+    """
+
+    def __init__(self, frame_min: np.ndarray, frame_max: np.ndarray):
+        self.levels_min: List[np.ndarray] = [frame_min]
+        self.levels_max: List[np.ndarray] = [frame_max]
+        while len(self.levels_min[-1]) > 1:
+            lo, hi = self.levels_min[-1], self.levels_max[-1]
+            if len(lo) % 2:
+                lo = np.vstack([lo, np.full((1, 3), np.inf, dtype=lo.dtype)])
+                hi = np.vstack([hi, np.full((1, 3), -np.inf, dtype=hi.dtype)])
+            self.levels_min.append(np.minimum(lo[0::2], lo[1::2]))
+            self.levels_max.append(np.maximum(hi[0::2], hi[1::2]))
+
+    @classmethod
+    def from_points(cls, points: np.ndarray) -> "SwingBounds":
+        """Build from a (num_frames, num_points, 3) array in one pass"""
+        finite = np.isfinite(points).all(axis=2, keepdims=True)
+        frame_min = np.where(finite, points, np.inf).min(axis=1)
+        frame_max = np.where(finite, points, -np.inf).max(axis=1)
+        return cls(frame_min.astype(np.float32), frame_max.astype(np.float32))
+
+    @classmethod
+    def from_frame_processor(cls, frame_processor: "FrameProcessor") -> "SwingBounds":
+        points = np.stack(
+            [
+                frame_processor.get_point_trajectory(point)
+                for point in POINT_COLUMN_PREFIXES
+            ],
+            axis=1,
+        )
+        return cls.from_points(points)
+
+    @staticmethod
+    def empty() -> Tuple[np.ndarray, np.ndarray]:
+        return (
+            np.full(3, np.inf, dtype=np.float32),
+            np.full(3, -np.inf, dtype=np.float32),
+        )
+
+    @staticmethod
+    def is_empty(bounds: Tuple[np.ndarray, np.ndarray]) -> bool:
+        lo, hi = bounds
+        return bool((lo > hi).any())
+
+    @property
+    def num_frames(self) -> int:
+        return len(self.levels_min[0])
+
+    def frame_bounds(self, frame_idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        return self.levels_min[0][frame_idx], self.levels_max[0][frame_idx]
+
+    def range_bounds(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Bounds over frames ``start`` to ``stop`` (exclusive, None for the end)"""
+        stop = self.num_frames if stop is None else min(stop, self.num_frames)
+        start = max(start, 0)
+        lo, hi = self.empty()
+
+        # Climb the levels, taking unpaired boxes at either end of the range
+        for level_min, level_max in zip(self.levels_min, self.levels_max):
+            if start >= stop:
+                break
+            if start % 2:
+                lo = np.minimum(lo, level_min[start])
+                hi = np.maximum(hi, level_max[start])
+                start += 1
+            if stop % 2 and start < stop:
+                stop -= 1
+                lo = np.minimum(lo, level_min[stop])
+                hi = np.maximum(hi, level_max[stop])
+            start //= 2
+            stop //= 2
+        return lo, hi
+
+
+# ============================================================================
+# SWING DATA STORE
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class SwingDataStore:
+    """Fully prepared swing data, handed from a loader to the UI in one piece.
+
+    Stores are shared between tabs and widgets through SwingDataRegistry, so
+    the DataFrames and processors must be treated as read-only.
+    """
+
+    name: str
+    datasets: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
+    frame_processor: FrameProcessor
+    ghost_processors: Dict[str, FrameProcessor] = field(default_factory=dict)
+    load_time_s: float = 0.0
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "ghost_processors", MappingProxyType(dict(self.ghost_processors))
+        )
+
+    @property
+    def num_frames(self) -> int:
+        return self.frame_processor.num_frames
+
+
+@dataclass(frozen=True)
+class SwingDataKey:
+    """Registry key: data source plus the options used to preprocess it"""
+
+    source: str
+    options: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def for_file(cls, path: Union[str, Path], **options) -> "SwingDataKey":
+        """Key for a file; its modification time is included so edits reload"""
+        path = Path(path).resolve()
+        options["mtime_ns"] = path.stat().st_mtime_ns
+        return cls(str(path), tuple(sorted(options.items())))
+
+    @classmethod
+    def for_dataframes(
+        cls, datasets: Tuple[pd.DataFrame, ...], **options
+    ) -> "SwingDataKey":
+        """Key for in-memory DataFrames (identity; the registry keeps them alive)"""
+        source = "memory:" + ",".join(f"{id(df):x}" for df in datasets)
+        return cls(source, tuple(sorted(options.items())))
+
+
+class SwingDataRegistry:
+    """Application-wide cache of SwingDataStores, one per source and options.
+
+    Thread-safe: loader threads insert, UI code reads. ``get_or_create``
+    builds a missing store at most once even when several callers race.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._stores: "OrderedDict[SwingDataKey, SwingDataStore]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[SwingDataKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: SwingDataKey) -> Optional[SwingDataStore]:
+        with self._lock:
+            store = self._stores.get(key)
+            if store is None:
+                self.misses += 1
+                return None
+            self._stores.move_to_end(key)
+            self.hits += 1
+            return store
+
+    def put(self, key: SwingDataKey, store: SwingDataStore) -> SwingDataStore:
+        """Insert a store; an existing entry for the key wins and is returned"""
+        with self._lock:
+            existing = self._stores.get(key)
+            if existing is not None:
+                self._stores.move_to_end(key)
+                return existing
+            self._stores[key] = store
+            while len(self._stores) > self.max_entries:
+                evicted_key, _ = self._stores.popitem(last=False)
+                print(f"🗑️ Evicted swing data: {evicted_key.source}")
+            return store
+
+    def get_or_create(
+        self, key: SwingDataKey, factory: Callable[[], SwingDataStore]
+    ) -> SwingDataStore:
+        """Cached store for the key, built with ``factory`` on a miss"""
+        store = self.get(key)
+        if store is not None:
+            return store
+
+        with self._lock:
+            key_lock = self._pending.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                # Another caller may have finished building while we waited
+                with self._lock:
+                    store = self._stores.get(key)
+                if store is None:
+                    store = self.put(key, factory())
+                return store
+        finally:
+            with self._lock:
+                if self._pending.get(key) is key_lock and not key_lock.locked():
+                    del self._pending[key]
+
+    def discard(self, key: SwingDataKey):
+        with self._lock:
+            self._stores.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._stores.clear()
+
+    def keys(self) -> List[SwingDataKey]:
+        with self._lock:
+            return list(self._stores)
+
+    def __contains__(self, key: SwingDataKey) -> bool:
+        with self._lock:
+            return key in self._stores
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._stores)
+
+
+_swing_registry: Optional[SwingDataRegistry] = None
+
+
+def get_swing_registry() -> SwingDataRegistry:
+    """Process-wide registry shared by every tab and widget"""
+    global _swing_registry
+    if _swing_registry is None:
+        _swing_registry = SwingDataRegistry()
+    return _swing_registry
+
 
 # ============================================================================
 # GEOMETRY UTILITIES
@@ -666,7 +1142,7 @@ class GeometryUtils:
     """High-performance geometry calculations for 3D visualization"""
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def rotation_matrix_from_vectors(vec1: np.ndarray, vec2: np.ndarray) -> np.ndarray:
         """Create rotation matrix to rotate vec1 to vec2 using Rodrigues formula"""
         # Normalize input vectors
@@ -709,38 +1185,23 @@ class GeometryUtils:
         radius: float = 1.0, height: float = 1.0, segments: int = 16
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Create optimized cylinder mesh with normals"""
-        vertices = []
-        normals = []
-        indices = []
-
-        # Generate vertices and normals
-        for i in range(segments + 1):
-            angle = 2 * np.pi * i / segments
-            x, z = np.cos(angle), np.sin(angle)
-
-            # Bottom vertex
-            vertices.extend([x * radius, 0, z * radius])
-            normals.extend([x, 0, z])
-
-            # Top vertex
-            vertices.extend([x * radius, height, z * radius])
-            normals.extend([x, 0, z])
-
-        # Generate indices for triangle strip
-        for i in range(segments):
-            # Two triangles per segment
-            base = i * 2
-            next_base = ((i + 1) % (segments + 1)) * 2
-
-            # First triangle
-            indices.extend([base, base + 1, next_base])
-            # Second triangle
-            indices.extend([next_base, base + 1, next_base + 1])
+        angles = 2 * np.pi * np.arange(segments + 1) / segments
+        ring = np.stack([np.cos(angles), np.zeros_like(angles), np.sin(angles)], 1)
+
+        # Bottom and top vertex interleaved per ring position
+        vertices = np.repeat(ring * radius, 2, axis=0)
+        vertices[1::2, 1] = height
+        normals = np.repeat(ring, 2, axis=0)
+
+        base = 2 * np.arange(segments)
+        indices = np.stack(
+            [base, base + 1, base + 2, base + 2, base + 1, base + 3], axis=1
+        )
 
         return (
-            np.array(vertices, dtype=np.float32),
-            np.array(normals, dtype=np.float32),
-            np.array(indices, dtype=np.uint32),
+            vertices.astype(np.float32).ravel(),
+            normals.astype(np.float32).ravel(),
+            indices.astype(np.uint32).ravel(),
         )
 
     @staticmethod
@@ -748,39 +1209,34 @@ class GeometryUtils:
         radius: float = 1.0, lat_segments: int = 12, lon_segments: int = 16
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Create optimized sphere mesh using UV sphere method"""
-        vertices = []
-        normals = []
-        indices = []
-
-        # Generate vertices
-        for i in range(lat_segments + 1):
-            lat = np.pi * i / lat_segments - np.pi / 2  # -π/2 to π/2
-            for j in range(lon_segments + 1):
-                lon = 2 * np.pi * j / lon_segments  # 0 to 2π
-
-                x = radius * np.cos(lat) * np.cos(lon)
-                y = radius * np.sin(lat)
-                z = radius * np.cos(lat) * np.sin(lon)
-
-                vertices.extend([x, y, z])
-                # For unit sphere, normal equals position
-                normals.extend([x / radius, y / radius, z / radius])
-
-        # Generate indices
-        for i in range(lat_segments):
-            for j in range(lon_segments):
-                first = i * (lon_segments + 1) + j
-                second = first + lon_segments + 1
-
-                # First triangle
-                indices.extend([first, second, first + 1])
-                # Second triangle
-                indices.extend([second, second + 1, first + 1])
+        lat = np.pi * np.arange(lat_segments + 1) / lat_segments - np.pi / 2
+        lon = 2 * np.pi * np.arange(lon_segments + 1) / lon_segments
+        lat_grid, lon_grid = np.meshgrid(lat, lon, indexing="ij")
+
+        # For unit sphere, normal equals position
+        normals = np.stack(
+            [
+                np.cos(lat_grid) * np.cos(lon_grid),
+                np.sin(lat_grid),
+                np.cos(lat_grid) * np.sin(lon_grid),
+            ],
+            axis=-1,
+        ).reshape(-1, 3)
+        vertices = normals * radius
+
+        row, col = np.meshgrid(
+            np.arange(lat_segments), np.arange(lon_segments), indexing="ij"
+        )
+        first = (row * (lon_segments + 1) + col).ravel()
+        second = first + lon_segments + 1
+        indices = np.stack(
+            [first, second, first + 1, second, second + 1, first + 1], axis=1
+        )
 
         return (
-            np.array(vertices, dtype=np.float32),
-            np.array(normals, dtype=np.float32),
-            np.array(indices, dtype=np.uint32),
+            vertices.astype(np.float32).ravel(),
+            normals.astype(np.float32).ravel(),
+            indices.astype(np.uint32).ravel(),
         )
 
     @staticmethod
@@ -792,63 +1248,60 @@ class GeometryUtils:
         segments: int = 8,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Create arrow mesh for force/torque visualization"""
-        vertices = []
-        normals = []
-        indices = []
+        angles = 2 * np.pi * np.arange(segments + 1) / segments
+        ring = np.stack([np.cos(angles), np.zeros_like(angles), np.sin(angles)], 1)
 
-        # Shaft cylinder
-        for i in range(segments + 1):
-            angle = 2 * np.pi * i / segments
-            x, z = np.cos(angle), np.sin(angle)
+        # Shaft cylinder: bottom and top vertex interleaved
+        shaft_vertices = np.repeat(ring * shaft_radius, 2, axis=0)
+        shaft_vertices[1::2, 1] = shaft_length
+        shaft_normals = np.repeat(ring, 2, axis=0)
 
-            # Bottom of shaft
-            vertices.extend([x * shaft_radius, 0, z * shaft_radius])
-            normals.extend([x, 0, z])
+        # Arrow head (cone) base ring and tip
+        head_vertices = ring * head_radius
+        head_vertices[:, 1] = shaft_length
+        tip = np.array([[0.0, shaft_length + head_length, 0.0]])
 
-            # Top of shaft (where head begins)
-            vertices.extend([x * shaft_radius, shaft_length, z * shaft_radius])
-            normals.extend([x, 0, z])
+        vertices = np.vstack([shaft_vertices, head_vertices, tip])
+        normals = np.vstack([shaft_normals, ring, [[0.0, 1.0, 0.0]]])
 
-        # Arrow head (cone)
-        head_start_y = shaft_length
-        head_end_y = shaft_length + head_length
-
-        # Head base vertices
-        head_base_start = len(vertices) // 3
-        for i in range(segments + 1):
-            angle = 2 * np.pi * i / segments
-            x, z = np.cos(angle), np.sin(angle)
-
-            vertices.extend([x * head_radius, head_start_y, z * head_radius])
-            normals.extend([x, 0, z])  # Simplified normal
-
-        # Head tip
-        tip_index = len(vertices) // 3
-        vertices.extend([0, head_end_y, 0])
-        normals.extend([0, 1, 0])
-
-        # Generate indices for shaft
-        shaft_segments = segments
-        for i in range(shaft_segments):
-            base = i * 2
-            next_base = ((i + 1) % (shaft_segments + 1)) * 2
-
-            indices.extend([base, base + 1, next_base])
-            indices.extend([next_base, base + 1, next_base + 1])
-
-        # Generate indices for head
-        for i in range(segments):
-            current = head_base_start + i
-            next_vertex = head_base_start + ((i + 1) % (segments + 1))
-
-            indices.extend([current, tip_index, next_vertex])
+        base = 2 * np.arange(segments)
+        shaft_indices = np.stack(
+            [base, base + 1, base + 2, base + 2, base + 1, base + 3], axis=1
+        )
+        head_base_start = len(shaft_vertices)
+        tip_index = len(vertices) - 1
+        current = head_base_start + np.arange(segments)
+        head_indices = np.stack(
+            [current, np.full(segments, tip_index), current + 1], axis=1
+        )
+        indices = np.concatenate([shaft_indices.ravel(), head_indices.ravel()])
 
         return (
-            np.array(vertices, dtype=np.float32),
-            np.array(normals, dtype=np.float32),
-            np.array(indices, dtype=np.uint32),
+            vertices.astype(np.float32).ravel(),
+            normals.astype(np.float32).ravel(),
+            indices.astype(np.uint32),
         )
 
+    @staticmethod
+    def get_mesh(mesh_type: str, **params) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Generated mesh, memoized per process (generation takes microseconds)"""
+        key = (mesh_type, tuple(sorted(params.items())))
+        mesh = _mesh_cache.get(key)
+        if mesh is None:
+            mesh = getattr(GeometryUtils, MESH_GENERATORS[mesh_type])(**params)
+            _mesh_cache[key] = mesh
+        return mesh
+
+
+# Mesh type -> GeometryUtils generator used by get_mesh
+MESH_GENERATORS: Dict[str, str] = {
+    "cylinder": "create_cylinder_mesh",
+    "sphere": "create_sphere_mesh",
+    "arrow": "create_arrow_mesh",
+}
+
+_mesh_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
 
 # ============================================================================
 # USAGE EXAMPLE AND TESTING
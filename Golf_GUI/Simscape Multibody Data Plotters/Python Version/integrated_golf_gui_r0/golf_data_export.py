@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Columnar Data Export
+Streams swing datasets to CSV, Parquet, Feather or HDF5 in row chunks, with
+vector columns split into x/y/z and optional float32 downcasting
+"""
+
+import gzip
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# File extension for each supported format
+EXPORT_FORMATS: Dict[str, str] = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "hdf5": ".h5",
+}
+
+# Compression used when DataExportOptions.compression is left as "default"
+DEFAULT_COMPRESSION: Dict[str, Optional[str]] = {
+    "csv": None,
+    "parquet": "zstd",
+    "feather": "zstd",
+    "hdf5": "blosc:zstd",
+}
+
+VECTOR_AXES = ("x", "y", "z")
+
+# Name used for an unnamed single dataset (no column prefix)
+SINGLE_DATASET = ""
+
+# File extensions recognized by format_for_path
+FORMAT_EXTENSIONS: Dict[str, str] = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".h5": "hdf5",
+    ".hdf5": "hdf5",
+}
+
+
+@dataclass
+class DataExportOptions:
+    """How a swing is laid out and compressed on disk"""
+
+    format: str = "parquet"  # "csv", "parquet", "feather" or "hdf5"
+    compression: Optional[str] = "default"
+    float32: bool = True  # Downcast float64 data (time is kept as float64)
+    chunk_rows: int = 65536  # Rows per row group / record batch / append
+    start: int = 0
+    stop: Optional[int] = None  # Exclusive end row
+    columns: Optional[List[str]] = None  # Source columns to keep (all if None)
+    time_column: str = "Time"
+
+    def resolved_compression(self) -> Optional[str]:
+        if self.compression == "default":
+            return DEFAULT_COMPRESSION[self.format]
+        return self.compression
+
+
+@dataclass
+class DataExportResult:
+    """Outcome of a data export"""
+
+    path: Path
+    rows: int
+    columns: int
+    bytes_written: int
+    elapsed_s: float
+    completed: bool = True  # False if should_stop cancelled the export
+
+
+# ============================================================================
+# CHUNKED COLUMN LAYOUT
+# ============================================================================
+
+
+def named_datasets(source: Any) -> Dict[str, pd.DataFrame]:
+    """Normalize an export source into named DataFrames.
+
+    Accepts a SwingDataStore or FrameProcessor (BASEQ/ZTCFQ/DELTAQ), a tuple
+    of those three DataFrames, a dict of named DataFrames, or a single
+    DataFrame / dict of columns exported without a name prefix.
+    """
+    if hasattr(source, "baseq_df"):
+        source = (source.baseq_df, source.ztcfq_df, source.deltaq_df)
+    elif hasattr(source, "datasets"):
+        source = source.datasets
+
+    if isinstance(source, tuple):
+        return dict(zip(("BASEQ", "ZTCFQ", "DELTAQ"), source))
+    if isinstance(source, pd.DataFrame):
+        return {SINGLE_DATASET: source}
+    if isinstance(source, dict):
+        if source and all(isinstance(df, pd.DataFrame) for df in source.values()):
+            return dict(source)
+        return {SINGLE_DATASET: pd.DataFrame(source)}
+    raise TypeError(f"Cannot export data of type {type(source).__name__}")
+
+
+def _is_vector_column(series: pd.Series) -> bool:
+    # Loader vector columns are object columns of 3-element arrays
+    if pd.api.types.is_numeric_dtype(series.dtype) or series.empty:
+        return False
+    first = series.iloc[0]
+    return np.ndim(first) == 1 and len(first) >= 3
+
+
+@dataclass
+class _ColumnPlan:
+    """One source column and the output columns it becomes"""
+
+    dataset: str
+    source: str
+    outputs: List[str]
+    vector: bool
+    dtype: np.dtype
+
+
+def plan_columns(
+    datasets: Dict[str, pd.DataFrame], options: DataExportOptions
+) -> List[_ColumnPlan]:
+    """Output layout: one shared time column, then each dataset's columns"""
+    plans: List[_ColumnPlan] = []
+    time_written = False
+    float_dtype = np.dtype(np.float32 if options.float32 else np.float64)
+
+    for name, df in datasets.items():
+        prefix = f"{name}_" if name else ""
+        for column in df.columns:
+            if options.columns is not None and column not in options.columns:
+                continue
+            series = df[column]
+            if column == options.time_column:
+                # Time repeats across datasets; keep one full-precision copy
+                if not time_written:
+                    plans.append(
+                        _ColumnPlan(name, column, [column], False, np.dtype(np.float64))
+                    )
+                    time_written = True
+                continue
+
+            if _is_vector_column(series):
+                outputs = [f"{prefix}{column}_{axis}" for axis in VECTOR_AXES]
+                plans.append(_ColumnPlan(name, column, outputs, True, float_dtype))
+            elif pd.api.types.is_float_dtype(series.dtype):
+                plans.append(
+                    _ColumnPlan(name, column, [f"{prefix}{column}"], False, float_dtype)
+                )
+            elif pd.api.types.is_numeric_dtype(series.dtype):
+                plans.append(
+                    _ColumnPlan(
+                        name, column, [f"{prefix}{column}"], False, series.dtype
+                    )
+                )
+            else:
+                print(f"⚠️ Export skipped non-numeric column {prefix}{column}")
+    return plans
+
+
+def iter_chunks(
+    datasets: Dict[str, pd.DataFrame],
+    plans: List[_ColumnPlan],
+    start: int,
+    stop: int,
+    chunk_rows: int,
+) -> Iterator[pd.DataFrame]:
+    """Yield the flattened output table a row chunk at a time.
+
+    Only the current chunk is converted, so an export never holds a second
+    full copy of the swing in memory.
+    """
+    for chunk_start in range(start, stop, chunk_rows):
+        chunk_stop = min(chunk_start + chunk_rows, stop)
+        columns: Dict[str, np.ndarray] = {}
+        for plan in plans:
+            series = datasets[plan.dataset][plan.source]
+            if plan.vector:
+                block = np.stack(series.iloc[chunk_start:chunk_stop].to_numpy())
+                block = block[:, : len(VECTOR_AXES)].astype(plan.dtype, copy=False)
+                for axis, output in enumerate(plan.outputs):
+                    columns[output] = block[:, axis]
+            else:
+                values = series.to_numpy()[chunk_start:chunk_stop]
+                columns[plan.outputs[0]] = values.astype(plan.dtype, copy=False)
+        yield pd.DataFrame(columns, copy=False)
+
+
+# ============================================================================
+# FORMAT WRITERS
+# ============================================================================
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Feather export need pyarrow: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, options: DataExportOptions):
+        compression = options.resolved_compression()
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Unsupported CSV compression: {compression}")
+        opener = gzip.open if compression == "gzip" else open
+        self.file = opener(path, "wt", newline="")
+        self.header = True
+
+    def write(self, chunk: pd.DataFrame):
+        chunk.to_csv(self.file, header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, options: DataExportOptions):
+        _require_pyarrow()
+        self.path = path
+        self.compression = options.resolved_compression() or "none"
+        self.writer = None
+
+    def write(self, chunk: pd.DataFrame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Each chunk becomes one row group, so readers can skip by row range
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(
+                self.path, table.schema, compression=self.compression
+            )
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class _FeatherWriter:
+    def __init__(self, path: Path, options: DataExportOptions):
+        _require_pyarrow()
+        self.path = path
+        self.compression = options.resolved_compression()
+        if self.compression not in (None, "lz4", "zstd"):
+            raise ValueError(f"Unsupported Feather compression: {self.compression}")
+        self.sink = None
+        self.writer = None
+
+    def write(self, chunk: pd.DataFrame):
+        import pyarrow as pa
+
+        # Feather v2 is the Arrow IPC file format: one record batch per chunk
+        batch = pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+        if self.writer is None:
+            self.sink = pa.OSFile(str(self.path), "wb")
+            self.writer = pa.ipc.new_file(
+                self.sink,
+                batch.schema,
+                options=pa.ipc.IpcWriteOptions(compression=self.compression),
+            )
+        self.writer.write_batch(batch)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self.sink is not None:
+            self.sink.close()
+
+
+class _Hdf5Writer:
+    def __init__(self, path: Path, options: DataExportOptions):
+        try:
+            import tables  # noqa: F401  (pandas HDFStore backend)
+        except ImportError as e:
+            raise ImportError("HDF5 export needs PyTables: pip install tables") from e
+
+        compression = options.resolved_compression()
+        self.store = pd.HDFStore(
+            path,
+            mode="w",
+            complevel=5 if compression else 0,
+            complib=compression,
+        )
+
+    def write(self, chunk: pd.DataFrame):
+        if chunk.empty:
+            # Table format silently skips empty frames; keep the columns anyway
+            self.store.put("swing", chunk, format="fixed")
+            return
+        # Table format appends in place and supports reading selected columns
+        self.store.append("swing", chunk, format="table", index=False)
+
+    def close(self):
+        self.store.close()
+
+
+_WRITERS: Dict[str, Callable[[Path, DataExportOptions], Any]] = {
+    "csv": _CsvWriter,
+    "parquet": _ParquetWriter,
+    "feather": _FeatherWriter,
+    "hdf5": _Hdf5Writer,
+}
+
+
+def format_for_path(path: Union[str, Path], default: str = "parquet") -> str:
+    """Export format implied by a file extension (".csv.gz" is CSV)"""
+    path = Path(path)
+    if path.suffix.lower() == ".gz":
+        path = path.with_suffix("")
+    return FORMAT_EXTENSIONS.get(path.suffix.lower(), default)
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+
+def export_datasets(
+    source: Any,
+    path: Union[str, Path],
+    options: Optional[DataExportOptions] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> DataExportResult:
+    """Write swing data to ``path`` one row chunk at a time.
+
+    ``should_stop`` is polled between chunks; a stopped export removes the
+    partial file. ``on_progress`` receives (rows written, total rows).
+    """
+    start_time = time.perf_counter()
+    options = options or DataExportOptions()
+    if options.format not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {options.format}")
+
+    path = Path(path)
+    datasets = named_datasets(source)
+    num_rows = min((len(df) for df in datasets.values()), default=0)
+    start = max(0, options.start)
+    stop = num_rows if options.stop is None else min(options.stop, num_rows)
+    stop = max(start, stop)
+    plans = plan_columns(datasets, options)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = _WRITERS[options.format](path, options)
+    rows = 0
+    completed = True
+    try:
+        for chunk in iter_chunks(
+            datasets, plans, start, stop, max(1, options.chunk_rows)
+        ):
+            if should_stop is not None and should_stop():
+                completed = False
+                break
+            writer.write(chunk)
+            rows += len(chunk)
+            if on_progress is not None:
+                on_progress(rows, stop - start)
+        if rows == 0 and completed:
+            # Still write the header/schema for an empty range
+            writer.write(next(iter_chunks(datasets, plans, 0, 1, 1)).iloc[:0])
+    except BaseException:
+        writer.close()
+        path.unlink(missing_ok=True)
+        raise
+    writer.close()
+
+    if not completed:
+        path.unlink(missing_ok=True)
+
+    num_columns = sum(len(plan.outputs) for plan in plans)
+    elapsed = time.perf_counter() - start_time
+    bytes_written = path.stat().st_size if completed else 0
+    if completed:
+        print(
+            f"💾 Exported {rows} rows x {num_columns} columns to {path} "
+            f"({bytes_written / 1e6:.1f} MB, {elapsed:.2f}s)"
+        )
+    return DataExportResult(path, rows, num_columns, bytes_written, elapsed, completed)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Frame Clock
+One display-rate tick that advances data playback, camera animation and
+inertia together, then repaints each affected view once
+"""
+
+import math
+import time
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+
+# Called as callback(now, dt) on every tick; returning False unsubscribes it
+TickCallback = Callable[[float, float], bool]
+
+# ============================================================================
+# FRAME CLOCK
+# ============================================================================
+
+
+class FrameClock(QObject):
+    """Shared animation clock ticking on the display refresh grid.
+
+    Subscribers all see the same timestamp each tick, so playback and camera
+    motion never drift apart. Widgets that ask for a repaint during a tick are
+    updated once after every subscriber has run. The clock only runs while
+    something is subscribed. With a vsync source the tick grid is re-phased
+    on each buffer swap. ``dt`` is capped at ``max_dt``, so a stall (a modal
+    dialog, a window drag) does not make dt-driven motion jump.
+    """
+
+    ticked = pyqtSignal(float, float)  # now, dt
+
+    def __init__(
+        self,
+        refresh_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.perf_counter,
+        max_dt: float = 0.1,
+    ):
+        super().__init__()
+        self.clock = clock
+        self.refresh_rate = refresh_rate or self._screen_refresh_rate()
+        self.max_dt = max_dt
+
+        # Insertion-ordered set of subscribers
+        self._callbacks: Dict[TickCallback, None] = {}
+        self._pending_repaints: Dict[int, object] = {}
+        self._in_tick = False
+        self._last_tick: Optional[float] = None
+        self._phase = 0.0  # Wall-clock instant on the refresh grid
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+        # Totals for diagnostics
+        self.ticks = 0
+        self.repaints = 0
+
+    @staticmethod
+    def _screen_refresh_rate() -> float:
+        screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+        refresh_rate = screen.refreshRate() if screen else 60.0
+        return refresh_rate if refresh_rate > 0 else 60.0
+
+    @property
+    def interval(self) -> float:
+        """Seconds between ticks"""
+        return 1.0 / self.refresh_rate
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._callbacks)
+
+    @property
+    def in_tick(self) -> bool:
+        return self._in_tick
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+
+    def start(self, callback: TickCallback):
+        """Call ``callback`` on every tick until it returns False or is stopped"""
+        if callback in self._callbacks:
+            return
+        self._callbacks[callback] = None
+        if len(self._callbacks) == 1:
+            # Waking from idle: the first tick has dt measured from now
+            now = self.clock()
+            self._last_tick = now
+            self._phase = now
+            self._schedule_next()
+
+    def stop(self, callback: TickCallback):
+        self._callbacks.pop(callback, None)
+        if not self._callbacks:
+            self._timer.stop()
+
+    def is_active(self, callback: TickCallback) -> bool:
+        return callback in self._callbacks
+
+    # ------------------------------------------------------------------
+    # Repaints
+    # ------------------------------------------------------------------
+
+    def request_repaint(self, widget) -> bool:
+        """Repaint ``widget`` once when the current tick ends.
+
+        Returns False outside a tick, where the caller schedules its own repaint.
+        """
+        if not self._in_tick:
+            return False
+        self._pending_repaints[id(widget)] = widget
+        return True
+
+    def set_vsync_source(self, widget):
+        """Lock the tick grid to a QOpenGLWidget's buffer swaps"""
+        widget.frameSwapped.connect(self._on_frame_swapped)
+
+    def _on_frame_swapped(self):
+        # The swap returned on a vertical blank: tick from here
+        self._phase = self.clock()
+        if self._callbacks and not self._in_tick:
+            self._schedule_next()
+
+    # ------------------------------------------------------------------
+    # Ticking
+    # ------------------------------------------------------------------
+
+    def _schedule_next(self):
+        """Start the timer for the next boundary on the refresh grid"""
+        interval = self.interval
+        now = self.clock()
+        # Skip boundaries less than half a frame after the last tick, so a
+        # timer firing a little early does not cause a double tick
+        earliest = max(now, (self._last_tick or now) + 0.5 * interval)
+        boundary = math.ceil((earliest - self._phase) / interval)
+        delay = self._phase + boundary * interval - now
+        self._timer.start(max(0, int(round(delay * 1000.0))))
+
+    def _tick(self):
+        now = self.clock()
+        dt = now - self._last_tick if self._last_tick is not None else 0.0
+        dt = min(dt, self.max_dt)
+        self._last_tick = now
+
+        self._in_tick = True
+        try:
+            for callback in list(self._callbacks):
+                if callback not in self._callbacks:
+                    continue  # Stopped by an earlier subscriber this tick
+                try:
+                    keep = callback(now, dt)
+                except Exception as e:
+                    print(f"❌ Frame clock subscriber failed: {e}")
+                    keep = False
+                if not keep:
+                    self._callbacks.pop(callback, None)
+            self.ticked.emit(now, dt)
+        finally:
+            self._in_tick = False
+
+        widgets: List[object] = list(self._pending_repaints.values())
+        self._pending_repaints.clear()
+        for widget in widgets:
+            widget.update()
+        self.ticks += 1
+        self.repaints += len(widgets)
+
+        if self._callbacks:
+            self._schedule_next()
+
+
+_frame_clock: Optional[FrameClock] = None
+
+
+def get_frame_clock() -> FrameClock:
+    """Application-wide frame clock (created on first use)"""
+    global _frame_clock
+    if _frame_clock is None:
+        _frame_clock = FrameClock()
+    return _frame_clock
@@ -6,7 +6,11 @@ Supports multiple data sources including motion capture and future Simulink mode
 
 import os
 import sys
+import threading
+import time
 import traceback
+from dataclasses import dataclass, field
+from enum import IntFlag
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -14,11 +18,23 @@ import moderngl as mgl
 import numpy as np
 import pandas as pd
 # Local imports
-from golf_data_core import FrameData, FrameProcessor, RenderConfig
-from golf_opengl_renderer import OpenGLRenderer
-from PyQt6.QtCore import (QEasingCurve, QPoint, QPropertyAnimation, QRect,
-                          QRunnable, QSize, Qt, QThread, QThreadPool, QTimer,
-                          pyqtSignal, pyqtSlot)
+from golf_data_core import (FrameData, FrameProcessor, RenderConfig,
+                            SwingDataKey, SwingDataRegistry, SwingDataStore,
+                            get_swing_registry, merge_bounds)
+from golf_frame_clock import get_frame_clock
+from golf_metrics import get_metrics
+from golf_opengl_renderer import (OpenGLRenderer, ViewportSpec,
+                                  calculate_bounds_framing,
+                                  calculate_camera_framing,
+                                  calculate_look_at_matrix,
+                                  calculate_orbit_position,
+                                  calculate_projection_matrix,
+                                  enable_driver_shader_cache,
+                                  split_viewport_rects)
+from golf_playback import PlaybackScheduler
+from PyQt6.QtCore import (QEasingCurve, QObject, QPoint, QPropertyAnimation,
+                          QRect, QRunnable, QSize, Qt, QThread, QThreadPool,
+                          QTimer, pyqtSignal, pyqtSlot)
 from PyQt6.QtGui import (QAction, QActionGroup, QBrush, QColor, QFont, QIcon,
                          QKeySequence, QPainter, QPalette, QPen, QPixmap,
                          QShortcut)
@@ -34,22 +50,159 @@ from PyQt6.QtWidgets import (QApplication, QCheckBox, QComboBox,
                              QVBoxLayout, QWidget)
 from wiffle_data_loader import MotionDataLoader
 
+# ============================================================================
+# BACKGROUND LOADING
+# ============================================================================
+
+# Loader stage -> (progress percent when the stage starts, display name)
+LOAD_STAGES = {
+    "reading": (0, "Reading"),
+    "converting": (40, "Converting"),
+    "indexing": (60, "Indexing"),
+    "uploading": (90, "Uploading to GPU"),
+    "ready": (100, "Ready"),
+}
+
+
+class LoadCancelled(Exception):
+    """Raised inside a load task once cancellation has been requested"""
+
+
+class DataLoadSignals(QObject):
+    """Signals for MotionDataLoadTask (a QRunnable cannot emit itself)"""
+
+    progress = pyqtSignal(int, str)  # generation, stage
+    finished = pyqtSignal(int, object)  # generation, SwingDataStore
+    failed = pyqtSignal(int, str)  # generation, message
+    cancelled = pyqtSignal(int)  # generation
+
+
+class MotionDataLoadTask(QRunnable):
+    """Read, convert and index motion capture data on a pool thread.
+
+    Nothing is shared with the UI until the finished signal hands over a
+    complete SwingDataStore, so a cancelled or superseded load leaves the
+    current swing untouched.
+    """
+
+    def __init__(
+        self,
+        swing_type: str,
+        generation: int,
+        key: SwingDataKey,
+        registry: SwingDataRegistry,
+    ):
+        super().__init__()
+        self.swing_type = swing_type
+        self.generation = generation
+        self.key = key
+        self.registry = registry
+        self.signals = DataLoadSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation; honoured at the next stage boundary"""
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _begin_stage(self, stage: str):
+        if self.is_cancelled:
+            raise LoadCancelled()
+        self.signals.progress.emit(self.generation, stage)
+
+    @pyqtSlot()
+    def run(self):
+        start_time = time.perf_counter()
+        try:
+            self._begin_stage("reading")
+            loader = MotionDataLoader()
+            excel_data = loader.load_excel_data(self.key.source)
+
+            self._begin_stage("converting")
+            datasets = loader.convert_to_gui_format(excel_data)
+            baseq_data, ztcfq_data, deltaq_data = datasets
+
+            self._begin_stage("indexing")
+            frame_processor = FrameProcessor(datasets, RenderConfig())
+            if not frame_processor.warm_caches(self._cancel_event.is_set):
+                raise LoadCancelled()
+
+            # ZTCFQ holds the Wiffle trial; overlay it against ProV1
+            wiffle_processor = FrameProcessor(
+                (ztcfq_data, ztcfq_data, deltaq_data), RenderConfig()
+            )
+            if not wiffle_processor.warm_caches(
+                self._cancel_event.is_set, include_dynamics=False
+            ):
+                raise LoadCancelled()
+
+            if self.is_cancelled:
+                raise LoadCancelled()
+
+            store = SwingDataStore(
+                name=Path(self.key.source).stem,
+                datasets=datasets,
+                frame_processor=frame_processor,
+                ghost_processors={"Wiffle": wiffle_processor},
+                load_time_s=time.perf_counter() - start_time,
+            )
+            get_metrics().histogram("loader.swing_load_ms").observe(
+                store.load_time_s * 1000
+            )
+            # A concurrent load of the same key may have won; share its store
+            store = self.registry.put(self.key, store)
+            self.signals.finished.emit(self.generation, store)
+
+        except LoadCancelled:
+            self.signals.cancelled.emit(self.generation)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(self.generation, str(e))
+
+
 # ============================================================================
 # TAB WIDGETS
 # ============================================================================
 
+# Playback combo entries: label -> (scheduler mode, slow-motion speed)
+PLAYBACK_SPEEDS = {
+    "Real-time": ("realtime", 1.0),
+    "Slow motion 0.5x": ("slow_motion", 0.5),
+    "Slow motion 0.25x": ("slow_motion", 0.25),
+    "Slow motion 0.1x": ("slow_motion", 0.1),
+    "Frame-accurate": ("frame_accurate", 1.0),
+}
+
 
 class MotionCaptureTab(QWidget):
     """Tab for motion capture data visualization"""
 
+    # Emitted with the SwingDataStore now shown by this tab
+    dataStoreChanged = pyqtSignal(object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.frame_processor = None
         self.current_frame = 0
         self.is_playing = False
-        self.playback_timer = QTimer()
-        self.playback_timer.timeout.connect(self._next_frame)
+
+        # Playhead follows the wall clock; the shared frame clock paces redraws
+        self.playback_scheduler = PlaybackScheduler()
+        self.frame_position = 0.0  # Fractional frame shown by the viewer
+        self.frame_clock = get_frame_clock()
+        # Processor and playhead of the frame data last sent to the viewer
+        self._shown_frame: Tuple[Any, float] = (None, 0.0)
+
+        # Background loading; results from older generations are dropped
+        self.swing_registry = get_swing_registry()
+        self.data_store: Optional[SwingDataStore] = None
+        self.thread_pool = QThreadPool.globalInstance()
+        self._load_task: Optional[MotionDataLoadTask] = None
+        self._load_generation = 0
 
         self._setup_ui()
         self._setup_connections()
@@ -88,6 +241,16 @@ class MotionCaptureTab(QWidget):
         self.load_button.setMaximumWidth(100)  # Make button smaller
         layout.addWidget(self.load_button, 0, 2)
 
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setVisible(False)
+        layout.addWidget(self.load_progress, 0, 3)
+
+        self.cancel_load_button = QPushButton("Cancel")
+        self.cancel_load_button.setMaximumWidth(100)
+        self.cancel_load_button.setVisible(False)
+        layout.addWidget(self.cancel_load_button, 0, 4)
+
         # Playback controls
         layout.addWidget(QLabel("Playback:"), 1, 0)
 
@@ -102,6 +265,10 @@ class MotionCaptureTab(QWidget):
         self.frame_label = QLabel("Frame: 0/0")
         layout.addWidget(self.frame_label, 1, 3)
 
+        self.playback_mode_combo = QComboBox()
+        self.playback_mode_combo.addItems(list(PLAYBACK_SPEEDS))
+        layout.addWidget(self.playback_mode_combo, 1, 4)
+
         # Visualization options
         layout.addWidget(QLabel("Display:"), 2, 0)
 
@@ -117,56 +284,173 @@ class MotionCaptureTab(QWidget):
         self.show_ground_check.setChecked(True)
         layout.addWidget(self.show_ground_check, 2, 3)
 
+        self.show_trails_check = QCheckBox("Trails")
+        self.show_trails_check.setChecked(False)
+        layout.addWidget(self.show_trails_check, 2, 4)
+
+        # Ghost overlay of the other ball type's swing
+        layout.addWidget(QLabel("Overlay:"), 3, 0)
+
+        self.show_ghosts_check = QCheckBox("Ghost Swings")
+        self.show_ghosts_check.setChecked(False)
+        layout.addWidget(self.show_ghosts_check, 3, 1)
+
+        self.ghost_alignment_combo = QComboBox()
+        self.ghost_alignment_combo.addItems(["normalized", "impact"])
+        layout.addWidget(self.ghost_alignment_combo, 3, 2)
+
         panel.setLayout(layout)
         return panel
 
     def _setup_connections(self):
         """Setup signal connections"""
         self.load_button.clicked.connect(self._load_motion_capture_data)
+        self.cancel_load_button.clicked.connect(self._cancel_loading)
+        self.opengl_widget.datasetUploaded.connect(self._on_dataset_uploaded)
         self.play_button.clicked.connect(self._toggle_playback)
         self.frame_slider.valueChanged.connect(self._on_frame_changed)
         self.swing_combo.currentTextChanged.connect(self._on_swing_changed)
+        self.playback_mode_combo.currentTextChanged.connect(
+            self._on_playback_mode_changed
+        )
 
         # Visualization checkboxes
         self.show_body_check.toggled.connect(self._update_visualization)
         self.show_club_check.toggled.connect(self._update_visualization)
         self.show_ground_check.toggled.connect(self._update_visualization)
+        self.show_trails_check.toggled.connect(self._update_visualization)
+        self.show_ghosts_check.toggled.connect(self._update_visualization)
+        self.ghost_alignment_combo.currentTextChanged.connect(
+            self._update_visualization
+        )
 
     def _load_motion_capture_data(self):
-        """Load motion capture data"""
-        try:
-            swing_type = self.swing_combo.currentText()
-            self.status_label.setText(f"Loading {swing_type} data...")
+        """Show cached swing data, or start loading it on the thread pool"""
+        self._cancel_loading()
+        self._load_generation += 1
+        swing_type = self.swing_combo.currentText()
 
-            # Load data using the existing MotionDataLoader
+        try:
             loader = MotionDataLoader()
-            excel_data = loader.load_data()  # Load the Excel data first
-            baseq_data, ztcfq_data, deltaq_data = loader.convert_to_gui_format(
-                excel_data
+            key = SwingDataKey.for_file(
+                loader.find_data_file(), **loader.cache_options()
             )
+        except Exception as e:
+            self.status_label.setText(f"Error loading data: {str(e)}")
+            traceback.print_exc()
+            return
 
-            # Create frame processor with config
-            config = RenderConfig()
-            self.frame_processor = FrameProcessor(
-                (baseq_data, ztcfq_data, deltaq_data), config
-            )
+        store = self.swing_registry.get(key)
+        if store is not None:
+            if store is not self.data_store:
+                self._apply_data_store(store)
+            self.status_label.setText(f"Loaded {swing_type} data (cached)")
+            return
 
-            # Update UI
-            total_frames = len(self.frame_processor.time_vector)
-            self.frame_slider.setMaximum(total_frames - 1)
-            self.frame_label.setText(f"Frame: 0/{total_frames}")
+        task = MotionDataLoadTask(
+            swing_type, self._load_generation, key, self.swing_registry
+        )
+        task.signals.progress.connect(self._on_load_progress)
+        task.signals.finished.connect(self._on_load_finished)
+        task.signals.failed.connect(self._on_load_failed)
+        task.signals.cancelled.connect(self._on_load_cancelled)
+        self._load_task = task
+
+        self.status_label.setText(f"Loading {swing_type} data...")
+        self._show_load_progress("reading")
+        self.cancel_load_button.setVisible(True)
+        self.thread_pool.start(task)
+
+    def _cancel_loading(self):
+        """Cancel the running load, if any; the current swing stays loaded"""
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+
+    def _is_current_load(self, generation: int) -> bool:
+        return generation == self._load_generation
+
+    def _show_load_progress(self, stage: str):
+        percent, label = LOAD_STAGES[stage]
+        self.load_progress.setValue(percent)
+        self.load_progress.setFormat(f"{label}... %p%")
+        self.load_progress.setVisible(True)
+
+    def _hide_load_progress(self):
+        self.load_progress.setVisible(False)
+        self.cancel_load_button.setVisible(False)
+
+    def _on_load_progress(self, generation: int, stage: str):
+        if self._is_current_load(generation):
+            self._show_load_progress(stage)
+
+    def _on_load_finished(self, generation: int, store: SwingDataStore):
+        if not self._is_current_load(generation):
+            return
 
-            # Initialize visualization
-            self.opengl_widget.load_data_from_dataframes(
-                (baseq_data, ztcfq_data, deltaq_data)
+        self._load_task = None
+        self.cancel_load_button.setVisible(False)
+        try:
+            self._apply_data_store(store)
+            self.status_label.setText(
+                f"Loaded {self.swing_combo.currentText()} data successfully "
+                f"({store.load_time_s:.2f}s)"
             )
-
-            self.status_label.setText(f"Loaded {swing_type} data successfully")
-
         except Exception as e:
+            self._hide_load_progress()
             self.status_label.setText(f"Error loading data: {str(e)}")
             traceback.print_exc()
 
+    def _on_load_failed(self, generation: int, message: str):
+        if not self._is_current_load(generation):
+            return
+
+        self._load_task = None
+        self._hide_load_progress()
+        self.status_label.setText(f"Error loading data: {message}")
+
+    def _on_load_cancelled(self, generation: int):
+        # A newer load may already be running; only the current one reports
+        if not self._is_current_load(generation):
+            return
+
+        self._load_task = None
+        self._hide_load_progress()
+        self.status_label.setText("Loading cancelled")
+
+    def _apply_data_store(self, store: SwingDataStore):
+        """Swap in a fully prepared swing in one step on the UI thread"""
+        if self.is_playing:
+            self._toggle_playback()
+
+        self.data_store = store
+        self.frame_processor = store.frame_processor
+        self.playback_scheduler.set_time_vector(self.frame_processor.time_vector)
+        self.frame_position = 0.0
+
+        # Update UI
+        self.frame_slider.blockSignals(True)
+        self.frame_slider.setMaximum(max(store.num_frames - 1, 0))
+        self.frame_slider.setValue(0)
+        self.frame_slider.blockSignals(False)
+        self._update_frame_label(0)
+
+        # GPU upload happens on the next paint with the context current
+        self._show_load_progress("uploading")
+        self.opengl_widget.set_frame_processor(store.frame_processor)
+        self.opengl_widget.set_ghost_swings(store.ghost_processors)
+        self._update_visualization()
+        self.dataStoreChanged.emit(store)
+
+        if not self.opengl_widget.renderer:
+            # No GL context yet; the upload happens when the view first shows
+            self._on_dataset_uploaded()
+
+    def _on_dataset_uploaded(self):
+        if not self.load_progress.isHidden():
+            self._show_load_progress("ready")
+            QTimer.singleShot(500, self._hide_load_progress)
+
     def _on_swing_changed(self, swing_type: str):
         """Handle swing type change"""
         if self.frame_processor is not None:
@@ -179,31 +463,54 @@ class MotionCaptureTab(QWidget):
 
         if self.is_playing:
             self.play_button.setText("Play")
-            self.playback_timer.stop()
+            self.frame_clock.stop(self._on_playback_tick)
+            self.playback_scheduler.pause()
             self.is_playing = False
         else:
             self.play_button.setText("Pause")
-            self.playback_timer.start(33)  # ~30 FPS
+            self.playback_scheduler.play(self.frame_position)
+            self.frame_clock.start(self._on_playback_tick)
             self.is_playing = True
 
-    def _next_frame(self):
-        """Advance to next frame"""
+    def _on_playback_mode_changed(self, label: str):
+        """Apply the selected playback mode and speed"""
+        mode, speed = PLAYBACK_SPEEDS[label]
+        if mode == "slow_motion":
+            self.playback_scheduler.set_slow_motion_speed(speed)
+        self.playback_scheduler.set_mode(mode)
+
+    def _on_playback_tick(self, now: float, dt: float) -> bool:
+        """Move the playhead to the frame clock's time and redraw"""
         if not self.frame_processor:
-            return
+            return False
 
-        current_frame = self.frame_slider.value()
-        total_frames = len(self.frame_processor.time_vector)
+        state = self.playback_scheduler.tick(now)
+        self.frame_position = state.position
 
-        next_frame = (current_frame + 1) % total_frames
-        self.frame_slider.setValue(next_frame)
+        # Keep the slider in step without treating it as a user seek
+        self.frame_slider.blockSignals(True)
+        self.frame_slider.setValue(state.frame_index)
+        self.frame_slider.blockSignals(False)
+        self._update_frame_label(state.frame_index)
+        self._update_visualization()
+
+        if state.finished:
+            self._toggle_playback()
+        return self.is_playing
+
+    def _update_frame_label(self, frame_index: int):
+        total_frames = len(self.frame_processor.time_vector)
+        self.frame_label.setText(f"Frame: {frame_index}/{total_frames}")
 
     def _on_frame_changed(self, frame_index: int):
         """Handle frame slider change"""
         if not self.frame_processor:
             return
 
-        total_frames = len(self.frame_processor.time_vector)
-        self.frame_label.setText(f"Frame: {frame_index}/{total_frames}")
+        # User seek: playback continues from the new position
+        self.frame_position = float(frame_index)
+        self.playback_scheduler.seek(self.frame_position)
+        self._update_frame_label(frame_index)
 
         # Update visualization
         self._update_visualization()
@@ -214,9 +521,6 @@ class MotionCaptureTab(QWidget):
             return
 
         try:
-            frame_index = self.frame_slider.value()
-            frame_data = self.frame_processor.get_frame_data(frame_index)
-
             # Update render config
             render_config = RenderConfig()
             render_config.show_body_segments = {
@@ -229,6 +533,29 @@ class MotionCaptureTab(QWidget):
             }
             render_config.show_club = self.show_club_check.isChecked()
             render_config.show_ground = self.show_ground_check.isChecked()
+            render_config.show_trajectory = self.show_trails_check.isChecked()
+            render_config.show_ghosts = self.show_ghosts_check.isChecked()
+            render_config.ghost_alignment = self.ghost_alignment_combo.currentText()
+
+            # Option toggles keep the frame on screen, so the viewer sees a
+            # config-only change; only a moved playhead builds new frame data
+            frame_data = self.opengl_widget.current_frame_data
+            shown_source, shown_position = self._shown_frame
+            if (
+                frame_data is None
+                or shown_source is not self.frame_processor
+                or shown_position != self.frame_position
+            ):
+                # Between-sample playhead positions are blended when enabled
+                if render_config.smooth_interpolation:
+                    frame_data = self.frame_processor.get_interpolated_frame_data(
+                        self.frame_position
+                    )
+                else:
+                    frame_data = self.frame_processor.get_frame_data(
+                        int(round(self.frame_position))
+                    )
+                self._shown_frame = (self.frame_processor, self.frame_position)
 
             # Update visualization
             self.opengl_widget.update_frame(frame_data, render_config)
@@ -243,6 +570,7 @@ class SimulinkModelTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
+        self.swing_registry = get_swing_registry()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -275,58 +603,247 @@ class SimulinkModelTab(QWidget):
         self.setLayout(layout)
 
 
+# Comparison layouts: label -> viewports as (title, azimuth, elevation, swing).
+# Swing "A" is the loaded swing, "B" its first overlay swing (Wiffle).
+COMPARISON_LAYOUTS = {
+    "Face-on | Down-the-line": (
+        ("Face-on", 0.0, 15.0, "A"),
+        ("Down-the-line", 90.0, 15.0, "A"),
+    ),
+    "Swing A | Swing B (face-on)": (
+        ("Swing A", 0.0, 15.0, "A"),
+        ("Swing B", 0.0, 15.0, "B"),
+    ),
+    "Swing A | Swing B (down-the-line)": (
+        ("Swing A", 90.0, 15.0, "A"),
+        ("Swing B", 90.0, 15.0, "B"),
+    ),
+    "Four views": (
+        ("Face-on", 0.0, 15.0, "A"),
+        ("Down-the-line", 90.0, 15.0, "A"),
+        ("Behind", 180.0, 15.0, "A"),
+        ("Overhead", 0.0, 80.0, "A"),
+    ),
+}
+
+
 class ComparisonTab(QWidget):
-    """Tab for comparing motion capture vs Simulink model data"""
+    """Tab for comparing swings and camera angles side by side"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
+        self.swing_registry = get_swing_registry()
+        self.data_store: Optional[SwingDataStore] = None
+        self.is_playing = False
+
+        # One playhead drives every viewport
+        self.playback_scheduler = PlaybackScheduler()
+        self.frame_position = 0.0
+        self.frame_clock = get_frame_clock()
+
         self._setup_ui()
+        self._setup_connections()
 
     def _setup_ui(self):
         """Setup the comparison tab UI"""
         layout = QVBoxLayout()
 
-        # Placeholder for comparison functionality
-        placeholder = QLabel(
-            "Data Comparison Analysis\n\nThis tab will support:\n"
-            "• Side-by-side visualization\n"
-            "• Hand midpoint tracking accuracy\n"
-            "• Error analysis and metrics\n"
-            "• Performance optimization feedback"
-        )
-        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder.setStyleSheet(
-            """
-            QLabel {
-                font-size: 16px;
-                color: #666;
-                padding: 40px;
-                border: 2px dashed #ccc;
-                border-radius: 10px;
-                background-color: #f9f9f9;
-            }
-        """
+        panel = QGroupBox("Comparison Controls")
+        controls = QGridLayout()
+
+        controls.addWidget(QLabel("Layout:"), 0, 0)
+        self.layout_combo = QComboBox()
+        self.layout_combo.addItems(list(COMPARISON_LAYOUTS))
+        controls.addWidget(self.layout_combo, 0, 1)
+
+        self.play_button = QPushButton("Play")
+        controls.addWidget(self.play_button, 0, 2)
+
+        self.frame_slider = QSlider(Qt.Orientation.Horizontal)
+        self.frame_slider.setMinimum(0)
+        self.frame_slider.setMaximum(0)
+        controls.addWidget(self.frame_slider, 0, 3)
+
+        self.frame_label = QLabel("Frame: 0/0")
+        controls.addWidget(self.frame_label, 0, 4)
+
+        self.playback_mode_combo = QComboBox()
+        self.playback_mode_combo.addItems(list(PLAYBACK_SPEEDS))
+        controls.addWidget(self.playback_mode_combo, 0, 5)
+
+        panel.setLayout(controls)
+        layout.addWidget(panel)
+
+        # All viewports share this widget's GL context and uploaded buffers
+        self.comparison_widget = ComparisonVisualizerWidget()
+        layout.addWidget(self.comparison_widget)
+
+        self.status_label = QLabel(
+            "Load motion capture data to compare swings and camera angles"
         )
+        layout.addWidget(self.status_label)
 
-        layout.addWidget(placeholder)
         self.setLayout(layout)
 
+    def _setup_connections(self):
+        """Setup signal connections"""
+        self.layout_combo.currentTextChanged.connect(self._apply_layout)
+        self.play_button.clicked.connect(self._toggle_playback)
+        self.frame_slider.valueChanged.connect(self._on_frame_changed)
+        self.playback_mode_combo.currentTextChanged.connect(
+            self._on_playback_mode_changed
+        )
+
+    def set_data_store(self, store: SwingDataStore):
+        """Compare the swings of a (shared) data store"""
+        if self.is_playing:
+            self._toggle_playback()
+
+        self.data_store = store
+        swings = {"A": store.frame_processor}
+        for ghost_processor in store.ghost_processors.values():
+            swings["B"] = ghost_processor
+            break
+
+        self.playback_scheduler.set_time_vector(store.frame_processor.time_vector)
+        self.frame_position = 0.0
+        self.frame_slider.blockSignals(True)
+        self.frame_slider.setMaximum(max(store.num_frames - 1, 0))
+        self.frame_slider.setValue(0)
+        self.frame_slider.blockSignals(False)
+        self._update_frame_label(0)
+
+        self.comparison_widget.set_swings(swings)
+        self._apply_layout(self.layout_combo.currentText())
+        self.status_label.setText(
+            f"Comparing {store.name}: {', '.join(swings)} ({store.num_frames} frames)"
+        )
+
+    def _apply_layout(self, label: str):
+        """Rebuild the viewports for a layout preset"""
+        swings = self.comparison_widget.swings
+        viewports = [
+            ComparisonViewport(
+                title=title,
+                azimuth=azimuth,
+                elevation=elevation,
+                # Without a second swing, show the first one in its place
+                swing_id=swing_id if swing_id in swings else "A",
+            )
+            for title, azimuth, elevation, swing_id in COMPARISON_LAYOUTS[label]
+        ]
+        self.comparison_widget.set_viewports(viewports)
+
+    def _toggle_playback(self):
+        """Toggle playback"""
+        if self.data_store is None:
+            return
+
+        if self.is_playing:
+            self.play_button.setText("Play")
+            self.frame_clock.stop(self._on_playback_tick)
+            self.playback_scheduler.pause()
+            self.is_playing = False
+        else:
+            self.play_button.setText("Pause")
+            self.playback_scheduler.play(self.frame_position)
+            self.frame_clock.start(self._on_playback_tick)
+            self.is_playing = True
+
+    def _on_playback_mode_changed(self, label: str):
+        """Apply the selected playback mode and speed"""
+        mode, speed = PLAYBACK_SPEEDS[label]
+        if mode == "slow_motion":
+            self.playback_scheduler.set_slow_motion_speed(speed)
+        self.playback_scheduler.set_mode(mode)
+
+    def _on_playback_tick(self, now: float, dt: float) -> bool:
+        """Advance the shared playhead and redraw every viewport"""
+        state = self.playback_scheduler.tick(now)
+        self.frame_position = state.position
+
+        self.frame_slider.blockSignals(True)
+        self.frame_slider.setValue(state.frame_index)
+        self.frame_slider.blockSignals(False)
+        self._update_frame_label(state.frame_index)
+        self.comparison_widget.set_playhead(state.data_time)
+
+        if state.finished:
+            self._toggle_playback()
+        return self.is_playing
+
+    def _update_frame_label(self, frame_index: int):
+        total_frames = self.data_store.num_frames if self.data_store else 0
+        self.frame_label.setText(f"Frame: {frame_index}/{total_frames}")
+
+    def _on_frame_changed(self, frame_index: int):
+        """Handle frame slider change"""
+        if self.data_store is None:
+            return
+
+        self.frame_position = float(frame_index)
+        self.playback_scheduler.seek(self.frame_position)
+        self._update_frame_label(frame_index)
+        self.comparison_widget.set_playhead(
+            self.playback_scheduler.position_to_time(self.frame_position)
+        )
+
 
 # ============================================================================
 # OPENGL WIDGET
 # ============================================================================
 
 
+class DirtyFlags(IntFlag):
+    """Parts of the widget state that changed since the last paint"""
+
+    NONE = 0
+    CAMERA = 1
+    FRAME = 2
+    CONFIG = 4
+    VIEWPORT = 8
+    ALL = CAMERA | FRAME | CONFIG | VIEWPORT
+
+
 class GolfVisualizerWidget(QOpenGLWidget):
     """OpenGL widget for 3D golf swing visualization"""
 
+    # Upper bound on repaint rate while events keep arriving
+    MAX_REDRAW_FPS = 120.0
+
+    # Emitted after a new dataset's trails and ghosts reach the GPU
+    datasetUploaded = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.renderer = None
         self.frame_processor = None
         self.current_frame_data = None
         self.current_render_config = None
+        self._dataset_source = None  # FrameProcessor whose GPU state is loaded
+        self.ghost_sources: Dict[str, FrameProcessor] = {}
+        self._ghost_loaded: Dict[str, FrameProcessor] = {}
+
+        # Demand-driven repaint: change events OR flags in, one timer flushes.
+        # PartialUpdate keeps the framebuffer between paints, so a paint with
+        # nothing dirty can leave the previous image in place.
+        self.setUpdateBehavior(QOpenGLWidget.UpdateBehavior.PartialUpdate)
+        self._dirty = DirtyFlags.ALL
+        self._last_paint_time = 0.0
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self.update)
+        self.skipped_paints = 0
+
+        # Animation ticks repaint through the shared clock, locked to our swaps
+        self.frame_clock = get_frame_clock()
+        self.frame_clock.set_vsync_source(self)
+
+        # Cached camera matrices, rebuilt only on CAMERA/VIEWPORT changes
+        self._view_matrix = None
+        self._proj_matrix = None
+        self._view_position = None
 
         # Camera state - Fixed for proper golf views
         self.camera_distance = 3.0
@@ -334,9 +851,15 @@ class GolfVisualizerWidget(QOpenGLWidget):
         self.camera_elevation = 15.0  # Slightly elevated for better view
         self.camera_target = np.array([0.0, 0.0, 0.0], dtype=np.float32)
 
+        # Optional CameraController: drags go through it so releases can coast
+        self.camera_controller = None
+
         # Ground level tracking
         self.ground_level = 0.0
 
+        # Render profiling overlay (toggle with P)
+        self.show_profiler_overlay = False
+
         # Mouse interaction
         self.last_mouse_pos = None
         self.mouse_pressed = False
@@ -370,22 +893,110 @@ class GolfVisualizerWidget(QOpenGLWidget):
         """Handle OpenGL widget resize"""
         if self.renderer:
             self.renderer.set_viewport(w, h)
+        # Qt repaints right after resizeGL, so no timer is needed here
+        self._dirty |= DirtyFlags.VIEWPORT
+
+    # ========================================================================
+    # REDRAW SCHEDULING
+    # ========================================================================
+
+    def request_redraw(self, flags: DirtyFlags = DirtyFlags.ALL):
+        """Mark state as changed and schedule a single coalesced repaint"""
+        self._dirty |= flags
+        # During a frame clock tick, repaint once when the tick ends
+        if self.frame_clock.request_repaint(self):
+            self._redraw_timer.stop()
+            return
+        if self._redraw_timer.isActive():
+            return
+
+        # Delay only as much as needed to respect MAX_REDRAW_FPS
+        min_interval = 1.0 / self.MAX_REDRAW_FPS
+        elapsed = time.perf_counter() - self._last_paint_time
+        delay_ms = max(0, int((min_interval - elapsed) * 1000.0))
+        self._redraw_timer.start(delay_ms)
+
+    def _update_camera_matrices(self):
+        """Rebuild cached view/projection matrices if camera or viewport changed"""
+        if self._dirty & (DirtyFlags.CAMERA | DirtyFlags.VIEWPORT) or (
+            self._view_matrix is None
+        ):
+            self._view_position = self._calculate_view_position()
+            self._view_matrix = calculate_look_at_matrix(
+                self._view_position, self.camera_target
+            )
+            self._proj_matrix = self._calculate_projection_matrix()
+            self._push_camera_state()
+
+    # ========================================================================
+    # CAMERA CONTROLLER
+    # ========================================================================
+
+    def set_camera_controller(self, camera_controller):
+        """Route drags through a CameraController (orbit, pan, zoom, inertia)"""
+        if self.camera_controller is not None:
+            self.camera_controller.cameraChanged.disconnect(self._pull_camera_state)
+        self.camera_controller = camera_controller
+        if camera_controller is not None:
+            self._push_camera_state()
+            camera_controller.cameraChanged.connect(self._pull_camera_state)
+
+    def _push_camera_state(self):
+        """Start the controller from the camera the user is looking at"""
+        if self.camera_controller is None:
+            return
+        state = self.camera_controller.current_state
+        state.distance = float(self.camera_distance)
+        state.azimuth = float(self.camera_azimuth)
+        state.elevation = float(self.camera_elevation)
+        state.target = np.array(self.camera_target, dtype=np.float32)
+
+    def _pull_camera_state(self):
+        """Apply a controller move (drag, inertia, follow or animation)"""
+        state = self.camera_controller.current_state
+        self.camera_distance = float(state.distance)
+        self.camera_azimuth = float(state.azimuth)
+        self.camera_elevation = float(state.elevation)
+        self.camera_target = np.array(state.target, dtype=np.float32)
+        self.request_redraw(DirtyFlags.CAMERA)
 
     def paintGL(self):
         """Render the OpenGL scene"""
         if not self.renderer or not self.current_frame_data:
             return
 
+        # With PartialUpdate the framebuffer survives between paints, so an
+        # unchanged scene (e.g. a plain expose event) needs no GL work at all
+        if not self._dirty:
+            self.skipped_paints += 1
+            return
+
         try:
-            # Calculate view and projection matrices
-            view_matrix = self._calculate_view_matrix()
-            proj_matrix = self._calculate_projection_matrix()
-            view_position = self._calculate_view_position()
+            self._update_camera_matrices()
+            view_matrix = self._view_matrix
+            proj_matrix = self._proj_matrix
+            view_position = self._view_position
 
             # Pass ground level to renderer
             if hasattr(self.renderer, "ground_level"):
                 self.renderer.ground_level = self.ground_level
 
+            # Trails and vector scaling go to the GPU once per loaded dataset
+            if (
+                self.frame_processor is not None
+                and self._dataset_source is not self.frame_processor
+            ):
+                self.renderer.load_dataset(self.frame_processor)
+                self._dataset_source = self.frame_processor
+                self._sync_ghost_swings()
+                self.datasetUploaded.emit()
+            else:
+                self._sync_ghost_swings()
+
+            # QPainter leaves its own GL state behind after the overlay
+            if self.show_profiler_overlay:
+                self.renderer.apply_gl_state()
+
             # Render frame
             self.renderer.render_frame(
                 self.current_frame_data,
@@ -396,202 +1007,206 @@ class GolfVisualizerWidget(QOpenGLWidget):
                 view_position,
             )
 
+            if self.show_profiler_overlay:
+                self._draw_profiler_overlay()
+
         except Exception as e:
             print(f"❌ Render error: {e}")
+        finally:
+            self._dirty = DirtyFlags.NONE
+            self._last_paint_time = time.perf_counter()
+
+    def set_ghost_swings(self, sources: Dict[str, FrameProcessor]):
+        """Swings to overlay as ghosts, keyed by display name"""
+        self.ghost_sources = dict(sources)
+        self.request_redraw(DirtyFlags.CONFIG)
+
+    def _sync_ghost_swings(self):
+        """Upload added/changed ghost swings and drop removed ones (GL current)"""
+        for swing_id in list(self._ghost_loaded):
+            if self.ghost_sources.get(swing_id) is not self._ghost_loaded[swing_id]:
+                self.renderer.remove_ghost_swing(swing_id)
+                del self._ghost_loaded[swing_id]
+
+        for swing_id, source in self.ghost_sources.items():
+            if swing_id not in self._ghost_loaded:
+                self.renderer.add_ghost_swing(swing_id, source)
+                self._ghost_loaded[swing_id] = source
+
+    def _draw_profiler_overlay(self):
+        """Draw per-pass timings and a frame-time sparkline over the scene"""
+        profiler = self.renderer.profiler
+        if profiler is None:
+            return
+
+        lines = profiler.overlay_lines()
+        line_height = 14
+        graph_height = 40
+        width = 360
+        height = line_height * len(lines) + graph_height + 16
+
+        painter = QPainter(self)
+        try:
+            painter.fillRect(8, 8, width, height, QColor(0, 0, 0, 160))
+            painter.setFont(QFont("Monospace", 8))
+            painter.setPen(QColor(255, 255, 255))
+            for i, line in enumerate(lines):
+                painter.drawText(16, 8 + line_height * (i + 1), line)
+
+            # Sparkline of recent frame times, scaled to a 33 ms budget
+            graph_bottom = 8 + height - 6
+            budget_ms = 33.3
+            for history, color in (
+                (profiler.cpu_frame_ms, QColor(255, 170, 0)),
+                (profiler.gpu_frame_ms, QColor(0, 200, 255)),
+            ):
+                painter.setPen(QPen(color, 1))
+                samples = list(history)[-(width - 16) :]
+                for x, value in enumerate(samples):
+                    bar = min(value / budget_ms, 1.0) * graph_height
+                    painter.drawLine(
+                        16 + x, graph_bottom, 16 + x, int(graph_bottom - bar)
+                    )
+        finally:
+            painter.end()
 
     def _calculate_view_matrix(self) -> np.ndarray:
         """Calculate view matrix from camera parameters"""
-        # Convert spherical coordinates to Cartesian
-        x = (
-            self.camera_distance
-            * np.cos(np.radians(self.camera_elevation))
-            * np.cos(np.radians(self.camera_azimuth))
+        return calculate_look_at_matrix(
+            self._calculate_view_position(), self.camera_target
         )
-        y = self.camera_distance * np.sin(np.radians(self.camera_elevation))
-        z = (
-            self.camera_distance
-            * np.cos(np.radians(self.camera_elevation))
-            * np.sin(np.radians(self.camera_azimuth))
-        )
-
-        camera_pos = np.array([x, y, z], dtype=np.float32) + self.camera_target
-
-        # Look-at matrix
-        forward = self.camera_target - camera_pos
-        forward_norm = np.linalg.norm(forward)
-        if forward_norm > 1e-6:
-            forward = forward / forward_norm
-        else:
-            forward = np.array(
-                [0, 0, -1], dtype=np.float32
-            )  # Default forward direction
-
-        right = np.cross(forward, np.array([0, 1, 0], dtype=np.float32))
-        right_norm = np.linalg.norm(right)
-        if right_norm > 1e-6:
-            right = right / right_norm
-        else:
-            right = np.array([1, 0, 0], dtype=np.float32)  # Default right direction
-
-        up = np.cross(right, forward)
-
-        view_matrix = np.eye(4, dtype=np.float32)
-        view_matrix[:3, 0] = right
-        view_matrix[:3, 1] = up
-        view_matrix[:3, 2] = -forward
-        view_matrix[:3, 3] = -camera_pos
-
-        return view_matrix
 
     def _calculate_projection_matrix(self) -> np.ndarray:
         """Calculate projection matrix"""
         aspect = self.width() / max(self.height(), 1)
-        fov = 45.0
-        near = 0.1
-        far = 100.0
-
-        f = 1.0 / np.tan(np.radians(fov) / 2.0)
-
-        proj_matrix = np.array(
-            [
-                [f / aspect, 0, 0, 0],
-                [0, f, 0, 0],
-                [0, 0, (far + near) / (near - far), (2 * far * near) / (near - far)],
-                [0, 0, -1, 0],
-            ],
-            dtype=np.float32,
-        )
-
-        return proj_matrix
+        return calculate_projection_matrix(aspect)
 
     def _calculate_view_position(self) -> np.ndarray:
         """Calculate view position"""
-        x = (
-            self.camera_distance
-            * np.cos(np.radians(self.camera_elevation))
-            * np.cos(np.radians(self.camera_azimuth))
-        )
-        y = self.camera_distance * np.sin(np.radians(self.camera_elevation))
-        z = (
-            self.camera_distance
-            * np.cos(np.radians(self.camera_elevation))
-            * np.sin(np.radians(self.camera_azimuth))
+        return calculate_orbit_position(
+            self.camera_distance,
+            self.camera_azimuth,
+            self.camera_elevation,
+            self.camera_target,
         )
 
-        return np.array([x, y, z], dtype=np.float32) + self.camera_target
-
     def load_data_from_dataframes(
         self, dataframes: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
     ):
         """Load data from pandas DataFrames"""
         try:
-            baseq_df, ztcfq_df, deltaq_df = dataframes
-
-            # Create frame processor with config
-            config = RenderConfig()
-            self.frame_processor = FrameProcessor(
-                (baseq_df, ztcfq_df, deltaq_df), config
+            datasets = tuple(dataframes)
+
+            # Reuse the processor if another tab or widget has these frames
+            def build_store() -> SwingDataStore:
+                start_time = time.perf_counter()
+                frame_processor = FrameProcessor(datasets, RenderConfig())
+                return SwingDataStore(
+                    name="dataframes",
+                    datasets=datasets,
+                    frame_processor=frame_processor,
+                    load_time_s=time.perf_counter() - start_time,
+                )
+
+            store = get_swing_registry().get_or_create(
+                SwingDataKey.for_dataframes(datasets), build_store
             )
+            self.set_frame_processor(store.frame_processor)
 
-            # Get first frame
-            if len(self.frame_processor.time_vector) > 0:
-                self.current_frame_data = self.frame_processor.get_frame_data(0)
-                self.current_render_config = RenderConfig()
+        except Exception as e:
+            print(f"❌ Data loading failed: {e}")
+            traceback.print_exc()
 
-                # Frame camera to data
-                self._frame_camera_to_data()
+    def set_frame_processor(self, frame_processor: FrameProcessor):
+        """Show an already prepared FrameProcessor (e.g. from a loader thread)"""
+        self.frame_processor = frame_processor
 
-                # Trigger redraw
-                self.update()
+        # Get first frame
+        if len(self.frame_processor.time_vector) > 0:
+            self.current_frame_data = self.frame_processor.get_frame_data(0)
+            self.current_render_config = RenderConfig()
 
-                print(f"✅ Loaded {len(self.frame_processor.time_vector)} frames")
+            # Frame camera to data
+            self._frame_camera_to_data()
 
-        except Exception as e:
-            print(f"❌ Data loading failed: {e}")
-            traceback.print_exc()
+            # Trigger redraw
+            self.request_redraw()
+
+            print(f"✅ Loaded {len(self.frame_processor.time_vector)} frames")
 
     def update_frame(self, frame_data: FrameData, render_config: RenderConfig):
         """Update the current frame data and render config"""
+        flags = DirtyFlags.NONE
+        if frame_data is not self.current_frame_data:
+            flags |= DirtyFlags.FRAME
+        if render_config != self.current_render_config:
+            flags |= DirtyFlags.CONFIG
+
         self.current_frame_data = frame_data
         self.current_render_config = render_config
-        self.update()
+        if flags:
+            self.request_redraw(flags)
 
     def _frame_camera_to_data(self):
-        """Frame camera to show all data and set proper ground level"""
-        if not self.current_frame_data:
+        """Frame camera on the whole swing and any ghosts; set the ground level"""
+        if self.frame_processor is None:
             return
 
-        # Calculate bounding box of data
-        positions = [
-            self.current_frame_data.left_wrist,
-            self.current_frame_data.left_elbow,
-            self.current_frame_data.left_shoulder,
-            self.current_frame_data.right_wrist,
-            self.current_frame_data.right_elbow,
-            self.current_frame_data.right_shoulder,
-            self.current_frame_data.hub,
-            self.current_frame_data.butt,
-            self.current_frame_data.clubhead,
-        ]
-
-        positions = [pos for pos in positions if np.isfinite(pos).all()]
-
-        if not positions:
+        # Precomputed bounds make this a lookup rather than a scan of frames
+        processors = [self.frame_processor, *self.ghost_sources.values()]
+        bounds = merge_bounds([fp.get_bounds().range_bounds() for fp in processors])
+        framing = calculate_bounds_framing(*bounds)
+        if framing is None and self.current_frame_data:
+            framing = calculate_camera_framing(self.current_frame_data)
+        if framing is None:
             return
 
-        positions = np.array(positions)
-        center = np.mean(positions, axis=0)
-        max_distance = np.max(np.linalg.norm(positions - center, axis=1))
-
-        # Set ground level to lowest Z point in the data
-        self.ground_level = np.min(positions[:, 2])
-
-        # Update camera target to be centered horizontally but at ground level
-        self.camera_target = np.array(
-            [center[0], center[1], self.ground_level], dtype=np.float32
-        )
-        self.camera_distance = max_distance * 2.5
+        self.camera_target, self.camera_distance, self.ground_level = framing
+        self._dirty |= DirtyFlags.CAMERA
 
         print(
-            f"📷 Camera framed: center={center}, ground_level={self.ground_level:.3f}, distance={self.camera_distance:.2f}"
+            f"📷 Camera framed: target={self.camera_target}, ground_level={self.ground_level:.3f}, distance={self.camera_distance:.2f}"
         )
 
     def set_face_on_view(self):
         """Set camera to face-on view (looking at golfer from front)"""
         self.camera_azimuth = 0.0
         self.camera_elevation = 15.0
-        self.update()
+        self.request_redraw(DirtyFlags.CAMERA)
         print("📷 Camera: Face-on view")
 
     def set_down_the_line_view(self):
         """Set camera to down-the-line view (90° from face-on)"""
         self.camera_azimuth = 90.0  # 90° from face-on, not 180°
         self.camera_elevation = 15.0
-        self.update()
+        self.request_redraw(DirtyFlags.CAMERA)
         print("📷 Camera: Down-the-line view")
 
     def set_behind_view(self):
         """Set camera to behind view (180° from face-on)"""
         self.camera_azimuth = 180.0
         self.camera_elevation = 15.0
-        self.update()
+        self.request_redraw(DirtyFlags.CAMERA)
         print("📷 Camera: Behind view")
 
     def set_above_view(self):
         """Set camera to overhead view"""
         self.camera_azimuth = 0.0
         self.camera_elevation = 80.0
-        self.update()
+        self.request_redraw(DirtyFlags.CAMERA)
         print("📷 Camera: Overhead view")
 
     def mousePressEvent(self, event):
         """Handle mouse press events"""
         self.last_mouse_pos = event.pos()
         self.mouse_pressed = True
+        self._push_camera_state()
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events"""
         self.mouse_pressed = False
+        if self.camera_controller is not None:
+            self.camera_controller.release_inertia()
 
     def mouseMoveEvent(self, event):
         """Handle mouse move events"""
@@ -600,6 +1215,15 @@ class GolfVisualizerWidget(QOpenGLWidget):
 
         delta = event.pos() - self.last_mouse_pos
 
+        if self.camera_controller is not None:
+            # The controller tracks drag velocity for inertia on release
+            if event.buttons() & Qt.MouseButton.LeftButton:
+                self.camera_controller.handle_mouse_orbit(delta.x(), -delta.y())
+            elif event.buttons() & Qt.MouseButton.RightButton:
+                self.camera_controller.handle_mouse_pan(delta.x(), -delta.y())
+            self.last_mouse_pos = event.pos()
+            return
+
         if event.buttons() & Qt.MouseButton.LeftButton:
             # Rotate camera
             self.camera_azimuth += delta.x() * 0.5
@@ -622,14 +1246,18 @@ class GolfVisualizerWidget(QOpenGLWidget):
             self.camera_target += (right * delta.x() - up * delta.y()) * pan_speed
 
         self.last_mouse_pos = event.pos()
-        self.update()
+        self.request_redraw(DirtyFlags.CAMERA)
 
     def wheelEvent(self, event):
         """Handle mouse wheel events"""
+        if self.camera_controller is not None:
+            self._push_camera_state()
+            self.camera_controller.handle_mouse_zoom(-event.angleDelta().y() / 120.0)
+            return
         zoom_factor = 1.1 if event.angleDelta().y() > 0 else 0.9
         self.camera_distance *= zoom_factor
         self.camera_distance = np.clip(self.camera_distance, 0.1, 50.0)
-        self.update()
+        self.request_redraw(DirtyFlags.CAMERA)
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
@@ -645,7 +1273,10 @@ class GolfVisualizerWidget(QOpenGLWidget):
             self.set_above_view()
         elif key == Qt.Key.Key_R:
             self._frame_camera_to_data()
-            self.update()
+            self.request_redraw(DirtyFlags.CAMERA)
+        elif key == Qt.Key.Key_P:
+            self.show_profiler_overlay = not self.show_profiler_overlay
+            self.request_redraw(DirtyFlags.CONFIG)
         elif key == Qt.Key.Key_Space:
             # Toggle playback if parent has this functionality
             parent = self.parent()
@@ -655,6 +1286,236 @@ class GolfVisualizerWidget(QOpenGLWidget):
             super().keyPressEvent(event)
 
 
+@dataclass
+class ComparisonViewport:
+    """Orbit camera and swing shown in one comparison viewport"""
+
+    title: str
+    azimuth: float = 0.0
+    elevation: float = 15.0
+    swing_id: str = "A"
+    distance: float = 3.0
+    target: np.ndarray = field(default_factory=lambda: np.zeros(3, dtype=np.float32))
+
+
+class ComparisonVisualizerWidget(GolfVisualizerWidget):
+    """Several synchronized cameras drawn side by side by one GL context.
+
+    Meshes, programs and per-swing trail buffers are uploaded once and shared;
+    each viewport only switches the viewport/scissor rectangle and camera.
+    Mouse and keyboard camera controls act on the viewport under the cursor.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.viewports: List[ComparisonViewport] = []
+        self.active_viewport = 0
+        self.swings: Dict[str, FrameProcessor] = {}
+        self.swing_frames: Dict[str, FrameData] = {}
+        self._swings_loaded: Dict[str, FrameProcessor] = {}
+        self.render_config = RenderConfig()
+
+    def set_swings(self, swings: Dict[str, FrameProcessor]):
+        """Swings available to the viewports, keyed by swing id"""
+        self.swings = dict(swings)
+        self.swing_frames = {
+            swing_id: frame_processor.get_frame_data(0)
+            for swing_id, frame_processor in self.swings.items()
+            if frame_processor.num_frames > 0
+        }
+        self._frame_viewports()
+        self.request_redraw()
+
+    def set_viewports(self, viewports: List[ComparisonViewport]):
+        """Replace the viewport layout (left to right)"""
+        self.viewports = list(viewports)
+        self.active_viewport = 0
+        self._frame_viewports()
+        self.request_redraw()
+
+    def set_playhead(self, data_time: float):
+        """Show every swing at the same data time"""
+        for swing_id, frame_processor in self.swings.items():
+            position = float(
+                np.interp(
+                    data_time,
+                    frame_processor.time_vector,
+                    np.arange(len(frame_processor.time_vector)),
+                )
+            )
+            self.swing_frames[swing_id] = frame_processor.get_interpolated_frame_data(
+                position
+            )
+        self.request_redraw(DirtyFlags.FRAME)
+
+    def set_render_config(self, render_config: RenderConfig):
+        if render_config != self.render_config:
+            self.render_config = render_config
+            self.request_redraw(DirtyFlags.CONFIG)
+
+    def _frame_viewports(self):
+        """Frame each viewport's camera on the whole of its swing.
+
+        The ground plane is shared, so it sits at the lowest framed swing.
+        """
+        ground_levels = []
+        for viewport in self.viewports:
+            frame_processor = self.swings.get(viewport.swing_id)
+            if frame_processor is None:
+                continue
+            framing = calculate_bounds_framing(
+                *frame_processor.get_bounds().range_bounds()
+            )
+            if framing is None:
+                continue
+            viewport.target, viewport.distance, ground_level = framing
+            ground_levels.append(ground_level)
+        if ground_levels:
+            self.ground_level = min(ground_levels)
+        if self.viewports:
+            self._load_camera(self.active_viewport)
+
+    def _frame_camera_to_data(self):
+        self._frame_viewports()
+
+    # ========================================================================
+    # RENDERING
+    # ========================================================================
+
+    def paintGL(self):
+        """Render all viewports in one pass"""
+        if not self.renderer or not self.viewports or not self.swing_frames:
+            return
+
+        if not self._dirty:
+            self.skipped_paints += 1
+            return
+
+        try:
+            self.renderer.ground_level = self.ground_level
+            self._sync_swings()
+
+            # The labels are drawn with QPainter, which leaves its GL state behind
+            self.renderer.apply_gl_state()
+            self.renderer.render_viewports(self._build_viewport_specs())
+
+            self._draw_viewport_labels()
+            if self.show_profiler_overlay:
+                self._draw_profiler_overlay()
+
+        except Exception as e:
+            print(f"❌ Render error: {e}")
+        finally:
+            self._dirty = DirtyFlags.NONE
+            self._last_paint_time = time.perf_counter()
+
+    def _sync_swings(self):
+        """Upload trails of added/changed swings once; viewports share them"""
+        for swing_id in list(self._swings_loaded):
+            if self.swings.get(swing_id) is not self._swings_loaded[swing_id]:
+                self.renderer.remove_trails(swing_id)
+                del self._swings_loaded[swing_id]
+
+        for swing_id, frame_processor in self.swings.items():
+            if swing_id in self._swings_loaded:
+                continue
+            self.renderer.load_trails(swing_id, frame_processor)
+            self._swings_loaded[swing_id] = frame_processor
+            if swing_id == next(iter(self.swings)):
+                self.renderer.set_vector_scales(frame_processor.get_vector_scales())
+
+    def _build_viewport_specs(self) -> List[ViewportSpec]:
+        """Camera matrices and frame for every viewport rectangle"""
+        width, height = self.renderer.viewport_size
+        rects = split_viewport_rects(width, height, len(self.viewports))
+        specs = []
+        for viewport, rect in zip(self.viewports, rects):
+            frame_data = self.swing_frames.get(viewport.swing_id)
+            if frame_data is None:
+                continue
+            view_position = calculate_orbit_position(
+                viewport.distance, viewport.azimuth, viewport.elevation, viewport.target
+            )
+            specs.append(
+                ViewportSpec(
+                    rect=rect,
+                    frame_data=frame_data,
+                    render_config=self.render_config,
+                    view_matrix=calculate_look_at_matrix(
+                        view_position, viewport.target
+                    ),
+                    proj_matrix=calculate_projection_matrix(rect[2] / max(rect[3], 1)),
+                    view_position=view_position,
+                    swing_id=viewport.swing_id,
+                )
+            )
+        return specs
+
+    def _draw_viewport_labels(self):
+        """Viewport titles and dividers"""
+        rects = split_viewport_rects(self.width(), self.height(), len(self.viewports))
+        painter = QPainter(self)
+        try:
+            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+            for index, (viewport, (x, _, _, height)) in enumerate(
+                zip(self.viewports, rects)
+            ):
+                if x > 0:
+                    painter.setPen(QPen(QColor(180, 180, 180), 1))
+                    painter.drawLine(x, 0, x, height)
+                active = index == self.active_viewport and len(self.viewports) > 1
+                painter.setPen(QColor(0, 90, 180) if active else QColor(60, 60, 60))
+                painter.drawText(x + 10, 20, viewport.title)
+        finally:
+            painter.end()
+
+    # ========================================================================
+    # PER-VIEWPORT CAMERA CONTROL
+    # ========================================================================
+
+    def _viewport_at(self, x: float) -> int:
+        count = max(len(self.viewports), 1)
+        return min(max(int(x / max(self.width(), 1) * count), 0), count - 1)
+
+    def _load_camera(self, index: int):
+        """Point the inherited camera controls at one viewport"""
+        self.active_viewport = index
+        viewport = self.viewports[index]
+        self.camera_azimuth = viewport.azimuth
+        self.camera_elevation = viewport.elevation
+        self.camera_distance = viewport.distance
+        self.camera_target = np.array(viewport.target, dtype=np.float32)
+
+    def _store_camera(self):
+        if not self.viewports:
+            return
+        viewport = self.viewports[self.active_viewport]
+        viewport.azimuth = float(self.camera_azimuth)
+        viewport.elevation = float(self.camera_elevation)
+        viewport.distance = float(self.camera_distance)
+        viewport.target = np.array(self.camera_target, dtype=np.float32)
+
+    def mousePressEvent(self, event):
+        if self.viewports:
+            self._load_camera(self._viewport_at(event.pos().x()))
+            self.request_redraw(DirtyFlags.CAMERA)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        self._store_camera()
+
+    def wheelEvent(self, event):
+        if self.viewports:
+            self._load_camera(self._viewport_at(event.position().x()))
+        super().wheelEvent(event)
+        self._store_camera()
+
+    def keyPressEvent(self, event):
+        super().keyPressEvent(event)
+        self._store_camera()
+
+
 # ============================================================================
 # MAIN WINDOW
 # ============================================================================
@@ -691,11 +1552,16 @@ class GolfVisualizerMainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
 
-        # Add tabs
+        # Add tabs (all share one swing data registry)
+        self.swing_registry = get_swing_registry()
         self.motion_capture_tab = MotionCaptureTab(self)
         self.simulink_tab = SimulinkModelTab(self)
         self.comparison_tab = ComparisonTab(self)
 
+        self.motion_capture_tab.dataStoreChanged.connect(
+            self.comparison_tab.set_data_store
+        )
+
         self.tab_widget.addTab(self.motion_capture_tab, "Motion Capture Data")
         self.tab_widget.addTab(self.simulink_tab, "Simulink Model")
         self.tab_widget.addTab(self.comparison_tab, "Data Comparison")
@@ -946,7 +1812,7 @@ class GolfVisualizerMainWindow(QMainWindow):
         """Reset camera to default position"""
         if hasattr(self, "gl_widget") and self.gl_widget:
             self.gl_widget._frame_camera_to_data()
-            self.gl_widget.update()
+            self.gl_widget.request_redraw(DirtyFlags.CAMERA)
 
     def _set_face_on_view(self):
         """Set face-on camera view"""
@@ -976,7 +1842,7 @@ class GolfVisualizerMainWindow(QMainWindow):
             and self.gl_widget.current_render_config
         ):
             self.gl_widget.current_render_config.show_face_normal = bool(state)
-            self.gl_widget.update()
+            self.gl_widget.request_redraw(DirtyFlags.CONFIG)
 
     def _toggle_ball(self, state):
         """Toggle ball visibility"""
@@ -986,7 +1852,7 @@ class GolfVisualizerMainWindow(QMainWindow):
             and self.gl_widget.current_render_config
         ):
             self.gl_widget.current_render_config.show_ball = bool(state)
-            self.gl_widget.update()
+            self.gl_widget.request_redraw(DirtyFlags.CONFIG)
 
     def _show_about(self):
         """Show about dialog"""
@@ -1011,6 +1877,9 @@ class GolfVisualizerMainWindow(QMainWindow):
 
 def main():
     """Main application entry point"""
+    # Must precede the first GL context so the driver picks it up
+    enable_driver_shader_cache()
+
     app = QApplication(sys.argv)
 
     # Set application properties
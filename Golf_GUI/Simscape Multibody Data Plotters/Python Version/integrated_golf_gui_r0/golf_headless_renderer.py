@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Headless Offscreen Renderer
+Renders swing frames without Qt into PNG sequences or raw RGB streams
+"""
+
+import argparse
+import struct
+import sys
+import time
+import traceback
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+import moderngl as mgl
+import numpy as np
+from golf_data_core import (FrameData, FrameProcessor, MatlabDataLoader,
+                            RenderConfig)
+from golf_opengl_renderer import (OpenGLRenderer, calculate_camera_framing,
+                                  calculate_look_at_matrix,
+                                  calculate_orbit_position,
+                                  calculate_projection_matrix,
+                                  enable_driver_shader_cache)
+
+# ============================================================================
+# OFFSCREEN CONTEXT
+# ============================================================================
+
+# EGL first: build boxes have no display, and Mesa's EGL falls back to llvmpipe
+DEFAULT_BACKENDS: Tuple[Optional[str], ...] = ("egl", None)
+
+
+def create_offscreen_context(backend: Optional[str] = None) -> mgl.Context:
+    """Create a standalone OpenGL 3.3 context without a window"""
+    backends = (backend,) if backend else DEFAULT_BACKENDS
+    errors = []
+    enable_driver_shader_cache()
+
+    for candidate in backends:
+        try:
+            if candidate:
+                return mgl.create_standalone_context(require=330, backend=candidate)
+            return mgl.create_standalone_context(require=330)
+        except Exception as e:
+            errors.append(f"{candidate or 'default'}: {e}")
+
+    raise RuntimeError(f"No offscreen OpenGL context available ({'; '.join(errors)})")
+
+
+# ============================================================================
+# IMAGE OUTPUT
+# ============================================================================
+
+
+def write_png(path: Path, image: np.ndarray, compress_level: int = 6):
+    """Write an RGB uint8 image (H, W, 3) as PNG using only the stdlib"""
+    height, width, _ = image.shape
+
+    # Each scanline is prefixed with filter type 0 (None)
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(tag + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", crc)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", header))
+        f.write(chunk(b"IDAT", zlib.compress(raw.tobytes(), compress_level)))
+        f.write(chunk(b"IEND", b""))
+
+
+# ============================================================================
+# HEADLESS RENDERER
+# ============================================================================
+
+
+class HeadlessRenderer:
+    """Offscreen wrapper around OpenGLRenderer for batch rendering"""
+
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        backend: Optional[str] = None,
+        ctx: Optional[mgl.Context] = None,
+    ):
+        self.width = width
+        self.height = height
+        self.ctx = ctx or create_offscreen_context(backend)
+
+        # Offscreen framebuffer replaces the widget's default framebuffer
+        self.fbo = self.ctx.framebuffer(
+            color_attachments=[self.ctx.renderbuffer((width, height), components=4)],
+            depth_attachment=self.ctx.depth_renderbuffer((width, height)),
+        )
+        self.fbo.use()
+
+        self.renderer = OpenGLRenderer()
+        self.renderer.initialize(self.ctx)
+        self.renderer.set_viewport(width, height)
+
+        # Camera state mirrors GolfVisualizerWidget
+        self.camera_distance = 3.0
+        self.camera_azimuth = 0.0
+        self.camera_elevation = 15.0
+        self.camera_target = np.array([0.0, 0.0, 0.0], dtype=np.float32)
+
+    def set_camera(self, azimuth: float, elevation: float):
+        """Set orbit angles in degrees"""
+        self.camera_azimuth = azimuth
+        self.camera_elevation = elevation
+
+    def frame_camera(self, frame_data: FrameData):
+        """Frame the camera and ground plane to the given frame"""
+        framing = calculate_camera_framing(frame_data)
+        if framing is None:
+            return
+        self.camera_target, self.camera_distance, ground_level = framing
+        self.renderer.ground_level = ground_level
+
+    def draw(self, frame_data: FrameData, render_config: Optional[RenderConfig] = None):
+        """Render one frame into the offscreen framebuffer without reading it back"""
+        view_position = calculate_orbit_position(
+            self.camera_distance,
+            self.camera_azimuth,
+            self.camera_elevation,
+            self.camera_target,
+        )
+        view_matrix = calculate_look_at_matrix(view_position, self.camera_target)
+        proj_matrix = calculate_projection_matrix(self.width / self.height)
+
+        self.fbo.use()
+        self.renderer.render_frame(
+            frame_data,
+            {},
+            render_config or RenderConfig(),
+            view_matrix,
+            proj_matrix,
+            view_position,
+        )
+
+    def render(
+        self, frame_data: FrameData, render_config: Optional[RenderConfig] = None
+    ) -> np.ndarray:
+        """Render one frame and return it as an RGB uint8 array (H, W, 3)"""
+        self.draw(frame_data, render_config)
+        pixels = self.fbo.read(components=3, alignment=1)
+        image = np.frombuffer(pixels, dtype=np.uint8).reshape(
+            self.height, self.width, 3
+        )
+        # OpenGL rows start at the bottom
+        return image[::-1]
+
+    def render_range(
+        self,
+        frame_processor: FrameProcessor,
+        start: int = 0,
+        end: Optional[int] = None,
+        step: int = 1,
+        render_config: Optional[RenderConfig] = None,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (frame index, image) for a frame range; end is exclusive"""
+        num_frames = len(frame_processor.time_vector)
+        end = num_frames if end is None else min(end, num_frames)
+        if start >= end:
+            return
+
+        self.renderer.load_dataset(frame_processor)
+        self.frame_camera(frame_processor.get_frame_data(start))
+
+        for frame_idx in range(start, end, step):
+            frame_data = frame_processor.get_frame_data(frame_idx)
+            yield frame_idx, self.render(frame_data, render_config)
+
+    def render_to_png_sequence(
+        self,
+        frame_processor: FrameProcessor,
+        output_dir: Path,
+        start: int = 0,
+        end: Optional[int] = None,
+        step: int = 1,
+        render_config: Optional[RenderConfig] = None,
+    ) -> List[Path]:
+        """Render a frame range to output_dir/frame_NNNNNN.png"""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        written = []
+        for frame_idx, image in self.render_range(
+            frame_processor, start, end, step, render_config
+        ):
+            path = output_dir / f"frame_{frame_idx:06d}.png"
+            write_png(path, image)
+            written.append(path)
+        return written
+
+    def render_to_raw_stream(
+        self,
+        frame_processor: FrameProcessor,
+        stream: BinaryIO,
+        start: int = 0,
+        end: Optional[int] = None,
+        step: int = 1,
+        render_config: Optional[RenderConfig] = None,
+    ) -> int:
+        """Write packed rgb24 frames to a binary stream (e.g. an ffmpeg pipe)"""
+        count = 0
+        for _, image in self.render_range(
+            frame_processor, start, end, step, render_config
+        ):
+            stream.write(np.ascontiguousarray(image).tobytes())
+            count += 1
+        stream.flush()
+        return count
+
+    def release(self):
+        """Release GL resources"""
+        self.renderer.cleanup()
+        self.fbo.release()
+        self.ctx.release()
+
+
+# ============================================================================
+# BATCH JOBS
+# ============================================================================
+
+
+@dataclass
+class HeadlessRenderJob:
+    """One swing to render offscreen"""
+
+    source: str  # Excel file, or directory holding BASEQ/ZTCFQ/DELTAQ.mat
+    output: str  # Directory for PNGs, file path (or "-") for raw RGB
+    output_format: str = "png"  # "png" or "rgb"
+    start_frame: int = 0
+    end_frame: Optional[int] = None
+    step: int = 1
+    width: int = 1280
+    height: int = 720
+    camera_azimuth: float = 0.0
+    camera_elevation: float = 15.0
+    backend: Optional[str] = None
+
+
+@dataclass
+class HeadlessRenderResult:
+    """Outcome of a HeadlessRenderJob"""
+
+    source: str
+    output: str
+    frames_rendered: int
+    elapsed_s: float
+    error: Optional[str] = None
+
+
+def load_frame_processor(source: str) -> FrameProcessor:
+    """Build a FrameProcessor from an Excel workbook or a MAT directory"""
+    path = Path(source)
+
+    if path.is_dir():
+        datasets = MatlabDataLoader().load_datasets(
+            str(path / "BASEQ.mat"), str(path / "ZTCFQ.mat"), str(path / "DELTAQ.mat")
+        )
+    elif path.suffix.lower() in (".xlsx", ".xls"):
+        from wiffle_data_loader import MotionDataLoader
+
+        loader = MotionDataLoader()
+        datasets = loader.convert_to_gui_format(loader.load_from_file(str(path)))
+    else:
+        raise ValueError(f"Unsupported swing source: {source}")
+
+    return FrameProcessor(datasets, RenderConfig())
+
+
+def run_render_job(
+    job: HeadlessRenderJob, renderer: Optional[HeadlessRenderer] = None
+) -> HeadlessRenderResult:
+    """Render a single job, creating a renderer if none is supplied"""
+    start_time = time.perf_counter()
+    owns_renderer = renderer is None
+
+    try:
+        frame_processor = load_frame_processor(job.source)
+        if renderer is None:
+            renderer = HeadlessRenderer(job.width, job.height, job.backend)
+        renderer.set_camera(job.camera_azimuth, job.camera_elevation)
+
+        frame_range = (job.start_frame, job.end_frame, job.step)
+        if job.output_format == "png":
+            frames = len(
+                renderer.render_to_png_sequence(
+                    frame_processor, Path(job.output), *frame_range
+                )
+            )
+        elif job.output_format == "rgb":
+            if job.output == "-":
+                frames = renderer.render_to_raw_stream(
+                    frame_processor, sys.__stdout__.buffer, *frame_range
+                )
+            else:
+                Path(job.output).parent.mkdir(parents=True, exist_ok=True)
+                with open(job.output, "wb") as stream:
+                    frames = renderer.render_to_raw_stream(
+                        frame_processor, stream, *frame_range
+                    )
+        else:
+            raise ValueError(f"Unknown output format: {job.output_format}")
+
+        return HeadlessRenderResult(
+            job.source, job.output, frames, time.perf_counter() - start_time
+        )
+
+    except Exception as e:
+        traceback.print_exc()
+        return HeadlessRenderResult(
+            job.source, job.output, 0, time.perf_counter() - start_time, str(e)
+        )
+
+    finally:
+        if owns_renderer and renderer is not None:
+            renderer.release()
+
+
+def run_render_jobs(
+    jobs: Sequence[HeadlessRenderJob], workers: int = 1
+) -> List[HeadlessRenderResult]:
+    """Render many swings, one GL context per worker process"""
+    if workers <= 1 or len(jobs) <= 1:
+        return [run_render_job(job) for job in jobs]
+
+    results = []
+    # Spawn so no worker inherits a parent's GL or numba state
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context("spawn")
+    ) as executor:
+        futures = [executor.submit(run_render_job, job) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Headless batch rendering entry point"""
+    parser = argparse.ArgumentParser(
+        description="Render golf swings offscreen to PNG sequences or raw RGB"
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Excel workbooks or directories containing BASEQ/ZTCFQ/DELTAQ.mat",
+    )
+    parser.add_argument("-o", "--output", default="renders", help="Output directory")
+    parser.add_argument("--format", choices=("png", "rgb"), default="png")
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Stream raw RGB of a single source to stdout",
+    )
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--end", type=int, default=None, help="Exclusive end frame")
+    parser.add_argument("--step", type=int, default=1)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--azimuth", type=float, default=0.0)
+    parser.add_argument("--elevation", type=float, default=15.0)
+    parser.add_argument("--backend", default=None, help="e.g. egl, x11")
+    parser.add_argument("-j", "--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.stdout and (args.format != "rgb" or len(args.sources) != 1):
+        parser.error("--stdout needs --format rgb and exactly one source")
+
+    output_root = Path(args.output)
+    jobs = []
+    for source in args.sources:
+        name = Path(source).stem if Path(source).is_file() else Path(source).name
+        if args.stdout:
+            output = "-"
+        elif args.format == "png":
+            output = str(output_root / name)
+        else:
+            output = str(output_root / f"{name}_{args.width}x{args.height}.rgb")
+
+        jobs.append(
+            HeadlessRenderJob(
+                source=source,
+                output=output,
+                output_format=args.format,
+                start_frame=args.start,
+                end_frame=args.end,
+                step=args.step,
+                width=args.width,
+                height=args.height,
+                camera_azimuth=args.azimuth,
+                camera_elevation=args.elevation,
+                backend=args.backend,
+            )
+        )
+
+    # Keep stdout clean for piped frames; status output goes to stderr
+    if args.stdout:
+        sys.stdout = sys.stderr
+    results = run_render_jobs(jobs, args.workers)
+
+    failures = 0
+    for result in results:
+        if result.error:
+            failures += 1
+            print(f"❌ {result.source}: {result.error}")
+        else:
+            fps = result.frames_rendered / max(result.elapsed_s, 1e-9)
+            print(
+                f"✅ {result.source}: {result.frames_rendered} frames -> "
+                f"{result.output} ({result.elapsed_s:.1f}s, {fps:.1f} fps)",
+            )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Metrics
+Counters, gauges and histograms cheap enough to record from hot paths, a
+background sampler for process CPU/RSS and frame-time percentiles, and
+JSON-lines / Chrome-trace export
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (50.0, 95.0, 99.0)
+
+# ============================================================================
+# METRIC TYPES
+# ============================================================================
+
+
+class Counter:
+    """Monotonic count.
+
+    Increments are not locked: a rare lost update under heavy cross-thread
+    contention is accepted to keep ``inc`` nearly free.
+    """
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+    def reset(self):
+        self.value = 0
+
+
+class Gauge:
+    """Last value set"""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def reset(self):
+        self.value = 0.0
+
+
+class Histogram:
+    """Recent observations in a fixed ring buffer, plus all-time count/sum"""
+
+    __slots__ = ("name", "count", "total", "_values", "_registry")
+
+    def __init__(
+        self,
+        name: str,
+        size: int = 1024,
+        registry: Optional["MetricsRegistry"] = None,
+    ):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        # A list, not an ndarray: item assignment is several times cheaper
+        self._values: List[float] = [0.0] * size
+        self._registry = registry
+
+    def observe(self, value: float):
+        self._values[self.count % len(self._values)] = value
+        self.count += 1
+        self.total += value
+
+    def time(self) -> "_Timer":
+        """Context manager observing the elapsed milliseconds"""
+        return _Timer(self)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def recent(self) -> np.ndarray:
+        """Observations still in the window, oldest first"""
+        size = len(self._values)
+        if self.count <= size:
+            return np.array(self._values[: self.count])
+        start = self.count % size
+        return np.array(self._values[start:] + self._values[:start])
+
+    def percentiles(
+        self, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, float]:
+        values = self._values[: min(self.count, len(self._values))]
+        if not values:
+            return {f"p{p:g}": 0.0 for p in percentiles}
+        return {
+            f"p{p:g}": float(value)
+            for p, value in zip(percentiles, np.percentile(values, percentiles))
+        }
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.histogram.observe((end - self.start) * 1000.0)
+        registry = self.histogram._registry
+        if registry is not None and registry.tracing:
+            registry.record_span(self.histogram.name, self.start, end)
+        return False
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+
+class MetricsRegistry:
+    """Named metrics shared by loaders, processors, the renderer and playback.
+
+    Look a metric up once (e.g. at import) and keep the object: recording is
+    then a single attribute update. ``reset`` zeroes metrics in place, so
+    held references stay valid.
+    """
+
+    def __init__(self, histogram_size: int = 1024, trace_capacity: int = 100_000):
+        self.histogram_size = histogram_size
+        self.epoch = time.perf_counter()
+        self.tracing = False  # Record timed spans for Chrome-trace export
+        self.trace_events: Deque[tuple] = deque(maxlen=trace_capacity)
+        self._metrics: Dict[str, Union[Counter, Gauge, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, metric_type: type, factory: Callable):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = factory()
+        if not isinstance(metric, metric_type):
+            raise TypeError(f"Metric {name} is a {type(metric).__name__}")
+        return metric
+
+    def counter(self, name: str) -> Counter:
+        return self._get_or_create(name, Counter, lambda: Counter(name))
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get_or_create(name, Gauge, lambda: Gauge(name))
+
+    def histogram(self, name: str, size: Optional[int] = None) -> Histogram:
+        return self._get_or_create(
+            name,
+            Histogram,
+            lambda: Histogram(name, size or self.histogram_size, self),
+        )
+
+    def time(self, name: str) -> _Timer:
+        """Time a block into the named histogram (milliseconds)"""
+        return self.histogram(name).time()
+
+    def record_span(self, name: str, start: float, end: float):
+        self.trace_events.append((name, start, end, threading.get_ident()))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values: counters, gauges and histogram summaries"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        result: Dict[str, Any] = {}
+        for metric in metrics:
+            if isinstance(metric, Histogram):
+                result[metric.name] = {
+                    "count": metric.count,
+                    "mean": metric.mean,
+                    **metric.percentiles(),
+                }
+            else:
+                result[metric.name] = metric.value
+        return result
+
+    def reset(self):
+        with self._lock:
+            for metric in self._metrics.values():
+                metric.reset()
+            self.trace_events.clear()
+
+
+_metrics: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Process-wide metrics registry"""
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
+
+
+# ============================================================================
+# PROCESS SAMPLER
+# ============================================================================
+
+
+def _rss_reader() -> Callable[[], float]:
+    """Best available resident-set-size reader, in MB"""
+    try:
+        import psutil
+
+        process = psutil.Process()
+        return lambda: process.memory_info().rss / 1e6
+    except ImportError:
+        pass
+
+    if os.path.exists("/proc/self/statm"):
+        page_size = os.sysconf("SC_PAGE_SIZE")
+
+        def read_statm() -> float:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * page_size / 1e6
+
+        return read_statm
+
+    try:
+        import resource
+    except ImportError:
+        return lambda: 0.0
+    # Peak rather than current RSS: kilobytes on Linux, bytes on macOS
+    scale = 1e-6 if os.uname().sysname == "Darwin" else 1e-3
+    return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class MetricsSampler:
+    """Periodically sample process CPU/RSS and frame-time percentiles.
+
+    Sampling never blocks: CPU use is the process-time delta between samples.
+    Each sample is kept in ``samples``, optionally appended to a JSON-lines
+    file, and passed to listeners (called on the sampler thread).
+    """
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        rate_hz: float = 1.0,
+        jsonl_path: Optional[Union[str, Path]] = None,
+        history: int = 3600,
+        frame_histogram: str = "renderer.frame_ms",
+        frame_counter: str = "renderer.frames",
+    ):
+        self.registry = registry or get_metrics()
+        self.rate_hz = rate_hz
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.samples: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+        self._frame_times = self.registry.histogram(frame_histogram)
+        self._frames = self.registry.counter(frame_counter)
+        self._read_rss = _rss_reader()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reset_baseline()
+
+    def _reset_baseline(self):
+        self._last_wall = time.perf_counter()
+        self._last_cpu = time.process_time()
+        self._last_frames = self._frames.value
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        self.listeners.append(listener)
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._reset_baseline()
+        self._thread = threading.Thread(
+            target=self._run, name="MetricsSampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(1.0 / self.rate_hz):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"⚠️ Metrics sampling failed: {e}")
+
+    def sample(self) -> Dict[str, Any]:
+        """Take one sample now"""
+        now = time.perf_counter()
+        cpu = time.process_time()
+        frames = self._frames.value
+        elapsed = max(now - self._last_wall, 1e-9)
+
+        sample: Dict[str, Any] = {
+            "t": now - self.registry.epoch,
+            "cpu_percent": (cpu - self._last_cpu) / elapsed * 100.0,
+            "rss_mb": self._read_rss(),
+            "fps": (frames - self._last_frames) / elapsed,
+        }
+        for name, value in self._frame_times.percentiles().items():
+            sample[f"frame_ms_{name}"] = value
+        self._last_wall, self._last_cpu, self._last_frames = now, cpu, frames
+
+        self.registry.gauge("process.cpu_percent").set(sample["cpu_percent"])
+        self.registry.gauge("process.rss_mb").set(sample["rss_mb"])
+
+        self.samples.append(sample)
+        if self.jsonl_path is not None:
+            with open(self.jsonl_path, "a") as f:
+                f.write(json.dumps(sample) + "\n")
+        for listener in list(self.listeners):
+            listener(sample)
+        return sample
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+
+def export_jsonl(samples: Sequence[Dict[str, Any]], path: Union[str, Path]) -> Path:
+    """Write samples as one JSON object per line"""
+    path = Path(path)
+    with open(path, "w") as f:
+        for sample in samples:
+            f.write(json.dumps(sample) + "\n")
+    return path
+
+
+def export_chrome_trace(
+    path: Union[str, Path],
+    registry: Optional[MetricsRegistry] = None,
+    samples: Sequence[Dict[str, Any]] = (),
+) -> Path:
+    """Write timed spans and sampler counters for chrome://tracing / Perfetto"""
+    registry = registry or get_metrics()
+    pid = os.getpid()
+    events: List[Dict[str, Any]] = []
+
+    for name, start, end, tid in list(registry.trace_events):
+        events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start - registry.epoch) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+        )
+
+    for sample in samples:
+        timestamp = sample["t"] * 1e6
+        events.append(
+            {
+                "name": "process",
+                "ph": "C",
+                "ts": timestamp,
+                "pid": pid,
+                "args": {
+                    "cpu_percent": sample["cpu_percent"],
+                    "rss_mb": sample["rss_mb"],
+                },
+            }
+        )
+        frame_args = {
+            key[len("frame_ms_") :]: value
+            for key, value in sample.items()
+            if key.startswith("frame_ms_")
+        }
+        frame_args["fps"] = sample["fps"]
+        events.append(
+            {
+                "name": "frames",
+                "ph": "C",
+                "ts": timestamp,
+                "pid": pid,
+                "args": frame_args,
+            }
+        )
+
+    path = Path(path)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
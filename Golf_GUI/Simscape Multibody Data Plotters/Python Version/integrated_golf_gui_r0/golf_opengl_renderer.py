@@ -4,15 +4,22 @@ Golf Swing Visualizer - Fixed OpenGL Renderer
 Fixed for moderngl 5.x compatibility with correct uniform API
 """
 
+import itertools
+import os
 import time
 import traceback
 import warnings
-from dataclasses import dataclass
+import weakref
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import (Any, Deque, Dict, Iterator, List, Optional, Sequence, Set,
+                    Tuple, Union)
 
 import moderngl as mgl
 import numpy as np
+from golf_metrics import get_metrics
 
 # ============================================================================
 # FIXED SHADER DEFINITIONS
@@ -132,11 +139,479 @@ class ShaderLibrary:
         }
         """
 
+    @staticmethod
+    def get_trail_vertex_shader() -> str:
+        """Line-strip vertex shader with a per-vertex speed attribute"""
+        return """
+        #version 330 core
+        
+        layout (location = 0) in vec3 position;
+        layout (location = 1) in float speed;
+        
+        uniform mat4 view;
+        uniform mat4 projection;
+        uniform float maxSpeed;
+        
+        out float SpeedRatio;
+        
+        void main() {
+            SpeedRatio = clamp(speed / max(maxSpeed, 1e-6), 0.0, 1.0);
+            gl_Position = projection * view * vec4(position, 1.0);
+        }
+        """
+
+    @staticmethod
+    def get_trail_fragment_shader() -> str:
+        """Trail fragment shader, flat or colored by speed"""
+        return """
+        #version 330 core
+        
+        in float SpeedRatio;
+        
+        out vec4 FragColor;
+        
+        uniform vec3 trailColor;
+        uniform vec3 slowColor;
+        uniform vec3 fastColor;
+        uniform bool colorBySpeed;
+        uniform float opacity;
+        
+        void main() {
+            vec3 color = colorBySpeed ? mix(slowColor, fastColor, SpeedRatio) : trailColor;
+            FragColor = vec4(color, opacity);
+        }
+        """
+
+    @staticmethod
+    def get_arrow_vertex_shader() -> str:
+        """Instanced arrow glyph vertex shader (mesh points along +Y, unit length)"""
+        return """
+        #version 330 core
+        
+        layout (location = 0) in vec3 position;
+        layout (location = 1) in vec3 normal;
+        
+        in vec3 instanceOrigin;
+        in vec3 instanceDirection;
+        in float instanceLength;
+        in vec4 instanceColor;
+        
+        uniform mat4 view;
+        uniform mat4 projection;
+        
+        out vec3 FragPos;
+        out vec3 Normal;
+        out vec4 Color;
+        
+        void main() {
+            // Orthonormal basis with +Y along the vector
+            vec3 yAxis = normalize(instanceDirection);
+            vec3 helper = abs(yAxis.y) < 0.999 ? vec3(0.0, 1.0, 0.0) : vec3(1.0, 0.0, 0.0);
+            vec3 xAxis = normalize(cross(yAxis, helper));
+            vec3 zAxis = cross(xAxis, yAxis);
+            mat3 basis = mat3(xAxis, yAxis, zAxis);
+            
+            vec3 local = vec3(position.x, position.y * instanceLength, position.z);
+            vec3 worldPos = instanceOrigin + basis * local;
+            
+            FragPos = worldPos;
+            Normal = basis * normal;
+            Color = instanceColor;
+            gl_Position = projection * view * vec4(worldPos, 1.0);
+        }
+        """
+
+    @staticmethod
+    def get_arrow_fragment_shader() -> str:
+        """Arrow glyph fragment shader with per-instance color"""
+        return """
+        #version 330 core
+        
+        in vec3 FragPos;
+        in vec3 Normal;
+        in vec4 Color;
+        
+        out vec4 FragColor;
+        
+        uniform vec3 lightPosition;
+        uniform vec3 lightColor;
+        
+        void main() {
+            vec3 N = normalize(Normal);
+            vec3 L = normalize(lightPosition - FragPos);
+            
+            vec3 ambient = 0.4 * Color.rgb;
+            vec3 diffuse = max(dot(N, L), 0.0) * lightColor * Color.rgb;
+            
+            FragColor = vec4(ambient + diffuse, Color.a);
+        }
+        """
+
+    @staticmethod
+    def get_ghost_vertex_shader(max_swings: int = 64) -> str:
+        """Instanced ghost skeleton shader sampling joints from a float texture"""
+        return """
+        #version 330 core
+        
+        layout (location = 0) in vec3 position;
+        layout (location = 1) in vec3 normal;
+        
+        in vec2 instanceRows;  // Joint texture rows of segment start/end
+        in float instanceSwing;
+        in float instanceRadius;
+        
+        uniform mat4 view;
+        uniform mat4 projection;
+        uniform sampler2D jointTexture;  // x = frame, y = swing slot * points + point
+        uniform vec3 swingFrames[MAX_SWINGS];  // (frame, next frame, blend)
+        uniform vec3 swingColors[MAX_SWINGS];
+        uniform bool sphereMode;
+        
+        out vec3 FragPos;
+        out vec3 Normal;
+        out vec3 Color;
+        
+        vec3 jointAt(float row, vec3 frames) {
+            vec3 a = texelFetch(jointTexture, ivec2(int(frames.x), int(row)), 0).xyz;
+            vec3 b = texelFetch(jointTexture, ivec2(int(frames.y), int(row)), 0).xyz;
+            return mix(a, b, frames.z);
+        }
+        
+        void main() {
+            int swing = int(instanceSwing);
+            vec3 frames = swingFrames[swing];
+            vec3 start = jointAt(instanceRows.x, frames);
+            
+            vec3 worldPos;
+            vec3 worldNormal;
+            if (sphereMode) {
+                worldPos = start + position * instanceRadius;
+                worldNormal = normal;
+            } else {
+                // Unit cylinder along +Y stretched from start to end
+                vec3 axis = jointAt(instanceRows.y, frames) - start;
+                float len = length(axis);
+                vec3 yAxis = len > 1e-6 ? axis / len : vec3(0.0, 1.0, 0.0);
+                vec3 helper = abs(yAxis.y) < 0.999 ? vec3(0.0, 1.0, 0.0) : vec3(1.0, 0.0, 0.0);
+                vec3 xAxis = normalize(cross(yAxis, helper));
+                vec3 zAxis = cross(xAxis, yAxis);
+                mat3 basis = mat3(xAxis, yAxis, zAxis);
+                
+                vec3 local = vec3(
+                    position.x * instanceRadius, position.y * len, position.z * instanceRadius
+                );
+                worldPos = start + basis * local;
+                worldNormal = basis * normal;
+            }
+            
+            FragPos = worldPos;
+            Normal = worldNormal;
+            Color = swingColors[swing];
+            gl_Position = projection * view * vec4(worldPos, 1.0);
+        }
+        """.replace(
+            "MAX_SWINGS", str(max_swings)
+        )
+
+    @staticmethod
+    def get_ghost_fragment_shader() -> str:
+        """Flat-lit translucent ghost fragment shader"""
+        return """
+        #version 330 core
+        
+        in vec3 FragPos;
+        in vec3 Normal;
+        in vec3 Color;
+        
+        out vec4 FragColor;
+        
+        uniform vec3 lightPosition;
+        uniform float opacity;
+        
+        void main() {
+            vec3 N = normalize(Normal);
+            vec3 L = normalize(lightPosition - FragPos);
+            vec3 shaded = (0.5 + 0.5 * max(dot(N, L), 0.0)) * Color;
+            FragColor = vec4(shaded, opacity);
+        }
+        """
+
+
+# ============================================================================
+# CAMERA MATH
+# ============================================================================
+
+
+def to_gl_matrix_bytes(matrix: np.ndarray) -> bytes:
+    """Pack a row-major numpy matrix for a GLSL (column-major) mat uniform"""
+    return np.ascontiguousarray(np.asarray(matrix, dtype=np.float32).T).tobytes()
+
+
+def calculate_orbit_position(
+    distance: float, azimuth: float, elevation: float, target: np.ndarray
+) -> np.ndarray:
+    """Camera position on an orbit around target (angles in degrees)"""
+    azimuth_rad = np.radians(azimuth)
+    elevation_rad = np.radians(elevation)
+    offset = np.array(
+        [
+            distance * np.cos(elevation_rad) * np.cos(azimuth_rad),
+            distance * np.sin(elevation_rad),
+            distance * np.cos(elevation_rad) * np.sin(azimuth_rad),
+        ],
+        dtype=np.float32,
+    )
+    return offset + np.asarray(target, dtype=np.float32)
+
+
+def calculate_look_at_matrix(
+    eye: np.ndarray, target: np.ndarray, up: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Right-handed look-at view matrix"""
+    eye = np.asarray(eye, dtype=np.float32)
+    up = np.array([0, 1, 0], dtype=np.float32) if up is None else up
+
+    forward = np.asarray(target, dtype=np.float32) - eye
+    forward_norm = np.linalg.norm(forward)
+    if forward_norm > 1e-6:
+        forward = forward / forward_norm
+    else:
+        forward = np.array([0, 0, -1], dtype=np.float32)
+
+    right = np.cross(forward, up)
+    right_norm = np.linalg.norm(right)
+    if right_norm > 1e-6:
+        right = right / right_norm
+    else:
+        right = np.array([1, 0, 0], dtype=np.float32)
+
+    true_up = np.cross(right, forward)
+
+    rotation = np.stack([right, true_up, -forward]).astype(np.float32)
+    view_matrix = np.eye(4, dtype=np.float32)
+    view_matrix[:3, :3] = rotation
+    view_matrix[:3, 3] = -rotation @ eye
+    return view_matrix
+
+
+def calculate_projection_matrix(
+    aspect: float, fov: float = 45.0, near: float = 0.1, far: float = 100.0
+) -> np.ndarray:
+    """OpenGL perspective projection matrix (fov in degrees)"""
+    f = 1.0 / np.tan(np.radians(fov) / 2.0)
+    return np.array(
+        [
+            [f / aspect, 0, 0, 0],
+            [0, f, 0, 0],
+            [0, 0, (far + near) / (near - far), (2 * far * near) / (near - far)],
+            [0, 0, -1, 0],
+        ],
+        dtype=np.float32,
+    )
+
+
+def calculate_camera_framing(
+    frame_data,
+) -> Optional[Tuple[np.ndarray, float, float]]:
+    """Camera target, distance and ground level that frame all tracked points"""
+    positions = [
+        frame_data.left_wrist,
+        frame_data.left_elbow,
+        frame_data.left_shoulder,
+        frame_data.right_wrist,
+        frame_data.right_elbow,
+        frame_data.right_shoulder,
+        frame_data.hub,
+        frame_data.butt,
+        frame_data.clubhead,
+    ]
+    positions = [pos for pos in positions if np.isfinite(pos).all()]
+    if not positions:
+        return None
+
+    positions = np.array(positions)
+    center = np.mean(positions, axis=0)
+    max_distance = np.max(np.linalg.norm(positions - center, axis=1))
+
+    # Ground sits at the lowest Z point in the data
+    ground_level = float(np.min(positions[:, 2]))
+    target = np.array([center[0], center[1], ground_level], dtype=np.float32)
+    return target, float(max_distance * 2.5), ground_level
+
+
+def calculate_bounds_framing(
+    bounds_min: np.ndarray, bounds_max: np.ndarray
+) -> Optional[Tuple[np.ndarray, float, float]]:
+    """calculate_camera_framing for a precomputed axis-aligned box"""
+    if not (np.isfinite(bounds_min).all() and np.isfinite(bounds_max).all()):
+        return None
+
+    center = (bounds_min + bounds_max) * 0.5
+    radius = float(np.linalg.norm(bounds_max - center))
+    ground_level = float(bounds_min[2])
+    target = np.array([center[0], center[1], ground_level], dtype=np.float32)
+    return target, radius * 2.5, ground_level
+
+
+# ============================================================================
+# PROGRAM CACHE
+# ============================================================================
+
+
+def get_shader_cache_dir() -> Path:
+    """Shader cache directory, overridable with GOLF_SHADER_CACHE_DIR"""
+    override = os.environ.get("GOLF_SHADER_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "golf_visualizer" / "shaders"
+
+
+def enable_driver_shader_cache(cache_dir: Optional[Path] = None) -> Path:
+    """Point the driver's on-disk shader cache at our directory.
+
+    Must run before the first GL context is created. Variables the user has
+    already set are left alone.
+    """
+    cache_dir = Path(cache_dir) if cache_dir else get_shader_cache_dir()
+    # Mesa (MESA_GLSL_CACHE_DIR on releases before 20.x)
+    os.environ.setdefault("MESA_SHADER_CACHE_DIR", str(cache_dir / "mesa"))
+    os.environ.setdefault("MESA_GLSL_CACHE_DIR", str(cache_dir / "mesa"))
+    # NVIDIA proprietary driver
+    os.environ.setdefault("__GL_SHADER_DISK_CACHE", "1")
+    os.environ.setdefault("__GL_SHADER_DISK_CACHE_PATH", str(cache_dir / "nvidia"))
+    os.environ.setdefault("__GL_SHADER_DISK_CACHE_SKIP_CLEANUP", "1")
+    return cache_dir
+
+
+class ProgramCache:
+    """Linked programs memoized per context.
+
+    Renderers sharing a context (viewer, comparison viewports, ghosts) link
+    each program once. moderngl cannot create a program from a binary, so
+    linked binaries are persisted across runs only by the driver's shader
+    cache, which enable_driver_shader_cache points at our directory.
+
+    The context is held weakly so the module-level cache registry does not
+    keep it alive; call release_program_cache when the context is torn down.
+    """
+
+    def __init__(self, ctx: mgl.Context):
+        self._ctx = weakref.ref(ctx)
+        # (vertex source, fragment source) -> linked program
+        self.programs: Dict[Tuple[str, str], mgl.Program] = {}
+        # Program name -> (milliseconds, "memory" | "linked")
+        self.timings: Dict[str, Tuple[float, str]] = {}
+
+    @property
+    def ctx(self) -> mgl.Context:
+        ctx = self._ctx()
+        if ctx is None:
+            raise RuntimeError("Program cache context has been released")
+        return ctx
+
+    def get_program(
+        self, name: str, vertex_shader: str, fragment_shader: str
+    ) -> mgl.Program:
+        """Linked program for the sources, compiling only on a memo miss"""
+        key = (vertex_shader, fragment_shader)
+        start = time.perf_counter()
+
+        program = self.programs.get(key)
+        if program is not None:
+            status = "memory"
+        else:
+            status = "linked"
+            program = self.ctx.program(
+                vertex_shader=vertex_shader, fragment_shader=fragment_shader
+            )
+            self.programs[key] = program
+
+        self.timings[name] = ((time.perf_counter() - start) * 1000, status)
+        return program
+
+    def get_summary(self) -> Dict[str, float]:
+        """Total compile time and counts per status for the programs requested"""
+        summary = {"total_ms": sum(ms for ms, _ in self.timings.values())}
+        for status in ("memory", "linked"):
+            summary[status] = sum(1 for _, s in self.timings.values() if s == status)
+        return summary
+
+    def release(self):
+        """Release every cached program"""
+        for program in self.programs.values():
+            program.release()
+        self.programs.clear()
+
+
+# Per-context caches, released explicitly by release_program_cache
+_program_caches: "weakref.WeakKeyDictionary[mgl.Context, ProgramCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_program_cache(ctx: mgl.Context) -> ProgramCache:
+    """The program cache shared by everything rendering into ctx"""
+    cache = _program_caches.get(ctx)
+    if cache is None:
+        cache = ProgramCache(ctx)
+        _program_caches[ctx] = cache
+    return cache
+
+
+def release_program_cache(ctx: mgl.Context):
+    """Drop ctx's program cache and release its programs"""
+    cache = _program_caches.pop(ctx, None)
+    if cache is not None:
+        cache.release()
+
 
 # ============================================================================
 # GEOMETRY MANAGER
 # ============================================================================
 
+# Tessellation levels per mesh type, finest first
+LOD_MESH_PARAMS: Dict[str, List[Dict[str, int]]] = {
+    "cylinder": [
+        {"segments": 32},
+        {"segments": 16},
+        {"segments": 8},
+        {"segments": 6},
+    ],
+    "sphere": [
+        {"lat_segments": 24, "lon_segments": 32},
+        {"lat_segments": 12, "lon_segments": 16},
+        {"lat_segments": 8, "lon_segments": 8},
+        {"lat_segments": 5, "lon_segments": 6},
+    ],
+}
+
+# Minimum projected radius (pixels) for each level but the coarsest
+LOD_PIXEL_THRESHOLDS = (40.0, 14.0, 5.0)
+
+
+@dataclass
+class GpuMesh:
+    """GPU buffers for one mesh, with a VAO per shader program"""
+
+    vertex_buffer: mgl.Buffer
+    normal_buffer: mgl.Buffer
+    index_buffer: mgl.Buffer
+    index_count: int
+    vaos: Dict[int, mgl.VertexArray]
+    # Mesh-space bounding sphere, used for frustum culling
+    bound_center: np.ndarray = field(
+        default_factory=lambda: np.zeros(3, dtype=np.float32)
+    )
+    bound_radius: float = 0.0
+
+    def release(self):
+        for vao in self.vaos.values():
+            vao.release()
+        self.vaos.clear()
+        self.vertex_buffer.release()
+        self.normal_buffer.release()
+        self.index_buffer.release()
+
 
 @dataclass
 class GeometryObject:
@@ -149,6 +624,7 @@ class GeometryObject:
     position: Optional[np.ndarray] = None
     rotation: Optional[np.ndarray] = None
     scale: Optional[np.ndarray] = None
+    mesh_type: str = ""
 
     def __post_init__(self):
         if self.position is None:
@@ -167,10 +643,22 @@ class GeometryManager:
         self.geometry_objects: Dict[str, GeometryObject] = {}
         self.mesh_library: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
         self.programs: Dict[str, mgl.Program] = {}
+        # One GPU buffer set per mesh type, shared by every object using it
+        self.gpu_meshes: Dict[str, GpuMesh] = {}
+        self.lod_meshes: Dict[str, List[GpuMesh]] = {}
+        # Programs are owned by the per-context cache, not by this manager
+        self.program_cache = get_program_cache(ctx)
+        self.startup_timings: Dict[str, float] = {}
 
         # Initialize standard meshes
-        self._create_standard_meshes()
-        self._compile_shaders()
+        for stage, step in (
+            ("meshes_ms", self._create_standard_meshes),
+            ("shaders_ms", self._compile_shaders),
+            ("lod_meshes_ms", self._create_lod_meshes),
+        ):
+            start = time.perf_counter()
+            step()
+            self.startup_timings[stage] = (time.perf_counter() - start) * 1000
 
     def _create_standard_meshes(self):
         """Create simple mesh library"""
@@ -184,17 +672,21 @@ class GeometryManager:
 
             # Create simple meshes
             print("  Creating cylinder mesh...")
-            self.mesh_library["cylinder"] = GeometryUtils.create_cylinder_mesh(
-                radius=1.0, height=1.0, segments=8
+            self.mesh_library["cylinder"] = GeometryUtils.get_mesh(
+                "cylinder", radius=1.0, height=1.0, segments=8
             )
             print("  ✅ Cylinder mesh created")
 
             print("  Creating sphere mesh...")
-            self.mesh_library["sphere"] = GeometryUtils.create_sphere_mesh(
-                radius=1.0, lat_segments=8, lon_segments=8
+            self.mesh_library["sphere"] = GeometryUtils.get_mesh(
+                "sphere", radius=1.0, lat_segments=8, lon_segments=8
             )
             print("  ✅ Sphere mesh created")
 
+            print("  Creating arrow mesh...")
+            self.mesh_library["arrow"] = GeometryUtils.get_mesh("arrow")
+            print("  ✅ Arrow mesh created")
+
             # Ground plane
             print("  Creating ground mesh...")
             self._create_ground_mesh()
@@ -242,25 +734,39 @@ class GeometryManager:
         )
 
     def _compile_shaders(self):
-        """Compile fixed shader programs"""
+        """Compile shader programs, reusing linked ones through the program cache"""
         try:
             print("🔧 Compiling shader programs...")
 
-            # Simple shader
-            print("  Compiling simple shader...")
-            self.programs["simple"] = self.ctx.program(
-                vertex_shader=ShaderLibrary.get_simple_vertex_shader(),
-                fragment_shader=ShaderLibrary.get_simple_fragment_shader(),
-            )
-            print(f"  ✅ Simple shader compiled: {type(self.programs['simple'])}")
-
-            # Ground shader
-            print("  Compiling ground shader...")
-            self.programs["ground"] = self.ctx.program(
-                vertex_shader=ShaderLibrary.get_ground_vertex_shader(),
-                fragment_shader=ShaderLibrary.get_ground_fragment_shader(),
-            )
-            print(f"  ✅ Ground shader compiled: {type(self.programs['ground'])}")
+            sources = {
+                "simple": (
+                    ShaderLibrary.get_simple_vertex_shader(),
+                    ShaderLibrary.get_simple_fragment_shader(),
+                ),
+                "ground": (
+                    ShaderLibrary.get_ground_vertex_shader(),
+                    ShaderLibrary.get_ground_fragment_shader(),
+                ),
+                "trail": (
+                    ShaderLibrary.get_trail_vertex_shader(),
+                    ShaderLibrary.get_trail_fragment_shader(),
+                ),
+                "arrow": (
+                    ShaderLibrary.get_arrow_vertex_shader(),
+                    ShaderLibrary.get_arrow_fragment_shader(),
+                ),
+                "ghost": (
+                    ShaderLibrary.get_ghost_vertex_shader(MAX_GHOST_SWINGS),
+                    ShaderLibrary.get_ghost_fragment_shader(),
+                ),
+            }
+
+            for name, (vertex_shader, fragment_shader) in sources.items():
+                self.programs[name] = self.program_cache.get_program(
+                    name, vertex_shader, fragment_shader
+                )
+                elapsed_ms, status = self.program_cache.timings[name]
+                print(f"  ✅ {name} shader ready ({status}, {elapsed_ms:.1f} ms)")
 
             print(f"✅ Compiled {len(self.programs)} shader programs")
 
@@ -269,6 +775,73 @@ class GeometryManager:
             traceback.print_exc()
             raise RuntimeError(f"Failed to compile shaders: {e}")
 
+    def _create_lod_meshes(self):
+        """Upload every tessellation level once; objects share these buffers"""
+        from golf_data_core import GeometryUtils
+
+        for mesh_type, levels in LOD_MESH_PARAMS.items():
+            self.lod_meshes[mesh_type] = [
+                self._upload_mesh(
+                    GeometryUtils.get_mesh(mesh_type, **params)
+                )
+                for params in levels
+            ]
+        print(
+            "✅ Created LOD meshes: "
+            + ", ".join(f"{k} x{len(v)}" for k, v in self.lod_meshes.items())
+        )
+
+    def _upload_mesh(
+        self, mesh: Tuple[np.ndarray, np.ndarray, np.ndarray], stride: int = 3
+    ) -> GpuMesh:
+        vertices, normals, indices = mesh
+        center, radius = bounding_sphere(vertices.reshape(-1, stride)[:, :3])
+        return GpuMesh(
+            vertex_buffer=self.ctx.buffer(vertices),
+            normal_buffer=self.ctx.buffer(normals),
+            index_buffer=self.ctx.buffer(indices),
+            index_count=len(indices),
+            vaos={},
+            bound_center=center,
+            bound_radius=radius,
+        )
+
+    def get_gpu_mesh(self, mesh_type: str) -> GpuMesh:
+        """Shared GPU buffers for a mesh type, uploaded on first use"""
+        if mesh_type not in self.gpu_meshes:
+            if mesh_type not in self.mesh_library:
+                raise ValueError(f"Mesh type '{mesh_type}' not found in library")
+            # Ground vertices interleave position and texcoord
+            stride = 5 if mesh_type == "ground" else 3
+            self.gpu_meshes[mesh_type] = self._upload_mesh(
+                self.mesh_library[mesh_type], stride
+            )
+        return self.gpu_meshes[mesh_type]
+
+    def get_mesh_vao(self, mesh: GpuMesh, program: mgl.Program) -> mgl.VertexArray:
+        """VAO binding a shared mesh to a program, created on first use"""
+        vao = mesh.vaos.get(program.glo)
+        if vao is None:
+            if mesh is self.gpu_meshes.get("ground"):
+                # Ground mesh has position + texcoord interleaved
+                content = [(mesh.vertex_buffer, "3f 2f", 0, 1)]
+            else:
+                content = [
+                    (mesh.vertex_buffer, "3f", "position"),
+                    (mesh.normal_buffer, "3f", "normal"),
+                ]
+            vao = self.ctx.vertex_array(program, content, mesh.index_buffer)
+            mesh.vaos[program.glo] = vao
+        return vao
+
+    @staticmethod
+    def select_lod_level(pixel_radius: float) -> int:
+        """LOD level index (0 = finest) for a projected radius in pixels"""
+        for level, threshold in enumerate(LOD_PIXEL_THRESHOLDS):
+            if pixel_radius >= threshold:
+                return level
+        return len(LOD_PIXEL_THRESHOLDS)
+
     def create_geometry_object(
         self, name: str, mesh_type: str, program_name: str = "simple"
     ) -> GeometryObject:
@@ -282,31 +855,14 @@ class GeometryManager:
         vertices, normals, indices = self.mesh_library[mesh_type]
         program = self.programs[program_name]
 
-        # Create buffers
-        vertex_buffer = self.ctx.buffer(vertices)
-        normal_buffer = self.ctx.buffer(normals)
-        index_buffer = self.ctx.buffer(indices)
-
-        # Create VAO based on mesh type
-        if mesh_type == "ground":
-            # Ground mesh has position + texcoord
-            vao = self.ctx.vertex_array(
-                program,
-                [
-                    (vertex_buffer, "3f 2f", 0, 1)
-                ],  # position at location 0, texCoord at location 1
-                index_buffer,
-            )
-        else:
-            # Standard mesh has position + normal only
-            vao = self.ctx.vertex_array(
-                program,
-                [(vertex_buffer, "3f", "position"), (normal_buffer, "3f", "normal")],
-                index_buffer,
-            )
+        # Objects of the same mesh type and program share buffers and VAO
+        vao = self.get_mesh_vao(self.get_gpu_mesh(mesh_type), program)
 
         geometry_obj = GeometryObject(
-            vao=vao, vertex_count=len(vertices) // 3, index_count=len(indices)
+            vao=vao,
+            vertex_count=len(vertices) // 3,
+            index_count=len(indices),
+            mesh_type=mesh_type,
         )
 
         self.geometry_objects[name] = geometry_obj
@@ -360,15 +916,1153 @@ class GeometryManager:
 
     def cleanup(self):
         """Clean up OpenGL resources"""
-        for obj in self.geometry_objects.values():
-            obj.vao.release()
+        # Object VAOs belong to the shared GPU meshes
         self.geometry_objects.clear()
 
-        for program in self.programs.values():
-            program.release()
+        for mesh in self.gpu_meshes.values():
+            mesh.release()
+        self.gpu_meshes.clear()
+
+        for levels in self.lod_meshes.values():
+            for mesh in levels:
+                mesh.release()
+        self.lod_meshes.clear()
+
+        # Programs belong to the context's cache; the renderer releases it
         self.programs.clear()
 
 
+# ============================================================================
+# DRAW LIST
+# ============================================================================
+
+
+def bounding_sphere(points: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Sphere around the bounding box center enclosing all points"""
+    if len(points) == 0:
+        return np.zeros(3, dtype=np.float32), 0.0
+    center = (points.min(axis=0) + points.max(axis=0)) * 0.5
+    radius = float(np.linalg.norm(points - center, axis=1).max())
+    return center.astype(np.float32), radius
+
+
+def extract_frustum_planes(view_proj: np.ndarray) -> np.ndarray:
+    """Normalized inward-facing (a, b, c, d) planes of a view-projection matrix"""
+    m = np.asarray(view_proj, dtype=np.float64)
+    planes = np.array(
+        [
+            m[3] + m[0],  # left
+            m[3] - m[0],  # right
+            m[3] + m[1],  # bottom
+            m[3] - m[1],  # top
+            m[3] + m[2],  # near
+            m[3] - m[2],  # far
+        ]
+    )
+    norms = np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+    return planes / np.maximum(norms, 1e-12)
+
+
+@dataclass
+class DrawItem:
+    """One queued draw: shared mesh VAO, program and per-object uniforms"""
+
+    name: str
+    program_name: str
+    vao: mgl.VertexArray
+    index_count: int
+    model: np.ndarray
+    center: np.ndarray  # World-space bounding sphere
+    radius: float
+    color: Optional[np.ndarray] = None
+    opacity: float = 1.0
+    category: str = ""  # Render pass the draw is profiled under
+
+
+class DrawList:
+    """Per-frame renderables, culled against the view frustum and state-sorted"""
+
+    def __init__(
+        self,
+        program_order: Sequence[str] = (),
+        depth_band: float = 0.05,
+        category_order: Sequence[str] = (),
+    ):
+        self.items: List[DrawItem] = []
+        self.program_rank = {name: i for i, name in enumerate(program_order)}
+        self.category_rank = {name: i for i, name in enumerate(category_order)}
+        # Translucent items this close in depth (meters) are batched by state
+        self.depth_band = depth_band
+        self.culled = 0
+
+    def clear(self):
+        self.items.clear()
+        self.culled = 0
+
+    def add(self, item: DrawItem):
+        self.items.append(item)
+
+    def cull(self, view_proj: np.ndarray) -> int:
+        """Drop items whose bounding sphere is entirely outside the frustum"""
+        if not self.items:
+            return 0
+
+        planes = extract_frustum_planes(view_proj)
+        centers = np.array([item.center for item in self.items], dtype=np.float64)
+        radii = np.array([item.radius for item in self.items], dtype=np.float64)
+        distances = centers @ planes[:, :3].T + planes[:, 3]
+        inside = (distances >= -radii[:, None]).all(axis=1)
+
+        self.culled = int(len(self.items) - np.count_nonzero(inside))
+        if self.culled:
+            self.items = [item for item, keep in zip(self.items, inside) if keep]
+        return self.culled
+
+    def sort(self, view_position: np.ndarray):
+        """Items grouped by category, then opaque by program and mesh and
+        translucent back to front.
+
+        Translucent items are ordered by depth band, then by program and mesh
+        within a band, so bodies at the default 0.85 opacity still batch.
+        """
+        eye = np.asarray(view_position, dtype=np.float64)
+        unranked = len(self.program_rank)
+        band = max(self.depth_band, 1e-6)
+
+        def sort_key(item: DrawItem):
+            category = self.category_rank.get(item.category, len(self.category_rank))
+            rank = self.program_rank.get(item.program_name, unranked)
+            if item.opacity < 1.0:
+                depth = float(np.linalg.norm(item.center - eye))
+                order = (1, -int(depth // band))
+            else:
+                order = (0, 0)
+            return (category, *order, rank, item.program_name, item.vao.glo)
+
+        self.items.sort(key=sort_key)
+
+    def segments(self) -> Iterator[Tuple[str, List[DrawItem]]]:
+        """Runs of consecutive items sharing a category, in draw order"""
+        for category, items in itertools.groupby(
+            self.items, key=lambda item: item.category
+        ):
+            yield category, list(items)
+
+
+# ============================================================================
+# TRAJECTORY TRAILS
+# ============================================================================
+
+# Tracked points that can carry a trail, with their flat trail colors
+TRAIL_COLORS: Dict[str, Tuple[float, float, float]] = {
+    "clubhead": (0.85, 0.15, 0.15),
+    "butt": (0.55, 0.55, 0.55),
+    "left_wrist": (0.15, 0.35, 0.85),
+    "right_wrist": (0.15, 0.65, 0.85),
+    "left_elbow": (0.45, 0.25, 0.75),
+    "right_elbow": (0.65, 0.35, 0.85),
+    "left_shoulder": (0.2, 0.6, 0.3),
+    "right_shoulder": (0.35, 0.75, 0.35),
+    "hub": (0.9, 0.6, 0.1),
+}
+
+
+@dataclass
+class TrailGeometry:
+    """GPU line strip holding one tracked point's full trajectory"""
+
+    vao: mgl.VertexArray
+    buffer: mgl.Buffer
+    positions: np.ndarray
+    time_vector: np.ndarray
+    color: Tuple[float, float, float]
+    max_speed: float
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.positions)
+
+
+class TrailRenderer:
+    """Full-swing trajectories uploaded once and drawn as line-strip prefixes"""
+
+    # Interleaved vertex layout: position (3f) + speed (1f)
+    VERTEX_STRIDE = 16
+
+    def __init__(self, ctx: mgl.Context, program: mgl.Program):
+        self.ctx = ctx
+        self.program = program
+        self.trail_sets: Dict[str, Dict[str, TrailGeometry]] = {}
+        self.slow_color = (0.2, 0.4, 0.9)
+        self.fast_color = (0.95, 0.2, 0.1)
+        self.opacity = 0.9
+
+    @staticmethod
+    def _fill_invalid(positions: np.ndarray) -> np.ndarray:
+        """Carry the last finite sample over gaps so the strip stays connected"""
+        valid = np.isfinite(positions).all(axis=1)
+        if valid.all() or not valid.any():
+            return np.nan_to_num(positions)
+        index = np.where(valid, np.arange(len(positions)), 0)
+        np.maximum.accumulate(index, out=index)
+        filled = positions[index]
+        # Leading gap takes the first valid sample
+        filled[: np.argmax(valid)] = positions[np.argmax(valid)]
+        return filled
+
+    @staticmethod
+    def compute_speed(positions: np.ndarray, time_vector: np.ndarray) -> np.ndarray:
+        """Per-sample speed magnitude from central differences"""
+        if len(positions) < 2:
+            return np.zeros(len(positions), dtype=np.float32)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = np.gradient(positions, time_vector, axis=0)
+        speed = np.linalg.norm(velocity, axis=1)
+        return np.nan_to_num(speed, nan=0.0, posinf=0.0).astype(np.float32)
+
+    @staticmethod
+    def _interleave(positions: np.ndarray, speed: np.ndarray) -> np.ndarray:
+        return np.hstack([positions, speed[:, None]]).astype(np.float32)
+
+    def upload_swing(
+        self,
+        swing_id: str,
+        trajectories: Dict[str, np.ndarray],
+        time_vector: np.ndarray,
+    ):
+        """Upload every trajectory of a swing; replaces any previous upload"""
+        self.remove_swing(swing_id)
+        time_vector = np.asarray(time_vector, dtype=np.float64)
+
+        trails = {}
+        for point, positions in trajectories.items():
+            positions = self._fill_invalid(np.asarray(positions, dtype=np.float32))
+            speed = self.compute_speed(positions, time_vector)
+            buffer = self.ctx.buffer(self._interleave(positions, speed).tobytes())
+            vao = self.ctx.vertex_array(
+                self.program, [(buffer, "3f 1f", "position", "speed")]
+            )
+            trails[point] = TrailGeometry(
+                vao=vao,
+                buffer=buffer,
+                positions=positions,
+                time_vector=time_vector,
+                color=TRAIL_COLORS.get(point, (0.3, 0.3, 0.3)),
+                max_speed=float(speed.max()) if len(speed) else 0.0,
+            )
+
+        self.trail_sets[swing_id] = trails
+
+    def update_range(
+        self, swing_id: str, point: str, start_frame: int, positions: np.ndarray
+    ):
+        """Overwrite part of an uploaded trajectory in place"""
+        trail = self.trail_sets[swing_id][point]
+        positions = self._fill_invalid(np.asarray(positions, dtype=np.float32))
+        end_frame = min(start_frame + len(positions), trail.vertex_count)
+        trail.positions[start_frame:end_frame] = positions[: end_frame - start_frame]
+
+        # Speed at the edges depends on the neighbouring samples
+        lo = max(start_frame - 1, 0)
+        hi = min(end_frame + 1, trail.vertex_count)
+        window_lo = max(lo - 1, 0)
+        window_hi = min(hi + 1, trail.vertex_count)
+        speed = self.compute_speed(
+            trail.positions[window_lo:window_hi],
+            trail.time_vector[window_lo:window_hi],
+        )[lo - window_lo : hi - window_lo]
+        trail.max_speed = max(trail.max_speed, float(speed.max(initial=0.0)))
+
+        data = self._interleave(trail.positions[lo:hi], speed)
+        trail.buffer.write(data.tobytes(), offset=lo * self.VERTEX_STRIDE)
+
+    def remove_swing(self, swing_id: str):
+        """Release a swing's trail buffers"""
+        for trail in self.trail_sets.pop(swing_id, {}).values():
+            trail.vao.release()
+            trail.buffer.release()
+
+    @staticmethod
+    def visible_range(frame_idx: int, vertex_count: int, trail_length: int):
+        """(first, count) of the strip to draw up to and including frame_idx"""
+        last = min(max(frame_idx, 0), vertex_count - 1)
+        first = 0 if trail_length <= 0 else max(0, last - trail_length + 1)
+        return first, last - first + 1
+
+    def render(
+        self,
+        view_matrix: np.ndarray,
+        proj_matrix: np.ndarray,
+        frame_idx: int,
+        render_config,
+        swing_frames: Optional[Dict[str, int]] = None,
+        swing_ids: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Draw enabled trails of every swing (or only ``swing_ids``)"""
+        if not self.trail_sets:
+            return 0
+
+        program = self.program
+        program["view"].write(to_gl_matrix_bytes(view_matrix))
+        program["projection"].write(to_gl_matrix_bytes(proj_matrix))
+        program["slowColor"].write(
+            np.array(self.slow_color, dtype=np.float32).tobytes()
+        )
+        program["fastColor"].write(
+            np.array(self.fast_color, dtype=np.float32).tobytes()
+        )
+        program["colorBySpeed"].value = render_config.trail_color_by_speed
+        program["opacity"].value = self.opacity
+
+        draw_calls = 0
+        for swing_id, trails in self.trail_sets.items():
+            if swing_ids is not None and swing_id not in swing_ids:
+                continue
+            swing_frame = (swing_frames or {}).get(swing_id, frame_idx)
+            for point, trail in trails.items():
+                if not render_config.show_trails.get(point, False):
+                    continue
+                first, count = self.visible_range(
+                    swing_frame, trail.vertex_count, render_config.trail_length
+                )
+                if count < 2:
+                    continue
+
+                program["trailColor"].write(
+                    np.array(trail.color, dtype=np.float32).tobytes()
+                )
+                program["maxSpeed"].value = trail.max_speed
+                trail.vao.render(mgl.LINE_STRIP, vertices=count, first=first)
+                draw_calls += 1
+
+        return draw_calls
+
+    def release(self):
+        """Release all trail buffers"""
+        for swing_id in list(self.trail_sets):
+            self.remove_swing(swing_id)
+
+
+# ============================================================================
+# VECTOR GLYPHS
+# ============================================================================
+
+VECTOR_COLORS: Dict[str, Tuple[float, float, float]] = {
+    "BASEQ": (1.0, 0.42, 0.21),  # Orange
+    "ZTCFQ": (0.31, 0.80, 0.77),  # Turquoise
+    "DELTAQ": (1.0, 0.90, 0.43),  # Yellow
+    "calculated": (0.80, 0.25, 0.80),  # Magenta
+}
+
+# Glyph length of the largest vector in the dataset, in meters
+FORCE_GLYPH_LENGTH = 0.3
+TORQUE_GLYPH_LENGTH = 0.2
+TORQUE_GLYPH_OFFSET = np.array([0.1, 0.0, 0.0], dtype=np.float32)
+
+
+class VectorGlyphRenderer:
+    """Force/torque vectors drawn as instances of one arrow mesh"""
+
+    # origin (3) + direction (3) + length (1) + rgba (4)
+    INSTANCE_FLOATS = 11
+
+    def __init__(
+        self,
+        ctx: mgl.Context,
+        program: mgl.Program,
+        mesh: GpuMesh,
+        capacity: int = 16,
+    ):
+        self.ctx = ctx
+        self.program = program
+        self.mesh = mesh
+        self.triangles_per_glyph = mesh.index_count // 3
+
+        # Dataset-wide maxima; set once per dataset via set_vector_scales
+        self.vector_scales: Dict[str, float] = {}
+
+        self.capacity = 0
+        self.instance_buffer: Optional[mgl.Buffer] = None
+        self.vao: Optional[mgl.VertexArray] = None
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        """(Re)create the instance buffer and VAO for at least capacity glyphs"""
+        if self.vao:
+            self.vao.release()
+        if self.instance_buffer:
+            self.instance_buffer.release()
+
+        self.capacity = capacity
+        self.instance_buffer = self.ctx.buffer(
+            reserve=capacity * self.INSTANCE_FLOATS * 4, dynamic=True
+        )
+        self.vao = self.ctx.vertex_array(
+            self.program,
+            [
+                (self.mesh.vertex_buffer, "3f", "position"),
+                (self.mesh.normal_buffer, "3f", "normal"),
+                (
+                    self.instance_buffer,
+                    "3f 3f 1f 4f/i",
+                    "instanceOrigin",
+                    "instanceDirection",
+                    "instanceLength",
+                    "instanceColor",
+                ),
+            ],
+            self.mesh.index_buffer,
+        )
+
+    def set_vector_scales(self, scales: Dict[str, float]):
+        """Store dataset maxima used to normalize glyph lengths"""
+        self.vector_scales = dict(scales)
+
+    def build_instances(self, frame_data, render_config) -> np.ndarray:
+        """Instance rows for every enabled, non-zero vector in the frame"""
+        opacity = render_config.force_opacity
+        vector_scale = render_config.vector_scale
+        calculated_scale = render_config.calculated_vector_scale
+        midpoint = np.asarray(frame_data.midpoint, dtype=np.float32)
+
+        # (vector, origin, scale key, glyph length, color key)
+        candidates = []
+        for dataset, force in frame_data.forces.items():
+            if dataset == "calculated":
+                if render_config.show_calculated_force:
+                    candidates.append(
+                        (
+                            force,
+                            frame_data.clubhead,
+                            "calculated_force",
+                            FORCE_GLYPH_LENGTH * calculated_scale,
+                            dataset,
+                        )
+                    )
+            elif render_config.show_forces.get(dataset, False):
+                candidates.append(
+                    (
+                        force,
+                        midpoint,
+                        "force",
+                        FORCE_GLYPH_LENGTH * vector_scale,
+                        dataset,
+                    )
+                )
+
+        for dataset, torque in frame_data.torques.items():
+            if dataset == "calculated":
+                if render_config.show_calculated_torque:
+                    candidates.append(
+                        (
+                            torque,
+                            frame_data.clubhead,
+                            "calculated_torque",
+                            TORQUE_GLYPH_LENGTH * calculated_scale,
+                            dataset,
+                        )
+                    )
+            elif render_config.show_torques.get(dataset, False):
+                candidates.append(
+                    (
+                        torque,
+                        midpoint + TORQUE_GLYPH_OFFSET,
+                        "torque",
+                        TORQUE_GLYPH_LENGTH * vector_scale,
+                        dataset,
+                    )
+                )
+
+        instances = np.zeros(
+            (len(candidates), self.INSTANCE_FLOATS), dtype=np.float32
+        )
+        count = 0
+        for vector, origin, scale_key, glyph_length, color_key in candidates:
+            vector = np.asarray(vector, dtype=np.float32)
+            magnitude = float(np.linalg.norm(vector))
+            if not np.isfinite(magnitude) or magnitude < 1e-6:
+                continue
+            if not np.isfinite(origin).all():
+                continue
+
+            max_magnitude = self.vector_scales.get(scale_key) or magnitude
+            instances[count, 0:3] = origin
+            instances[count, 3:6] = vector / magnitude
+            instances[count, 6] = glyph_length * magnitude / max_magnitude
+            instances[count, 7:10] = VECTOR_COLORS.get(color_key, (0.5, 0.5, 0.5))
+            instances[count, 10] = opacity
+            count += 1
+
+        return instances[:count]
+
+    def render(
+        self,
+        view_matrix: np.ndarray,
+        proj_matrix: np.ndarray,
+        frame_data,
+        render_config,
+    ) -> int:
+        """Draw all enabled vectors in one instanced call; returns glyph count"""
+        instances = self.build_instances(frame_data, render_config)
+        if len(instances) == 0:
+            return 0
+
+        if len(instances) > self.capacity:
+            self._allocate(max(len(instances), self.capacity * 2))
+        self.instance_buffer.write(instances.tobytes())
+
+        program = self.program
+        program["view"].write(to_gl_matrix_bytes(view_matrix))
+        program["projection"].write(to_gl_matrix_bytes(proj_matrix))
+        program["lightPosition"].write(
+            np.array([2.0, 4.0, 1.0], dtype=np.float32).tobytes()
+        )
+        program["lightColor"].write(
+            np.array([1.0, 1.0, 1.0], dtype=np.float32).tobytes()
+        )
+
+        self.vao.render(instances=len(instances))
+        return len(instances)
+
+    def release(self):
+        """Release instance resources; the arrow mesh belongs to GeometryManager"""
+        for resource in (self.vao, self.instance_buffer):
+            if resource:
+                resource.release()
+
+
+# ============================================================================
+# GHOST OVERLAY
+# ============================================================================
+
+# Uniform array size in the ghost shader; swings beyond this are rejected
+MAX_GHOST_SWINGS = 64
+
+# Tracked points stored per swing in the joint texture, in row order
+GHOST_POINTS = (
+    "butt",
+    "clubhead",
+    "left_wrist",
+    "left_elbow",
+    "left_shoulder",
+    "right_wrist",
+    "right_elbow",
+    "right_shoulder",
+    "hub",
+)
+
+# (start point, end point, radius) drawn as cylinders
+GHOST_SEGMENTS = (
+    ("left_wrist", "left_elbow", 0.025),
+    ("left_elbow", "left_shoulder", 0.035),
+    ("right_wrist", "right_elbow", 0.025),
+    ("right_elbow", "right_shoulder", 0.035),
+    ("left_shoulder", "hub", 0.04),
+    ("right_shoulder", "hub", 0.04),
+    ("butt", "clubhead", 0.006),
+)
+
+# (point, radius) drawn as spheres
+GHOST_JOINTS = (
+    ("left_elbow", 0.03),
+    ("right_elbow", 0.03),
+    ("left_shoulder", 0.042),
+    ("right_shoulder", 0.042),
+    ("hub", 0.06),
+    ("clubhead", 0.02),
+)
+
+# Per-swing colors, cycled as swings are added
+GHOST_PALETTE = (
+    (0.12, 0.47, 0.71),
+    (1.0, 0.5, 0.05),
+    (0.17, 0.63, 0.17),
+    (0.84, 0.15, 0.16),
+    (0.58, 0.4, 0.74),
+    (0.55, 0.34, 0.29),
+    (0.89, 0.47, 0.76),
+    (0.5, 0.5, 0.5),
+    (0.74, 0.74, 0.13),
+    (0.09, 0.75, 0.81),
+)
+
+GHOST_ALIGNMENTS = ("normalized", "impact")
+
+
+@dataclass
+class GhostSwing:
+    """One overlaid swing: joint texture slot plus timing for alignment"""
+
+    swing_id: str
+    slot: int
+    joints: np.ndarray  # (points, frames, 3)
+    time_vector: np.ndarray
+    impact_frame: int
+    color: Tuple[float, float, float]
+
+    @property
+    def frame_count(self) -> int:
+        return self.joints.shape[1]
+
+
+def detect_impact_frame(clubhead: np.ndarray, time_vector: np.ndarray) -> int:
+    """Frame of peak clubhead speed, used as the impact estimate"""
+    if len(clubhead) < 2:
+        return 0
+    return int(np.argmax(TrailRenderer.compute_speed(clubhead, time_vector)))
+
+
+def sample_interval(time_vector: np.ndarray) -> float:
+    """Median frame spacing in seconds"""
+    if len(time_vector) < 2:
+        return 1.0
+    dt = float(np.median(np.diff(time_vector)))
+    return dt if dt > 0 else 1.0
+
+
+class GhostRenderer:
+    """Many swings drawn as translucent skeletons with two instanced calls.
+
+    Joint positions of every swing live in one float texture uploaded once per
+    swing; each frame only the per-swing frame indices change.
+    """
+
+    # row start, row end, swing slot, radius
+    INSTANCE_FLOATS = 4
+
+    def __init__(
+        self,
+        ctx: mgl.Context,
+        program: mgl.Program,
+        cylinder: GpuMesh,
+        sphere: GpuMesh,
+    ):
+        self.ctx = ctx
+        self.program = program
+        self.meshes = {"cylinder": cylinder, "sphere": sphere}
+        self.swings: Dict[str, GhostSwing] = {}
+        self.max_texture_size = int(ctx.info["GL_MAX_TEXTURE_SIZE"])
+
+        # Reference timeline the viewer's frame index refers to
+        self.reference_time: Optional[np.ndarray] = None
+        self.reference_impact = 0
+
+        self.joint_texture: Optional[mgl.Texture] = None
+        self.frame_capacity = 0
+        self.slot_capacity = 0
+
+        self.instance_buffers: Dict[str, mgl.Buffer] = {}
+        self.vaos: Dict[str, mgl.VertexArray] = {}
+        self.instance_counts = {"cylinder": 0, "sphere": 0}
+        self._instances_dirty = False
+
+    # ------------------------------------------------------------------
+    # Swing management
+    # ------------------------------------------------------------------
+
+    def add_swing(
+        self,
+        swing_id: str,
+        trajectories: Dict[str, np.ndarray],
+        time_vector: np.ndarray,
+        impact_frame: Optional[int] = None,
+        color: Optional[Tuple[float, float, float]] = None,
+    ):
+        """Upload a swing's joint trajectories; replaces a swing with the same id"""
+        self.remove_swing(swing_id)
+        used = {swing.slot for swing in self.swings.values()}
+        slot = next(i for i in range(MAX_GHOST_SWINGS + 1) if i not in used)
+        if slot >= MAX_GHOST_SWINGS:
+            raise ValueError(f"Ghost overlay is limited to {MAX_GHOST_SWINGS} swings")
+
+        time_vector = np.asarray(time_vector, dtype=np.float64)
+        joints = np.stack(
+            [
+                TrailRenderer._fill_invalid(
+                    np.asarray(trajectories[point], dtype=np.float32)
+                )
+                for point in GHOST_POINTS
+            ]
+        )
+        if joints.shape[1] > self.max_texture_size:
+            raise ValueError(
+                f"Swing '{swing_id}' has {joints.shape[1]} frames; "
+                f"the joint texture allows {self.max_texture_size}"
+            )
+
+        if impact_frame is None:
+            clubhead = joints[GHOST_POINTS.index("clubhead")]
+            impact_frame = detect_impact_frame(clubhead, time_vector)
+
+        swing = GhostSwing(
+            swing_id=swing_id,
+            slot=slot,
+            joints=joints,
+            time_vector=time_vector,
+            impact_frame=int(impact_frame),
+            color=color or GHOST_PALETTE[slot % len(GHOST_PALETTE)],
+        )
+        self.swings[swing_id] = swing
+
+        if swing.frame_count > self.frame_capacity or slot >= self.slot_capacity:
+            self._allocate_texture()
+        else:
+            self._upload_joints(swing)
+        self._instances_dirty = True
+
+    def remove_swing(self, swing_id: str):
+        """Drop a swing from the overlay; its texture rows are reused"""
+        if self.swings.pop(swing_id, None) is not None:
+            self._instances_dirty = True
+
+    def clear(self):
+        """Remove every overlaid swing"""
+        self.swings.clear()
+        self._instances_dirty = True
+
+    def set_reference(
+        self, time_vector: np.ndarray, impact_frame: Optional[int] = None
+    ):
+        """Timeline of the primary swing that frame indices are given in"""
+        self.reference_time = np.asarray(time_vector, dtype=np.float64)
+        self.reference_impact = 0 if impact_frame is None else int(impact_frame)
+
+    # ------------------------------------------------------------------
+    # GPU resources
+    # ------------------------------------------------------------------
+
+    def _allocate_texture(self):
+        """Grow the joint texture and re-upload every swing"""
+        frames = max(swing.frame_count for swing in self.swings.values())
+        slots = max(swing.slot for swing in self.swings.values()) + 1
+        self.frame_capacity = max(frames, self.frame_capacity)
+        self.slot_capacity = min(
+            max(slots, self.slot_capacity * 2, 4), MAX_GHOST_SWINGS
+        )
+
+        if self.joint_texture:
+            self.joint_texture.release()
+        self.joint_texture = self.ctx.texture(
+            (self.frame_capacity, self.slot_capacity * len(GHOST_POINTS)),
+            3,
+            dtype="f4",
+        )
+        self.joint_texture.filter = (mgl.NEAREST, mgl.NEAREST)
+        for swing in self.swings.values():
+            self._upload_joints(swing)
+
+    def _upload_joints(self, swing: GhostSwing):
+        """Write one swing's block of texture rows"""
+        rows = len(GHOST_POINTS)
+        self.joint_texture.write(
+            np.ascontiguousarray(swing.joints).tobytes(),
+            viewport=(0, swing.slot * rows, swing.frame_count, rows),
+        )
+
+    def _build_instances(self):
+        """Rebuild per-(swing, part) instance rows after the swing set changes"""
+        rows = len(GHOST_POINTS)
+        row_of = {point: i for i, point in enumerate(GHOST_POINTS)}
+        parts = {
+            "cylinder": [(row_of[a], row_of[b], r) for a, b, r in GHOST_SEGMENTS],
+            "sphere": [(row_of[p], row_of[p], r) for p, r in GHOST_JOINTS],
+        }
+
+        colors = np.zeros((MAX_GHOST_SWINGS, 3), dtype=np.float32)
+        for swing in self.swings.values():
+            colors[swing.slot] = swing.color
+        self.program["swingColors"].write(colors.tobytes())
+
+        for mesh_type, mesh_parts in parts.items():
+            instances = np.array(
+                [
+                    (swing.slot * rows + start, swing.slot * rows + end, swing.slot, r)
+                    for swing in self.swings.values()
+                    for start, end, r in mesh_parts
+                ],
+                dtype=np.float32,
+            ).reshape(-1, self.INSTANCE_FLOATS)
+            self.instance_counts[mesh_type] = len(instances)
+            if len(instances) == 0:
+                continue
+
+            buffer = self.instance_buffers.get(mesh_type)
+            if buffer is None or buffer.size < instances.nbytes:
+                self._release_instances(mesh_type)
+                buffer = self.ctx.buffer(reserve=instances.nbytes * 2)
+                mesh = self.meshes[mesh_type]
+                self.instance_buffers[mesh_type] = buffer
+                self.vaos[mesh_type] = self.ctx.vertex_array(
+                    self.program,
+                    [
+                        (mesh.vertex_buffer, "3f", "position"),
+                        (mesh.normal_buffer, "3f", "normal"),
+                        (
+                            buffer,
+                            "2f 1f 1f/i",
+                            "instanceRows",
+                            "instanceSwing",
+                            "instanceRadius",
+                        ),
+                    ],
+                    mesh.index_buffer,
+                )
+            buffer.write(instances.tobytes())
+
+        self._instances_dirty = False
+
+    def _release_instances(self, mesh_type: str):
+        for store in (self.vaos, self.instance_buffers):
+            resource = store.pop(mesh_type, None)
+            if resource:
+                resource.release()
+
+    # ------------------------------------------------------------------
+    # Time alignment
+    # ------------------------------------------------------------------
+
+    def frame_mapping(
+        self, alignment: str = "normalized"
+    ) -> Dict[str, Tuple[float, float]]:
+        """Affine (scale, offset) per swing from reference frame to swing frame"""
+        if alignment not in GHOST_ALIGNMENTS:
+            raise ValueError(f"Unknown ghost alignment '{alignment}'")
+
+        reference = self.reference_time
+        if reference is None and self.swings:
+            # Without a primary swing, the longest ghost sets the timeline
+            longest = max(self.swings.values(), key=lambda s: s.frame_count)
+            reference = longest.time_vector
+            reference_impact = longest.impact_frame
+        else:
+            reference_impact = self.reference_impact
+        if reference is None:
+            return {}
+
+        mapping = {}
+        for swing_id, swing in self.swings.items():
+            if alignment == "impact":
+                scale = sample_interval(reference) / sample_interval(swing.time_vector)
+                offset = swing.impact_frame - scale * reference_impact
+            else:
+                scale = (swing.frame_count - 1) / max(len(reference) - 1, 1)
+                offset = 0.0
+            mapping[swing_id] = (scale, offset)
+        return mapping
+
+    def swing_frames(self, reference_frame: float, alignment: str) -> np.ndarray:
+        """(frame, next frame, blend) rows indexed by swing slot"""
+        frames = np.zeros((MAX_GHOST_SWINGS, 3), dtype=np.float32)
+        for swing_id, (scale, offset) in self.frame_mapping(alignment).items():
+            swing = self.swings[swing_id]
+            last = swing.frame_count - 1
+            frame = min(max(scale * reference_frame + offset, 0.0), last)
+            frame0 = int(np.floor(frame))
+            frames[swing.slot] = (frame0, min(frame0 + 1, last), frame - frame0)
+        return frames
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+
+    def render(
+        self,
+        view_matrix: np.ndarray,
+        proj_matrix: np.ndarray,
+        reference_frame: float,
+        render_config,
+    ) -> Tuple[int, int]:
+        """Draw all ghosts; returns (draw calls, triangles)"""
+        if not self.swings:
+            return 0, 0
+        if self._instances_dirty:
+            self._build_instances()
+
+        program = self.program
+        program["view"].write(to_gl_matrix_bytes(view_matrix))
+        program["projection"].write(to_gl_matrix_bytes(proj_matrix))
+        program["lightPosition"].write(
+            np.array([2.0, 4.0, 1.0], dtype=np.float32).tobytes()
+        )
+        program["opacity"].value = render_config.ghost_opacity
+        program["swingFrames"].write(
+            self.swing_frames(reference_frame, render_config.ghost_alignment).tobytes()
+        )
+        self.joint_texture.use(location=0)
+        program["jointTexture"].value = 0
+
+        draw_calls = 0
+        triangles = 0
+        for mesh_type in ("cylinder", "sphere"):
+            count = self.instance_counts[mesh_type]
+            if count == 0:
+                continue
+            program["sphereMode"].value = mesh_type == "sphere"
+            self.vaos[mesh_type].render(instances=count)
+            draw_calls += 1
+            triangles += count * (self.meshes[mesh_type].index_count // 3)
+        return draw_calls, triangles
+
+    def release(self):
+        """Release texture and instance resources; meshes belong to GeometryManager"""
+        for mesh_type in list(self.vaos):
+            self._release_instances(mesh_type)
+        if self.joint_texture:
+            self.joint_texture.release()
+            self.joint_texture = None
+        self.frame_capacity = 0
+        self.slot_capacity = 0
+
+
+# ============================================================================
+# MULTI-VIEWPORT
+# ============================================================================
+
+
+@dataclass
+class ViewportSpec:
+    """One framebuffer rectangle drawn with its own camera and swing"""
+
+    rect: Tuple[int, int, int, int]  # x, y, width, height (GL origin bottom-left)
+    frame_data: Any
+    render_config: Any
+    view_matrix: np.ndarray
+    proj_matrix: np.ndarray
+    view_position: np.ndarray
+    swing_id: Optional[str] = None  # Trails to draw; None draws every swing
+
+
+def split_viewport_rects(
+    width: int, height: int, count: int
+) -> List[Tuple[int, int, int, int]]:
+    """Side-by-side columns covering the framebuffer, left to right"""
+    count = max(count, 1)
+    edges = np.linspace(0, width, count + 1).round().astype(int)
+    return [
+        (int(edges[i]), 0, int(edges[i + 1] - edges[i]), height)
+        for i in range(count)
+    ]
+
+
+# ============================================================================
+# RENDER PROFILING
+# ============================================================================
+
+# Display order for passes; unknown pass names are appended as they appear
+RENDER_PASSES = ("collect", "ground", "body", "club", "ghosts", "trails", "vectors")
+
+
+@dataclass
+class PassTiming:
+    """Counters and timings for one render pass in one frame"""
+
+    cpu_ms: float = 0.0
+    gpu_ms: Optional[float] = None
+    draw_calls: int = 0
+    triangles: int = 0
+    primitives: Optional[int] = None
+
+
+def _summarize_times(values: Deque[float]) -> Dict[str, float]:
+    """Mean and percentiles of a rolling time history"""
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    data = np.fromiter(values, dtype=np.float64)
+    p50, p95, p99 = np.percentile(data, [50, 95, 99])
+    return {
+        "mean": float(data.mean()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(data.max()),
+    }
+
+
+class RenderProfiler:
+    """Per-pass GL timer queries with rolling CPU and GPU frame-time history"""
+
+    def __init__(self, ctx: mgl.Context, history_size: int = 300, latency: int = 3):
+        self.ctx = ctx
+        self.enabled = True
+        self.history_size = history_size
+        # Results are read this many frames late so readback never stalls the GPU
+        self.latency = max(1, latency)
+
+        self._query_pool: List[mgl.Query] = []
+        self.gpu_timers_supported = self._probe_timer_queries()
+        self._pending: Deque[
+            Tuple[Dict[str, PassTiming], Dict[str, List[mgl.Query]]]
+        ] = deque()
+        self._frame_passes: Dict[str, PassTiming] = {}
+        # One query per pass scope; a pass repeated per viewport has several
+        self._frame_queries: Dict[str, List[mgl.Query]] = {}
+        self._frame_start = 0.0
+
+        self.frame_count = 0
+        self.cpu_frame_ms: Deque[float] = deque(maxlen=history_size)
+        self.gpu_frame_ms: Deque[float] = deque(maxlen=history_size)
+        self.pass_cpu_ms: Dict[str, Deque[float]] = {}
+        self.pass_gpu_ms: Dict[str, Deque[float]] = {}
+        self.last_frame: Dict[str, PassTiming] = {}
+        self.last_resolved_frame: Dict[str, PassTiming] = {}
+
+    def _probe_timer_queries(self) -> bool:
+        """Check whether the context supports GL_TIME_ELAPSED queries"""
+        try:
+            # The probe query becomes the first pooled query
+            self._query_pool.append(self.ctx.query(time=True, primitives=True))
+            return True
+        except Exception as e:
+            print(f"⚠️ GPU timer queries unavailable, profiling CPU only: {e}")
+            return False
+
+    def _acquire_query(self) -> Optional[mgl.Query]:
+        if not self.gpu_timers_supported:
+            return None
+        if self._query_pool:
+            return self._query_pool.pop()
+        return self.ctx.query(time=True, primitives=True)
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        self._frame_passes = {}
+        self._frame_queries = {}
+        self._frame_start = time.perf_counter()
+
+    @contextmanager
+    def pass_scope(self, name: str, render_stats: Dict[str, float], gpu: bool = True):
+        """Time a render pass and attribute draw calls/triangles to it.
+
+        A pass entered again in the same frame (once per viewport) adds to its
+        totals. CPU-only passes (``gpu=False``) issue no GL work, so they skip
+        the query.
+        """
+        timing = self._frame_passes.setdefault(name, PassTiming())
+        draw_calls = render_stats["draw_calls"]
+        triangles = render_stats["triangles_rendered"]
+
+        query = self._acquire_query() if gpu else None
+        start = time.perf_counter()
+        try:
+            if query is None:
+                yield timing
+            else:
+                self._frame_queries.setdefault(name, []).append(query)
+                with query:
+                    yield timing
+        finally:
+            timing.cpu_ms += (time.perf_counter() - start) * 1000
+            timing.draw_calls += int(render_stats["draw_calls"] - draw_calls)
+            timing.triangles += int(render_stats["triangles_rendered"] - triangles)
+
+    def end_frame(self) -> float:
+        """Finish the frame, record CPU time and resolve old GPU queries"""
+        cpu_ms = (time.perf_counter() - self._frame_start) * 1000
+        self.cpu_frame_ms.append(cpu_ms)
+        for name, timing in self._frame_passes.items():
+            self._history(self.pass_cpu_ms, name).append(timing.cpu_ms)
+
+        self.last_frame = self._frame_passes
+        self.frame_count += 1
+
+        if self._frame_queries:
+            self._pending.append((self._frame_passes, self._frame_queries))
+        else:
+            self.last_resolved_frame = self._frame_passes
+        self.resolve()
+        return cpu_ms
+
+    def resolve(self, flush: bool = False):
+        """Read back GPU results older than the latency window"""
+        keep = 0 if flush else self.latency
+        while len(self._pending) > keep:
+            passes, queries = self._pending.popleft()
+            gpu_total = 0.0
+            for name, pass_queries in queries.items():
+                timing = passes[name]
+                timing.gpu_ms = sum(query.elapsed for query in pass_queries) / 1e6
+                timing.primitives = sum(query.primitives for query in pass_queries)
+                gpu_total += timing.gpu_ms
+                self._history(self.pass_gpu_ms, name).append(timing.gpu_ms)
+                self._query_pool.extend(pass_queries)
+            self.gpu_frame_ms.append(gpu_total)
+            self.last_resolved_frame = passes
+
+    def _history(self, store: Dict[str, Deque[float]], name: str) -> Deque[float]:
+        if name not in store:
+            store[name] = deque(maxlen=self.history_size)
+        return store[name]
+
+    def pass_names(self) -> List[str]:
+        """Known passes in display order"""
+        seen = set(self.pass_cpu_ms) | set(self.pass_gpu_ms)
+        ordered = [name for name in RENDER_PASSES if name in seen]
+        return ordered + sorted(seen - set(RENDER_PASSES))
+
+    def get_histogram(
+        self, source: str = "gpu", bins: int = 20
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram (counts, bin edges in ms) of recent frame times"""
+        values = self.gpu_frame_ms if source == "gpu" else self.cpu_frame_ms
+        if not values:
+            return np.zeros(bins, dtype=np.int64), np.zeros(bins + 1)
+        return np.histogram(np.fromiter(values, dtype=np.float64), bins=bins)
+
+    def get_summary(self) -> Dict:
+        """Frame and per-pass statistics over the rolling window"""
+        passes = {}
+        for name in self.pass_names():
+            latest = self.last_resolved_frame.get(name, PassTiming())
+            passes[name] = {
+                "cpu_ms": _summarize_times(self.pass_cpu_ms.get(name, deque())),
+                "gpu_ms": _summarize_times(self.pass_gpu_ms.get(name, deque())),
+                "draw_calls": latest.draw_calls,
+                "triangles": latest.triangles,
+                "primitives": latest.primitives,
+            }
+
+        return {
+            "frames": self.frame_count,
+            "gpu_timers": self.gpu_timers_supported,
+            "cpu_frame_ms": _summarize_times(self.cpu_frame_ms),
+            "gpu_frame_ms": _summarize_times(self.gpu_frame_ms),
+            "passes": passes,
+        }
+
+    def overlay_lines(self) -> List[str]:
+        """Short text report for on-screen display"""
+        summary = self.get_summary()
+        cpu = summary["cpu_frame_ms"]
+        gpu = summary["gpu_frame_ms"]
+        lines = [
+            f"CPU {cpu['mean']:.2f} ms  p95 {cpu['p95']:.2f}  p99 {cpu['p99']:.2f}",
+        ]
+        if self.gpu_timers_supported:
+            lines.append(
+                f"GPU {gpu['mean']:.2f} ms  p95 {gpu['p95']:.2f}  p99 {gpu['p99']:.2f}"
+            )
+        for name, stats in summary["passes"].items():
+            gpu_text = ""
+            if self.gpu_timers_supported:
+                gpu_text = f"gpu {stats['gpu_ms']['mean']:.2f}"
+            lines.append(
+                f"{name:<8} cpu {stats['cpu_ms']['mean']:.2f} {gpu_text}  "
+                f"{stats['draw_calls']} draws  {stats['triangles']} tris"
+            )
+        return lines
+
+    def reset(self):
+        """Drop all history and outstanding queries"""
+        self.resolve(flush=True)
+        self.frame_count = 0
+        self.cpu_frame_ms.clear()
+        self.gpu_frame_ms.clear()
+        self.pass_cpu_ms.clear()
+        self.pass_gpu_ms.clear()
+        self.last_frame = {}
+        self.last_resolved_frame = {}
+
+
 # ============================================================================
 # FIXED OPENGL RENDERER
 # ============================================================================
@@ -384,6 +2078,11 @@ class OpenGLRenderer:
         self.textures = {}
         self.ground_level = 0.0  # Ground level for proper rendering
 
+        # Per-frame LOD inputs, set in render_frame
+        self._use_lod = False
+        self._lod_view_matrix = np.eye(4, dtype=np.float32)
+        self._lod_pixel_scale = 1.0
+
         # Rendering state
         self.viewport_size = (1600, 900)
         self.clear_color = (1.0, 1.0, 1.0, 1.0)  # White background
@@ -393,18 +2092,38 @@ class OpenGLRenderer:
             "draw_calls": 0,
             "triangles_rendered": 0,
             "render_time_ms": 0.0,
+            "gpu_time_ms": 0.0,
+            "culled_objects": 0,
+            "state_changes": 0,
         }
+        self.draw_list = DrawList(
+            program_order=("ground", "simple"), category_order=("ground", "body", "club")
+        )
+        self._collect_category = ""  # Category stamped on queued draw items
+        # Program and mesh bound by the draw-list submission, per view
+        self._bound_program = None
+        self._bound_vao = None
+        self._bound_programs: Set[str] = set()
+        self.profiler: Optional[RenderProfiler] = None
+        self.trail_renderer: Optional[TrailRenderer] = None
+        self.vector_renderer: Optional[VectorGlyphRenderer] = None
+        self.ghost_renderer: Optional[GhostRenderer] = None
+        self.startup_stats: Dict[str, float] = {}
+        self._frame_start_time = 0.0
+
+        # Shared metrics, sampled by MetricsSampler
+        self._metrics = get_metrics()
+        self._frames_metric = self._metrics.counter("renderer.frames")
+        self._frame_ms_metric = self._metrics.histogram("renderer.frame_ms")
+        self._gpu_ms_metric = self._metrics.histogram("renderer.gpu_ms")
 
     def initialize(self, ctx: mgl.Context):
         """Initialize OpenGL context and resources"""
+        start_time = time.perf_counter()
         self.ctx = ctx
 
         # Setup OpenGL state
-        self.ctx.enable(mgl.DEPTH_TEST)
-        self.ctx.enable(mgl.BLEND)
-        self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
-        self.ctx.enable(mgl.CULL_FACE)
-        self.ctx.front_face = "ccw"
+        self.apply_gl_state()
 
         # Initialize geometry manager
         self.geometry_manager = GeometryManager(self.ctx)
@@ -412,9 +2131,48 @@ class OpenGLRenderer:
         # Create standard geometry objects
         self._create_standard_objects()
 
+        self.profiler = RenderProfiler(self.ctx)
+        self.trail_renderer = TrailRenderer(
+            self.ctx, self.geometry_manager.programs["trail"]
+        )
+        self.vector_renderer = VectorGlyphRenderer(
+            self.ctx,
+            self.geometry_manager.programs["arrow"],
+            self.geometry_manager.get_gpu_mesh("arrow"),
+        )
+        # Ghosts are small and translucent; a mid tessellation level suffices
+        lod_meshes = self.geometry_manager.lod_meshes
+        self.ghost_renderer = GhostRenderer(
+            self.ctx,
+            self.geometry_manager.programs["ghost"],
+            lod_meshes["cylinder"][2],
+            lod_meshes["sphere"][2],
+        )
+
+        shader_summary = self.geometry_manager.program_cache.get_summary()
+        self.startup_stats = {
+            "total_ms": (time.perf_counter() - start_time) * 1000,
+            **self.geometry_manager.startup_timings,
+            "programs_linked": shader_summary["linked"],
+            "programs_memory": shader_summary["memory"],
+        }
+
         print("✅ OpenGL renderer initialized")
         print(f"   OpenGL Version: {self.ctx.info['GL_VERSION']}")
         print(f"   Renderer: {self.ctx.info['GL_RENDERER']}")
+        print(
+            f"   Startup: {self.startup_stats['total_ms']:.1f} ms "
+            f"(shaders {self.startup_stats['shaders_ms']:.1f} ms: "
+            f"{shader_summary['linked']} linked, {shader_summary['memory']} reused)"
+        )
+
+    def apply_gl_state(self):
+        """(Re)apply the fixed-function state the passes rely on"""
+        self.ctx.enable(mgl.DEPTH_TEST)
+        self.ctx.enable(mgl.BLEND)
+        self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
+        self.ctx.enable(mgl.CULL_FACE)
+        self.ctx.front_face = "ccw"
 
     def _create_standard_objects(self):
         """Create standard geometry objects for rendering"""
@@ -465,7 +2223,49 @@ class OpenGLRenderer:
         """Render complete frame with all elements"""
         if not self.ctx or not self.geometry_manager:
             return
-        start_time = time.time()
+        self._begin_frame()
+        self._render_view(
+            frame_data,
+            render_config,
+            view_matrix,
+            proj_matrix,
+            view_position,
+            self.viewport_size[1],
+        )
+        self._end_frame()
+
+    def render_viewports(self, viewports: Sequence[ViewportSpec]):
+        """Render several cameras into one framebuffer in a single pass.
+
+        All viewports share the context, meshes, programs and uploaded swing
+        buffers; only the viewport/scissor rectangle and uniforms change.
+        """
+        if not self.ctx or not self.geometry_manager:
+            return
+        self._begin_frame()
+        try:
+            for viewport in viewports:
+                self.ctx.viewport = viewport.rect
+                self.ctx.scissor = viewport.rect
+                self._render_view(
+                    viewport.frame_data,
+                    viewport.render_config,
+                    viewport.view_matrix,
+                    viewport.proj_matrix,
+                    viewport.view_position,
+                    viewport.rect[3],
+                    viewport.swing_id,
+                )
+        finally:
+            self.ctx.scissor = None
+            self.ctx.viewport = (0, 0, *self.viewport_size)
+        self._end_frame()
+
+    def _begin_frame(self):
+        """Reset per-frame stats and clear the whole framebuffer"""
+        self._frame_start_time = time.perf_counter()
+        if self.profiler is not None and self.profiler.enabled:
+            self.profiler.begin_frame()
 
         # Clear framebuffer with white background
         self.ctx.clear(*self.clear_color)
@@ -473,46 +2273,208 @@ class OpenGLRenderer:
         # Reset stats
         self.render_stats["triangles_rendered"] = 0
         self.render_stats["draw_calls"] = 0
+        self.render_stats["culled_objects"] = 0
+        self.render_stats["state_changes"] = 0
 
-        # Render ground
-        if render_config.show_ground:
-            self._render_ground(view_matrix, proj_matrix, view_position)
-
-        # Render body segments
-        self._render_body_segments(
-            frame_data, render_config, view_matrix, proj_matrix, view_position
-        )
-
-        # Render club
-        if render_config.show_club:
-            self._render_club(
-                frame_data, render_config, view_matrix, proj_matrix, view_position
-            )
-
+    def _end_frame(self):
         # Update performance stats
-        self.render_stats["render_time_ms"] = (time.time() - start_time) * 1000
-
-    def _render_ground(
+        end_time = time.perf_counter()
+        self.render_stats["render_time_ms"] = (end_time - self._frame_start_time) * 1000
+        self._frames_metric.inc()
+        self._frame_ms_metric.observe(self.render_stats["render_time_ms"])
+        if self._metrics.tracing:
+            self._metrics.record_span("render_frame", self._frame_start_time, end_time)
+        if self.profiler is not None and self.profiler.enabled:
+            self.profiler.end_frame()
+            gpu_ms = self.profiler.gpu_frame_ms
+            self.render_stats["gpu_time_ms"] = gpu_ms[-1] if gpu_ms else 0.0
+            if gpu_ms:
+                self._gpu_ms_metric.observe(gpu_ms[-1])
+
+    def _render_view(
         self,
+        frame_data,
+        render_config,
         view_matrix: np.ndarray,
         proj_matrix: np.ndarray,
         view_position: np.ndarray,
+        viewport_height: int,
+        swing_id: Optional[str] = None,
     ):
-        """Render ground plane at proper level with golf grid"""
-        if not self.geometry_manager:
-            return
+        """Draw the scene for one camera into the current viewport"""
+        # Projected-size LOD: pixels per world unit at unit view depth
+        self._use_lod = getattr(render_config, "level_of_detail", False)
+        self._lod_view_matrix = view_matrix
+        self._lod_pixel_scale = proj_matrix[1, 1] * viewport_height / 2.0
+
+        # Collect ground, body and club into the draw list, cull, sort (CPU)
+        with self._profile_pass("collect", gpu=False):
+            self.draw_list.clear()
+            if render_config.show_ground:
+                self._collect_category = "ground"
+                self._collect_ground()
+            self._collect_category = "body"
+            self._collect_body_segments(frame_data, render_config)
+            if render_config.show_club:
+                self._collect_category = "club"
+                self._collect_club(frame_data, render_config)
+            self.render_stats["culled_objects"] += self.draw_list.cull(
+                proj_matrix @ view_matrix
+            )
+            self.draw_list.sort(view_position)
+
+        # Submit in sorted order, each category under its own pass timer
+        self._bound_program = self._bound_vao = None
+        self._bound_programs.clear()
+        for category, items in self.draw_list.segments():
+            with self._profile_pass(category):
+                self.render_stats["state_changes"] += self._submit_draw_list(
+                    items, view_matrix, proj_matrix, view_position
+                )
+
+        # Render overlaid swings as translucent ghosts
+        if render_config.show_ghosts and self.ghost_renderer:
+            with self._profile_pass("ghosts"):
+                draw_calls, triangles = self.ghost_renderer.render(
+                    view_matrix, proj_matrix, frame_data.frame_idx, render_config
+                )
+                self.render_stats["draw_calls"] += draw_calls
+                self.render_stats["triangles_rendered"] += triangles
+
+        # Render trajectory trails
+        if render_config.show_trajectory and self.trail_renderer:
+            with self._profile_pass("trails"):
+                self.render_stats["draw_calls"] += self.trail_renderer.render(
+                    view_matrix,
+                    proj_matrix,
+                    frame_data.frame_idx,
+                    render_config,
+                    swing_ids=None if swing_id is None else (swing_id,),
+                )
+
+        # Render force/torque vectors
+        if self.vector_renderer:
+            with self._profile_pass("vectors"):
+                glyphs = self.vector_renderer.render(
+                    view_matrix, proj_matrix, frame_data, render_config
+                )
+                if glyphs:
+                    self.render_stats["draw_calls"] += 1
+                    self.render_stats["triangles_rendered"] += (
+                        glyphs * self.vector_renderer.triangles_per_glyph
+                    )
+
+    def _profile_pass(self, name: str, gpu: bool = True):
+        """Profiler scope for a render pass, or a no-op when profiling is off"""
+        if self.profiler is None or not self.profiler.enabled:
+            return nullcontext()
+        return self.profiler.pass_scope(name, self.render_stats, gpu)
+
+    def _record_draw(self, index_count: int):
+        """Count a draw call and its triangles"""
+        self.render_stats["draw_calls"] += 1
+        self.render_stats["triangles_rendered"] += index_count // 3
+
+    def _select_mesh(
+        self,
+        obj: GeometryObject,
+        center: np.ndarray,
+        radius: float,
+        program: mgl.Program,
+    ) -> Tuple[mgl.VertexArray, int]:
+        """Pick the LOD mesh for an object from its projected screen size"""
+        levels = self.geometry_manager.lod_meshes.get(obj.mesh_type)
+        if not self._use_lod or not levels:
+            return obj.vao, obj.index_count
+
+        view_row = self._lod_view_matrix[2]
+        depth = -(float(view_row[:3] @ center) + float(view_row[3]))
+        if depth <= 1e-3:
+            level = 0
+        else:
+            pixel_radius = radius * self._lod_pixel_scale / depth
+            level = self.geometry_manager.select_lod_level(pixel_radius)
 
-        if "ground" not in self.geometry_manager.programs:
+        mesh = levels[min(level, len(levels) - 1)]
+        return self.geometry_manager.get_mesh_vao(mesh, program), mesh.index_count
+
+    def load_trails(
+        self, swing_id: str, frame_processor, points: Optional[List[str]] = None
+    ):
+        """Upload full trajectories of a swing's tracked points for trail drawing"""
+        if not self.trail_renderer:
             return
+        points = points or list(TRAIL_COLORS)
+        trajectories = {
+            point: frame_processor.get_point_trajectory(point) for point in points
+        }
+        self.trail_renderer.upload_swing(
+            swing_id, trajectories, frame_processor.time_vector
+        )
 
-        program = self.geometry_manager.programs["ground"]
-        if program is None:
+    def remove_trails(self, swing_id: str):
+        """Release a swing's trail buffers"""
+        if self.trail_renderer:
+            self.trail_renderer.remove_swing(swing_id)
+
+    def set_vector_scales(self, scales: Dict[str, float]):
+        """Set dataset-wide vector maxima used for glyph lengths"""
+        if self.vector_renderer:
+            self.vector_renderer.set_vector_scales(scales)
+
+    def load_dataset(self, frame_processor, swing_id: str = "primary"):
+        """Upload per-dataset GPU state: trajectory trails and vector scaling"""
+        self.load_trails(swing_id, frame_processor)
+        self.set_vector_scales(frame_processor.get_vector_scales())
+        if self.ghost_renderer:
+            # Ghost frames are aligned against the primary swing's timeline
+            time_vector = frame_processor.time_vector
+            clubhead = frame_processor.get_point_trajectory("clubhead")
+            self.ghost_renderer.set_reference(
+                time_vector, detect_impact_frame(clubhead, time_vector)
+            )
+
+    def add_ghost_swing(
+        self,
+        swing_id: str,
+        frame_processor,
+        impact_frame: Optional[int] = None,
+        color: Optional[Tuple[float, float, float]] = None,
+    ):
+        """Upload a swing's joint trajectories for the ghost overlay"""
+        if not self.ghost_renderer:
             return
+        trajectories = {
+            point: frame_processor.get_point_trajectory(point)
+            for point in GHOST_POINTS
+        }
+        self.ghost_renderer.add_swing(
+            swing_id, trajectories, frame_processor.time_vector, impact_frame, color
+        )
 
-        # Set uniforms safely using correct moderngl 5.x API
-        try:
-            program["view"].write(view_matrix.astype(np.float32).tobytes())
-            program["projection"].write(proj_matrix.astype(np.float32).tobytes())
+    def remove_ghost_swing(self, swing_id: str):
+        """Remove one swing from the ghost overlay"""
+        if self.ghost_renderer:
+            self.ghost_renderer.remove_swing(swing_id)
+
+    def get_profile_summary(self) -> Dict:
+        """Per-pass CPU/GPU timings and counters over the rolling window"""
+        if self.profiler is None:
+            return {}
+        return self.profiler.get_summary()
+
+    def _bind_frame_uniforms(
+        self,
+        program_name: str,
+        program: mgl.Program,
+        view_matrix: np.ndarray,
+        proj_matrix: np.ndarray,
+        view_position: np.ndarray,
+    ):
+        """Write per-frame uniforms (camera, lighting) for a program"""
+        program["view"].write(to_gl_matrix_bytes(view_matrix))
+        program["projection"].write(to_gl_matrix_bytes(proj_matrix))
+        if program_name == "ground":
             program["grassColor"].write(
                 np.array([0.2, 0.6, 0.2], dtype=np.float32).tobytes()
             )
@@ -520,8 +2482,109 @@ class OpenGLRenderer:
                 np.array([0.3, 0.3, 0.3], dtype=np.float32).tobytes()
             )
             program["gridSpacing"].value = 0.5  # 50cm grid spacing
-        except Exception as e:
-            print(f"⚠️ Ground uniform error: {e}")
+        else:
+            program["lightPosition"].write(
+                np.array([2.0, 4.0, 1.0], dtype=np.float32).tobytes()
+            )
+            program["lightColor"].write(
+                np.array([1.0, 1.0, 1.0], dtype=np.float32).tobytes()
+            )
+            program["viewPosition"].write(view_position.astype(np.float32).tobytes())
+
+    def _submit_draw_list(
+        self,
+        items: Sequence[DrawItem],
+        view_matrix: np.ndarray,
+        proj_matrix: np.ndarray,
+        view_position: np.ndarray,
+    ) -> int:
+        """Issue queued draws in order; returns program/mesh state changes.
+
+        Bound state carries over between calls for the same view, so the
+        category segments of one draw list count changes as a single run.
+        """
+        programs = self.geometry_manager.programs
+        state_changes = 0
+
+        for item in items:
+            program = programs[item.program_name]
+            try:
+                if program is not self._bound_program:
+                    self._bound_program = program
+                    state_changes += 1
+                    # Camera and light uniforms persist in the program
+                    if item.program_name not in self._bound_programs:
+                        self._bind_frame_uniforms(
+                            item.program_name,
+                            program,
+                            view_matrix,
+                            proj_matrix,
+                            view_position,
+                        )
+                        self._bound_programs.add(item.program_name)
+                if item.vao is not self._bound_vao:
+                    self._bound_vao = item.vao
+                    state_changes += 1
+
+                program["model"].write(to_gl_matrix_bytes(item.model))
+                if item.color is not None:
+                    program["materialColor"].write(item.color.tobytes())
+                    program["opacity"].value = item.opacity
+
+                item.vao.render()
+                self._record_draw(item.index_count)
+            except Exception as e:
+                print(f"⚠️ Draw error ({item.name}): {e}")
+
+        return state_changes
+
+    def _queue_object(
+        self,
+        name: str,
+        program_name: str,
+        model: np.ndarray,
+        color: Optional[List[float]] = None,
+        opacity: float = 1.0,
+        lod_radius: Optional[float] = None,
+    ):
+        """Add a geometry object to the draw list with its world bounds"""
+        obj = self.geometry_manager.geometry_objects[name]
+        program = self.geometry_manager.programs[program_name]
+        mesh = self.geometry_manager.get_gpu_mesh(obj.mesh_type)
+
+        # Transform the mesh bounding sphere; radius scales by the largest axis
+        center = model[:3, :3] @ mesh.bound_center + model[:3, 3]
+        scale = float(np.linalg.norm(model[:3, :3], axis=0).max())
+        radius = mesh.bound_radius * scale
+
+        vao, index_count = self._select_mesh(
+            obj, center, radius if lod_radius is None else lod_radius, program
+        )
+        self.draw_list.add(
+            DrawItem(
+                name=name,
+                program_name=program_name,
+                vao=vao,
+                index_count=index_count,
+                model=model,
+                center=center,
+                radius=radius,
+                color=None if color is None else np.asarray(color, dtype=np.float32),
+                opacity=opacity,
+                category=self._collect_category,
+            )
+        )
+        obj.visible = True
+
+    def _collect_ground(self):
+        """Queue ground plane at proper level with golf grid"""
+        if not self.geometry_manager:
+            return
+
+        if "ground" not in self.geometry_manager.programs:
+            return
+
+        if "ground" not in self.geometry_manager.geometry_objects:
             return
 
         # Create ground plane at proper level
@@ -535,52 +2598,16 @@ class OpenGLRenderer:
         ground_model[2, 2] = ground_size  # Scale Z
         ground_model[1, 3] = ground_level  # Position at ground level
 
-        try:
-            program["model"].write(ground_model.astype(np.float32).tobytes())
-
-            # Render ground plane
-            if "ground_plane" in self.geometry_manager.geometry_objects:
-                ground_obj = self.geometry_manager.geometry_objects["ground_plane"]
-                ground_obj.vao.render()
-                self.render_stats["draw_calls"] += 1
-                self.render_stats["triangles_rendered"] += ground_obj.index_count // 3
-        except Exception as e:
-            print(f"⚠️ Ground render error: {e}")
+        self._queue_object("ground", "ground", ground_model)
 
-    def _render_body_segments(
-        self,
-        frame_data,
-        render_config,
-        view_matrix: np.ndarray,
-        proj_matrix: np.ndarray,
-        view_position: np.ndarray,
-    ):
-        """Render all body segments"""
+    def _collect_body_segments(self, frame_data, render_config):
+        """Queue all body segments"""
         if not self.geometry_manager:
             return
 
         if "simple" not in self.geometry_manager.programs:
             return
 
-        program = self.geometry_manager.programs["simple"]
-        if program is None:
-            return
-
-        # Set common uniforms safely using correct moderngl 5.x API
-        try:
-            program["view"].write(view_matrix.astype(np.float32).tobytes())
-            program["projection"].write(proj_matrix.astype(np.float32).tobytes())
-            program["lightPosition"].write(
-                np.array([2.0, 4.0, 1.0], dtype=np.float32).tobytes()
-            )
-            program["lightColor"].write(
-                np.array([1.0, 1.0, 1.0], dtype=np.float32).tobytes()
-            )
-            program["viewPosition"].write(view_position.astype(np.float32).tobytes())
-        except Exception as e:
-            print(f"⚠️ Body segments uniform error: {e}")
-            return
-
         # Define body segments with their properties
         segments = [
             # (name, start_point, end_point, radius, color, is_skin)
@@ -641,39 +2668,36 @@ class OpenGLRenderer:
             if not (np.isfinite(start_pos).all() and np.isfinite(end_pos).all()):
                 continue
 
-            # Render cylinder
-            self._render_cylinder_between_points(
+            # Queue cylinder
+            self._queue_cylinder_between_points(
                 f"{segment_name}_cyl",
                 start_pos,
                 end_pos,
                 radius,
                 color,
                 render_config.body_opacity,
-                program,
             )
 
-            # Render joint spheres
-            self._render_sphere_at_point(
+            # Queue joint spheres
+            self._queue_sphere_at_point(
                 f"{segment_name}_sph",
                 end_pos,
                 radius * 1.2,
                 color,
                 render_config.body_opacity,
-                program,
             )
 
-        # Render hub
+        # Queue hub
         if np.isfinite(frame_data.hub).all():
-            self._render_sphere_at_point(
+            self._queue_sphere_at_point(
                 "hub",
                 frame_data.hub,
                 0.06,
                 [0.18, 0.32, 0.40],
                 render_config.body_opacity,
-                program,
             )
 
-    def _render_cylinder_between_points(
+    def _queue_cylinder_between_points(
         self,
         obj_name: str,
         start: np.ndarray,
@@ -681,9 +2705,8 @@ class OpenGLRenderer:
         radius: float,
         color: List[float],
         opacity: float,
-        program: mgl.Program,
     ):
-        """Render cylinder between two 3D points"""
+        """Queue cylinder between two 3D points"""
         if not self.geometry_manager:
             return
 
@@ -725,33 +2748,25 @@ class OpenGLRenderer:
             np.array([radius, length, radius], dtype=np.float32),
         )
 
-        # Set material properties safely using correct moderngl 5.x API
-        try:
-            program["materialColor"].write(np.array(color, dtype=np.float32).tobytes())
-            program["opacity"].value = opacity
-
-            # Render
-            model_matrix = self.geometry_manager.get_model_matrix(obj)
-            program["model"].write(model_matrix.astype(np.float32).tobytes())
-
-            obj.vao.render()
-            obj.visible = True
-
-            self.render_stats["draw_calls"] += 1
-            self.render_stats["triangles_rendered"] += obj.index_count // 3
-        except Exception as e:
-            print(f"⚠️ Cylinder render error: {e}")
+        # LOD follows the tube thickness, not its length
+        self._queue_object(
+            obj_name,
+            "simple",
+            self.geometry_manager.get_model_matrix(obj),
+            color,
+            opacity,
+            lod_radius=radius,
+        )
 
-    def _render_sphere_at_point(
+    def _queue_sphere_at_point(
         self,
         obj_name: str,
         position: np.ndarray,
         radius: float,
         color: List[float],
         opacity: float,
-        program: mgl.Program,
     ):
-        """Render sphere at specific point"""
+        """Queue sphere at specific point"""
         if not self.geometry_manager:
             return
 
@@ -765,69 +2780,33 @@ class OpenGLRenderer:
             obj_name, position, np.eye(3, dtype=np.float32), radius
         )
 
-        # Set material properties safely using correct moderngl 5.x API
-        try:
-            program["materialColor"].write(np.array(color, dtype=np.float32).tobytes())
-            program["opacity"].value = opacity
-
-            # Render
-            model_matrix = self.geometry_manager.get_model_matrix(obj)
-            program["model"].write(model_matrix.astype(np.float32).tobytes())
-
-            obj.vao.render()
-            obj.visible = True
-
-            self.render_stats["draw_calls"] += 1
-            self.render_stats["triangles_rendered"] += obj.index_count // 3
-        except Exception as e:
-            print(f"⚠️ Sphere render error: {e}")
+        self._queue_object(
+            obj_name,
+            "simple",
+            self.geometry_manager.get_model_matrix(obj),
+            color,
+            opacity,
+        )
 
-    def _render_club(
-        self,
-        frame_data,
-        render_config,
-        view_matrix: np.ndarray,
-        proj_matrix: np.ndarray,
-        view_position: np.ndarray,
-    ):
-        """Render golf club with improved geometry and face normal"""
+    def _collect_club(self, frame_data, render_config):
+        """Queue golf club with improved geometry and face normal"""
         if not self.geometry_manager:
             return
 
         if "simple" not in self.geometry_manager.programs:
             return
 
-        program = self.geometry_manager.programs["simple"]
-        if program is None:
-            return
-
-        # Set common uniforms safely using correct moderngl 5.x API
-        try:
-            program["view"].write(view_matrix.astype(np.float32).tobytes())
-            program["projection"].write(proj_matrix.astype(np.float32).tobytes())
-            program["lightPosition"].write(
-                np.array([2.0, 4.0, 1.0], dtype=np.float32).tobytes()
-            )
-            program["lightColor"].write(
-                np.array([1.0, 1.0, 1.0], dtype=np.float32).tobytes()
-            )
-            program["viewPosition"].write(view_position.astype(np.float32).tobytes())
-        except Exception as e:
-            print(f"⚠️ Club uniform error: {e}")
-            return
-
         # Render shaft with realistic proportions
         shaft_radius = 0.004  # 4mm radius for more realistic shaft
         shaft_color = [0.8, 0.8, 0.8]  # Metallic gray
 
-        self._render_cylinder_between_points(
+        self._queue_cylinder_between_points(
             "shaft",
             frame_data.butt,
             frame_data.clubhead,
             shaft_radius,
             shaft_color,
             1.0,
-            program,
         )
 
         # Render clubhead with more realistic geometry
@@ -849,13 +2828,12 @@ class OpenGLRenderer:
         # Render clubhead as an elongated ellipsoid (more realistic than sphere)
         clubhead_radius = 0.02  # Smaller, more realistic head size
 
-        self._render_sphere_at_point(
+        self._queue_sphere_at_point(
             "clubhead",
             frame_data.clubhead,
             clubhead_radius,
             clubhead_color,
             1.0,
-            program,
         )
 
         # Render face normal vector if enabled
@@ -867,19 +2845,18 @@ class OpenGLRenderer:
             normal_end = frame_data.clubhead + face_normal * normal_length
             normal_color = [1.0, 0.0, 0.0]  # Red for face normal
 
-            self._render_cylinder_between_points(
+            self._queue_cylinder_between_points(
                 "face_normal",
                 frame_data.clubhead,
                 normal_end,
                 0.002,
                 normal_color,
                 0.8,
-                program,
             )
 
             # Add arrowhead to normal vector
-            self._render_sphere_at_point(
-                "normal_arrow", normal_end, 0.005, normal_color, 0.8, program
+            self._queue_sphere_at_point(
+                "normal_arrow", normal_end, 0.005, normal_color, 0.8
             )
 
         # Render ball at center strike position
@@ -890,14 +2867,24 @@ class OpenGLRenderer:
             ball_color = [1.0, 1.0, 1.0]  # White ball
             ball_radius = 0.02135  # Standard golf ball diameter (42.67mm)
 
-            self._render_sphere_at_point(
-                "ball", ball_position, ball_radius, ball_color, 1.0, program
+            self._queue_sphere_at_point(
+                "ball", ball_position, ball_radius, ball_color, 1.0
             )
 
     def cleanup(self):
         """Clean up OpenGL resources"""
+        if self.profiler:
+            self.profiler.reset()
+        if self.trail_renderer:
+            self.trail_renderer.release()
+        if self.vector_renderer:
+            self.vector_renderer.release()
+        if self.ghost_renderer:
+            self.ghost_renderer.release()
         if self.geometry_manager:
             self.geometry_manager.cleanup()
+        if self.ctx is not None:
+            release_program_cache(self.ctx)
 
         print("🧹 OpenGL renderer cleaned up")
 
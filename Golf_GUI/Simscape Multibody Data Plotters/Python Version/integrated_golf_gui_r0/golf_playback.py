@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Playback Scheduling
+Maps wall-clock time to data time so playback speed does not depend on the
+sample rate or on how long each frame takes to render
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+from golf_metrics import get_metrics
+
+# ============================================================================
+# PLAYBACK MODES
+# ============================================================================
+
+# Mode -> display name
+PLAYBACK_MODES = {
+    "realtime": "Real-time",
+    "slow_motion": "Slow motion",
+    "frame_accurate": "Frame-accurate",
+}
+
+
+@dataclass
+class PlaybackState:
+    """Playhead after a scheduler tick"""
+
+    position: float  # Fractional frame index
+    frame_index: int  # Nearest whole frame
+    data_time: float  # Seconds on the data timeline
+    frames_skipped: int = 0  # Data frames passed over (decimation included)
+    wrapped: bool = False
+    finished: bool = False  # Reached the end with looping off
+
+
+# ============================================================================
+# PLAYBACK SCHEDULER
+# ============================================================================
+
+
+class PlaybackScheduler:
+    """Playhead driven by wall-clock time times a speed factor.
+
+    In the continuous modes the playhead is anchored to a wall-clock instant
+    and its data time, so a late tick skips frames instead of slowing the
+    swing down. Frame-accurate mode advances exactly one frame per tick.
+    """
+
+    def __init__(
+        self,
+        time_vector: Optional[np.ndarray] = None,
+        mode: str = "realtime",
+        slow_motion_speed: float = 0.25,
+        loop: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.clock = clock
+        self.loop = loop
+        self.mode = mode
+        self.slow_motion_speed = slow_motion_speed
+        self.is_playing = False
+
+        self.time_vector = np.zeros(1, dtype=np.float64)
+        self.position = 0.0
+        self._anchor_wall = 0.0
+        self._anchor_time = 0.0
+        self._last_frame = 0
+
+        # Totals since play() for diagnostics
+        self.ticks = 0
+        self.total_skipped = 0
+        self._ticks_metric = get_metrics().counter("playback.ticks")
+        self._skipped_metric = get_metrics().counter("playback.frames_skipped")
+
+        self.set_mode(mode)
+        if time_vector is not None:
+            self.set_time_vector(time_vector)
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.time_vector)
+
+    @property
+    def rate(self) -> float:
+        """Data seconds per wall-clock second (0 in frame-accurate mode)"""
+        if self.mode == "realtime":
+            return 1.0
+        if self.mode == "slow_motion":
+            return self.slow_motion_speed
+        return 0.0
+
+    def set_time_vector(self, time_vector: np.ndarray):
+        """Use a new data timeline; the playhead restarts at frame 0"""
+        time_vector = np.asarray(time_vector, dtype=np.float64)
+        if len(time_vector) == 0:
+            time_vector = np.zeros(1, dtype=np.float64)
+        self.time_vector = time_vector
+        self.seek(0.0)
+
+    def set_mode(self, mode: str):
+        """Switch mode without moving the playhead"""
+        if mode not in PLAYBACK_MODES:
+            raise ValueError(f"Unknown playback mode '{mode}'")
+        self.mode = mode
+        self._reanchor()
+
+    def set_slow_motion_speed(self, speed: float):
+        """Data seconds per wall second used in slow-motion mode"""
+        if speed <= 0:
+            raise ValueError("Slow-motion speed must be positive")
+        self.slow_motion_speed = speed
+        self._reanchor()
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def play(self, position: Optional[float] = None):
+        """Start (or restart) playback, optionally from a frame position"""
+        if position is not None:
+            self.position = self._clamp(position)
+        elif self.position >= self.frame_count - 1 and not self.loop:
+            self.position = 0.0
+        self.is_playing = True
+        self.ticks = 0
+        self.total_skipped = 0
+        self._reanchor()
+
+    def pause(self):
+        self.is_playing = False
+
+    def seek(self, position: float):
+        """Move the playhead to a fractional frame index"""
+        self.position = self._clamp(position)
+        self._last_frame = int(round(self.position))
+        self._reanchor()
+
+    def _reanchor(self, now: Optional[float] = None):
+        self._anchor_wall = self.clock() if now is None else now
+        self._anchor_time = self.position_to_time(self.position)
+
+    def _clamp(self, position: float) -> float:
+        return min(max(float(position), 0.0), float(self.frame_count - 1))
+
+    # ------------------------------------------------------------------
+    # Time mapping
+    # ------------------------------------------------------------------
+
+    def position_to_time(self, position: float) -> float:
+        """Data time at a fractional frame index"""
+        return float(
+            np.interp(position, np.arange(self.frame_count), self.time_vector)
+        )
+
+    def time_to_position(self, data_time: float) -> float:
+        """Fractional frame index at a data time"""
+        return float(
+            np.interp(data_time, self.time_vector, np.arange(self.frame_count))
+        )
+
+    # ------------------------------------------------------------------
+    # Ticking
+    # ------------------------------------------------------------------
+
+    def tick(self, now: Optional[float] = None) -> PlaybackState:
+        """Advance the playhead to the current wall-clock time"""
+        now = self.clock() if now is None else now
+        last_index = self.frame_count - 1
+        wrapped = False
+        finished = False
+
+        if self.is_playing and last_index > 0:
+            if self.mode == "frame_accurate":
+                position = float(int(round(self.position)) + 1)
+                if position > last_index:
+                    wrapped = self.loop
+                    position = 0.0 if self.loop else float(last_index)
+            else:
+                start_time = float(self.time_vector[0])
+                end_time = float(self.time_vector[-1])
+                data_time = self._anchor_time + (now - self._anchor_wall) * self.rate
+                if data_time > end_time:
+                    if self.loop and end_time > start_time:
+                        data_time = start_time + (data_time - start_time) % (
+                            end_time - start_time
+                        )
+                        wrapped = True
+                    else:
+                        data_time = end_time
+                position = self.time_to_position(data_time)
+
+            if position >= last_index and not self.loop:
+                position = float(last_index)
+                finished = True
+                self.is_playing = False
+            self.position = position
+            self.ticks += 1
+            self._ticks_metric.inc()
+
+            if wrapped:
+                # Keep the anchor near the playhead so time stays precise
+                self._reanchor(now)
+
+        frame_index = int(round(self.position))
+        frames_skipped = 0
+        if self.ticks:
+            step = frame_index - self._last_frame
+            if wrapped:
+                # The last frame and frame 0 are the same point in the loop
+                step += self.frame_count - 1
+            frames_skipped = max(step - 1, 0)
+            self.total_skipped += frames_skipped
+            self._skipped_metric.inc(frames_skipped)
+        self._last_frame = frame_index
+
+        return PlaybackState(
+            position=self.position,
+            frame_index=frame_index,
+            data_time=self.position_to_time(self.position),
+            frames_skipped=frames_skipped,
+            wrapped=wrapped,
+            finished=finished,
+        )
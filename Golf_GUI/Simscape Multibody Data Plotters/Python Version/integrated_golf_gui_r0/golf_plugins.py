@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Analysis Plugins
+Plugins declare the swing columns they read and the outputs they produce.
+They are discovered without importing them, imported on first use, and run
+in worker processes over shared-memory views of the swing arrays
+"""
+
+import ast
+import importlib.util
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from multiprocessing import get_context, shared_memory
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+import numpy as np
+import pandas as pd
+
+PLUGIN_KINDS = ("metric", "detector", "exporter")
+DATASET_NAMES = ("BASEQ", "ZTCFQ", "DELTAQ")
+DEFAULT_DATASET = "BASEQ"
+
+# Class attributes read from plugin source without importing it
+SPEC_ATTRIBUTES = ("name", "version", "kind", "inputs", "outputs")
+
+# ============================================================================
+# PLUGIN API
+# ============================================================================
+
+
+class AnalysisPlugin:
+    """Base class for analysis plugins (custom metrics, detectors, exporters).
+
+    Subclasses set ``name``, ``inputs`` and ``outputs`` as literal class
+    attributes, so they can be listed without importing the plugin, and
+    implement ``run``. Inputs are "DATASET.Column" references (the dataset
+    defaults to BASEQ). A vector column, or a point prefix with x/y/z columns
+    such as "CH", arrives as an (N, 3) array. Input arrays are read-only.
+    """
+
+    name: str = ""
+    version: str = "1.0"
+    kind: str = "metric"
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+    def run(self, inputs: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Return one value per declared output"""
+        raise NotImplementedError
+
+
+@dataclass
+class PluginSpec:
+    """What a plugin reads and produces, and where to import it from"""
+
+    name: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    version: str = "1.0"
+    kind: str = "metric"
+    path: Optional[str] = None  # Plugin file, imported on first use
+    class_name: Optional[str] = None
+    plugin_class: Optional[type] = None  # Set once imported or registered
+
+    @classmethod
+    def from_class(cls, plugin_class: type) -> "PluginSpec":
+        return cls(
+            name=plugin_class.name or plugin_class.__name__,
+            inputs=tuple(plugin_class.inputs),
+            outputs=tuple(plugin_class.outputs),
+            version=str(plugin_class.version),
+            kind=plugin_class.kind,
+            plugin_class=plugin_class,
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.plugin_class is not None
+
+    def load(self) -> type:
+        """Import the plugin class (once per process)"""
+        if self.plugin_class is None:
+            self.plugin_class = _import_plugin_class(self.path, self.class_name)
+        return self.plugin_class
+
+    def for_worker(self) -> "PluginSpec":
+        # File plugins are re-imported by path in the worker
+        return replace(self, plugin_class=None) if self.path else self
+
+
+@dataclass
+class PluginResult:
+    """Outputs of one plugin run"""
+
+    name: str
+    version: str
+    outputs: Dict[str, Any]
+    elapsed_s: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _import_plugin_class(path: str, class_name: str) -> type:
+    module_name = f"golf_plugin_{Path(path).stem}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return getattr(module, class_name)
+
+
+def read_plugin_specs(path: Union[str, Path]) -> List[PluginSpec]:
+    """Plugin classes declared in a file, found by parsing it (no import).
+
+    A class counts as a plugin when it assigns literal ``name`` and
+    ``outputs`` class attributes.
+    """
+    path = Path(path)
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+    specs = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        attributes: Dict[str, Any] = {}
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+                target, value = statement.targets[0], statement.value
+            elif isinstance(statement, ast.AnnAssign) and statement.value:
+                target, value = statement.target, statement.value
+            else:
+                continue
+            if isinstance(target, ast.Name) and target.id in SPEC_ATTRIBUTES:
+                try:
+                    attributes[target.id] = ast.literal_eval(value)
+                except ValueError:
+                    pass
+        if "name" in attributes and "outputs" in attributes:
+            specs.append(
+                PluginSpec(
+                    name=attributes["name"],
+                    inputs=tuple(attributes.get("inputs", ())),
+                    outputs=tuple(attributes["outputs"]),
+                    version=str(attributes.get("version", "1.0")),
+                    kind=attributes.get("kind", "metric"),
+                    path=str(path),
+                    class_name=node.name,
+                )
+            )
+    return specs
+
+
+# ============================================================================
+# SWING INPUTS
+# ============================================================================
+
+
+def _split_reference(reference: str) -> Tuple[str, str]:
+    dataset, _, column = reference.rpartition(".")
+    if dataset not in DATASET_NAMES:
+        return DEFAULT_DATASET, reference
+    return dataset, column
+
+
+def gather_inputs(frame_processor, references: Iterable[str]) -> Dict[str, np.ndarray]:
+    """Arrays for "DATASET.Column" references; numeric columns are not copied"""
+    datasets = dict(
+        zip(
+            DATASET_NAMES,
+            (
+                frame_processor.baseq_df,
+                frame_processor.ztcfq_df,
+                frame_processor.deltaq_df,
+            ),
+        )
+    )
+
+    arrays = {}
+    for reference in references:
+        dataset, column = _split_reference(reference)
+        df: pd.DataFrame = datasets[dataset]
+        if column in df.columns:
+            series = df[column]
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                array = series.to_numpy()
+            else:
+                # Loader vector columns hold one 3-vector per row
+                array = np.stack(series.to_numpy()).astype(np.float64)
+        elif all(f"{column}{axis}" in df.columns for axis in "xyz"):
+            array = df[[f"{column}{axis}" for axis in "xyz"]].to_numpy(np.float64)
+        else:
+            raise KeyError(f"{reference} not found in the swing data")
+        arrays[reference] = array
+    return arrays
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _align(offset: int, alignment: int = 64) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class SharedSwingArrays:
+    """Swing arrays packed into one shared-memory block.
+
+    Arrays are copied into the block once; workers attach by name and wrap
+    ndarray views around it, so nothing is pickled per task.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.layout: Dict[str, Tuple[int, Tuple[int, ...], str]] = {}
+        offset = 0
+        for key, array in arrays.items():
+            offset = _align(offset)
+            self.layout[key] = (offset, array.shape, array.dtype.str)
+            offset += array.nbytes
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for key, array in arrays.items():
+            np.copyto(attach_views(self.shm.buf, self.layout, [key], False)[key], array)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def release(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def attach_views(
+    buffer,
+    layout: Dict[str, Tuple[int, Tuple[int, ...], str]],
+    keys: Iterable[str],
+    read_only: bool = True,
+) -> Dict[str, np.ndarray]:
+    views = {}
+    for key in keys:
+        offset, shape, dtype = layout[key]
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=buffer, offset=offset)
+        views[key] = _read_only(view) if read_only else view
+    return views
+
+
+# ============================================================================
+# RUNNING PLUGINS
+# ============================================================================
+
+
+def run_plugin(spec: PluginSpec, inputs: Dict[str, np.ndarray]) -> PluginResult:
+    """Run one plugin on prepared inputs, checking its declared outputs"""
+    start_time = time.perf_counter()
+    try:
+        plugin = spec.load()()
+        outputs = plugin.run({key: inputs[key] for key in spec.inputs})
+        missing = [key for key in spec.outputs if key not in outputs]
+        if missing:
+            raise ValueError(f"Missing declared outputs: {missing}")
+        outputs = {key: outputs[key] for key in spec.outputs}
+        error = None
+    except Exception as e:
+        traceback.print_exc()
+        outputs, error = {}, f"{type(e).__name__}: {e}"
+    return PluginResult(
+        spec.name, spec.version, outputs, time.perf_counter() - start_time, error
+    )
+
+
+def _run_plugin_in_worker(spec: PluginSpec, shm_name: str, layout) -> PluginResult:
+    """Process pool task: attach the shared block and run one plugin"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        inputs = attach_views(shm.buf, layout, spec.inputs)
+        result = run_plugin(spec, inputs)
+        # Outputs may be views of the inputs; copy them out of the block
+        result.outputs = {
+            key: np.array(value) if isinstance(value, np.ndarray) else value
+            for key, value in result.outputs.items()
+        }
+        del inputs
+        return result
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # A plugin kept a view; the mapping goes with the process
+
+
+class PluginRegistry:
+    """Known plugins, a lazily started process pool and cached results.
+
+    Results are cached per FrameProcessor (dropped with it) and per optional
+    dataset version, e.g. a SwingDataKey, so callers can force a re-run
+    when the data behind a processor changes.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.specs: Dict[str, PluginSpec] = {}
+        self.workers = min(4, os.cpu_count() or 1) if workers is None else workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._results: "WeakKeyDictionary[Any, Dict[Any, Dict]]" = WeakKeyDictionary()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register(self, plugin: Union[type, AnalysisPlugin, PluginSpec]) -> PluginSpec:
+        if isinstance(plugin, PluginSpec):
+            spec = plugin
+        else:
+            plugin_class = plugin if isinstance(plugin, type) else type(plugin)
+            spec = PluginSpec.from_class(plugin_class)
+        if spec.kind not in PLUGIN_KINDS:
+            raise ValueError(f"Unknown plugin kind for {spec.name}: {spec.kind}")
+        if not spec.outputs:
+            raise ValueError(f"Plugin {spec.name} declares no outputs")
+        self.specs[spec.name] = spec
+        return spec
+
+    def discover(self, directory: Union[str, Path]) -> List[PluginSpec]:
+        """Register every plugin declared in ``directory``/*.py (not imported)"""
+        found = []
+        for path in sorted(Path(directory).glob("*.py")):
+            if path.name.startswith("_"):
+                continue
+            try:
+                for spec in read_plugin_specs(path):
+                    found.append(self.register(spec))
+            except (SyntaxError, ValueError, OSError) as e:
+                print(f"⚠️ Skipping plugin file {path.name}: {e}")
+        print(f"🔌 Found {len(found)} plugins in {directory}")
+        return found
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        source,
+        names: Optional[Iterable[str]] = None,
+        version: Any = None,
+    ) -> Dict[str, PluginResult]:
+        """Run plugins on a FrameProcessor or SwingDataStore.
+
+        Cached results for the same processor and version are reused; only
+        the missing plugins run, all at once across the worker pool.
+        """
+        frame_processor = getattr(source, "frame_processor", source)
+        names = list(self.specs) if names is None else list(names)
+        specs = [self.specs[name] for name in names]
+
+        with self._lock:
+            cache = self._results.setdefault(frame_processor, {}).setdefault(
+                version, {}
+            )
+        results: Dict[str, PluginResult] = {}
+        pending = []
+        for spec in specs:
+            cached = cache.get((spec.name, spec.version))
+            if cached is not None:
+                results[spec.name] = cached
+            else:
+                pending.append(spec)
+
+        if pending:
+            start_time = time.perf_counter()
+            for result in self._run_specs(frame_processor, pending):
+                results[result.name] = result
+                if result.ok:
+                    cache[(result.name, result.version)] = result
+            print(
+                f"🔌 Ran {len(pending)} plugins in "
+                f"{time.perf_counter() - start_time:.2f}s"
+            )
+        return {name: results[name] for name in names}
+
+    def _run_specs(
+        self, frame_processor, specs: List[PluginSpec]
+    ) -> List[PluginResult]:
+        references = list(dict.fromkeys(ref for spec in specs for ref in spec.inputs))
+        arrays, failures, runnable = {}, [], []
+        for spec in specs:
+            try:
+                arrays.update(gather_inputs(frame_processor, spec.inputs))
+                runnable.append(spec)
+            except KeyError as e:
+                failures.append(PluginResult(spec.name, spec.version, {}, 0.0, str(e)))
+        arrays = {ref: arrays[ref] for ref in references if ref in arrays}
+
+        if self.workers <= 0 or not runnable:
+            views = {key: _read_only(array) for key, array in arrays.items()}
+            return failures + [run_plugin(spec, views) for spec in runnable]
+
+        shared = SharedSwingArrays(arrays)
+        try:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(
+                    _run_plugin_in_worker, spec.for_worker(), shared.name, shared.layout
+                )
+                for spec in runnable
+            ]
+            results = []
+            for spec, future in zip(runnable, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(
+                        PluginResult(spec.name, spec.version, {}, 0.0, str(e))
+                    )
+            return failures + results
+        finally:
+            shared.release()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawn so no worker inherits a parent's GL or Qt state
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=get_context("spawn")
+                )
+            return self._executor
+
+    def clear_cache(self):
+        with self._lock:
+            self._results = WeakKeyDictionary()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Session Snapshots
+Preprocessed swing arrays, dynamics and statistics saved next to a session so
+it reopens from memory-mapped files instead of re-reading the MAT files
+"""
+
+import json
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from golf_data_core import FrameProcessor, RenderConfig, SwingBounds
+
+SNAPSHOT_FORMAT = "golf-session-snapshot"
+SNAPSHOT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+DATASET_NAMES = ("BASEQ", "ZTCFQ", "DELTAQ")
+
+
+class StaleSnapshotError(RuntimeError):
+    """A source file changed (or vanished) since the snapshot was written"""
+
+    def __init__(self, message: str, session: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.session = session or {}
+
+
+@dataclass
+class SessionSnapshot:
+    """A reopened snapshot: session metadata plus a ready FrameProcessor"""
+
+    session: Dict[str, Any]
+    frame_processor: FrameProcessor
+    manifest: Dict[str, Any]
+    load_time_s: float = 0.0
+
+
+# ============================================================================
+# SOURCE FINGERPRINTS
+# ============================================================================
+
+
+def fingerprint_source(path: Union[str, Path]) -> Dict[str, Any]:
+    """Size and modification time of a source file"""
+    stat = Path(path).stat()
+    return {
+        "path": str(Path(path).resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def changed_sources(manifest: Dict[str, Any]) -> list:
+    """Paths of recorded sources that no longer match their fingerprint"""
+    changed = []
+    for source in manifest.get("sources", []):
+        path = Path(source["path"])
+        try:
+            current = fingerprint_source(path)
+        except OSError:
+            changed.append(str(path))
+            continue
+        if (current["size"], current["mtime_ns"]) != (
+            source["size"],
+            source["mtime_ns"],
+        ):
+            changed.append(str(path))
+    return changed
+
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+
+def _json_default(value):
+    # NumPy scalars from the statistics caches; anything else as text
+    return value.item() if isinstance(value, np.generic) else str(value)
+
+
+def _save_array(directory: Path, name: str, array: np.ndarray) -> str:
+    filename = f"{name}.npy"
+    np.save(directory / filename, np.ascontiguousarray(array), allow_pickle=False)
+    return filename
+
+
+def _save_dataset(directory: Path, name: str, df: pd.DataFrame) -> Dict[str, Any]:
+    """Numeric columns as one 2D block, vector columns as (rows, 3) arrays"""
+    numeric_columns = [
+        column
+        for column in df.columns
+        if pd.api.types.is_numeric_dtype(df[column].dtype)
+    ]
+    entry: Dict[str, Any] = {
+        "rows": len(df),
+        "columns": [str(column) for column in df.columns],
+        "numeric": None,
+        "vectors": {},
+        "dropped": [],
+    }
+    if numeric_columns:
+        block = df[numeric_columns].to_numpy(dtype=np.float64)
+        entry["numeric"] = {
+            "file": _save_array(directory, f"{name}.numeric", block),
+            "columns": [str(column) for column in numeric_columns],
+        }
+
+    for index, column in enumerate(df.columns):
+        if column in numeric_columns:
+            continue
+        try:
+            vectors = np.stack(df[column].to_numpy()).astype(np.float32)
+        except (TypeError, ValueError):
+            vectors = None
+        if vectors is None or vectors.ndim != 2 or len(vectors) != len(df):
+            entry["dropped"].append(str(column))
+            continue
+        entry["vectors"][str(column)] = _save_array(
+            directory, f"{name}.vector{index}", vectors
+        )
+
+    if entry["dropped"]:
+        print(f"⚠️ Snapshot skipped non-array columns in {name}: {entry['dropped']}")
+    return entry
+
+
+def save_session_snapshot(
+    directory: Union[str, Path],
+    frame_processor: FrameProcessor,
+    session: Optional[Dict[str, Any]] = None,
+    source_files: Iterable[Union[str, Path]] = (),
+) -> Path:
+    """Write a snapshot directory, replacing any previous one atomically.
+
+    Warms the processor's caches first, so the trajectories, bounds, vector
+    scales and dynamics of the active filter are always included. Dynamics
+    computed earlier for other filters are included as well. The new snapshot
+    is written to a staging directory and swapped in by renames; the previous
+    one is only deleted once the new one is in place.
+    """
+    start_time = time.perf_counter()
+    directory = Path(directory)
+    frame_processor.warm_caches()
+
+    staging = directory.with_name(directory.name + ".tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    datasets = (
+        frame_processor.baseq_df,
+        frame_processor.ztcfq_df,
+        frame_processor.deltaq_df,
+    )
+    manifest: Dict[str, Any] = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "created": time.time(),
+        "session": session or {},
+        "sources": [fingerprint_source(path) for path in source_files],
+        "current_filter": frame_processor.current_filter,
+        "datasets": {
+            name: _save_dataset(staging, name, df)
+            for name, df in zip(DATASET_NAMES, datasets)
+        },
+        "trajectories": {
+            prefix: _save_array(staging, f"trajectory.{prefix}", trajectory)
+            for prefix, trajectory in frame_processor.trajectory_cache.items()
+        },
+        "dynamics": {
+            filter_name: {
+                key: _save_array(staging, f"dynamics.{index}.{key}", values)
+                for key, values in dynamics.items()
+            }
+            for index, (filter_name, dynamics) in enumerate(
+                frame_processor.dynamics_cache.items()
+            )
+        },
+        "vector_scales": frame_processor.vector_scale_cache,
+    }
+
+    bounds = frame_processor.get_bounds()
+    manifest["bounds"] = {
+        "min": _save_array(staging, "bounds.min", bounds.levels_min[0]),
+        "max": _save_array(staging, "bounds.max", bounds.levels_max[0]),
+    }
+
+    with open(staging / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2, default=_json_default)
+
+    previous = _previous_snapshot_dir(directory)
+    if previous.exists():
+        shutil.rmtree(previous)
+    if directory.exists():
+        directory.rename(previous)
+    staging.rename(directory)
+    if previous.exists():
+        shutil.rmtree(previous)
+
+    print(
+        f"💾 Session snapshot saved to {directory} in "
+        f"{time.perf_counter() - start_time:.2f}s"
+    )
+    return directory
+
+
+def _previous_snapshot_dir(directory: Path) -> Path:
+    # Where the old snapshot waits while a new one is renamed into place
+    return directory.with_name(directory.name + ".old")
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+
+def read_manifest(directory: Union[str, Path]) -> Dict[str, Any]:
+    with open(Path(directory) / MANIFEST_NAME, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"{directory} is not a session snapshot")
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {manifest.get('version')} "
+            f"(expected {SNAPSHOT_VERSION})"
+        )
+    return manifest
+
+
+def _load_dataset(directory: Path, entry: Dict[str, Any]) -> pd.DataFrame:
+    # The numeric block stays a single view of the mapped file
+    if entry["numeric"]:
+        block = np.load(directory / entry["numeric"]["file"], mmap_mode="r")
+        df = pd.DataFrame(block, columns=entry["numeric"]["columns"], copy=False)
+    else:
+        df = pd.DataFrame(index=pd.RangeIndex(entry["rows"]))
+
+    # Vector columns go back to their original positions, in ascending order
+    for position, column in enumerate(entry["columns"]):
+        if column in entry["vectors"]:
+            vectors = np.load(directory / entry["vectors"][column], mmap_mode="r")
+            # Plain row views (memmap rows are slow to create), matching the
+            # loader's list-of-vectors cells
+            rows = list(np.asarray(vectors))
+            df.insert(min(position, len(df.columns)), column, rows)
+    return df
+
+
+def load_session_snapshot(
+    directory: Union[str, Path], check_sources: bool = True
+) -> SessionSnapshot:
+    """Rebuild a FrameProcessor with warm caches from a snapshot directory.
+
+    Raises StaleSnapshotError if a source file changed since the snapshot was
+    written; the error carries the session so callers can reload the sources.
+    """
+    start_time = time.perf_counter()
+    directory = Path(directory)
+    previous = _previous_snapshot_dir(directory)
+    if not directory.exists() and previous.exists():
+        # A save stopped between its two renames; the old snapshot is intact
+        directory = previous
+    manifest = read_manifest(directory)
+
+    if check_sources:
+        changed = changed_sources(manifest)
+        if changed:
+            raise StaleSnapshotError(
+                f"Source files changed since the snapshot: {changed}",
+                manifest.get("session"),
+            )
+
+    datasets: Tuple[pd.DataFrame, ...] = tuple(
+        _load_dataset(directory, manifest["datasets"][name]) for name in DATASET_NAMES
+    )
+    frame_processor = FrameProcessor(datasets, RenderConfig())
+    frame_processor.current_filter = manifest["current_filter"]
+
+    def load(filename: str) -> np.ndarray:
+        return np.load(directory / filename, mmap_mode="r")
+
+    frame_processor.trajectory_cache = {
+        prefix: load(filename) for prefix, filename in manifest["trajectories"].items()
+    }
+    frame_processor.dynamics_cache = {
+        filter_name: {key: load(filename) for key, filename in files.items()}
+        for filter_name, files in manifest["dynamics"].items()
+    }
+    frame_processor.vector_scale_cache = manifest["vector_scales"]
+    frame_processor._bounds = SwingBounds(
+        load(manifest["bounds"]["min"]), load(manifest["bounds"]["max"])
+    )
+
+    load_time = time.perf_counter() - start_time
+    print(f"⚡ Session snapshot opened from {directory} in {load_time * 1000:.0f} ms")
+    return SessionSnapshot(
+        session=manifest.get("session", {}),
+        frame_processor=frame_processor,
+        manifest=manifest,
+        load_time_s=load_time,
+    )
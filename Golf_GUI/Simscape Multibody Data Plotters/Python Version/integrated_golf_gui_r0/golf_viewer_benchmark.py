@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Golf Swing Visualizer - Interaction Replay Benchmark
+Replays a scripted session (playback, scrubbing, camera moves, toggles) against
+the renderer and writes frame-time percentiles and per-subsystem costs as JSON
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import moderngl as mgl
+import numpy as np
+from golf_data_core import FrameData, FrameProcessor, RenderConfig
+from golf_headless_renderer import HeadlessRenderer, load_frame_processor
+from golf_opengl_renderer import OpenGLRenderer
+from golf_playback import PlaybackScheduler
+
+# Bumped when the report layout changes incompatibly
+REPORT_VERSION = 1
+
+# ============================================================================
+# SCRIPTS
+# ============================================================================
+
+# A recorded session: every step names an action plus its parameters.
+#   play    duration_s, mode ("realtime" | "slow_motion" | "frame_accurate"), speed
+#   scrub   from, to (fractions of the swing), frames
+#   orbit   degrees, elevation (degrees added over the step), frames
+#   zoom    factor (distance multiplier over the step), frames
+#   toggle  option (RenderConfig attribute), value (default: flip), frames
+#   filter  filter ("None" | "Butterworth" | "Savitzky-Golay"), frames
+DEFAULT_SCRIPT: Dict[str, Any] = {
+    "name": "default",
+    "steps": [
+        {"action": "play", "duration_s": 2.0, "mode": "realtime"},
+        {"action": "scrub", "from": 1.0, "to": 0.0, "frames": 60},
+        {"action": "orbit", "degrees": 360.0, "elevation": 20.0, "frames": 120},
+        {"action": "zoom", "factor": 0.5, "frames": 30},
+        {"action": "zoom", "factor": 2.0, "frames": 30},
+        {"action": "toggle", "option": "show_trajectory", "frames": 30},
+        {"action": "toggle", "option": "show_ground", "frames": 30},
+        {"action": "toggle", "option": "show_ground", "frames": 30},
+        {"action": "filter", "filter": "Butterworth", "frames": 30},
+        {"action": "filter", "filter": "None", "frames": 30},
+        {"action": "play", "duration_s": 2.0, "mode": "slow_motion", "speed": 0.25},
+    ],
+}
+
+
+def load_script(path: Optional[str]) -> Dict[str, Any]:
+    """Read a JSON script, or return the default one"""
+    if not path:
+        return DEFAULT_SCRIPT
+    with open(path, "r", encoding="utf-8") as f:
+        script = json.load(f)
+    if "steps" not in script:
+        raise ValueError(f"Benchmark script has no 'steps': {path}")
+    script.setdefault("name", Path(path).stem)
+    return script
+
+
+# ============================================================================
+# TARGETS
+# ============================================================================
+
+
+class HeadlessTarget:
+    """Benchmark target drawing into an offscreen framebuffer"""
+
+    def __init__(self, width: int, height: int, backend: Optional[str] = None):
+        self.viewer = HeadlessRenderer(width, height, backend)
+        self.renderer: OpenGLRenderer = self.viewer.renderer
+        self.ctx: mgl.Context = self.viewer.ctx
+        self.size = (width, height)
+
+    def load(self, frame_processor: FrameProcessor):
+        self.renderer.load_dataset(frame_processor)
+        self.viewer.frame_camera(frame_processor.get_frame_data(0))
+
+    def get_camera(self) -> Tuple[float, float, float]:
+        viewer = self.viewer
+        return viewer.camera_azimuth, viewer.camera_elevation, viewer.camera_distance
+
+    def set_camera(self, azimuth: float, elevation: float, distance: float):
+        self.viewer.camera_azimuth = azimuth
+        self.viewer.camera_elevation = elevation
+        self.viewer.camera_distance = distance
+
+    def draw(self, frame_data: FrameData, render_config: RenderConfig):
+        self.viewer.draw(frame_data, render_config)
+
+    def finish(self):
+        """Block until the GPU has executed the frame"""
+        self.ctx.finish()
+
+    def release(self):
+        self.viewer.release()
+
+
+class WidgetTarget:
+    """Benchmark target driving an on-screen GolfVisualizerWidget"""
+
+    def __init__(self, width: int, height: int):
+        from golf_gui_application import DirtyFlags, GolfVisualizerWidget
+        from PyQt6.QtWidgets import QApplication
+
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.dirty_camera = DirtyFlags.CAMERA
+        self.widget = GolfVisualizerWidget()
+        self.widget.resize(width, height)
+        self.widget.show()
+        self.app.processEvents()
+        if not self.widget.renderer:
+            raise RuntimeError("GolfVisualizerWidget has no OpenGL context")
+        self.renderer: OpenGLRenderer = self.widget.renderer
+        self.size = (width, height)
+
+    def load(self, frame_processor: FrameProcessor):
+        self.widget.set_frame_processor(frame_processor)
+        self.app.processEvents()
+
+    def get_camera(self) -> Tuple[float, float, float]:
+        widget = self.widget
+        return widget.camera_azimuth, widget.camera_elevation, widget.camera_distance
+
+    def set_camera(self, azimuth: float, elevation: float, distance: float):
+        self.widget.camera_azimuth = azimuth
+        self.widget.camera_elevation = elevation
+        self.widget.camera_distance = distance
+        self.widget.request_redraw(self.dirty_camera)
+
+    def draw(self, frame_data: FrameData, render_config: RenderConfig):
+        # repaint() runs paintGL now instead of waiting for the redraw timer
+        self.widget.update_frame(frame_data, render_config)
+        self.widget.request_redraw(self.dirty_camera)
+        self.widget.repaint()
+
+    def finish(self):
+        self.widget.makeCurrent()
+        self.widget.ctx.finish()
+        self.widget.doneCurrent()
+        self.app.processEvents()
+
+    def release(self):
+        self.widget.close()
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+
+def summarize_samples(values: Sequence[float]) -> Dict[str, float]:
+    """Mean, percentiles and max of a list of millisecond samples"""
+    if len(values) == 0:
+        return {
+            "count": 0,
+            "mean": 0.0,
+            "p50": 0.0,
+            "p90": 0.0,
+            "p95": 0.0,
+            "p99": 0.0,
+            "max": 0.0,
+            "total": 0.0,
+        }
+    data = np.asarray(values, dtype=np.float64)
+    p50, p90, p95, p99 = np.percentile(data, [50, 90, 95, 99])
+    return {
+        "count": int(len(data)),
+        "mean": float(data.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(data.max()),
+        "total": float(data.sum()),
+    }
+
+
+# Report entries checked by compare_reports; higher is worse for all of them
+COMPARED_METRICS = (
+    "frame_time_ms.p50",
+    "frame_time_ms.p95",
+    "frame_time_ms.p99",
+    "dropped_frames",
+)
+
+
+def _lookup(report: Dict[str, Any], path: str) -> float:
+    value: Any = report
+    for key in path.split("."):
+        value = value[key]
+    return float(value)
+
+
+def compare_reports(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10
+) -> List[str]:
+    """Regressions of current against baseline beyond a relative threshold"""
+    regressions = []
+    for path in COMPARED_METRICS:
+        try:
+            before = _lookup(baseline, path)
+            after = _lookup(current, path)
+        except (KeyError, TypeError):
+            continue
+        # Small absolute slack so near-zero baselines don't flag noise
+        limit = before * (1.0 + threshold) + (1.0 if path == "dropped_frames" else 0.1)
+        if after > limit:
+            change = (after - before) / before * 100.0 if before else float("inf")
+            regressions.append(f"{path}: {before:.2f} -> {after:.2f} (+{change:.0f}%)")
+    return regressions
+
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+
+@dataclass
+class StepResult:
+    """Frame times recorded while replaying one script step"""
+
+    action: str
+    params: Dict[str, Any]
+    frame_ms: List[float] = field(default_factory=list)
+    dropped_frames: int = 0
+    playback_frames_skipped: int = 0
+
+
+class ViewerBenchmark:
+    """Replays a script against a target and collects frame statistics.
+
+    Frames are paced to ``target_fps`` like a vsynced display. A frame that
+    takes longer than the budget counts the refresh intervals it missed as
+    dropped; playback steps also report data frames skipped by the scheduler.
+    """
+
+    def __init__(
+        self,
+        target,
+        frame_processor: FrameProcessor,
+        target_fps: float = 60.0,
+        warmup_frames: int = 10,
+    ):
+        self.target = target
+        self.frame_processor = frame_processor
+        self.target_fps = target_fps
+        self.frame_budget_ms = 1000.0 / target_fps
+        self.warmup_frames = warmup_frames
+
+        self.render_config = RenderConfig()
+        self.position = 0.0
+        self.steps: List[StepResult] = []
+        self.subsystem_ms: Dict[str, List[float]] = {}
+        self._seen_gpu_frame: Optional[Dict] = None
+        self._next_deadline = 0.0
+
+    # ------------------------------------------------------------------
+    # Frame measurement
+    # ------------------------------------------------------------------
+
+    def _record(self, name: str, value_ms: float):
+        self.subsystem_ms.setdefault(name, []).append(value_ms)
+
+    def _frame(self, step: Optional[StepResult]) -> float:
+        """Fetch, draw and finish one frame; returns its time in ms"""
+        start = time.perf_counter()
+        frame_data = self.frame_processor.get_interpolated_frame_data(self.position)
+        fetched = time.perf_counter()
+        self.target.draw(frame_data, self.render_config)
+        drawn = time.perf_counter()
+        self.target.finish()
+        finished = time.perf_counter()
+        frame_ms = (finished - start) * 1000.0
+
+        if step is not None:
+            step.frame_ms.append(frame_ms)
+            step.dropped_frames += max(
+                math.ceil(frame_ms / self.frame_budget_ms) - 1, 0
+            )
+            self._record("data", (fetched - start) * 1000.0)
+            self._record("render_cpu", (drawn - fetched) * 1000.0)
+            self._record("gpu_wait", (finished - drawn) * 1000.0)
+            self._record_passes()
+
+        self._pace(finished)
+        return frame_ms
+
+    def _record_passes(self):
+        """Per-pass CPU time of the last frame, GPU time as queries resolve"""
+        profiler = self.target.renderer.profiler
+        if profiler is None:
+            return
+        for name, timing in profiler.last_frame.items():
+            self._record(f"pass.{name}.cpu", timing.cpu_ms)
+        resolved = profiler.last_resolved_frame
+        if resolved is not self._seen_gpu_frame and profiler.gpu_timers_supported:
+            self._seen_gpu_frame = resolved
+            for name, timing in resolved.items():
+                self._record(f"pass.{name}.gpu", timing.gpu_ms)
+
+    def _pace(self, now: float):
+        """Wait for the next refresh slot, skipping slots already missed"""
+        interval = 1.0 / self.target_fps
+        if self._next_deadline <= 0.0:
+            self._next_deadline = now
+        self._next_deadline += interval
+        if now > self._next_deadline:
+            missed = math.ceil((now - self._next_deadline) / interval)
+            self._next_deadline += missed * interval
+        time.sleep(max(self._next_deadline - time.perf_counter(), 0.0))
+
+    # ------------------------------------------------------------------
+    # Script steps
+    # ------------------------------------------------------------------
+
+    def _step_play(self, step: StepResult):
+        params = step.params
+        scheduler = PlaybackScheduler(
+            self.frame_processor.time_vector,
+            mode=params.get("mode", "realtime"),
+            slow_motion_speed=params.get("speed", 0.25),
+        )
+        scheduler.play(self.position)
+        end_time = time.perf_counter() + params.get("duration_s", 2.0)
+        while time.perf_counter() < end_time:
+            state = scheduler.tick()
+            self.position = state.position
+            self._frame(step)
+        step.playback_frames_skipped = scheduler.total_skipped
+
+    def _step_scrub(self, step: StepResult):
+        params = step.params
+        last_frame = self.frame_processor.num_frames - 1
+        frames = int(params.get("frames", 60))
+        for fraction in np.linspace(
+            params.get("from", 0.0), params.get("to", 1.0), frames
+        ):
+            self.position = float(fraction) * last_frame
+            self._frame(step)
+
+    def _step_orbit(self, step: StepResult):
+        params = step.params
+        frames = int(params.get("frames", 120))
+        azimuth, elevation, distance = self.target.get_camera()
+        d_azimuth = params.get("degrees", 360.0) / frames
+        d_elevation = params.get("elevation", 0.0) / frames
+        for _ in range(frames):
+            azimuth += d_azimuth
+            elevation = float(np.clip(elevation + d_elevation, -89.0, 89.0))
+            self.target.set_camera(azimuth, elevation, distance)
+            self._frame(step)
+
+    def _step_zoom(self, step: StepResult):
+        params = step.params
+        frames = int(params.get("frames", 30))
+        azimuth, elevation, distance = self.target.get_camera()
+        ratio = params.get("factor", 0.5) ** (1.0 / frames)
+        for _ in range(frames):
+            distance = float(np.clip(distance * ratio, 0.1, 50.0))
+            self.target.set_camera(azimuth, elevation, distance)
+            self._frame(step)
+
+    def _step_toggle(self, step: StepResult):
+        params = step.params
+        option = params["option"]
+        if not hasattr(self.render_config, option):
+            raise ValueError(f"Unknown RenderConfig option '{option}'")
+        value = params.get("value", not getattr(self.render_config, option))
+        setattr(self.render_config, option, value)
+        for _ in range(int(params.get("frames", 30))):
+            self._frame(step)
+
+    def _step_filter(self, step: StepResult):
+        params = step.params
+        # The first frame after the switch pays for the dynamics recompute
+        self.frame_processor.set_filter(params.get("filter", "None"))
+        for _ in range(int(params.get("frames", 30))):
+            self._frame(step)
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run(self, script: Dict[str, Any]) -> Dict[str, Any]:
+        """Replay every step and return the report"""
+        self.target.load(self.frame_processor)
+        if self.target.renderer.profiler is not None:
+            self.target.renderer.profiler.enabled = True
+
+        # Shader warm-up and first-touch caches stay out of the statistics
+        for _ in range(self.warmup_frames):
+            self._frame(None)
+
+        start_time = time.perf_counter()
+        for params in script["steps"]:
+            action = params.get("action", "")
+            handler = getattr(self, f"_step_{action}", None)
+            if handler is None:
+                raise ValueError(f"Unknown benchmark action '{action}'")
+            step = StepResult(action, dict(params))
+            handler(step)
+            self.steps.append(step)
+
+        return self.report(script, time.perf_counter() - start_time)
+
+    def report(self, script: Dict[str, Any], elapsed_s: float) -> Dict[str, Any]:
+        """Machine-readable results of the replay"""
+        frame_ms = [ms for step in self.steps for ms in step.frame_ms]
+        ctx_info = self.target.renderer.ctx.info
+        return {
+            "version": REPORT_VERSION,
+            "script": script.get("name", "custom"),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "moderngl": mgl.__version__,
+                "gl_renderer": ctx_info.get("GL_RENDERER", ""),
+                "gl_version": ctx_info.get("GL_VERSION", ""),
+                "target": type(self.target).__name__,
+                "width": self.target.size[0],
+                "height": self.target.size[1],
+                "num_frames": self.frame_processor.num_frames,
+            },
+            "target_fps": self.target_fps,
+            "elapsed_s": elapsed_s,
+            "frames": len(frame_ms),
+            "frame_time_ms": summarize_samples(frame_ms),
+            "dropped_frames": sum(step.dropped_frames for step in self.steps),
+            "missed_deadlines": int(
+                np.count_nonzero(np.asarray(frame_ms) > self.frame_budget_ms)
+            ),
+            "playback_frames_skipped": sum(
+                step.playback_frames_skipped for step in self.steps
+            ),
+            "subsystems_ms": {
+                name: summarize_samples(values)
+                for name, values in sorted(self.subsystem_ms.items())
+            },
+            "steps": [
+                {
+                    "action": step.action,
+                    "params": step.params,
+                    "frames": len(step.frame_ms),
+                    "frame_time_ms": summarize_samples(step.frame_ms),
+                    "dropped_frames": step.dropped_frames,
+                    "playback_frames_skipped": step.playback_frames_skipped,
+                }
+                for step in self.steps
+            ],
+        }
+
+
+def print_report(report: Dict[str, Any]):
+    """Human-readable summary of a report"""
+    frame_ms = report["frame_time_ms"]
+    print(f"📊 Benchmark '{report['script']}' ({report['environment']['gl_renderer']})")
+    print(
+        f"   {report['frames']} frames: p50 {frame_ms['p50']:.2f} ms, "
+        f"p95 {frame_ms['p95']:.2f} ms, p99 {frame_ms['p99']:.2f} ms, "
+        f"max {frame_ms['max']:.2f} ms"
+    )
+    print(
+        f"   Dropped {report['dropped_frames']} frames at "
+        f"{report['target_fps']:.0f} fps ({report['missed_deadlines']} late), "
+        f"playback skipped {report['playback_frames_skipped']} data frames"
+    )
+    for step in report["steps"]:
+        step_ms = step["frame_time_ms"]
+        print(
+            f"   {step['action']:<7} {step['frames']:>4} frames  "
+            f"p50 {step_ms['p50']:6.2f}  p95 {step_ms['p95']:6.2f}  "
+            f"dropped {step['dropped_frames']}"
+        )
+    for name, stats in report["subsystems_ms"].items():
+        print(f"   {name:<22} mean {stats['mean']:6.3f}  p95 {stats['p95']:6.3f} ms")
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(
+        description="Replay a scripted viewer session and report frame timings"
+    )
+    parser.add_argument(
+        "source", help="Excel workbook or directory containing BASEQ/ZTCFQ/DELTAQ.mat"
+    )
+    parser.add_argument("--script", default=None, help="JSON script (default built-in)")
+    parser.add_argument(
+        "-o", "--output", default="benchmark_report.json", help="JSON report path"
+    )
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--fps", type=float, default=60.0, help="Display refresh rate")
+    parser.add_argument(
+        "--onscreen",
+        action="store_true",
+        help="Drive a GolfVisualizerWidget instead of an offscreen context",
+    )
+    parser.add_argument("--backend", default=None, help="Offscreen backend, e.g. egl")
+    parser.add_argument("--compare", default=None, help="Baseline report to compare")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Allowed relative regression"
+    )
+    args = parser.parse_args(argv)
+
+    target = None
+    try:
+        script = load_script(args.script)
+        frame_processor = load_frame_processor(args.source)
+        if args.onscreen:
+            target = WidgetTarget(args.width, args.height)
+        else:
+            target = HeadlessTarget(args.width, args.height, args.backend)
+
+        report = ViewerBenchmark(target, frame_processor, args.fps).run(script)
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        traceback.print_exc()
+        return 2
+    finally:
+        if target is not None:
+            target.release()
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print_report(report)
+    print(f"✅ Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) against {args.compare}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print(f"✅ No regressions against {args.compare}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
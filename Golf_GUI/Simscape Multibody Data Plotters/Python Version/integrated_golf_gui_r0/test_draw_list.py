@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Tests for the renderer draw list: frustum planes, sphere culling and
+state sorting
+"""
+
+import itertools
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from golf_opengl_renderer import (DrawItem, DrawList, bounding_sphere,
+                                  calculate_look_at_matrix,
+                                  calculate_projection_matrix,
+                                  extract_frustum_planes)
+
+# Camera 5 m up the Z axis looking at the origin with a 90° square frustum:
+# at the origin the visible slice spans x, y in [-5, 5]
+EYE = np.array([0.0, 0.0, 5.0])
+VIEW_PROJ = calculate_projection_matrix(
+    1.0, fov=90.0, near=0.1, far=100.0
+) @ calculate_look_at_matrix(EYE, np.zeros(3))
+
+
+def box_corners(center, half_size):
+    offsets = np.array(list(itertools.product((-1.0, 1.0), repeat=3)))
+    return np.asarray(center, dtype=np.float64) + offsets * half_size
+
+
+def classify_box(planes, corners):
+    """"inside", "outside" or "straddling" from the signed corner distances"""
+    distances = corners @ planes[:, :3].T + planes[:, 3]
+    if (distances >= 0).all():
+        return "inside"
+    if (distances < 0).all(axis=0).any():
+        return "outside"
+    return "straddling"
+
+
+def make_item(name, program_name="simple", glo=1, opacity=1.0, **kwargs):
+    kwargs.setdefault("center", np.zeros(3, dtype=np.float32))
+    kwargs.setdefault("radius", 0.1)
+    return DrawItem(
+        name=name,
+        program_name=program_name,
+        vao=SimpleNamespace(glo=glo),  # Sorting only reads the GL name
+        index_count=36,
+        model=np.eye(4, dtype=np.float32),
+        opacity=opacity,
+        **kwargs,
+    )
+
+
+def test_frustum_planes():
+    """Planes are unit-normal, face inwards and sit where the frustum is"""
+    print("🧪 Testing frustum planes...")
+    # Clip space itself is the [-1, 1] cube
+    np.testing.assert_allclose(
+        extract_frustum_planes(np.eye(4)),
+        [
+            [1, 0, 0, 1],
+            [-1, 0, 0, 1],
+            [0, 1, 0, 1],
+            [0, -1, 0, 1],
+            [0, 0, 1, 1],
+            [0, 0, -1, 1],
+        ],
+    )
+
+    planes = extract_frustum_planes(VIEW_PROJ)
+    np.testing.assert_allclose(np.linalg.norm(planes[:, :3], axis=1), 1.0)
+    # Origin: 5 m deep, so 5/√2 from each 45° side plane, 4.9 m past near
+    # and 95 m short of far
+    distances = planes[:, :3] @ np.zeros(3) + planes[:, 3]
+    np.testing.assert_allclose(
+        distances, [5 / np.sqrt(2)] * 4 + [4.9, 95.0], rtol=1e-5
+    )
+
+    assert classify_box(planes, box_corners((0, 0, 0), 0.5)) == "inside"
+    assert classify_box(planes, box_corners((0, 0, -50), 10.0)) == "inside"
+    assert classify_box(planes, box_corners((20, 0, 0), 1.0)) == "outside"
+    assert classify_box(planes, box_corners((0, -20, 0), 1.0)) == "outside"
+    assert classify_box(planes, box_corners((0, 0, 10), 1.0)) == "outside"
+    assert classify_box(planes, box_corners((0, 0, -200), 1.0)) == "outside"
+    assert classify_box(planes, box_corners((5, 0, 0), 1.0)) == "straddling"
+    assert classify_box(planes, box_corners((0, 0, 5), 1.0)) == "straddling"
+    assert classify_box(planes, box_corners((0, 0, -95), 1.0)) == "straddling"
+    print("✅ Frustum planes OK")
+
+
+def test_cull_drops_only_outside():
+    """Culling keeps inside and straddling boxes and drops the rest"""
+    print("🧪 Testing frustum culling...")
+    planes = extract_frustum_planes(VIEW_PROJ)
+    boxes = {
+        "inside": ((0, 0, 0), 0.5),
+        "far_inside": ((0, 0, -50), 10.0),
+        "right_edge": ((5, 0, 0), 1.0),
+        "at_camera": ((0, 0, 5), 1.0),
+        "far_plane": ((0, 0, -95), 1.0),
+        "right": ((20, 0, 0), 1.0),
+        "below": ((0, -20, 0), 1.0),
+        "behind": ((0, 0, 10), 1.0),
+        "too_far": ((0, 0, -200), 1.0),
+    }
+    draw_list = DrawList()
+    expected = []
+    for name, (center, half_size) in boxes.items():
+        corners = box_corners(center, half_size)
+        sphere_center, radius = bounding_sphere(corners)
+        draw_list.add(make_item(name, center=sphere_center, radius=radius))
+        if classify_box(planes, corners) != "outside":
+            expected.append(name)
+
+    assert draw_list.cull(VIEW_PROJ) == 4
+    assert draw_list.culled == 4
+    assert [item.name for item in draw_list.items] == expected
+    assert expected[:5] == list(boxes)[:5]
+
+    # A sphere just off a side plane is kept only while it touches it
+    touching = make_item("touching", center=np.array([7.0, 0, 0]), radius=1.5)
+    clear = make_item("clear", center=np.array([7.0, 0, 0]), radius=1.3)
+    draw_list = DrawList()
+    draw_list.add(touching)
+    draw_list.add(clear)
+    draw_list.cull(VIEW_PROJ)
+    assert draw_list.items == [touching]
+
+    draw_list.clear()
+    assert draw_list.cull(VIEW_PROJ) == 0 and draw_list.culled == 0
+    print("✅ Frustum culling OK")
+
+
+def test_sort_by_program_then_mesh():
+    """Within a category opaque draws group by program rank, then mesh"""
+    print("🧪 Testing state sort...")
+    draw_list = DrawList(program_order=("ground", "simple"))
+    order = [
+        ("a", "phong", 3),
+        ("b", "simple", 7),
+        ("c", "ground", 2),
+        ("d", "simple", 4),
+        ("e", "phong", 1),
+        ("f", "simple", 7),
+        ("g", "ground", 1),
+        ("h", "simple", 4),
+    ]
+    for name, program_name, glo in order:
+        draw_list.add(make_item(name, program_name, glo, category="body"))
+    draw_list.sort(EYE)
+
+    # Ranked programs first, then unranked ones; stable within a mesh
+    assert [item.name for item in draw_list.items] == [
+        "g",
+        "c",
+        "d",
+        "h",
+        "b",
+        "f",
+        "e",
+        "a",
+    ]
+    assert [category for category, _ in draw_list.segments()] == ["body"]
+    print("✅ State sort OK")
+
+
+def test_sort_translucent_back_to_front():
+    """Translucent draws follow the opaque ones, far depth bands first"""
+    print("🧪 Testing translucent sort...")
+    draw_list = DrawList(program_order=("ground", "simple"), depth_band=0.5)
+    for name, program_name, glo, z in (
+        ("near_simple", "simple", 1, 4.0),
+        ("far_phong", "phong", 1, -3.0),
+        ("far_simple_2", "simple", 2, -3.1),
+        ("far_simple_1", "simple", 1, -3.2),
+        ("mid", "simple", 1, 0.0),
+    ):
+        draw_list.add(
+            make_item(
+                name,
+                program_name,
+                glo,
+                opacity=0.85,
+                center=np.array([0.0, 0.0, z]),
+                category="body",
+            )
+        )
+    draw_list.add(
+        make_item("solid", "simple", 9, center=np.array([0, 0, 4.5]), category="body")
+    )
+    draw_list.sort(EYE)
+
+    # The three far items share a band and batch by program, then mesh
+    assert [item.name for item in draw_list.items] == [
+        "solid",
+        "far_simple_1",
+        "far_simple_2",
+        "far_phong",
+        "mid",
+        "near_simple",
+    ]
+    print("✅ Translucent sort OK")
+
+
+def test_sort_keeps_categories_together():
+    """Categories come first in the key, so each pass is one contiguous run"""
+    print("🧪 Testing category order...")
+    draw_list = DrawList(
+        program_order=("ground", "simple"),
+        category_order=("ground", "body", "club"),
+    )
+    for name, category, program_name, glo, opacity in (
+        ("club_shaft", "club", "ground", 1, 1.0),
+        ("arm", "body", "simple", 2, 0.85),
+        ("overlay", "", "ground", 1, 1.0),
+        ("grid", "ground", "simple", 3, 1.0),
+        ("torso", "body", "phong", 1, 1.0),
+        ("head", "club", "simple", 1, 1.0),
+        ("plane", "ground", "ground", 4, 1.0),
+        ("leg", "body", "simple", 2, 1.0),
+    ):
+        draw_list.add(make_item(name, program_name, glo, opacity, category=category))
+    draw_list.sort(EYE)
+
+    assert [(item.category, item.name) for item in draw_list.items] == [
+        ("ground", "plane"),
+        ("ground", "grid"),
+        ("body", "leg"),
+        ("body", "torso"),
+        ("body", "arm"),
+        ("club", "club_shaft"),
+        ("club", "head"),
+        ("", "overlay"),  # Unlisted categories go last
+    ]
+    segments = [
+        (category, [item.name for item in items])
+        for category, items in draw_list.segments()
+    ]
+    assert segments == [
+        ("ground", ["plane", "grid"]),
+        ("body", ["leg", "torso", "arm"]),
+        ("club", ["club_shaft", "head"]),
+        ("", ["overlay"]),
+    ]
+    print("✅ Category order OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Draw List Tests")
+    print("=" * 50)
+
+    test_frustum_planes()
+    test_cull_drops_only_outside()
+    test_sort_by_program_then_mesh()
+    test_sort_translucent_back_to_front()
+    test_sort_keeps_categories_together()
+
+    print("\n✅ All draw list tests passed!")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized mesh generators against the original per-vertex loops
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from golf_data_core import GeometryUtils
+
+# ============================================================================
+# REFERENCE LOOP GENERATORS (pre-vectorization)
+# ============================================================================
+
+
+def loop_cylinder_mesh(radius=1.0, height=1.0, segments=16):
+    vertices, normals, indices = [], [], []
+    for i in range(segments + 1):
+        angle = 2 * np.pi * i / segments
+        x, z = np.cos(angle), np.sin(angle)
+        vertices.extend([x * radius, 0, z * radius])
+        normals.extend([x, 0, z])
+        vertices.extend([x * radius, height, z * radius])
+        normals.extend([x, 0, z])
+    for i in range(segments):
+        base = i * 2
+        next_base = ((i + 1) % (segments + 1)) * 2
+        indices.extend([base, base + 1, next_base])
+        indices.extend([next_base, base + 1, next_base + 1])
+    return (
+        np.array(vertices, dtype=np.float32),
+        np.array(normals, dtype=np.float32),
+        np.array(indices, dtype=np.uint32),
+    )
+
+
+def loop_sphere_mesh(radius=1.0, lat_segments=12, lon_segments=16):
+    vertices, normals, indices = [], [], []
+    for i in range(lat_segments + 1):
+        lat = np.pi * i / lat_segments - np.pi / 2
+        for j in range(lon_segments + 1):
+            lon = 2 * np.pi * j / lon_segments
+            x = radius * np.cos(lat) * np.cos(lon)
+            y = radius * np.sin(lat)
+            z = radius * np.cos(lat) * np.sin(lon)
+            vertices.extend([x, y, z])
+            normals.extend([x / radius, y / radius, z / radius])
+    for i in range(lat_segments):
+        for j in range(lon_segments):
+            first = i * (lon_segments + 1) + j
+            second = first + lon_segments + 1
+            indices.extend([first, second, first + 1])
+            indices.extend([second, second + 1, first + 1])
+    return (
+        np.array(vertices, dtype=np.float32),
+        np.array(normals, dtype=np.float32),
+        np.array(indices, dtype=np.uint32),
+    )
+
+
+def loop_arrow_mesh(
+    shaft_radius=0.01, shaft_length=0.8, head_radius=0.02, head_length=0.2, segments=8
+):
+    vertices, normals, indices = [], [], []
+    for i in range(segments + 1):
+        angle = 2 * np.pi * i / segments
+        x, z = np.cos(angle), np.sin(angle)
+        vertices.extend([x * shaft_radius, 0, z * shaft_radius])
+        normals.extend([x, 0, z])
+        vertices.extend([x * shaft_radius, shaft_length, z * shaft_radius])
+        normals.extend([x, 0, z])
+    head_base_start = len(vertices) // 3
+    for i in range(segments + 1):
+        angle = 2 * np.pi * i / segments
+        x, z = np.cos(angle), np.sin(angle)
+        vertices.extend([x * head_radius, shaft_length, z * head_radius])
+        normals.extend([x, 0, z])
+    tip_index = len(vertices) // 3
+    vertices.extend([0, shaft_length + head_length, 0])
+    normals.extend([0, 1, 0])
+    for i in range(segments):
+        base = i * 2
+        next_base = ((i + 1) % (segments + 1)) * 2
+        indices.extend([base, base + 1, next_base])
+        indices.extend([next_base, base + 1, next_base + 1])
+    for i in range(segments):
+        current = head_base_start + i
+        next_vertex = head_base_start + ((i + 1) % (segments + 1))
+        indices.extend([current, tip_index, next_vertex])
+    return (
+        np.array(vertices, dtype=np.float32),
+        np.array(normals, dtype=np.float32),
+        np.array(indices, dtype=np.uint32),
+    )
+
+
+def assert_same_mesh(actual, expected, label):
+    for part, a, e in zip(("vertices", "normals", "indices"), actual, expected):
+        assert a.dtype == e.dtype, f"{label} {part}: {a.dtype} != {e.dtype}"
+        assert a.shape == e.shape, f"{label} {part}: {a.shape} != {e.shape}"
+        if part == "indices":
+            np.testing.assert_array_equal(a, e, err_msg=f"{label} {part}")
+        else:
+            # Same formulas in a different evaluation order: float32 rounding
+            np.testing.assert_allclose(
+                a, e, rtol=0, atol=1e-6, err_msg=f"{label} {part}"
+            )
+
+
+def test_cylinder_matches_loop():
+    print("🧪 Testing cylinder mesh...")
+    cases = ({}, {"segments": 3}, {"segments": 8}, {"radius": 0.3, "height": 2.5})
+    for params in cases:
+        assert_same_mesh(
+            GeometryUtils.create_cylinder_mesh(**params),
+            loop_cylinder_mesh(**params),
+            f"cylinder {params}",
+        )
+    print("✅ Cylinder mesh OK")
+
+
+def test_sphere_matches_loop():
+    print("🧪 Testing sphere mesh...")
+    for params in (
+        {},
+        {"lat_segments": 2, "lon_segments": 3},
+        {"lat_segments": 8, "lon_segments": 8},
+        {"radius": 0.02, "lat_segments": 24, "lon_segments": 32},
+    ):
+        assert_same_mesh(
+            GeometryUtils.create_sphere_mesh(**params),
+            loop_sphere_mesh(**params),
+            f"sphere {params}",
+        )
+    print("✅ Sphere mesh OK")
+
+
+def test_arrow_matches_loop():
+    print("🧪 Testing arrow mesh...")
+    for params in ({}, {"segments": 3}, {"segments": 16, "head_length": 0.35}):
+        assert_same_mesh(
+            GeometryUtils.create_arrow_mesh(**params),
+            loop_arrow_mesh(**params),
+            f"arrow {params}",
+        )
+    print("✅ Arrow mesh OK")
+
+
+def test_get_mesh_memoizes():
+    """Equal parameters in any order share one generated mesh"""
+    print("🧪 Testing mesh memo...")
+    first = GeometryUtils.get_mesh("sphere", lat_segments=6, lon_segments=10)
+    again = GeometryUtils.get_mesh("sphere", lon_segments=10, lat_segments=6)
+    assert again is first
+    assert_same_mesh(
+        first, loop_sphere_mesh(lat_segments=6, lon_segments=10), "memoized sphere"
+    )
+    other = GeometryUtils.get_mesh("sphere", lat_segments=6, lon_segments=12)
+    assert other is not first
+    print("✅ Mesh memo OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Geometry Mesh Tests")
+    print("=" * 50)
+
+    test_cylinder_matches_loop()
+    test_sphere_matches_loop()
+    test_arrow_matches_loop()
+    test_get_mesh_memoizes()
+
+    print("\n✅ All mesh tests passed!")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for chunked columnar data export: format round trips, chunk layout,
+row-range clamping, cancellation and float32 downcasting
+"""
+
+import importlib.util
+import math
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from golf_data_export import EXPORT_FORMATS, DataExportOptions, export_datasets
+
+NUM_ROWS = 1000
+
+
+def available_formats():
+    """Formats whose optional dependencies are installed"""
+    formats = ["csv"]
+    if importlib.util.find_spec("pyarrow"):
+        formats += ["parquet", "feather"]
+    if importlib.util.find_spec("tables"):
+        formats.append("hdf5")
+    return formats
+
+
+def make_datasets(num_rows=NUM_ROWS):
+    """BASEQ/ZTCFQ/DELTAQ with scalar and 3-vector columns"""
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 0.3, num_rows)
+    datasets = {}
+    for name in ("BASEQ", "ZTCFQ", "DELTAQ"):
+        df = pd.DataFrame(
+            {
+                "Time": t,
+                "CHx": rng.normal(size=num_rows),
+                "Frame": np.arange(num_rows, dtype=np.int64),
+            }
+        )
+        df["TotalHandForceGlobal"] = list(rng.normal(size=(num_rows, 3)))
+        datasets[name] = df
+    return datasets
+
+
+def read_back(path, data_format):
+    if data_format == "csv":
+        return pd.read_csv(path)
+    if data_format == "parquet":
+        return pd.read_parquet(path)
+    if data_format == "feather":
+        return pd.read_feather(path)
+    return pd.read_hdf(path, "swing")
+
+
+def export(tmp, data_format, datasets=None, **options):
+    path = Path(tmp) / f"swing{EXPORT_FORMATS[data_format]}"
+    result = export_datasets(
+        datasets if datasets is not None else make_datasets(),
+        path,
+        DataExportOptions(format=data_format, **options),
+    )
+    return path, result
+
+
+def test_round_trip_all_formats():
+    """Every format reads back the same table"""
+    print("🧪 Testing format round trips...")
+    datasets = make_datasets()
+    base = datasets["BASEQ"]
+    forces = np.stack(base["TotalHandForceGlobal"].to_numpy())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for data_format in available_formats():
+            path, result = export(tmp, data_format, datasets, float32=False)
+            table = read_back(path, data_format)
+
+            assert result.completed and result.rows == NUM_ROWS
+            assert result.bytes_written == path.stat().st_size
+            # One shared Time column, then each dataset's columns
+            assert list(table.columns[:5]) == [
+                "Time",
+                "BASEQ_CHx",
+                "BASEQ_Frame",
+                "BASEQ_TotalHandForceGlobal_x",
+                "BASEQ_TotalHandForceGlobal_y",
+            ]
+            assert result.columns == len(table.columns) == 1 + 3 * 5
+            np.testing.assert_allclose(table["Time"], base["Time"], rtol=1e-12)
+            np.testing.assert_allclose(table["BASEQ_CHx"], base["CHx"], rtol=1e-12)
+            np.testing.assert_array_equal(table["DELTAQ_Frame"], base["Frame"])
+            np.testing.assert_allclose(
+                table["BASEQ_TotalHandForceGlobal_z"], forces[:, 2], rtol=1e-12
+            )
+            print(f"  ✅ {data_format}")
+    print("✅ Format round trips OK")
+
+
+def test_chunk_layout():
+    """Parquet row groups and Feather batches follow chunk_rows"""
+    print("🧪 Testing chunk layout...")
+    if not importlib.util.find_spec("pyarrow"):
+        print("⚠️ pyarrow not installed, skipping")
+        return
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for chunk_rows in (1, 128, 999, 1000, 4096):
+            expected = math.ceil(NUM_ROWS / chunk_rows)
+            path, _ = export(tmp, "parquet", chunk_rows=chunk_rows)
+            assert pq.ParquetFile(path).num_row_groups == expected
+            path, _ = export(tmp, "feather", chunk_rows=chunk_rows)
+            with pa.OSFile(str(path), "rb") as f:
+                assert pa.ipc.open_file(f).num_record_batches == expected
+    print("✅ Chunk layout OK")
+
+
+def test_range_clamping():
+    """start/stop are clamped to the data; an empty range keeps the header"""
+    print("🧪 Testing row-range clamping...")
+    datasets = make_datasets()
+    time_vector = datasets["BASEQ"]["Time"].to_numpy()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for data_format in available_formats():
+            path, result = export(tmp, data_format, start=-5, stop=NUM_ROWS * 2)
+            assert result.rows == NUM_ROWS
+            assert len(read_back(path, data_format)) == NUM_ROWS
+
+            path, result = export(tmp, data_format, start=10, stop=25, chunk_rows=4)
+            table = read_back(path, data_format)
+            assert result.rows == len(table) == 15
+            np.testing.assert_allclose(table["Time"], time_vector[10:25])
+
+            path, result = export(tmp, data_format, start=50, stop=20)
+            table = read_back(path, data_format)
+            assert result.completed and result.rows == len(table) == 0
+            assert "BASEQ_CHx" in table.columns
+    print("✅ Row-range clamping OK")
+
+
+def test_cancellation_removes_file():
+    """A stopped export reports incomplete and leaves no partial file"""
+    print("🧪 Testing cancellation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        for data_format in available_formats():
+            path = Path(tmp) / f"cancelled{EXPORT_FORMATS[data_format]}"
+            progress = []
+            result = export_datasets(
+                make_datasets(),
+                path,
+                DataExportOptions(format=data_format, chunk_rows=100),
+                should_stop=lambda: len(progress) >= 3,
+                on_progress=lambda rows, total: progress.append((rows, total)),
+            )
+            assert not result.completed
+            assert result.rows == 300 and result.bytes_written == 0
+            assert progress[-1] == (300, NUM_ROWS)
+            assert not path.exists()
+    print("✅ Cancellation OK")
+
+
+def test_float32_spares_time():
+    """float32 downcasts data columns but keeps Time at float64"""
+    print("🧪 Testing float32 downcasting...")
+    datasets = make_datasets()
+    with tempfile.TemporaryDirectory() as tmp:
+        for data_format in set(available_formats()) - {"csv"}:
+            path, _ = export(tmp, data_format, datasets, float32=True)
+            table = read_back(path, data_format)
+            assert table["Time"].dtype == np.float64
+            np.testing.assert_array_equal(table["Time"], datasets["BASEQ"]["Time"])
+            assert table["BASEQ_CHx"].dtype == np.float32
+            assert table["ZTCFQ_TotalHandForceGlobal_y"].dtype == np.float32
+            # Integer columns are left alone
+            assert table["BASEQ_Frame"].dtype == np.int64
+
+            path, _ = export(tmp, data_format, datasets, float32=False)
+            assert read_back(path, data_format)["BASEQ_CHx"].dtype == np.float64
+    print("✅ float32 downcasting OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Data Export Tests")
+    print("=" * 50)
+
+    test_round_trip_all_formats()
+    test_chunk_layout()
+    test_range_clamping()
+    test_cancellation_removes_file()
+    test_float32_spares_time()
+
+    print("\n✅ All data export tests passed!")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared frame clock: tick scheduling on the refresh grid,
+subscribers, dt clamping after stalls and idling without subscribers
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from golf_frame_clock import FrameClock
+from PyQt6.QtCore import QCoreApplication
+
+# QTimer needs an application instance; ticks are driven by hand below
+app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Recorder:
+    """Subscriber that logs its ticks and keeps going while ``keep`` holds"""
+
+    def __init__(self, log=None, name="", keep=True):
+        self.log = log if log is not None else []
+        self.name = name
+        self.keep = keep
+        self.ticks = []
+
+    def __call__(self, now, dt):
+        self.ticks.append((now, dt))
+        self.log.append(self.name)
+        return self.keep
+
+
+class FakeWidget:
+    def __init__(self):
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+
+def make_clock(**kwargs):
+    clock = FakeClock()
+    return FrameClock(refresh_rate=100.0, clock=clock, **kwargs), clock
+
+
+def tick_at(frame_clock, clock, now):
+    """Fire the single-shot tick timer at ``now``"""
+    frame_clock._timer.stop()
+    clock.now = now
+    frame_clock._tick()
+
+
+def test_schedules_on_refresh_grid():
+    """Ticks land on the refresh grid even when the timer fires early or late"""
+    print("🧪 Testing tick scheduling...")
+    frame_clock, clock = make_clock()
+    subscriber = Recorder()
+    frame_clock.start(subscriber)
+    assert frame_clock.is_running and frame_clock._timer.isActive()
+    assert frame_clock._timer.interval() == 10
+
+    tick_at(frame_clock, clock, 0.010)
+    assert subscriber.ticks == [(0.010, 0.010)]
+    assert frame_clock._timer.interval() == 10  # Next boundary: 20 ms
+
+    # Early (19.2 ms): the 20 ms boundary is too close, aim for 30 ms
+    tick_at(frame_clock, clock, 0.0192)
+    assert frame_clock._timer.interval() == 11
+
+    # Late (33.7 ms): back onto the grid at 40 ms
+    tick_at(frame_clock, clock, 0.0337)
+    assert frame_clock._timer.interval() == 6
+    assert frame_clock.ticks == 3
+
+    # Vsync re-phases the grid to the buffer swap
+    clock.now = 0.0353
+    frame_clock._on_frame_swapped()
+    assert frame_clock._timer.interval() == 10  # 45.3 ms
+    print("✅ Tick scheduling OK")
+
+
+def test_subscribers_share_each_tick():
+    """Subscribers run in order with one timestamp; repaints are coalesced"""
+    print("🧪 Testing subscribers...")
+    frame_clock, clock = make_clock()
+    log = []
+    first, second = Recorder(log, "first"), Recorder(log, "second")
+    widget = FakeWidget()
+    emitted = []
+    frame_clock.ticked.connect(lambda now, dt: emitted.append((now, dt)))
+
+    def repainting(now, dt):
+        log.append("repainting")
+        assert frame_clock.in_tick
+        frame_clock.request_repaint(widget)
+        frame_clock.request_repaint(widget)
+        return True
+
+    def stopper(now, dt):
+        log.append("stopper")
+        frame_clock.stop(second)
+        return False
+
+    for callback in (first, repainting, stopper, second, second):
+        frame_clock.start(callback)
+    assert not frame_clock.request_repaint(widget)  # Outside a tick
+
+    tick_at(frame_clock, clock, 0.01)
+    assert log == ["first", "repainting", "stopper"]
+    assert emitted == [(0.01, 0.01)]
+    assert widget.updates == 1 and frame_clock.repaints == 1
+    assert not frame_clock.is_active(stopper)
+    assert not frame_clock.is_active(second) and not second.ticks
+
+    def failing(now, dt):
+        raise RuntimeError("boom")
+
+    frame_clock.start(failing)
+    log.clear()
+    tick_at(frame_clock, clock, 0.02)
+    assert log == ["first", "repainting"]
+    assert not frame_clock.is_active(failing)
+    assert first.ticks == [(0.01, 0.01), (0.02, 0.01)]
+    print("✅ Subscribers OK")
+
+
+def test_dt_clamped_after_stall():
+    """A stall reports at most max_dt; the next tick is back to normal"""
+    print("🧪 Testing dt clamping...")
+    frame_clock, clock = make_clock()
+    subscriber = Recorder()
+    frame_clock.start(subscriber)
+
+    tick_at(frame_clock, clock, 0.01)
+    tick_at(frame_clock, clock, 2.5)  # Event loop blocked for 2.5 s
+    tick_at(frame_clock, clock, 2.51)
+    dts = [dt for _, dt in subscriber.ticks]
+    assert dts[0] == 0.01 and dts[1] == 0.1
+    assert abs(dts[2] - 0.01) < 1e-12
+    # Timestamps are not clamped, so wall-clock playback still catches up
+    assert [now for now, _ in subscriber.ticks] == [0.01, 2.5, 2.51]
+
+    frame_clock, clock = make_clock(max_dt=0.05)
+    frame_clock.start(subscriber)
+    tick_at(frame_clock, clock, 0.5)
+    assert subscriber.ticks[-1] == (0.5, 0.05)
+    print("✅ dt clamping OK")
+
+
+def test_stops_without_subscribers():
+    """The timer stops with the last subscriber, and restarts fresh"""
+    print("🧪 Testing idle stop...")
+    frame_clock, clock = make_clock()
+    staying, leaving = Recorder(), Recorder(keep=False)
+    frame_clock.start(staying)
+    frame_clock.start(leaving)
+
+    tick_at(frame_clock, clock, 0.01)
+    assert not frame_clock.is_active(leaving)
+    assert frame_clock.is_running and frame_clock._timer.isActive()
+
+    frame_clock.stop(staying)
+    assert not frame_clock.is_running and not frame_clock._timer.isActive()
+
+    # Leaving by returning False does not schedule another tick either
+    frame_clock.start(leaving)
+    tick_at(frame_clock, clock, 0.02)
+    assert not frame_clock.is_running and not frame_clock._timer.isActive()
+    assert len(leaving.ticks) == 2
+
+    # Waking after a long idle measures dt from the restart, not the last tick
+    clock.now = 30.0
+    frame_clock.start(staying)
+    tick_at(frame_clock, clock, 30.01)
+    assert abs(staying.ticks[-1][1] - 0.01) < 1e-9
+    frame_clock.stop(staying)
+    frame_clock.stop(staying)  # Stopping twice is harmless
+    assert not frame_clock._timer.isActive()
+    print("✅ Idle stop OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Frame Clock Tests")
+    print("=" * 50)
+
+    test_schedules_on_refresh_grid()
+    test_subscribers_share_each_tick()
+    test_dt_clamped_after_stall()
+    test_stops_without_subscribers()
+
+    print("\n✅ All frame clock tests passed!")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for metrics: histogram ring-buffer windows, percentiles across resets
+and Chrome-trace export
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from golf_metrics import (Histogram, MetricsRegistry, MetricsSampler,
+                          export_chrome_trace)
+
+
+def test_recent_wraps_oldest_first():
+    """Once the ring is full, recent() keeps the newest values in order"""
+    print("🧪 Testing histogram ring wrap...")
+    histogram = Histogram("frame_ms", size=8)
+    assert len(histogram.recent()) == 0
+
+    for value in range(5):
+        histogram.observe(float(value))
+    np.testing.assert_array_equal(histogram.recent(), [0, 1, 2, 3, 4])
+
+    for value in range(5, 8):
+        histogram.observe(float(value))
+    np.testing.assert_array_equal(histogram.recent(), np.arange(8))
+
+    for value in range(8, 21):
+        histogram.observe(float(value))
+    np.testing.assert_array_equal(histogram.recent(), np.arange(13, 21))
+
+    # Count, sum and mean cover every observation, not just the window
+    assert histogram.count == 21
+    assert histogram.total == sum(range(21))
+    assert histogram.mean == 10.0
+    print("✅ Histogram ring wrap OK")
+
+
+def test_percentiles_after_reset():
+    """Percentiles only see observations made since the last reset"""
+    print("🧪 Testing percentiles after reset...")
+    histogram = Histogram("frame_ms", size=100)
+    for value in range(1, 101):
+        histogram.observe(float(value))
+    assert histogram.percentiles() == {"p50": 50.5, "p95": 95.05, "p99": 99.01}
+
+    histogram.reset()
+    assert histogram.count == 0 and histogram.mean == 0.0
+    assert histogram.percentiles() == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    assert len(histogram.recent()) == 0
+
+    # Fewer new values than before: stale slots must not leak in
+    for value in (1000.0, 2000.0, 3000.0):
+        histogram.observe(value)
+    assert histogram.percentiles((0, 50, 100)) == {
+        "p0": 1000.0,
+        "p50": 2000.0,
+        "p100": 3000.0,
+    }
+    np.testing.assert_array_equal(histogram.recent(), [1000.0, 2000.0, 3000.0])
+
+    # A registry reset keeps held references working
+    registry = MetricsRegistry(histogram_size=16)
+    held = registry.histogram("renderer.frame_ms")
+    held.observe(5.0)
+    registry.reset()
+    held.observe(7.0)
+    assert registry.histogram("renderer.frame_ms") is held
+    assert registry.snapshot()["renderer.frame_ms"]["p50"] == 7.0
+    print("✅ Percentiles after reset OK")
+
+
+def test_chrome_trace_export():
+    """Timed spans become "X" events and sampler output "C" counters"""
+    print("🧪 Testing Chrome-trace export...")
+    registry = MetricsRegistry(trace_capacity=10)
+    with registry.time("untraced"):
+        pass
+
+    registry.tracing = True
+    with registry.time("renderer.frame_ms"):
+        pass
+    worker = threading.Thread(target=lambda: registry.time("loader.read").__enter__())
+    worker.start()
+    worker.join()
+    with registry.time("loader.read"):
+        pass
+
+    sampler = MetricsSampler(registry)
+    registry.counter("renderer.frames").inc(30)
+    samples = [sampler.sample(), sampler.sample()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_chrome_trace(Path(tmp) / "trace.json", registry, samples)
+        with open(path) as f:
+            trace = json.load(f)
+
+    assert trace["displayTimeUnit"] == "ms"
+    events = trace["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    counters = [event for event in events if event["ph"] == "C"]
+
+    # Only spans timed while tracing was on, and only completed ones
+    assert [span["name"] for span in spans] == ["renderer.frame_ms", "loader.read"]
+    for span in spans:
+        assert span["ts"] >= 0 and span["dur"] >= 0
+        assert span["pid"] == os.getpid() and span["tid"] == threading.get_ident()
+
+    assert [event["name"] for event in counters] == ["process", "frames"] * 2
+    process, frames = counters[0], counters[1]
+    assert process["ts"] == frames["ts"] == samples[0]["t"] * 1e6
+    assert set(process["args"]) == {"cpu_percent", "rss_mb"}
+    assert set(frames["args"]) == {"p50", "p95", "p99", "fps"}
+    assert frames["args"]["fps"] > 0 and counters[3]["args"]["fps"] == 0
+    print("✅ Chrome-trace export OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Metrics Tests")
+    print("=" * 50)
+
+    test_recent_wraps_oldest_first()
+    test_percentiles_after_reset()
+    test_chrome_trace_export()
+
+    print("\n✅ All metrics tests passed!")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for the wall-clock playback scheduler, driven by an injected clock, and
+for blending frames at fractional playhead positions
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from golf_data_core import FrameProcessor, RenderConfig
+from golf_playback import PlaybackScheduler
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_scheduler(num_frames=1001, rate_hz=1000.0, **kwargs):
+    clock = FakeClock()
+    time_vector = np.arange(num_frames) / rate_hz
+    return PlaybackScheduler(time_vector, clock=clock, **kwargs), clock
+
+
+def test_loop_wrap():
+    """Wrapping counts the skipped frames across the loop point once"""
+    print("🧪 Testing loop wrap...")
+    scheduler, clock = make_scheduler()
+    scheduler.play()
+
+    clock.now = 1.25  # 1 s swing at 1 kHz: wraps to 0.25 s
+    state = scheduler.tick()
+
+    assert state.wrapped
+    assert not state.finished
+    assert state.frame_index == 250
+    assert state.frames_skipped == 1249
+    assert scheduler.is_playing
+    print("✅ Loop wrap OK")
+
+
+def test_finish_without_loop():
+    """With looping off the playhead stops on the last frame"""
+    print("🧪 Testing finish with loop off...")
+    scheduler, clock = make_scheduler(loop=False)
+    scheduler.play()
+
+    clock.now = 0.5
+    assert not scheduler.tick().finished
+
+    clock.now = 2.0
+    state = scheduler.tick()
+    assert state.finished
+    assert not state.wrapped
+    assert state.frame_index == 1000
+    assert not scheduler.is_playing
+
+    # Playing again restarts from the beginning
+    scheduler.play()
+    assert scheduler.position == 0.0
+    print("✅ Finish without loop OK")
+
+
+def test_frame_accurate_stepping():
+    """Frame-accurate mode advances one frame per tick regardless of time"""
+    print("🧪 Testing frame-accurate stepping...")
+    scheduler, clock = make_scheduler(num_frames=4, mode="frame_accurate")
+    scheduler.play()
+
+    frames = []
+    for _ in range(5):
+        clock.now += 10.0  # Long stalls must not skip frames
+        state = scheduler.tick()
+        frames.append(state.frame_index)
+        assert state.frames_skipped == 0
+    assert frames == [1, 2, 3, 0, 1]
+    assert scheduler.total_skipped == 0
+    print("✅ Frame-accurate stepping OK")
+
+
+def test_empty_time_vector():
+    """An empty timeline holds a single frame and never advances"""
+    print("🧪 Testing empty time vector...")
+    scheduler, clock = make_scheduler()
+    scheduler.set_time_vector(np.array([]))
+    assert scheduler.frame_count == 1
+
+    scheduler.play()
+    clock.now = 5.0
+    state = scheduler.tick()
+    assert state.frame_index == 0
+    assert state.data_time == 0.0
+    assert not state.finished
+    assert not state.wrapped
+    print("✅ Empty time vector OK")
+
+
+def test_skipped_frame_counts():
+    """Each tick reports the data frames passed over since the previous one"""
+    print("🧪 Testing skipped-frame counts...")
+    scheduler, clock = make_scheduler()
+    scheduler.play()
+
+    clock.now = 0.001
+    assert scheduler.tick().frames_skipped == 0
+
+    clock.now = 0.006  # Five frames later: four never shown
+    assert scheduler.tick().frames_skipped == 4
+
+    clock.now = 0.007
+    assert scheduler.tick().frames_skipped == 0
+    assert scheduler.total_skipped == 4
+    assert scheduler.ticks == 3
+
+    # Slow motion at 0.25x needs 4 ms of wall time per 1 ms frame
+    scheduler.set_mode("slow_motion")
+    clock.now = 0.011
+    state = scheduler.tick()
+    assert state.frame_index == 8
+    assert state.frames_skipped == 0
+
+    # On-time 60 Hz ticks over 1 kHz data pass over frames by design
+    scheduler, clock = make_scheduler()
+    scheduler.play()
+    skipped = []
+    for tick in range(1, 31):
+        clock.now = tick / 60.0
+        skipped.append(scheduler.tick().frames_skipped)
+    assert set(skipped) == {15, 16}
+    assert scheduler.total_skipped == sum(skipped) == 500 - 30
+    print("✅ Skipped-frame counts OK")
+
+
+def make_linear_processor(num_frames=11):
+    """Points and forces linear in the frame index, except one quadratic axis"""
+    index = np.arange(num_frames, dtype=np.float64)
+    df = pd.DataFrame(
+        {
+            "Time": index / 1000.0,
+            "CHx": index,
+            "CHy": 2.0 * index,
+            "CHz": -index,
+            "Bx": np.zeros(num_frames),
+            "By": np.zeros(num_frames),
+            "Bz": index / 2.0,
+        }
+    )
+    df["TotalHandForceGlobal"] = list(
+        np.stack([index, index**2, np.ones(num_frames)], axis=1)
+    )
+    return FrameProcessor((df, df.copy(), df.copy()), RenderConfig())
+
+
+def test_interpolated_frames():
+    """Fractional positions blend neighbouring frames and clamp at the ends"""
+    print("🧪 Testing interpolated frames...")
+    frame_processor = make_linear_processor()
+
+    frame = frame_processor.get_interpolated_frame_data(2.25)
+    assert frame.frame_idx == 2
+    np.testing.assert_allclose(frame.time, 0.00225)
+    np.testing.assert_allclose(frame.clubhead, [2.25, 4.5, -2.25])
+    np.testing.assert_allclose(frame.butt, [0.0, 0.0, 1.125])
+    assert frame.clubhead.dtype == np.float32
+    # Blending is linear between samples, even for a quadratic signal
+    for name in ("BASEQ", "ZTCFQ", "DELTAQ"):
+        np.testing.assert_allclose(frame.forces[name], [2.25, 5.25, 1.0])
+    assert "calculated" in frame.forces and "calculated" in frame.torques
+
+    # Past the midpoint the nearest whole frame is the next one
+    assert frame_processor.get_interpolated_frame_data(2.75).frame_idx == 3
+
+    # Whole positions return the cached frame itself
+    assert frame_processor.get_interpolated_frame_data(4.0) is (
+        frame_processor.get_frame_data(4)
+    )
+
+    # Clamped to the swing at both ends
+    last = frame_processor.get_frame_data(10)
+    for position in (10.0, 10.4, 12.0, 1e9):
+        assert frame_processor.get_interpolated_frame_data(position) is last
+    first = frame_processor.get_frame_data(0)
+    for position in (-0.5, -3.0):
+        assert frame_processor.get_interpolated_frame_data(position) is first
+    frame = frame_processor.get_interpolated_frame_data(9.5)
+    np.testing.assert_allclose(frame.clubhead, [9.5, 19.0, -9.5])
+    print("✅ Interpolated frames OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Playback Scheduler Tests")
+    print("=" * 50)
+
+    test_loop_wrap()
+    test_finish_without_loop()
+    test_frame_accurate_stepping()
+    test_empty_time_vector()
+    test_skipped_frame_counts()
+    test_interpolated_frames()
+
+    print("\n✅ All playback tests passed!")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for analysis plugins: discovery without import, shared-memory workers,
+missing inputs and the per-version result cache
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from golf_data_core import FrameProcessor, RenderConfig
+from golf_plugins import AnalysisPlugin, PluginRegistry, read_plugin_specs
+
+PLUGIN_SOURCE = '''
+import numpy as np
+from golf_plugins import AnalysisPlugin
+
+
+class PeakSpeed(AnalysisPlugin):
+    name = "peak_speed"
+    version = "1.0"
+    inputs = ("CH", "BASEQ.Time")
+    outputs = ("peak_speed", "speed")
+
+    def run(self, inputs):
+        step = np.linalg.norm(np.diff(inputs["CH"], axis=0), axis=1)
+        speed = step / np.diff(inputs["BASEQ.Time"])
+        return {"peak_speed": float(speed.max()), "speed": speed}
+
+
+class ForceRange(AnalysisPlugin):
+    name = "force_range"
+    kind = "detector"
+    inputs = ("ZTCFQ.TotalHandForceGlobal",)
+    outputs = ("low", "high")
+
+    def run(self, inputs):
+        force = inputs["ZTCFQ.TotalHandForceGlobal"]
+        return {"low": force.min(axis=0), "high": force.max(axis=0)}
+
+
+class MissingColumn(AnalysisPlugin):
+    name = "missing_column"
+    inputs = ("DELTAQ.NoSuchColumn",)
+    outputs = ("value",)
+
+    def run(self, inputs):
+        return {"value": 0.0}
+'''
+
+
+def make_frame_processor(num_frames=200):
+    """Synthetic swing with a moving clubhead and a vector force column"""
+    t = np.linspace(0.0, 1.0, num_frames)
+    angle = np.pi * t
+    df = pd.DataFrame(
+        {
+            "Time": t,
+            "CHx": 0.5 * np.sin(angle),
+            "CHy": 0.3 * np.cos(angle),
+            "CHz": np.zeros(num_frames),
+        }
+    )
+    df["TotalHandForceGlobal"] = list(np.stack([np.sin(angle), np.cos(angle), t], 1))
+    return FrameProcessor((df, df.copy(), df.copy()), RenderConfig())
+
+
+def write_plugin(directory, stem, source=PLUGIN_SOURCE):
+    path = Path(directory) / f"{stem}.py"
+    path.write_text(textwrap.dedent(source), encoding="utf-8")
+    return path
+
+
+def test_discovery_does_not_import():
+    """Specs are read from source; a plugin module only runs on first use"""
+    print("🧪 Testing discovery without import...")
+    with tempfile.TemporaryDirectory() as tmp:
+        write_plugin(
+            tmp,
+            "explodes_on_import",
+            "raise RuntimeError('imported')\n" + PLUGIN_SOURCE,
+        )
+        write_plugin(tmp, "_private", PLUGIN_SOURCE)
+        write_plugin(tmp, "broken", "class Oops(:\n")
+
+        registry = PluginRegistry(workers=0)
+        found = registry.discover(tmp)
+
+        assert [spec.name for spec in found] == [
+            "peak_speed",
+            "force_range",
+            "missing_column",
+        ]
+        assert "golf_plugin_explodes_on_import" not in sys.modules
+        assert not any(spec.is_loaded for spec in found)
+
+        spec = registry.specs["force_range"]
+        assert spec.kind == "detector" and spec.version == "1.0"
+        assert spec.inputs == ("ZTCFQ.TotalHandForceGlobal",)
+        assert spec.class_name == "ForceRange"
+
+        # The import error surfaces as a failed result, not an exception
+        result = registry.run(make_frame_processor(), ["peak_speed"])["peak_speed"]
+        assert not result.ok and "imported" in result.error
+        assert "golf_plugin_explodes_on_import" not in sys.modules
+    print("✅ Discovery without import OK")
+
+
+def test_workers_match_in_process():
+    """The shared-memory worker path gives the in-process results"""
+    print("🧪 Testing shared-memory workers...")
+    frame_processor = make_frame_processor()
+    names = ["peak_speed", "force_range"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        specs = read_plugin_specs(write_plugin(tmp, "swing_metrics"))
+        in_process = PluginRegistry(workers=0)
+        pooled = PluginRegistry(workers=2)
+        for spec in specs:
+            in_process.register(spec)
+            pooled.register(spec)
+
+        try:
+            expected = in_process.run(frame_processor, names)
+            actual = pooled.run(frame_processor, names)
+        finally:
+            pooled.shutdown()
+
+    for name in names:
+        assert actual[name].ok, actual[name].error
+        assert actual[name].outputs.keys() == expected[name].outputs.keys()
+        for key, value in expected[name].outputs.items():
+            np.testing.assert_array_equal(actual[name].outputs[key], value)
+    # Worker outputs were copied out of the shared block, which is now unlinked
+    speed = actual["peak_speed"].outputs["speed"]
+    assert speed.shape == (199,) and speed.flags.writeable
+    print("✅ Shared-memory workers OK")
+
+
+def test_missing_input_is_error_result():
+    """An unknown input column fails that plugin only"""
+    print("🧪 Testing missing inputs...")
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = PluginRegistry(workers=0)
+        for spec in read_plugin_specs(write_plugin(tmp, "with_missing")):
+            registry.register(spec)
+
+        results = registry.run(make_frame_processor(), ["missing_column", "peak_speed"])
+
+    missing = results["missing_column"]
+    assert not missing.ok
+    assert "DELTAQ.NoSuchColumn" in missing.error
+    assert missing.outputs == {}
+    assert results["peak_speed"].ok
+    print("✅ Missing inputs OK")
+
+
+class CountingPlugin(AnalysisPlugin):
+    name = "counting"
+    inputs = ("BASEQ.Time",)
+    outputs = ("duration",)
+    calls = 0
+
+    def run(self, inputs):
+        CountingPlugin.calls += 1
+        time_vector = inputs["BASEQ.Time"]
+        assert not time_vector.flags.writeable
+        return {"duration": float(time_vector[-1] - time_vector[0])}
+
+
+def test_result_cache_per_version():
+    """Results are reused per processor and version until cleared"""
+    print("🧪 Testing result cache...")
+    CountingPlugin.calls = 0
+    registry = PluginRegistry(workers=0)
+    registry.register(CountingPlugin)
+    frame_processor = make_frame_processor()
+
+    first = registry.run(frame_processor, version="v1")["counting"]
+    assert first.ok and first.outputs["duration"] == 1.0
+    assert registry.run(frame_processor, version="v1")["counting"] is first
+    assert CountingPlugin.calls == 1
+
+    # A new dataset version or another processor runs again
+    assert registry.run(frame_processor, version="v2")["counting"] is not first
+    assert CountingPlugin.calls == 2
+    registry.run(make_frame_processor())
+    assert CountingPlugin.calls == 3
+
+    registry.clear_cache()
+    registry.run(frame_processor, version="v1")
+    assert CountingPlugin.calls == 4
+
+    # Cached results go away with their processor
+    del frame_processor
+    gc.collect()
+    assert len(registry._results) == 0
+    print("✅ Result cache OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Analysis Plugin Tests")
+    print("=" * 50)
+
+    test_discovery_does_not_import()
+    test_workers_match_in_process()
+    test_missing_input_is_error_result()
+    test_result_cache_per_version()
+
+    print("\n✅ All plugin tests passed!")
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for session snapshots: round trip through memory-mapped files,
+stale-source detection and replacing an existing snapshot
+"""
+
+import dataclasses
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from golf_data_core import FrameProcessor, RenderConfig
+from golf_session_snapshot import (StaleSnapshotError, load_session_snapshot,
+                                   save_session_snapshot)
+
+POINTS = {
+    "CH": (0.0, 0.0, 0.0),
+    "B": (0.0, 0.0, 0.9),
+    "MP": (0.0, 0.0, 0.85),
+    "LW": (0.05, 0.0, 0.85),
+    "LE": (0.15, 0.1, 1.05),
+    "LS": (0.2, 0.1, 1.4),
+    "RW": (-0.05, 0.0, 0.85),
+    "RE": (-0.15, 0.1, 1.05),
+    "RS": (-0.2, 0.1, 1.4),
+    "H": (0.0, 0.1, 1.5),
+}
+
+
+def make_frame_processor(num_frames=120):
+    """Synthetic swing with point columns and a vector force column"""
+    t = np.linspace(0.0, 1.0, num_frames)
+    angle = np.pi * t
+    data = {"Time": t}
+    for name, (x, y, z) in POINTS.items():
+        moving = name == "CH"
+        data[f"{name}x"] = x + (0.5 * np.sin(angle) if moving else 0.0)
+        data[f"{name}y"] = y + (0.3 * np.cos(angle) if moving else np.zeros(num_frames))
+        data[f"{name}z"] = z + np.zeros(num_frames)
+    df = pd.DataFrame(data)
+    forces = np.stack([np.sin(angle), np.cos(angle), t], axis=1)
+    df["TotalHandForceGlobal"] = list(forces)
+    return FrameProcessor((df, df.copy(), df.copy()), RenderConfig())
+
+
+def assert_values_equal(actual, expected, label):
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys(), f"{label}: keys differ"
+        for key in expected:
+            assert_values_equal(actual[key], expected[key], f"{label}[{key}]")
+    elif isinstance(expected, np.ndarray):
+        np.testing.assert_array_equal(actual, expected, err_msg=label)
+    else:
+        assert actual == expected or (
+            np.isnan(actual) and np.isnan(expected)
+        ), f"{label}: {actual} != {expected}"
+
+
+def assert_frames_equal(actual, expected):
+    for field in dataclasses.fields(expected):
+        assert_values_equal(
+            getattr(actual, field.name),
+            getattr(expected, field.name),
+            f"frame {expected.frame_idx} {field.name}",
+        )
+
+
+def test_round_trip():
+    """A reopened snapshot serves the same frames as the original processor"""
+    print("🧪 Testing snapshot round trip...")
+    frame_processor = make_frame_processor()
+    frames = [0, 1, 37, 64, frame_processor.num_frames - 1]
+    expected = [frame_processor.get_frame_data(i) for i in frames]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "session"
+        save_session_snapshot(directory, frame_processor, {"id": "abc123"})
+        snapshot = load_session_snapshot(directory)
+
+        reopened = snapshot.frame_processor
+        assert snapshot.session["id"] == "abc123"
+        assert reopened.num_frames == frame_processor.num_frames
+        for frame_idx, frame in zip(frames, expected):
+            assert_frames_equal(reopened.get_frame_data(frame_idx), frame)
+
+        original_bounds = frame_processor.get_bounds().range_bounds()
+        reopened_bounds = reopened.get_bounds().range_bounds()
+        for actual, wanted in zip(reopened_bounds, original_bounds):
+            np.testing.assert_array_equal(actual, wanted)
+
+        # Saving again over an existing snapshot replaces it
+        save_session_snapshot(directory, frame_processor, {"id": "def456"})
+        assert load_session_snapshot(directory).session["id"] == "def456"
+        del snapshot, reopened  # Release memory maps before cleanup
+    print("✅ Snapshot round trip OK")
+
+
+def test_stale_source():
+    """Changing a source file's mtime makes the snapshot stale"""
+    print("🧪 Testing stale snapshot detection...")
+    frame_processor = make_frame_processor(num_frames=30)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = []
+        for name in ("BASEQ", "ZTCFQ", "DELTAQ"):
+            path = Path(tmp) / f"{name}.mat"
+            path.write_bytes(name.encode())
+            sources.append(path)
+        session = {"id": "stale1", "data_files": [str(p) for p in sources]}
+
+        directory = Path(tmp) / "session"
+        save_session_snapshot(directory, frame_processor, session, sources)
+        load_session_snapshot(directory)  # Fresh: no error
+
+        stat = sources[1].stat()
+        os.utime(
+            sources[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000)
+        )
+        try:
+            load_session_snapshot(directory)
+        except StaleSnapshotError as e:
+            assert str(sources[1].resolve()) in str(e)
+            assert e.session["data_files"] == session["data_files"]
+        else:
+            raise AssertionError("Expected StaleSnapshotError")
+
+        # Callers may still open it deliberately
+        snapshot = load_session_snapshot(directory, check_sources=False)
+        assert snapshot.frame_processor.num_frames == 30
+        del snapshot
+    print("✅ Stale snapshot detection OK")
+
+
+def test_replace_keeps_previous_until_swapped():
+    """A failed save leaves the old snapshot; an interrupted swap still loads"""
+    print("🧪 Testing snapshot replacement...")
+    frame_processor = make_frame_processor(num_frames=30)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "session"
+        save_session_snapshot(directory, frame_processor, {"id": "first"})
+
+        with mock.patch("json.dump", side_effect=OSError("disk full")):
+            try:
+                save_session_snapshot(directory, frame_processor, {"id": "second"})
+            except OSError:
+                pass
+            else:
+                raise AssertionError("Expected the save to fail")
+        assert load_session_snapshot(directory).session["id"] == "first"
+
+        save_session_snapshot(directory, frame_processor, {"id": "second"})
+        assert sorted(path.name for path in Path(tmp).iterdir()) == ["session"]
+        assert load_session_snapshot(directory).session["id"] == "second"
+
+        # Stopped after moving the old snapshot aside, before the new rename
+        directory.rename(directory.with_name("session.old"))
+        assert load_session_snapshot(directory).session["id"] == "second"
+
+        save_session_snapshot(directory, frame_processor, {"id": "third"})
+        assert sorted(path.name for path in Path(tmp).iterdir()) == ["session"]
+        assert load_session_snapshot(directory).session["id"] == "third"
+    print("✅ Snapshot replacement OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Session Snapshot Tests")
+    print("=" * 50)
+
+    test_round_trip()
+    test_stale_source()
+    test_replace_keeps_previous_until_swapped()
+
+    print("\n✅ All snapshot tests passed!")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for hierarchical swing bounds against brute-force nanmin/nanmax
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from golf_data_core import SwingBounds, merge_bounds
+
+NUM_FRAMES = 1000  # Not a power of two, so odd tails appear at every level
+NUM_POINTS = 9
+
+
+def make_points(seed=0):
+    """Random trajectories with NaN points and whole NaN frames"""
+    rng = np.random.default_rng(seed)
+    points = rng.normal(size=(NUM_FRAMES, NUM_POINTS, 3)).astype(np.float32)
+    # Scattered invalid coordinates invalidate their whole point
+    points[rng.random(points.shape) < 0.02] = np.nan
+    # Runs of missing frames, including ones straddling 64-frame blocks
+    for start in (0, 60, 127, 500, 990):
+        points[start : start + 6] = np.nan
+    return points
+
+
+def brute_force(points, start, stop):
+    """Bounds over frames [start, stop) of points with all coordinates finite"""
+    window = points[max(start, 0) : stop].reshape(-1, 3)
+    valid = window[np.isfinite(window).all(axis=1)]
+    if len(valid) == 0:
+        return SwingBounds.empty()
+    return np.nanmin(valid, axis=0), np.nanmax(valid, axis=0)
+
+
+def assert_same(actual, expected, label):
+    assert np.array_equal(actual[0], expected[0]), f"{label}: min differs"
+    assert np.array_equal(actual[1], expected[1]), f"{label}: max differs"
+
+
+def test_random_ranges():
+    """Random ranges match the brute-force result exactly"""
+    print("🧪 Testing random ranges...")
+    points = make_points()
+    bounds = SwingBounds.from_points(points)
+    rng = np.random.default_rng(1)
+
+    for _ in range(500):
+        start, stop = sorted(rng.integers(0, NUM_FRAMES + 1, size=2))
+        assert_same(
+            bounds.range_bounds(start, stop),
+            brute_force(points, start, stop),
+            f"[{start}, {stop})",
+        )
+    print("✅ Random ranges OK")
+
+
+def test_block_edges():
+    """Ranges starting or ending on either side of block boundaries"""
+    print("🧪 Testing block-edge ranges...")
+    points = make_points(seed=2)
+    bounds = SwingBounds.from_points(points)
+
+    edges = [0, 1, 999, 1000]
+    for block in (64, 128, 256, 512):
+        for edge in range(block, NUM_FRAMES, block):
+            edges.extend((edge - 1, edge, edge + 1))
+    edges = sorted(set(e for e in edges if 0 <= e <= NUM_FRAMES))
+
+    for start in edges:
+        for stop in edges:
+            if stop < start:
+                continue
+            assert_same(
+                bounds.range_bounds(start, stop),
+                brute_force(points, start, stop),
+                f"[{start}, {stop})",
+            )
+    print("✅ Block-edge ranges OK")
+
+
+def test_nan_and_degenerate_ranges():
+    """All-NaN, empty and out-of-range requests"""
+    print("🧪 Testing NaN and degenerate ranges...")
+    points = make_points(seed=3)
+    bounds = SwingBounds.from_points(points)
+
+    # Frames 60-65 are entirely NaN
+    assert SwingBounds.is_empty(bounds.range_bounds(60, 66))
+    assert SwingBounds.is_empty(bounds.frame_bounds(62))
+    assert SwingBounds.is_empty(bounds.range_bounds(10, 10))
+    assert SwingBounds.is_empty(bounds.range_bounds(20, 5))
+
+    # Whole swing, defaults and clamping past either end
+    expected = brute_force(points, 0, NUM_FRAMES)
+    assert_same(bounds.range_bounds(), expected, "whole swing")
+    assert_same(bounds.range_bounds(-5, NUM_FRAMES + 50), expected, "clamped")
+
+    for frame in (0, 59, 66, 128, 999):
+        assert_same(
+            bounds.frame_bounds(frame),
+            brute_force(points, frame, frame + 1),
+            f"frame {frame}",
+        )
+    print("✅ NaN and degenerate ranges OK")
+
+
+def test_merge_bounds():
+    """Merging the bounds of adjacent pieces gives the bounds of the whole"""
+    print("🧪 Testing merge_bounds...")
+    points = make_points(seed=4)
+    bounds = SwingBounds.from_points(points)
+    rng = np.random.default_rng(5)
+
+    for _ in range(100):
+        cuts = np.sort(rng.integers(0, NUM_FRAMES + 1, size=4))
+        pieces = [
+            bounds.range_bounds(lo, hi) for lo, hi in zip(cuts[:-1], cuts[1:])
+        ]
+        assert_same(
+            merge_bounds(pieces),
+            brute_force(points, cuts[0], cuts[-1]),
+            f"cuts {cuts.tolist()}",
+        )
+
+    # Empty boxes do not widen a merge; merging nothing is empty
+    whole = bounds.range_bounds()
+    assert_same(merge_bounds([whole, SwingBounds.empty()]), whole, "with empty")
+    assert SwingBounds.is_empty(merge_bounds([]))
+    print("✅ merge_bounds OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Swing Bounds Tests")
+    print("=" * 50)
+
+    test_random_ranges()
+    test_block_edges()
+    test_nan_and_degenerate_ranges()
+    test_merge_bounds()
+
+    print("\n✅ All bounds tests passed!")
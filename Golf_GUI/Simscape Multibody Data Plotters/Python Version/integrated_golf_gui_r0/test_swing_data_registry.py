@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared swing data registry: LRU eviction, racing loads and
+file-modification keys
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from golf_data_core import (FrameProcessor, RenderConfig, SwingDataKey,
+                            SwingDataRegistry, SwingDataStore)
+
+
+def make_datasets(num_frames=20):
+    """Small synthetic BASEQ/ZTCFQ/DELTAQ triple"""
+    t = np.linspace(0.0, 1.0, num_frames)
+    data = {"Time": t}
+    for name, z in (("CH", 0.0), ("B", 0.9), ("MP", 0.85), ("H", 1.5)):
+        data[f"{name}x"] = 0.5 * np.sin(np.pi * t)
+        data[f"{name}y"] = np.zeros(num_frames)
+        data[f"{name}z"] = np.full(num_frames, z)
+    df = pd.DataFrame(data)
+    return df, df.copy(), df.copy()
+
+
+def make_store(name):
+    datasets = make_datasets()
+    return SwingDataStore(name, datasets, FrameProcessor(datasets, RenderConfig()))
+
+
+def test_lru_eviction():
+    """The least recently used store is evicted first"""
+    print("🧪 Testing LRU eviction...")
+    registry = SwingDataRegistry(max_entries=2)
+    keys = [SwingDataKey(f"swing{i}") for i in range(3)]
+
+    registry.put(keys[0], make_store("a"))
+    registry.put(keys[1], make_store("b"))
+    assert registry.get(keys[0]) is not None  # keys[1] is now oldest
+
+    registry.put(keys[2], make_store("c"))
+    assert len(registry) == 2
+    assert keys[1] not in registry
+    assert registry.keys() == [keys[0], keys[2]]
+    assert registry.get(keys[1]) is None
+    assert registry.hits == 1 and registry.misses == 1
+    print("✅ LRU eviction OK")
+
+
+def test_racing_put_returns_existing():
+    """When two loads finish for one key, both callers get the first store"""
+    print("🧪 Testing racing loads...")
+    registry = SwingDataRegistry()
+    key = SwingDataKey("swing.mat")
+    stores = [make_store("first"), make_store("second")]
+    results = [None, None]
+    barrier = threading.Barrier(2)
+
+    def load(i):
+        barrier.wait()
+        results[i] = registry.put(key, stores[i])
+
+    threads = [threading.Thread(target=load, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results[0] is results[1]
+    assert registry.get(key) is results[0]
+    assert len(registry) == 1
+
+    # Sequential case: a later put does not replace the cached store
+    assert registry.put(key, make_store("third")) is results[0]
+    print("✅ Racing loads OK")
+
+
+def test_get_or_create_builds_once():
+    """Concurrent get_or_create calls share one factory run"""
+    print("🧪 Testing get_or_create under contention...")
+    registry = SwingDataRegistry()
+    key = SwingDataKey("swing.mat")
+    calls = []
+    barrier = threading.Barrier(4)
+    results = []
+
+    def factory():
+        calls.append(1)
+        return make_store("built")
+
+    def load():
+        barrier.wait()
+        results.append(registry.get_or_create(key, factory))
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(store is results[0] for store in results)
+    print("✅ get_or_create OK")
+
+
+def test_file_key_changes_with_mtime():
+    """Touching a source file produces a new key, so edits reload"""
+    print("🧪 Testing file keys...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "BASEQ.mat"
+        path.write_bytes(b"swing")
+        stat = path.stat()
+
+        key = SwingDataKey.for_file(path, filtered=True)
+        assert key == SwingDataKey.for_file(path, filtered=True)
+        assert key != SwingDataKey.for_file(path, filtered=False)
+
+        registry = SwingDataRegistry()
+        registry.put(key, make_store("original"))
+
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        new_key = SwingDataKey.for_file(path, filtered=True)
+        assert new_key != key
+        assert new_key.source == key.source
+        assert registry.get(new_key) is None
+        assert registry.get(key) is not None
+    print("✅ File keys OK")
+
+
+if __name__ == "__main__":
+    print("🚀 Starting Swing Data Registry Tests")
+    print("=" * 50)
+
+    test_lru_eviction()
+    test_racing_put_returns_existing()
+    test_get_or_create_builds_once()
+    test_file_key_changes_with_mtime()
+
+    print("\n✅ All registry tests passed!")
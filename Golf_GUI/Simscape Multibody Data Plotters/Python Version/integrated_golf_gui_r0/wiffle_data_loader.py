@@ -113,12 +113,12 @@ class MotionDataLoader:
         self.config = config or MotionDataConfig()
         self.data_cache = {}
 
-    def load_data(self) -> Dict[str, pd.DataFrame]:
+    def find_data_file(self) -> Path:
         """
-        Load Wiffle_ProV1 data from the default Excel file location
+        Locate the Wiffle_ProV1 Excel file in the default locations
 
         Returns:
-            Dictionary with 'ProV1' and 'Wiffle' DataFrames
+            Path of the first existing candidate
         """
         # Try to find the Excel file in common locations
         possible_paths = [
@@ -130,12 +130,31 @@ class MotionDataLoader:
 
         for path in possible_paths:
             if path.exists():
-                return self.load_excel_data(str(path))
+                return path
 
         raise FileNotFoundError(
             "Wiffle_ProV1 Excel file not found in any expected location"
         )
 
+    def load_data(self) -> Dict[str, pd.DataFrame]:
+        """
+        Load Wiffle_ProV1 data from the default Excel file location
+
+        Returns:
+            Dictionary with 'ProV1' and 'Wiffle' DataFrames
+        """
+        return self.load_excel_data(str(self.find_data_file()))
+
+    def cache_options(self) -> Dict[str, object]:
+        """Config values that change the loaded data, for cache keys"""
+        return {
+            "prov1_sheet": self.config.prov1_sheet,
+            "wiffle_sheet": self.config.wiffle_sheet,
+            "normalize_time": self.config.normalize_time,
+            "filter_noise": self.config.filter_noise,
+            "interpolate_missing": self.config.interpolate_missing,
+        }
+
     def load_from_file(self, filepath: str) -> Dict[str, pd.DataFrame]:
         """
         Load Wiffle_ProV1 Excel data from a specific file path